@@ -8,12 +8,28 @@ from io import StringIO
 import os
 from dotenv import load_dotenv
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+from contextlib import nullcontext
 
 # 환경변수 로드
 load_dotenv()
 
+# 공유 OHLCV 아카이브 (python -m stock_analyzer.utils.panel_archive 로 갱신)
+ARCHIVE_PATH = os.getenv("ARCHIVE_PATH", "data/archive")
+try:
+    from stock_analyzer.utils.panel_archive import load_archived_ohlcv
+except ImportError:
+    load_archived_ohlcv = None
+
+# 네이버 금융 공유 rate limiter (응답이 빠르면 속도를 올리고, 타임아웃/429/5xx면 낮춤)
+try:
+    from stock_analyzer.utils.rate_limiter import get_rate_limiter, NAVER_FINANCE_HOST
+    naver_limiter = get_rate_limiter(NAVER_FINANCE_HOST)
+except ImportError:
+    naver_limiter = None
+
 # 설정 상수
-RATE_LIMIT_DELAY = 0.3  # 요청 간 대기 시간 (초) - 병렬 처리로 단축 가능
+RATE_LIMIT_DELAY = 0.3  # 요청 간 대기 시간 (초) - rate limiter가 없을 때만 사용
 MAX_WORKERS = 10  # 동시 실행 워커 수 (15 → 10으로 낮춤, 서버 부하 감소)
 MAX_RETRIES = 3  # 실패 시 재시도 횟수
 TIMEOUT = 15  # 요청 타임아웃 (초) - 10초에서 15초로 증가
@@ -94,8 +110,27 @@ def get_kosdaq_stock_codes():
         send_telegram_message(f"[ERROR] 종목 데이터 로드 실패: {e}")
         return pd.DataFrame()
 
+# 공유 아카이브에서 시세 가져오기 (네이버 시세와 같은 최신순 형식)
+def get_archived_price_history(code, count=30):
+    if load_archived_ohlcv is None:
+        return None
+
+    end_date = datetime.now().date()
+    start_date = end_date - timedelta(days=count * 2)  # 휴장일 여유
+    df = load_archived_ohlcv(code, start_date, end_date, ARCHIVE_PATH)
+    if df is None:
+        return None
+
+    df = df.iloc[::-1].head(count).reset_index()
+    df = df.rename(columns={df.columns[0]: '날짜'})
+    return df[['날짜', '종가', '시가', '고가', '저가', '거래량']]
+
 # 네이버 시세 가져오기 (조기 종료 최적화 + 재시도 로직)
 def get_price_history(code, count=30):
+    archived = get_archived_price_history(code, count)
+    if archived is not None:
+        return archived
+
     url = f"https://finance.naver.com/item/sise_day.nhn?code={code}"
     dfs = []
     total_rows = 0
@@ -106,8 +141,9 @@ def get_price_history(code, count=30):
         # 재시도 로직 추가
         for retry in range(MAX_RETRIES):
             try:
-                res = requests.get(pg_url, headers=HEADERS, timeout=TIMEOUT)
-                res.raise_for_status()
+                with naver_limiter.request() if naver_limiter is not None else nullcontext():
+                    res = requests.get(pg_url, headers=HEADERS, timeout=TIMEOUT)
+                    res.raise_for_status()
 
                 # pandas는 자동으로 사용 가능한 파서를 선택합니다 (lxml -> html5lib -> html.parser)
                 df = pd.read_html(StringIO(res.text))[0]
@@ -120,13 +156,15 @@ def get_price_history(code, count=30):
                 if total_rows >= count:
                     break
 
-                time.sleep(RATE_LIMIT_DELAY)
+                if naver_limiter is None:
+                    time.sleep(RATE_LIMIT_DELAY)
                 break  # 성공하면 재시도 루프 탈출
 
             except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
                 if retry < MAX_RETRIES - 1:
-                    wait_time = (retry + 1) * 2  # 재시도 시 대기 시간 증가 (2, 4, 6초)
-                    time.sleep(wait_time)
+                    # rate limiter가 속도를 낮춰 다음 요청 시점을 늦춤 (없으면 2, 4, 6초 대기)
+                    if naver_limiter is None:
+                        time.sleep((retry + 1) * 2)
                     continue
                 else:
                     # 최종 실패
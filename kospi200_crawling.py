@@ -1,6 +1,14 @@
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
+from contextlib import nullcontext
+
+# 네이버 금융 공유 rate limiter (다른 스크립트와 합산한 호스트별 요청 한도도 함께 지킴)
+try:
+    from stock_analyzer.utils.rate_limiter import get_rate_limiter, NAVER_FINANCE_HOST
+    naver_limiter = get_rate_limiter(NAVER_FINANCE_HOST)
+except ImportError:
+    naver_limiter = None
 
 def crawl_kospi200():
     url = "https://finance.naver.com/sise/entryJongmok.naver?type=KPI200"
@@ -9,7 +17,8 @@ def crawl_kospi200():
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     }
     
-    response = requests.get(url, headers=headers)
+    with naver_limiter.request() if naver_limiter is not None else nullcontext():
+        response = requests.get(url, headers=headers)
     response.encoding = 'utf-8'
     
     soup = BeautifulSoup(response.content, 'html.parser')
@@ -8,6 +8,14 @@ from bs4 import BeautifulSoup
 import pandas as pd
 import time
 from datetime import datetime
+from contextlib import nullcontext
+
+# 네이버 금융 공유 rate limiter (다른 스크립트와 합산한 호스트별 요청 한도도 함께 지킴)
+try:
+    from stock_analyzer.utils.rate_limiter import get_rate_limiter, NAVER_FINANCE_HOST
+    naver_limiter = get_rate_limiter(NAVER_FINANCE_HOST)
+except ImportError:
+    naver_limiter = None
 
 
 def crawl_theme_page(page=1):
@@ -27,8 +35,9 @@ def crawl_theme_page(page=1):
     }
 
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
+        with naver_limiter.request() if naver_limiter is not None else nullcontext():
+            response = requests.get(url, headers=headers)
+            response.raise_for_status()
         soup = BeautifulSoup(response.text, 'html.parser')
 
         # 테마 테이블 찾기 - 여러 방법 시도
@@ -139,8 +148,8 @@ def crawl_all_themes(max_pages=7):
         themes = crawl_theme_page(page)
         all_themes.extend(themes)
 
-        # 서버 부하 방지를 위한 대기
-        if page < max_pages:
+        # 서버 부하 방지를 위한 대기 (rate limiter가 없을 때만)
+        if page < max_pages and naver_limiter is None:
             time.sleep(1)
 
     df = pd.DataFrame(all_themes)
@@ -8,6 +8,14 @@ from bs4 import BeautifulSoup
 import pandas as pd
 import time
 from datetime import datetime
+from contextlib import nullcontext
+
+# 네이버 금융 공유 rate limiter (다른 스크립트와 합산한 호스트별 요청 한도도 함께 지킴)
+try:
+    from stock_analyzer.utils.rate_limiter import get_rate_limiter, NAVER_FINANCE_HOST
+    naver_limiter = get_rate_limiter(NAVER_FINANCE_HOST)
+except ImportError:
+    naver_limiter = None
 
 
 def crawl_theme_stocks(theme_no, theme_name=""):
@@ -28,8 +36,9 @@ def crawl_theme_stocks(theme_no, theme_name=""):
     }
 
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
+        with naver_limiter.request() if naver_limiter is not None else nullcontext():
+            response = requests.get(url, headers=headers)
+            response.raise_for_status()
         soup = BeautifulSoup(response.text, 'html.parser')
 
         # 종목 테이블 찾기
@@ -143,8 +152,8 @@ def crawl_multiple_themes(theme_list):
         stocks = crawl_theme_stocks(theme_no, theme_name)
         all_stocks.extend(stocks)
 
-        # 서버 부하 방지를 위한 대기
-        if i < len(theme_list):
+        # 서버 부하 방지를 위한 대기 (rate limiter가 없을 때만)
+        if i < len(theme_list) and naver_limiter is None:
             time.sleep(1)
 
     df = pd.DataFrame(all_stocks)
@@ -7,6 +7,8 @@
 from typing import Dict, Tuple, List
 from dataclasses import dataclass
 
+import numpy as np
+
 from stock_analyzer.config import get_settings
 from stock_analyzer.utils.logger import LoggerMixin
 
@@ -53,6 +55,22 @@ class SignalClassifier(LoggerMixin):
 
         return SignalGrade(grade=grade, score=score, reasons=reasons)
 
+    def classify_all(self, indicators_by_ticker: Dict[str, Dict]) -> Dict[str, SignalGrade]:
+        """
+        여러 종목의 지표를 한 번에 분류합니다.
+
+        Args:
+            indicators_by_ticker: 종목 코드 -> 지표 딕셔너리
+                (TechnicalAnalyzer.get_panel_indicators 결과)
+
+        Returns:
+            종목 코드 -> SignalGrade
+        """
+        return {
+            ticker: self.classify(indicators)
+            for ticker, indicators in indicators_by_ticker.items()
+        }
+
     def is_a_signal(self, ind: Dict) -> bool:
         """A급 신호 여부"""
         cond_volume_explosion = (
@@ -146,6 +164,51 @@ class SignalClassifier(LoggerMixin):
 
         return score
 
+    def grade_threshold(self, grade: str) -> int:
+        """등급의 최소 점수"""
+        return {
+            'A': self.criteria.a_score_threshold,
+            'B': self.criteria.b_score_threshold,
+            'C': self.criteria.c_score_threshold,
+        }[grade]
+
+    def max_possible_scores(
+        self,
+        open_: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        prev_volume: np.ndarray
+    ) -> np.ndarray:
+        """
+        당일 봉과 전일 거래량만으로 _compute_score의 상한을 계산합니다 (종목별 벡터 연산).
+
+        이력이 필요한 조건(MA20, 저점 상승)은 충족된다고 보고, 나머지는 이력과 무관하게
+        성립하는 관계(high20 >= 당일 고가, vol_avg5 >= (당일 + 전일 거래량) / 5)로만 배제합니다.
+        prev_volume이 NaN인 종목은 전일 거래량 조건을 모두 충족 가능으로 봅니다.
+
+        Returns:
+            종목별 최대 점수 (int 배열)
+        """
+        unknown = np.isnan(prev_volume)
+        prev = np.where(unknown, 0.0, prev_volume)
+        today_return = (close - open_) / np.maximum(open_, 1e-9) * 100
+        candle_range = np.maximum(high - low, 1e-9)
+
+        score = np.ones(len(close), dtype=np.int64)  # MA20
+        score += today_return >= 2
+        score += close >= high * 0.95
+        score += 2 * (close >= high)
+        score += unknown | (volume >= prev * 1.5)
+        score += 2 * (unknown | (volume >= prev * 3))
+        score += unknown | (volume * 3 >= prev * 2)
+        score += 2 * (unknown | (prev == 0))
+        score += 1  # 저점 상승
+        score += close > open_
+        score += 2 * (close - open_ >= candle_range * 0.7)
+        return score
+
     def _summarize_reasons(self, ind: Dict, grade: str) -> List[str]:
         """등급별 이유를 요약합니다"""
         reasons = []
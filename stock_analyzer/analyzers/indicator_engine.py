@@ -0,0 +1,165 @@
+"""
+벡터화 지표 엔진
+
+전종목 (종목 × 거래일) 2차원 배열에서 TechnicalAnalyzer의 지표를 한 번에 계산합니다.
+평균은 누적합, 최댓값/최솟값은 sliding_window_view, 표준편차는 창 평균을 먼저 구한 뒤
+편차 제곱합을 구하는 2-pass 방식이며, 모든 커널(analyzers/rolling.py)은 마지막 축(거래일)을 따라
+계산하므로 1차원 배열(종목 하나)에도 그대로 사용할 수 있습니다.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from stock_analyzer.analyzers.rolling import (  # noqa: F401 - 기존 import 경로 유지
+    pack_valid, pct_change, rolling_max, rolling_mean, rolling_min, rolling_std, rolling_sum
+)
+from stock_analyzer.config import AnalysisSettings, get_settings
+from stock_analyzer.utils.market_panel import MarketPanel
+
+
+# ==================== 지표 엔진 ====================
+
+class IndicatorEngine:
+    """
+    전종목 지표 일괄 계산기
+
+    series()는 TechnicalAnalyzer._calculate_indicators와 같은 지표 시계열을,
+    latest()는 get_latest_indicators와 같은 최신 지표를 종목 축 배열로 반환합니다.
+    """
+
+    def __init__(self, settings: Optional[AnalysisSettings] = None):
+        """
+        Args:
+            settings: 분석 설정 (None이면 전역 설정)
+        """
+        self.settings = settings or get_settings().analysis
+
+    @property
+    def required_bars(self) -> int:
+        """최신 지표 계산에 필요한 최소 거래일 수 (이보다 긴 이력은 결과에 영향 없음)"""
+        config = self.settings
+        warmup = max(
+            config.ma_period_short, config.ma_period_long,
+            config.volume_window, config.volatility_window, 2
+        ) - 1
+        return warmup + config.ma_period_long + 1
+
+    def series(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        지표 시계열 (입력과 같은 모양, 창이 덜 찬 앞부분은 NaN)
+
+        Args:
+            high/low/close/volume: (종목, 거래일) 또는 (거래일,) 배열
+        """
+        config = self.settings
+        spread = np.asarray(high, dtype=np.float64) - np.asarray(low, dtype=np.float64)
+        return {
+            # 이동평균
+            'MA5': rolling_mean(close, config.ma_period_short),
+            'MA20': rolling_mean(close, config.ma_period_long),
+
+            # 거래량 평균
+            'vol_avg5': rolling_mean(volume, config.ma_period_short),
+            'vol_avg20': rolling_mean(volume, config.volume_window),
+
+            # 20일 고가
+            'high20': rolling_max(high, config.ma_period_long),
+            'low20': rolling_min(low, config.ma_period_long),
+
+            # 변동성
+            'volatility5': rolling_std(spread, config.ma_period_short),
+            'volatility20': rolling_std(spread, config.volatility_window),
+
+            # 가격 변동률
+            'price_change': pct_change(close),
+        }
+
+    def latest(
+        self,
+        open_: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        결측 없이 끝이 맞춰진 (종목, 거래일) 배열의 마지막 거래일 지표 (종목 축 1차원 배열)
+
+        마지막 창의 값만 필요하므로 이동 창 전체를 만들지 않고 끝부분에서 바로 집계합니다.
+        """
+        config = self.settings
+        short, long = config.ma_period_short, config.ma_period_long
+        open_, high, low, close, volume = (
+            np.asarray(a, dtype=np.float64) for a in (open_, high, low, close, volume)
+        )
+        candle = high - low
+
+        return {
+            # 가격
+            'close': close[:, -1],
+            'open': open_[:, -1],
+            'high': high[:, -1],
+            'low': low[:, -1],
+
+            # 거래량
+            'volume_today': volume[:, -1],
+            'volume_prev': volume[:, -2],
+
+            # 이동평균
+            'MA5': close[:, -short:].mean(axis=1),
+            'MA20': close[:, -long:].mean(axis=1),
+
+            # 거래량 평균
+            'vol_avg5': volume[:, -short:].mean(axis=1),
+            'vol_avg20': volume[:, -config.volume_window:].mean(axis=1),
+
+            # 고저가
+            'high20': high[:, -long:].max(axis=1),
+            'low20': low[:, -long:].min(axis=1),
+            'min_low5': low[:, -5:].min(axis=1),
+            'min_low_prev5': low[:, -10:-5].min(axis=1),
+
+            # 변동성
+            'volatility5': candle[:, -short:].std(axis=1, ddof=1),
+            'volatility20': candle[:, -config.volatility_window:].std(axis=1, ddof=1),
+
+            # 수익률
+            'today_return': (close[:, -1] - open_[:, -1]) / np.maximum(open_[:, -1], 1e-9) * 100,
+
+            # 캔들
+            'body': close[:, -1] - open_[:, -1],
+            'candle_range': np.maximum(high[:, -1] - low[:, -1], 1e-9),
+        }
+
+    def latest_from_panel(self, panel: MarketPanel) -> Tuple[list, Dict[str, np.ndarray]]:
+        """
+        패널 전종목의 최신 지표
+
+        종목마다 결측 거래일을 건너뛴 마지막 required_bars개 봉으로 계산하며,
+        유효한 봉이 부족한 종목은 제외합니다.
+
+        Returns:
+            (종목 코드 리스트, 지표 이름 -> 종목 축 배열)
+        """
+        length = self.required_bars
+        if len(panel) == 0 or panel.shape[1] < length:
+            return [], {}
+
+        ok, cols = pack_valid(~np.isnan(panel.close), length)
+        rows = np.flatnonzero(ok)[:, None]
+        cols = cols[ok]
+        arrays = [
+            getattr(panel, field)[rows, cols]
+            for field in ('open', 'high', 'low', 'close', 'volume')
+        ]
+        tickers = [panel.tickers[i] for i in rows[:, 0]]
+        if not tickers:
+            return [], {}
+        return tickers, self.latest(*arrays)
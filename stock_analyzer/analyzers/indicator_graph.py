@@ -0,0 +1,369 @@
+"""
+지표 의존성 그래프
+
+지표마다 입력(OHLCV 필드 또는 다른 지표)과 창 길이를 선언하고, 리졸버가 요청한 지표의
+전이적 의존성을 순서대로 계산합니다. 계산 결과는 (종목, 기준 봉, 지표 파라미터)마다
+한 번만 계산해 프로세스 공유 캐시에 보관하므로, 같은 실행에서 MA20 등을 다시 요청하는
+다른 경로(스크리너, 분류기, 레거시 스크립트)는 캐시된 배열을 사용합니다.
+
+창 지표는 시작 시점과 무관하게 같은 값이므로, 요청한 이력이 캐시된 결과의 끝부분
+(같은 거래일 순서)이면 그만큼 잘라 사용합니다 (앞부분 워밍업 구간은 새로 계산할 때처럼 NaN).
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from cachetools import LRUCache
+
+from stock_analyzer.analyzers.indicator_engine import (
+    pct_change, rolling_max, rolling_mean, rolling_min, rolling_std
+)
+from stock_analyzer.config import AnalysisSettings
+from stock_analyzer.utils.logger import LoggerMixin
+
+# 지표 입력으로 쓸 수 있는 OHLCV 필드 -> 데이터프레임 컬럼
+BASE_FIELDS: Dict[str, str] = {
+    'open': '시가',
+    'high': '고가',
+    'low': '저가',
+    'close': '종가',
+    'volume': '거래량',
+}
+
+# TechnicalAnalyzer._calculate_indicators가 데이터프레임에 추가하는 지표 (IndicatorEngine.series와 같은 구성)
+SERIES_INDICATORS: Tuple[str, ...] = (
+    'MA5', 'MA20', 'vol_avg5', 'vol_avg20', 'high20', 'low20',
+    'volatility5', 'volatility20', 'price_change',
+)
+
+# 분류기 입력 지표 (IndicatorEngine.latest와 같은 구성)
+LATEST_INDICATORS: Tuple[str, ...] = (
+    'close', 'open', 'high', 'low', 'volume_today', 'volume_prev',
+    'MA5', 'MA20', 'vol_avg5', 'vol_avg20', 'high20', 'low20', 'min_low5', 'min_low_prev5',
+    'volatility5', 'volatility20', 'today_return', 'body', 'candle_range',
+)
+
+
+@dataclass(frozen=True)
+class IndicatorSpec:
+    """
+    지표 선언
+
+    Attributes:
+        name: 지표 이름
+        inputs: 입력 (BASE_FIELDS 필드 또는 먼저 등록한 지표 이름)
+        window: 값 하나를 계산하는 데 필요한 입력 봉 수 (같은 봉만 쓰면 1)
+        func: 입력 배열을 순서대로 받아 같은 길이의 배열을 반환하는 함수
+    """
+    name: str
+    inputs: Tuple[str, ...]
+    window: int
+    func: Callable[..., np.ndarray]
+
+
+def shift(values: np.ndarray, periods: int) -> np.ndarray:
+    """periods봉 이전 값 (앞부분은 NaN)"""
+    values = np.asarray(values, dtype=np.float64)
+    pad = np.full(values.shape[:-1] + (periods,), np.nan)
+    return np.concatenate([pad, values[..., :values.shape[-1] - periods]], axis=-1)
+
+
+class IndicatorRegistry:
+    """지표 선언 모음 (등록 순서가 곧 의존성 순서)"""
+
+    def __init__(self):
+        self._specs: Dict[str, IndicatorSpec] = {}
+        self._warmup: Dict[str, int] = {field: 0 for field in BASE_FIELDS}
+        self._signature: Dict[str, Hashable] = {field: field for field in BASE_FIELDS}
+
+    def register(self, spec: IndicatorSpec) -> IndicatorSpec:
+        """
+        지표를 등록합니다.
+
+        Raises:
+            ValueError: 이미 있는 이름이거나 등록되지 않은 입력, 1보다 작은 창
+        """
+        if spec.name in self._warmup:
+            raise ValueError(f"이미 등록된 지표: {spec.name}")
+        unknown = [name for name in spec.inputs if name not in self._warmup]
+        if unknown:
+            raise ValueError(f"{spec.name}: 등록되지 않은 입력 {unknown}")
+        if spec.window < 1:
+            raise ValueError(f"{spec.name}: 창 길이는 1 이상이어야 합니다 ({spec.window})")
+
+        self._specs[spec.name] = spec
+        self._warmup[spec.name] = max((self._warmup[name] for name in spec.inputs), default=0) + spec.window - 1
+        self._signature[spec.name] = (
+            spec.name, spec.window, tuple(self._signature[name] for name in spec.inputs)
+        )
+        return spec
+
+    def add(self, name: str, inputs: Iterable[str], window: int, func: Callable[..., np.ndarray]) -> IndicatorSpec:
+        """IndicatorSpec을 만들어 등록합니다"""
+        return self.register(IndicatorSpec(name, tuple(inputs), window, func))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._warmup
+
+    def __getitem__(self, name: str) -> IndicatorSpec:
+        return self._specs[name]
+
+    @property
+    def names(self) -> List[str]:
+        """등록된 지표 이름 (등록 순서)"""
+        return list(self._specs)
+
+    def _check(self, names: Iterable[str]) -> List[str]:
+        names = list(names)
+        unknown = [name for name in names if name not in self._warmup]
+        if unknown:
+            raise KeyError(f"등록되지 않은 지표: {unknown}")
+        return names
+
+    def closure(self, names: Iterable[str]) -> List[str]:
+        """요청한 지표와 전이적 의존 지표 (계산 순서, OHLCV 필드 제외)"""
+        needed = set()
+        stack = self._check(names)
+        while stack:
+            name = stack.pop()
+            if name in needed or name in BASE_FIELDS:
+                continue
+            needed.add(name)
+            stack.extend(self._specs[name].inputs)
+        return [name for name in self._specs if name in needed]
+
+    def warmup(self, name: str) -> int:
+        """첫 유효 값 이전의 봉 수 (창이 덜 차서 NaN인 앞부분 길이)"""
+        return self._warmup[self._check([name])[0]]
+
+    def required_bars(self, names: Iterable[str]) -> int:
+        """요청한 지표의 마지막 값을 계산하는 데 필요한 최소 봉 수"""
+        return max((self._warmup[name] for name in self._check(names)), default=0) + 1
+
+    def signature(self, name: str) -> Hashable:
+        """지표와 모든 의존 지표의 이름/창 길이 (캐시 키의 파라미터 부분)"""
+        return self._signature[name]
+
+
+def default_registry(settings: AnalysisSettings) -> IndicatorRegistry:
+    """분석 설정의 창 길이로 TechnicalAnalyzer/분류기 지표를 선언합니다"""
+    short, long = settings.ma_period_short, settings.ma_period_long
+    registry = IndicatorRegistry()
+    add = registry.add
+
+    # 이동평균
+    add('MA5', ['close'], short, lambda c: rolling_mean(c, short))
+    add('MA20', ['close'], long, lambda c: rolling_mean(c, long))
+
+    # 거래량
+    add('volume_today', ['volume'], 1, lambda v: np.asarray(v, dtype=np.float64))
+    add('volume_prev', ['volume'], 2, lambda v: shift(v, 1))
+    add('vol_avg5', ['volume'], short, lambda v: rolling_mean(v, short))
+    add('vol_avg20', ['volume'], settings.volume_window, lambda v: rolling_mean(v, settings.volume_window))
+
+    # 고저가
+    add('high20', ['high'], long, lambda h: rolling_max(h, long))
+    add('low20', ['low'], long, lambda l: rolling_min(l, long))
+    add('min_low5', ['low'], 5, lambda l: rolling_min(l, 5))
+    add('min_low_prev5', ['min_low5'], 6, lambda m: shift(m, 5))
+
+    # 변동성
+    add('candle_spread', ['high', 'low'], 1, lambda h, l: np.asarray(h, dtype=np.float64) - l)
+    add('volatility5', ['candle_spread'], short, lambda s: rolling_std(s, short))
+    add('volatility20', ['candle_spread'], settings.volatility_window,
+        lambda s: rolling_std(s, settings.volatility_window))
+
+    # 수익률
+    add('price_change', ['close'], 2, pct_change)
+    add('today_return', ['open', 'close'], 1, lambda o, c: (c - o) / np.maximum(o, 1e-9) * 100)
+
+    # 캔들
+    add('body', ['open', 'close'], 1, lambda o, c: np.asarray(c, dtype=np.float64) - o)
+    add('candle_range', ['candle_spread'], 1, lambda s: np.maximum(s, 1e-9))
+    return registry
+
+
+# ==================== 캐시 ====================
+
+class IndicatorCache:
+    """스레드 안전 LRU 지표 캐시 (프로세스 공유, 적중/미적중 집계)"""
+
+    def __init__(self, maxsize: int):
+        """
+        Args:
+            maxsize: 최대 항목 수 (지표 배열 하나가 한 항목, 0이면 저장하지 않음)
+        """
+        self.maxsize = maxsize
+        self._cache: LRUCache = LRUCache(maxsize=max(maxsize, 1))
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, index: np.ndarray, warmup: int) -> Optional[np.ndarray]:
+        """
+        캐시된 결과 중 요청한 거래일 구간 (새로 계산할 때처럼 앞부분 warmup개는 NaN)
+
+        요청한 거래일이 캐시된 거래일의 끝부분이 아니면 None
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+        tail = None if entry is None else self._tail(entry, index, warmup)
+        with self._lock:
+            if tail is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return tail
+
+    @staticmethod
+    def _tail(entry: Tuple[np.ndarray, np.ndarray], index: np.ndarray, warmup: int) -> Optional[np.ndarray]:
+        cached_index, cached = entry
+        length = len(index)
+        if len(cached_index) < length or not np.array_equal(cached_index[len(cached_index) - length:], index):
+            return None
+        if len(cached) == length:
+            return cached
+        tail = cached[len(cached) - length:].copy()
+        tail[:warmup] = np.nan
+        return tail
+
+    def put(self, key: Hashable, index: np.ndarray, value: np.ndarray):
+        """거래일 인덱스와 함께 저장 (같은 키는 더 긴 이력으로 계산한 결과를 유지)"""
+        if self.maxsize <= 0:
+            return
+        value.setflags(write=False)  # 여러 소비자가 공유하므로 읽기 전용
+        with self._lock:
+            current = self._cache.get(key)
+            if current is None or len(current[1]) < len(value):
+                self._cache[key] = (index, value)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_cache: Optional[IndicatorCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_indicator_cache() -> IndicatorCache:
+    """
+    공유 지표 캐시를 반환합니다 (프로세스 내 싱글톤).
+
+    텔레그램 설정이 없는 레거시 스크립트에서도 쓰이므로 ANALYSIS_ 설정만 읽습니다.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = IndicatorCache(AnalysisSettings().indicator_cache_size)
+        return _cache
+
+
+# ==================== 리졸버 ====================
+
+class IndicatorResolver(LoggerMixin):
+    """
+    지표 리졸버
+
+    요청한 지표의 전이적 의존성을 계산하며, 종목 코드가 주어지면
+    (종목, 마지막 봉 날짜와 값, 지표 파라미터) 키로 결과를 캐시와 공유합니다.
+    """
+
+    def __init__(self, registry: IndicatorRegistry, cache: Optional[IndicatorCache] = None):
+        """
+        Args:
+            registry: 지표 선언
+            cache: 지표 캐시 (None이면 프로세스 공유 캐시)
+        """
+        self.registry = registry
+        self.cache = cache if cache is not None else get_indicator_cache()
+
+    @staticmethod
+    def _bar_key(ticker: Optional[str], df: pd.DataFrame) -> Optional[Tuple]:
+        """
+        종목과 기준 봉 키 (종목 코드가 없으면 캐시하지 않음)
+
+        같은 거래일이라도 장중 갱신으로 마지막 봉이 바뀌면 다른 키가 됩니다.
+        """
+        if ticker is None or df.empty:
+            return None
+        last = df.iloc[-1]
+        return ticker, df.index[-1], float(last['종가']), float(last['거래량'])
+
+    def resolve(
+        self,
+        ticker: Optional[str],
+        df: pd.DataFrame,
+        names: Iterable[str]
+    ) -> Dict[str, np.ndarray]:
+        """
+        지표 시계열을 계산합니다.
+
+        Args:
+            ticker: 종목 코드 (None이면 캐시 없이 계산)
+            df: OHLCV 데이터프레임 (한글 컬럼, 오름차순)
+            names: 지표 이름 (OHLCV 필드 이름도 가능)
+
+        Returns:
+            지표 이름 -> df와 같은 길이의 배열 (읽기 전용일 수 있음)
+        """
+        names = list(names)
+        self.registry.closure(names)  # 등록되지 않은 이름 검사
+        bar_key = self._bar_key(ticker, df)
+        index = df.index.to_numpy()
+        length = len(index)
+        values: Dict[str, np.ndarray] = {}
+
+        def get(name: str) -> np.ndarray:
+            if name in values:
+                return values[name]
+            if name in BASE_FIELDS:
+                values[name] = df[BASE_FIELDS[name]].to_numpy(dtype=np.float64)
+                return values[name]
+
+            key = None if bar_key is None else bar_key + (self.registry.signature(name),)
+            cached = None if key is None else self.cache.get(key, index, self.registry.warmup(name))
+            if cached is not None:
+                values[name] = cached
+                return cached
+
+            spec = self.registry[name]
+            result = np.asarray(spec.func(*(get(source) for source in spec.inputs)), dtype=np.float64)
+            if key is not None:
+                self.cache.put(key, index, result)
+            values[name] = result
+            return result
+
+        return {name: get(name) for name in names}
+
+    def frame(
+        self,
+        ticker: Optional[str],
+        df: pd.DataFrame,
+        names: Iterable[str] = SERIES_INDICATORS
+    ) -> pd.DataFrame:
+        """
+        원본 컬럼에 지표 컬럼을 더한 새 데이터프레임
+
+        원본 프레임은 캐시와 공유하는 읽기 전용 프레임일 수 있으므로 수정하지 않고,
+        원본 컬럼 배열(복사 없음)과 지표 배열을 새 데이터프레임으로 묶습니다.
+        """
+        columns = {column: df[column].to_numpy() for column in df.columns}
+        columns.update(self.resolve(ticker, df, names))
+        return pd.DataFrame(columns, index=df.index, copy=False)
+
+    def latest(
+        self,
+        ticker: Optional[str],
+        df: pd.DataFrame,
+        names: Iterable[str] = LATEST_INDICATORS
+    ) -> Dict[str, float]:
+        """마지막 봉의 지표 값"""
+        return {name: float(values[-1]) for name, values in self.resolve(ticker, df, names).items()}
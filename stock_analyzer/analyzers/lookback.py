@@ -0,0 +1,124 @@
+"""
+조회 기간 계획
+
+요청한 지표의 창 길이(IndicatorRegistry)로 필요한 최소 거래일 수를 구하고,
+거래일 달력으로 조회 시작일을 계산합니다. 달력일 기준 어림값(50일, 120일 등) 대신
+지표에 필요한 만큼만 조회하므로 종목마다 내려받고 파싱하는 데이터가 줄어듭니다.
+
+달력에 없는 휴장일이나 거래정지로 받은 봉이 필요한 수보다 적으면, 조회 기간을 넓혀
+한 번 더 조회합니다 (fetch, widened_start).
+"""
+
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from stock_analyzer.analyzers.indicator_graph import SERIES_INDICATORS, IndicatorRegistry, default_registry
+from stock_analyzer.config import AnalysisSettings, get_settings
+from stock_analyzer.utils.trading_calendar import TradingCalendar, get_trading_calendar
+
+if TYPE_CHECKING:
+    from stock_analyzer.utils.data_provider import DataProvider
+    from stock_analyzer.utils.market_panel import MarketPanel
+
+
+class LookbackPlanner:
+    """지표 집합 -> 필요한 거래일 수 -> 조회 시작일"""
+
+    def __init__(
+        self,
+        settings: Optional[AnalysisSettings] = None,
+        calendar: Optional[TradingCalendar] = None,
+        registry: Optional[IndicatorRegistry] = None
+    ):
+        """
+        Args:
+            settings: 분석 설정 (None이면 전역 설정)
+            calendar: 거래일 달력 (None이면 공유 KRX 달력)
+            registry: 지표 선언 (None이면 settings의 기본 지표)
+        """
+        self.settings = settings or get_settings().analysis
+        self.calendar = calendar or get_trading_calendar()
+        self.registry = registry or default_registry(self.settings)
+
+    def bars(self, names: Iterable[str] = SERIES_INDICATORS, history: int = 1) -> int:
+        """
+        지표 값이 마지막 history개 봉에서 모두 유효하기 위한 최소 거래일 수
+
+        Args:
+            names: 지표 이름
+            history: 지표가 유효해야 하는 마지막 봉 수 (마지막 값만 필요하면 1)
+        """
+        return self.registry.required_bars(names) + history - 1
+
+    @property
+    def required_bars(self) -> int:
+        """최신 지표 계산(TechnicalAnalyzer.get_latest_indicators)에 필요한 최소 거래일 수"""
+        return self.bars(SERIES_INDICATORS, history=self.settings.ma_period_long + 1)
+
+    def start_date(self, end_date: date, bars: Optional[int] = None) -> date:
+        """
+        end_date까지 bars개(+ 여유 거래일) 거래일을 담는 조회 시작일
+
+        ANALYSIS_LOOKBACK_DAYS가 설정되어 있으면 달력일 기준 고정 기간을 사용합니다.
+        """
+        if self.settings.lookback_days:
+            return end_date - timedelta(days=self.settings.lookback_days)
+        bars = (bars or self.required_bars) + self.settings.lookback_margin_bars
+        return self.calendar.start_for_bars(end_date, bars)
+
+    @property
+    def can_widen(self) -> bool:
+        """봉이 부족할 때 기간을 넓혀 다시 조회하는지 여부 (고정 기간 설정이면 False)"""
+        return not self.settings.lookback_days
+
+    def widened_start(self, end_date: date, bars: Optional[int] = None) -> date:
+        """받은 봉이 bars개보다 적을 때 다시 조회할 시작일 (필요 거래일 + 여유 거래일의 두 배)"""
+        bars = bars or self.required_bars
+        return self.calendar.start_for_bars(end_date, 2 * (bars + self.settings.lookback_margin_bars))
+
+    def fetch(
+        self,
+        provider: 'DataProvider',
+        ticker: str,
+        end_date: date,
+        bars: Optional[int] = None,
+        fetch_end: Optional[date] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        end_date까지 bars개 거래일을 조회합니다.
+
+        받은 봉이 bars개보다 적으면 widened_start()부터 한 번 더 조회하고 더 긴 쪽을 반환합니다
+        (상장 직후 종목처럼 이력 자체가 짧으면 그대로 반환).
+
+        Args:
+            provider: 데이터 제공자
+            ticker: 종목 코드
+            end_date: 계획 기준일 (이 날까지의 거래일 수를 셈)
+            bars: 필요한 거래일 수 (None이면 최신 지표 계산에 필요한 거래일 수)
+            fetch_end: 조회 종료일 (None이면 end_date)
+        """
+        bars = bars or self.required_bars
+        fetch_end = fetch_end or end_date
+        df = provider.fetch_ohlcv(ticker, self.start_date(end_date, bars), fetch_end)
+        if df is None or df.empty or len(df) >= bars or not self.can_widen:
+            return df
+
+        wider = provider.fetch_ohlcv(ticker, self.widened_start(end_date, bars), fetch_end)
+        if wider is not None and len(wider) > len(df):
+            return wider
+        return df
+
+    def short_tickers(self, panel: 'MarketPanel', bars: Optional[int] = None) -> List[str]:
+        """
+        패널에서 유효한 봉이 bars개보다 적은 종목 (widened_start()부터 다시 조회할 대상)
+
+        이력이 전혀 없는 종목과 고정 기간 설정(ANALYSIS_LOOKBACK_DAYS)일 때는 대상이 없습니다.
+        """
+        if not self.can_widen or len(panel) == 0:
+            return []
+        bars = bars or self.required_bars
+        counts = panel.valid.sum(axis=1)
+        return [panel.tickers[i] for i in np.flatnonzero((counts > 0) & (counts < bars))]
@@ -0,0 +1,98 @@
+"""
+이동 창 커널
+
+NumPy 배열의 마지막 축(거래일)을 따라 계산하는 이동 합계/평균/최댓값/최솟값/표준편차와
+결측 거래일을 건너뛰는 열 정렬 도우미입니다. NumPy만 사용하므로 설정이나 데이터 제공자 없이
+독립 스크립트(vidya_indicator.py 등)에서도 가져올 수 있습니다.
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _pad_front(values: np.ndarray, window: int) -> np.ndarray:
+    """창이 채워지지 않은 앞부분 window - 1개를 NaN으로 채워 입력 길이에 맞춥니다"""
+    pad = np.full(values.shape[:-1] + (window - 1,), np.nan)
+    return np.concatenate([pad, values], axis=-1)
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    누적합으로 계산한 이동 합계 (창이 덜 찼거나 창 안에 NaN이 있으면 NaN)
+
+    pandas rolling(window).sum()과 같은 결과입니다 (min_periods=window).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.shape[-1] < window:
+        return np.full(values.shape, np.nan)
+
+    missing = np.isnan(values)
+    zero = np.zeros(values.shape[:-1] + (1,))
+    csum = np.concatenate([zero, np.cumsum(np.where(missing, 0.0, values), axis=-1)], axis=-1)
+    ccount = np.concatenate([zero, np.cumsum(missing, axis=-1)], axis=-1)
+
+    sums = csum[..., window:] - csum[..., :-window]
+    sums[(ccount[..., window:] - ccount[..., :-window]) > 0] = np.nan
+    return _pad_front(sums, window)
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """이동 평균 (rolling(window).mean())"""
+    return rolling_sum(values, window) / window
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """이동 최댓값 (rolling(window).max(), 창 안에 NaN이 있으면 NaN)"""
+    values = np.asarray(values, dtype=np.float64)
+    if values.shape[-1] < window:
+        return np.full(values.shape, np.nan)
+    return _pad_front(sliding_window_view(values, window, axis=-1).max(axis=-1), window)
+
+
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """이동 최솟값 (rolling(window).min(), 창 안에 NaN이 있으면 NaN)"""
+    values = np.asarray(values, dtype=np.float64)
+    if values.shape[-1] < window:
+        return np.full(values.shape, np.nan)
+    return _pad_front(sliding_window_view(values, window, axis=-1).min(axis=-1), window)
+
+
+def rolling_std(values: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    """
+    이동 표준편차 (rolling(window).std())
+
+    누적 제곱합 방식(E[x²] - E[x]²)은 가격 수준이 크면 자릿수 손실이 생기므로
+    창 평균을 먼저 구한 뒤 창마다 편차 제곱합을 다시 계산합니다.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.shape[-1] < window:
+        return np.full(values.shape, np.nan)
+    windows = sliding_window_view(values, window, axis=-1)
+    mean = windows.mean(axis=-1, keepdims=True)
+    var = ((windows - mean) ** 2).sum(axis=-1) / (window - ddof)
+    return _pad_front(np.sqrt(var), window)
+
+
+def pct_change(values: np.ndarray) -> np.ndarray:
+    """전일 대비 변동률 (첫 열은 NaN)"""
+    values = np.asarray(values, dtype=np.float64)
+    change = values[..., 1:] / values[..., :-1] - 1
+    return np.concatenate([np.full(values.shape[:-1] + (1,), np.nan), change], axis=-1)
+
+
+def pack_valid(valid: np.ndarray, length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    행마다 유효한 마지막 length개 열의 위치를 구합니다.
+
+    거래정지 등으로 중간에 빠진 거래일을 건너뛰어, 종목별 데이터프레임에서 결측 행을
+    제거한 것과 같은 순서로 값을 모읍니다.
+
+    Returns:
+        (length개 이상 유효한 행 마스크, (행, length) 열 인덱스 - 오름차순)
+    """
+    counts = valid.sum(axis=1)
+    # 유효하지 않은 열을 앞으로 보내는 안정 정렬 - 유효한 열의 원래 순서 유지
+    order = np.argsort(valid, axis=1, kind='stable')
+    return counts >= length, order[:, valid.shape[1] - length:]
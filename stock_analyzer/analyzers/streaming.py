@@ -0,0 +1,405 @@
+"""
+스트리밍 지표 상태
+
+종목마다 확정된 봉의 이동 창 집계(이동 평균/분산 누적기, 단조 덱 최댓값/최솟값, 전일 거래량)를
+보관하고, 새 봉이 확정될 때마다 봉 하나만큼 상수 시간에 갱신합니다. 당일 봉(장중 잠정치)은
+상태를 바꾸지 않고 peek()으로 더해 보기만 하므로 장중에 여러 번 다시 계산해도 종목당 수 마이크로초로 끝납니다.
+
+각 창은 마지막 (창 길이 - 1)개의 확정된 봉만 담고, 당일 봉 하나를 더하면
+TechnicalAnalyzer.get_latest_indicators와 같은 값이 됩니다 (워밍업의 창 집계와 같은 구성).
+"""
+
+import json
+import math
+import os
+import threading
+from collections import deque
+from datetime import date
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from stock_analyzer.analyzers.indicator_engine import IndicatorEngine
+from stock_analyzer.config import AnalysisSettings, get_settings
+from stock_analyzer.utils.logger import LoggerMixin
+
+# Parquet 스키마 메타데이터 키 (상태를 만든 창 설정)
+_WINDOWS_KEY = b'windows'
+
+# 이동 평균/분산의 부동소수점 오차를 버퍼에서 다시 계산해 없애는 주기 (갱신 횟수)
+_RESYNC_INTERVAL = 256
+
+# 저점 상승 판단에 쓰는 최근 확정 저가 수 (당일 포함 min_low5 / 그 전 5일 min_low_prev5)
+_LOW_HISTORY = 9
+
+_FIELDS = ('시가', '고가', '저가', '종가', '거래량')
+
+
+class RollingWindow:
+    """
+    길이 고정 이동 창의 평균과 편차 제곱합 (Welford 누적기에 새 값을 더하고 가장 오래된 값을 뺌)
+
+    창 길이와 무관하게 값 하나당 상수 시간이며, 오차가 쌓이지 않도록 주기적으로 버퍼에서 다시 계산합니다.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values: deque = deque(maxlen=size)
+        self.mean = 0.0
+        self.m2 = 0.0
+        self._updates = 0
+
+    def push(self, value: float):
+        if self.size == 0:
+            return
+        if len(self.values) < self.size:
+            self.values.append(value)
+            delta = value - self.mean
+            self.mean += delta / len(self.values)
+            self.m2 += delta * (value - self.mean)
+        else:
+            old = self.values[0]
+            self.values.append(value)
+            mean = self.mean + (value - old) / self.size
+            self.m2 += (value - old) * (value - mean + old - self.mean)
+            self.mean = mean
+
+        self._updates += 1
+        if self._updates % _RESYNC_INTERVAL == 0:
+            self.resync()
+
+    def resync(self):
+        """버퍼에서 평균/편차 제곱합을 다시 계산합니다"""
+        if not self.values:
+            self.mean = self.m2 = 0.0
+            return
+        values = np.fromiter(self.values, dtype=np.float64, count=len(self.values))
+        self.mean = float(values.mean())
+        self.m2 = float(((values - self.mean) ** 2).sum())
+
+    def mean_with(self, value: float) -> float:
+        """창에 value 하나를 더한 평균"""
+        n = len(self.values)
+        return (self.mean * n + value) / (n + 1)
+
+    def std_with(self, value: float, ddof: int = 1) -> float:
+        """창에 value 하나를 더한 표준편차"""
+        n = len(self.values) + 1
+        if n <= ddof:
+            return float('nan')
+        delta = value - self.mean
+        m2 = self.m2 + delta * (value - (self.mean + delta / n))
+        return math.sqrt(max(m2, 0.0) / (n - ddof))
+
+
+class MonotonicWindow:
+    """단조 덱으로 유지하는 길이 고정 이동 창의 최댓값(또는 최솟값) - 값 하나당 분할 상환 상수 시간"""
+
+    def __init__(self, size: int, largest: bool = True):
+        self.size = size
+        self.largest = largest
+        self._deque: deque = deque()  # (순번, 값) - 값이 단조 감소(최댓값) / 증가(최솟값)
+        self._seq = 0
+
+    def push(self, value: float):
+        if self.size == 0:
+            return
+        dominated = (lambda v: v <= value) if self.largest else (lambda v: v >= value)
+        while self._deque and dominated(self._deque[-1][1]):
+            self._deque.pop()
+        self._deque.append((self._seq, value))
+        self._seq += 1
+        while self._deque[0][0] <= self._seq - 1 - self.size:
+            self._deque.popleft()
+
+    @property
+    def value(self) -> float:
+        """창의 최댓값/최솟값 (비어 있으면 NaN)"""
+        return self._deque[0][1] if self._deque else float('nan')
+
+    def value_with(self, value: float) -> float:
+        """창에 value 하나를 더한 최댓값/최솟값"""
+        if not self._deque:
+            return value
+        return max(self.value, value) if self.largest else min(self.value, value)
+
+
+class IndicatorState:
+    """
+    종목 하나의 스트리밍 지표 상태 (확정된 봉 기준)
+
+    push()는 확정된 봉을 하나 반영하고, peek()은 당일 봉을 더한 최신 지표를 상태 변경 없이 계산합니다.
+    """
+
+    def __init__(self, settings: Optional[AnalysisSettings] = None):
+        """
+        Args:
+            settings: 분석 설정 (None이면 전역 설정)
+        """
+        config = settings or get_settings().analysis
+        self.settings = config
+        self.required_bars = IndicatorEngine(config).required_bars
+
+        # 확정된 봉 (창 길이 - 1)개 집계
+        self.close_short = RollingWindow(config.ma_period_short - 1)
+        self.close_long = RollingWindow(config.ma_period_long - 1)
+        self.volume_short = RollingWindow(config.ma_period_short - 1)
+        self.volume_long = RollingWindow(config.volume_window - 1)
+        self.candle_short = RollingWindow(config.ma_period_short - 1)
+        self.candle_long = RollingWindow(config.volatility_window - 1)
+        self.high_long = MonotonicWindow(config.ma_period_long - 1, largest=True)
+        self.low_long = MonotonicWindow(config.ma_period_long - 1, largest=False)
+        self.lows: deque = deque(maxlen=_LOW_HISTORY)
+
+        self.prev_volume = float('nan')
+        self.last_date: Optional[date] = None
+        self.count = 0  # 지금까지 반영한 확정 봉 수
+
+    def push(self, open_: float, high: float, low: float, close: float, volume: float, session: date):
+        """확정된 봉 하나를 반영합니다 (분할 상환 상수 시간)"""
+        candle = high - low
+        self.close_short.push(close)
+        self.close_long.push(close)
+        self.volume_short.push(volume)
+        self.volume_long.push(volume)
+        self.candle_short.push(candle)
+        self.candle_long.push(candle)
+        self.high_long.push(high)
+        self.low_long.push(low)
+        self.lows.append(low)
+
+        self.prev_volume = volume
+        self.last_date = session
+        self.count += 1
+
+    @property
+    def ready(self) -> bool:
+        """당일 봉 하나를 더하면 최신 지표를 계산할 수 있는지 (데이터프레임 경로의 최소 길이 기준)"""
+        return self.count + 1 >= self.required_bars
+
+    def peek(self, open_: float, high: float, low: float, close: float, volume: float) -> Optional[Dict]:
+        """
+        당일 봉을 더한 최신 지표 (상태는 바꾸지 않음)
+
+        Returns:
+            get_latest_indicators와 같은 형식의 지표 딕셔너리 (이력이 부족하면 None)
+        """
+        if not self.ready:
+            return None
+        lows = list(self.lows)
+        return {
+            # 가격
+            'close': float(close),
+            'open': float(open_),
+            'high': float(high),
+            'low': float(low),
+
+            # 거래량
+            'volume_today': float(volume),
+            'volume_prev': float(self.prev_volume),
+
+            # 이동평균
+            'MA5': self.close_short.mean_with(close),
+            'MA20': self.close_long.mean_with(close),
+
+            # 거래량 평균
+            'vol_avg5': self.volume_short.mean_with(volume),
+            'vol_avg20': self.volume_long.mean_with(volume),
+
+            # 고저가
+            'high20': float(self.high_long.value_with(high)),
+            'low20': float(self.low_long.value_with(low)),
+            'min_low5': float(min(lows[-4:] + [low])),
+            'min_low_prev5': float(min(lows[-9:-4])),
+
+            # 변동성
+            'volatility5': self.candle_short.std_with(high - low),
+            'volatility20': self.candle_long.std_with(high - low),
+
+            # 수익률
+            'today_return': float((close - open_) / max(open_, 1e-9) * 100),
+
+            # 캔들
+            'body': float(close - open_),
+            'candle_range': float(max(high - low, 1e-9)),
+        }
+
+    # ==================== 저장 ====================
+
+    @property
+    def history(self) -> int:
+        """복원에 필요한 마지막 확정 봉 수"""
+        config = self.settings
+        return max(
+            config.ma_period_short, config.ma_period_long,
+            config.volume_window, config.volatility_window, _LOW_HISTORY + 1
+        ) - 1
+
+    def to_record(self) -> Dict:
+        """저장용 레코드 (누적기 값과 각 창의 버퍼)"""
+        windows = {
+            name: getattr(self, name)
+            for name in ('close_short', 'close_long', 'volume_short', 'volume_long', 'candle_short', 'candle_long')
+        }
+        record = {
+            'last_date': self.last_date,
+            'count': self.count,
+            'prev_volume': self.prev_volume,
+            'lows': list(self.lows),
+            'highs_long': [value for _, value in self.high_long._deque],
+            'high_seq': [seq - self.high_long._seq for seq, _ in self.high_long._deque],
+            'lows_long': [value for _, value in self.low_long._deque],
+            'low_seq': [seq - self.low_long._seq for seq, _ in self.low_long._deque],
+        }
+        for name, window in windows.items():
+            record[f'{name}_values'] = list(window.values)
+            record[f'{name}_mean'] = window.mean
+            record[f'{name}_m2'] = window.m2
+        return record
+
+    @classmethod
+    def from_record(cls, record: Dict, settings: Optional[AnalysisSettings] = None) -> 'IndicatorState':
+        """저장된 레코드에서 상태 복원"""
+        state = cls(settings)
+        for name in ('close_short', 'close_long', 'volume_short', 'volume_long', 'candle_short', 'candle_long'):
+            window = getattr(state, name)
+            window.values.extend(float(v) for v in record[f'{name}_values'])
+            window.mean = float(record[f'{name}_mean'])
+            window.m2 = float(record[f'{name}_m2'])
+        for window, values, seqs in (
+            (state.high_long, record['highs_long'], record['high_seq']),
+            (state.low_long, record['lows_long'], record['low_seq']),
+        ):
+            window._deque.extend((int(seq), float(value)) for seq, value in zip(seqs, values))
+        state.lows.extend(float(v) for v in record['lows'])
+        state.prev_volume = float(record['prev_volume'])
+        state.last_date = record['last_date']
+        state.count = int(record['count'])
+        return state
+
+
+class IndicatorStateBook(LoggerMixin):
+    """
+    전종목 스트리밍 지표 상태 모음
+
+    advance()는 종목의 이력 데이터프레임에서 상태의 마지막 날짜 이후 봉만 반영하고,
+    save()/load()로 Parquet 파일 하나에 보관하여 다음 실행에서 이어 갑니다.
+    """
+
+    def __init__(self, settings: Optional[AnalysisSettings] = None):
+        self.settings = settings or get_settings().analysis
+        self.states: Dict[str, IndicatorState] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self.states
+
+    def advance(self, ticker: str, df: pd.DataFrame) -> int:
+        """
+        이력 데이터프레임의 새 확정 봉을 반영합니다.
+
+        상태의 마지막 날짜가 데이터프레임에 없으면(처음 보는 종목, 오래 갱신하지 않은 상태)
+        데이터프레임 전체로 다시 만듭니다.
+
+        Args:
+            ticker: 종목 코드
+            df: 확정된 봉만 담은 OHLCV 데이터프레임 (Date 인덱스, 한글 컬럼)
+
+        Returns:
+            반영한 봉 수
+        """
+        df = df.dropna(subset=list(_FIELDS))
+        if df.empty:
+            return 0
+        dates = df.index.date
+        state = self.states.get(ticker)
+        if state is not None and state.last_date is not None and state.last_date in set(dates):
+            start = int(np.searchsorted(dates, state.last_date, side='right'))
+        else:
+            state = IndicatorState(self.settings)
+            start = 0
+
+        values = df[list(_FIELDS)].to_numpy(np.float64)
+        for i in range(start, len(df)):
+            state.push(*values[i], dates[i])
+
+        with self._lock:
+            self.states[ticker] = state
+        return len(df) - start
+
+    def peek(self, ticker: str, bar: pd.Series) -> Optional[Dict]:
+        """당일 봉(한글 컬럼 Series)을 더한 최신 지표 (상태가 없거나 이력이 부족하면 None)"""
+        state = self.states.get(ticker)
+        if state is None:
+            return None
+        return state.peek(*(float(bar[column]) for column in _FIELDS))
+
+    def peek_all(self, bars: pd.DataFrame, session: date) -> Dict[str, Dict]:
+        """
+        전종목 당일 스냅샷(티커 인덱스, 한글 컬럼)을 더한 최신 지표
+
+        당일 거래가 없거나(거래정지) 상태가 당일 이전까지 확정되지 않은 종목은 제외합니다.
+        """
+        results = {}
+        values = bars[list(_FIELDS)].to_numpy(np.float64)
+        for ticker, row in zip(bars.index, values):
+            state = self.states.get(ticker)
+            if state is None or state.last_date is None or state.last_date >= session or not row[4] > 0:
+                continue
+            indicators = state.peek(*row)
+            if indicators is not None:
+                results[ticker] = indicators
+        return results
+
+    # ==================== 저장 ====================
+
+    def _windows(self) -> str:
+        config = self.settings
+        return json.dumps([
+            config.ma_period_short, config.ma_period_long, config.volume_window, config.volatility_window
+        ])
+
+    def save(self, path: str):
+        """상태를 Parquet 파일로 저장합니다 (임시 파일 기록 후 교체)"""
+        records = [dict(code=ticker, **state.to_record()) for ticker, state in self.states.items()]
+        table = pa.Table.from_pylist(records) if records else pa.table({'code': pa.array([], pa.string())})
+        metadata = dict(table.schema.metadata or {})
+        metadata[_WINDOWS_KEY] = self._windows().encode()
+        table = table.replace_schema_metadata(metadata)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, settings: Optional[AnalysisSettings] = None) -> 'IndicatorStateBook':
+        """
+        저장된 상태를 불러옵니다.
+
+        파일이 없거나 읽을 수 없거나 창 설정이 바뀌었으면 빈 상태에서 시작합니다.
+        """
+        book = cls(settings)
+        path = Path(path)
+        if not path.exists():
+            return book
+        try:
+            table = pq.read_table(path)
+        except Exception as e:
+            book.logger.warning(f"지표 상태 파일 읽기 오류 - 새로 계산: {e}")
+            return book
+        if (table.schema.metadata or {}).get(_WINDOWS_KEY, b'').decode() != book._windows():
+            book.logger.info("지표 창 설정이 바뀌어 저장된 상태를 사용하지 않음")
+            return book
+
+        for record in table.to_pylist():
+            book.states[record['code']] = IndicatorState.from_record(record, book.settings)
+        return book
@@ -8,7 +8,11 @@ from typing import Optional, Dict
 from datetime import datetime, timedelta
 import pandas as pd
 
+from stock_analyzer.analyzers.indicator_engine import IndicatorEngine
+from stock_analyzer.analyzers.indicator_graph import IndicatorResolver, default_registry
+from stock_analyzer.analyzers.lookback import LookbackPlanner
 from stock_analyzer.utils.data_provider import DataProvider
+from stock_analyzer.utils.market_panel import MarketPanel
 from stock_analyzer.config import get_settings
 from stock_analyzer.utils.logger import LoggerMixin
 
@@ -23,59 +27,50 @@ class TechnicalAnalyzer(LoggerMixin):
         """
         self.data_provider = data_provider
         self.settings = get_settings().analysis
+        self.engine = IndicatorEngine(self.settings)
+        self.resolver = IndicatorResolver(default_registry(self.settings))
+        self.planner = LookbackPlanner(self.settings, registry=self.resolver.registry)
 
     def fetch_and_analyze(
         self,
         ticker: str,
-        days: Optional[int] = None
+        days: Optional[int] = None,
+        bars: Optional[int] = None
     ) -> Optional[pd.DataFrame]:
         """
         데이터를 가져와서 기술적 지표를 계산합니다.
 
         Args:
             ticker: 종목 코드
-            days: 조회 기간 (일)
+            days: 조회 기간 (달력일, 주어지면 bars 대신 사용)
+            bars: 필요한 거래일 수 (None이면 최신 지표 계산에 필요한 거래일 수)
 
         Returns:
             지표가 추가된 데이터프레임
         """
-        days = days or self.settings.lookback_days
         end_date = datetime.now().date()
-        start_date = end_date - timedelta(days=days)
 
-        # 데이터 조회
-        df = self.data_provider.fetch_ohlcv(ticker, start_date, end_date)
+        # 데이터 조회 (계획한 기간에서 봉이 부족하면 기간을 넓혀 다시 조회)
+        if days:
+            df = self.data_provider.fetch_ohlcv(ticker, end_date - timedelta(days=days), end_date)
+        else:
+            df = self.planner.fetch(self.data_provider, ticker, end_date, bars or self.required_bars)
         if df is None or df.empty:
             return None
 
         # 지표 계산
-        df = self._calculate_indicators(df)
+        df = self._calculate_indicators(df, ticker)
         return df.dropna()
 
-    def _calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
-        """기술적 지표를 계산합니다"""
-        df = df.copy()
-
-        # 이동평균
-        df['MA5'] = df['종가'].rolling(self.settings.ma_period_short).mean()
-        df['MA20'] = df['종가'].rolling(self.settings.ma_period_long).mean()
-
-        # 거래량 평균
-        df['vol_avg5'] = df['거래량'].rolling(self.settings.ma_period_short).mean()
-        df['vol_avg20'] = df['거래량'].rolling(self.settings.volume_window).mean()
-
-        # 20일 고가
-        df['high20'] = df['고가'].rolling(self.settings.ma_period_long).max()
-        df['low20'] = df['저가'].rolling(self.settings.ma_period_long).min()
-
-        # 변동성
-        df['volatility5'] = (df['고가'] - df['저가']).rolling(self.settings.ma_period_short).std()
-        df['volatility20'] = (df['고가'] - df['저가']).rolling(self.settings.volatility_window).std()
-
-        # 가격 변동률
-        df['price_change'] = df['종가'].pct_change()
+    def _calculate_indicators(self, df: pd.DataFrame, ticker: Optional[str] = None) -> pd.DataFrame:
+        """
+        기술적 지표를 계산합니다.
 
-        return df
+        입력 데이터프레임은 캐시와 공유하는 읽기 전용 프레임일 수 있으므로 수정하지 않습니다.
+        지표는 IndicatorResolver로 별도 배열에 계산하고(종목 코드가 있으면 같은 실행의
+        다른 경로와 결과 공유), 원본 컬럼 배열(복사 없음)과 함께 새 데이터프레임으로 묶습니다.
+        """
+        return self.resolver.frame(ticker, df)
 
     def get_latest_indicators(self, ticker: str) -> Optional[Dict]:
         """
@@ -91,55 +86,34 @@ class TechnicalAnalyzer(LoggerMixin):
         if df is None or len(df) < self.settings.ma_period_long + 1:
             return None
 
-        last = df.iloc[-1]
-        prev = df.iloc[-2]
-
-        # 최근 5일, 10일 저가
-        low5 = df['저가'].tail(5)
-        low10_prev5 = df['저가'].tail(10).head(5)
-
-        # 캔들 정보
-        candle_range = max(last['고가'] - last['저가'], 1e-9)
-        body = last['종가'] - last['시가']
+        return self.resolver.latest(ticker, df)
 
-        indicators = {
-            # 가격
-            'close': float(last['종가']),
-            'open': float(last['시가']),
-            'high': float(last['고가']),
-            'low': float(last['저가']),
-
-            # 거래량
-            'volume_today': float(last['거래량']),
-            'volume_prev': float(prev['거래량']),
-
-            # 이동평균
-            'MA5': float(last['MA5']),
-            'MA20': float(last['MA20']),
-
-            # 거래량 평균
-            'vol_avg5': float(last['vol_avg5']),
-            'vol_avg20': float(last['vol_avg20']),
-
-            # 고저가
-            'high20': float(last['high20']),
-            'low20': float(last['low20']),
-            'min_low5': float(low5.min()),
-            'min_low_prev5': float(low10_prev5.min() if len(low10_prev5) > 0 else low5.min()),
+    def get_panel_indicators(self, panel: MarketPanel) -> Dict[str, Dict]:
+        """
+        패널의 모든 종목에 대해 최신 지표를 계산합니다.
 
-            # 변동성
-            'volatility5': float(last['volatility5']),
-            'volatility20': float(last['volatility20']),
+        종목별 데이터프레임을 만들지 않고 IndicatorEngine으로 전종목을 한 번에 계산하며,
+        결과는 get_latest_indicators와 같은 형식입니다.
 
-            # 수익률
-            'today_return': float((last['종가'] - last['시가']) / max(last['시가'], 1e-9) * 100),
+        Args:
+            panel: 시장 패널
 
-            # 캔들
-            'body': float(body),
-            'candle_range': float(candle_range),
+        Returns:
+            종목 코드 -> 지표 딕셔너리 (데이터가 부족한 종목은 제외)
+        """
+        tickers, latest = self.engine.latest_from_panel(panel)
+        if not tickers:
+            return {}
+        columns = {name: values.tolist() for name, values in latest.items()}
+        return {
+            ticker: {name: values[i] for name, values in columns.items()}
+            for i, ticker in enumerate(tickers)
         }
 
-        return indicators
+    @property
+    def required_bars(self) -> int:
+        """최신 지표 계산에 필요한 최소 거래일 수 (이보다 긴 이력은 결과에 영향 없음)"""
+        return self.planner.required_bars
 
     @staticmethod
     def calculate_volatility(df: pd.DataFrame, window: int) -> Optional[float]:
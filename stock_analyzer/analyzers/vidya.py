@@ -0,0 +1,208 @@
+"""
+VIDYA / Volumatic VIDYA 커널
+
+NumPy 배열(1차원: 종목 하나, 2차원: 종목 × 거래일)에서 CMO, VIDYA, Volumatic VIDYA를 계산합니다.
+CMO는 한 번만 계산해 두 평균이 함께 사용하며, 봉마다 이전 값에 의존하는 재귀 단계는
+numba가 설치되어 있으면 JIT 컴파일한 루프로, 없으면 종목 축 전체를 한 번에 갱신하는
+거래일 루프(거래일 수만큼만 반복)로 계산합니다.
+"""
+
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from stock_analyzer.analyzers.rolling import pack_valid, rolling_mean, rolling_sum
+
+if TYPE_CHECKING:  # 패널 모듈은 데이터 제공자(pykrx)와 설정을 불러오므로 독립 스크립트에서는 가져오지 않음
+    from stock_analyzer.utils.market_panel import MarketPanel
+
+try:
+    from numba import njit
+except ImportError:  # numba는 선택 의존성
+    njit = None
+
+JIT_AVAILABLE = njit is not None
+
+
+# ==================== 재귀 단계 ====================
+
+def _adaptive_average_numpy(values: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+    """거래일 루프 (종목 축은 벡터 연산)"""
+    out = np.empty_like(values)
+    out[:, 0] = values[:, 0]
+    for t in range(1, values.shape[1]):
+        prev = out[:, t - 1]
+        a = alpha[:, t]
+        step = a * values[:, t] + (1 - a) * prev
+        out[:, t] = np.where(np.isnan(prev), values[:, t], np.where(np.isnan(a), prev, step))
+    return out
+
+
+if JIT_AVAILABLE:
+    @njit(cache=True)
+    def _adaptive_average_jit(values, alpha):  # pragma: no cover - numba 설치 환경에서만 실행
+        rows, cols = values.shape
+        out = np.empty_like(values)
+        for i in range(rows):
+            prev = values[i, 0]
+            out[i, 0] = prev
+            for t in range(1, cols):
+                a = alpha[i, t]
+                if np.isnan(prev):
+                    prev = values[i, t]
+                elif not np.isnan(a):
+                    prev = a * values[i, t] + (1.0 - a) * prev
+                out[i, t] = prev
+        return out
+
+
+def adaptive_average(values: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+    """
+    가변 계수 지수 이동평균: out[t] = a[t] * x[t] + (1 - a[t]) * out[t-1]
+
+    a[t]가 NaN이면 이전 값을 유지하고, 이전 값이 없으면(앞부분 결측) 그 봉의 값에서 시작합니다.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    alpha = np.asarray(alpha, dtype=np.float64)
+    flat = values.ndim == 1
+    values2d, alpha2d = np.atleast_2d(values), np.atleast_2d(alpha)
+    if values2d.shape[1] == 0:
+        return values.copy()
+
+    if JIT_AVAILABLE:
+        out = _adaptive_average_jit(np.ascontiguousarray(values2d), np.ascontiguousarray(alpha2d))
+    else:
+        out = _adaptive_average_numpy(values2d, alpha2d)
+    return out[0] if flat else out
+
+
+# ==================== 지표 ====================
+
+def cmo(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Chande Momentum Oscillator (-100 ~ 100, 앞부분 period개는 NaN)"""
+    close = np.asarray(close, dtype=np.float64)
+    delta = np.diff(close, axis=-1, prepend=np.nan)
+    up_sum = rolling_sum(np.where(delta > 0, delta, np.where(np.isnan(delta), np.nan, 0.0)), period)
+    down_sum = rolling_sum(np.where(delta < 0, -delta, np.where(np.isnan(delta), np.nan, 0.0)), period)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return 100 * (up_sum - down_sum) / (up_sum + down_sum)
+
+
+def volume_ratio(volume: np.ndarray, period: int = 14, cap: float = 2.0) -> np.ndarray:
+    """거래량 / period일 평균 거래량 (cap으로 상한 제한)"""
+    volume = np.asarray(volume, dtype=np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.minimum(volume / rolling_mean(volume, period), cap)
+
+
+def vidya(
+    close: np.ndarray,
+    period: int = 14,
+    cmo_period: int = 14,
+    cmo_values: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    VIDYA (Variable Index Dynamic Average) - CMO 절댓값으로 평활 계수를 조절하는 이동평균
+
+    Args:
+        close: 종가 (1차원 또는 종목 × 거래일)
+        period: 기준 지수 이동평균 기간
+        cmo_period: CMO 기간
+        cmo_values: 미리 계산한 CMO (None이면 계산)
+    """
+    if cmo_values is None:
+        cmo_values = cmo(close, cmo_period)
+    alpha = 2 / (period + 1) * np.abs(cmo_values) / 100
+    return adaptive_average(close, alpha)
+
+
+def volumatic_vidya(
+    close: np.ndarray,
+    volume: np.ndarray,
+    period: int = 14,
+    cmo_period: int = 14,
+    cmo_values: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Volumatic VIDYA - VIDYA 평활 계수에 거래량 비율(최대 2배)을 곱한 이동평균 (계수 상한 1)
+
+    Args:
+        close: 종가 (1차원 또는 종목 × 거래일)
+        volume: 거래량 (close와 같은 모양)
+        period: 기준 지수 이동평균 / 평균 거래량 기간
+        cmo_period: CMO 기간
+        cmo_values: 미리 계산한 CMO (None이면 계산)
+    """
+    if cmo_values is None:
+        cmo_values = cmo(close, cmo_period)
+    alpha = 2 / (period + 1) * np.abs(cmo_values) / 100 * volume_ratio(volume, period)
+    return adaptive_average(close, np.minimum(alpha, 1.0))
+
+
+def vidya_bundle(
+    close: np.ndarray,
+    volume: np.ndarray,
+    period: int = 14,
+    cmo_period: int = 14
+) -> Dict[str, np.ndarray]:
+    """CMO를 한 번 계산해 CMO/VIDYA/Volumatic VIDYA를 함께 반환합니다"""
+    cmo_values = cmo(close, cmo_period)
+    return {
+        'CMO': cmo_values,
+        'VIDYA': vidya(close, period, cmo_values=cmo_values),
+        'Volumatic_VIDYA': volumatic_vidya(close, volume, period, cmo_values=cmo_values),
+    }
+
+
+# ==================== 전종목 ====================
+
+def _right_aligned(panel: 'MarketPanel') -> Tuple[np.ndarray, np.ndarray]:
+    """결측 거래일을 건너뛰고 종목마다 유효한 봉을 오른쪽 끝에 모은 (종가, 거래량) 배열 (앞부분 NaN)"""
+    valid = ~np.isnan(panel.close)
+    _, order = pack_valid(valid, valid.shape[1])
+    filled = np.take_along_axis(valid, order, axis=1)
+    close = np.take_along_axis(panel.close.astype(np.float64), order, axis=1)
+    volume = np.take_along_axis(panel.volume.astype(np.float64), order, axis=1)
+    close[~filled] = np.nan
+    volume[~filled] = np.nan
+    return close, volume
+
+
+def volumatic_vidya_screen(
+    panel: 'MarketPanel',
+    period: int = 20,
+    cmo_period: int = 14
+) -> pd.DataFrame:
+    """
+    전종목 Volumatic VIDYA 스크린
+
+    Args:
+        panel: 시장 패널
+        period: VIDYA 기간
+        cmo_period: CMO 기간
+
+    Returns:
+        종목코드 인덱스 데이터프레임
+        (close, VIDYA, Volumatic_VIDYA, CMO, gap_pct: 종가의 Volumatic VIDYA 대비 괴리율,
+         cross_up: 직전 봉에는 아래, 마지막 봉에는 위)
+    """
+    columns = ['close', 'VIDYA', 'Volumatic_VIDYA', 'CMO', 'gap_pct', 'cross_up']
+    if len(panel) == 0 or panel.shape[1] < 2:
+        return pd.DataFrame(columns=columns)
+
+    close, volume = _right_aligned(panel)
+    bundle = vidya_bundle(close, volume, period, cmo_period)
+    line = bundle['Volumatic_VIDYA']
+    with np.errstate(invalid='ignore'):
+        cross_up = (close[:, -2] <= line[:, -2]) & (close[:, -1] > line[:, -1])
+        gap = (close[:, -1] / line[:, -1] - 1) * 100
+
+    return pd.DataFrame({
+        'close': close[:, -1],
+        'VIDYA': bundle['VIDYA'][:, -1],
+        'Volumatic_VIDYA': line[:, -1],
+        'CMO': bundle['CMO'][:, -1],
+        'gap_pct': gap,
+        'cross_up': cross_up,
+    }, index=pd.Index(panel.tickers, name='Code')).dropna(subset=['Volumatic_VIDYA'])
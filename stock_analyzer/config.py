@@ -5,7 +5,8 @@
 환경 변수를 통해 설정을 주입받으며, Pydantic을 사용하여 유효성을 검증합니다.
 """
 
-from typing import Optional
+from datetime import date
+from typing import Any, Dict, List, Optional
 from pydantic import BaseSettings, Field, validator
 from pathlib import Path
 
@@ -68,6 +69,7 @@ class TelegramSettings(BaseSettings):
     token: str = Field(..., env='TELEGRAM_TOKEN', description="텔레그램 봇 토큰")
     chat_id: str = Field(..., env='TELEGRAM_CHAT_ID', description="텔레그램 채팅 ID")
     max_message_length: int = Field(default=4096, description="최대 메시지 길이")
+    outbox: Optional[str] = Field(default=None, description="설정 시 전송 대신 이 JSONL 파일에 기록 (오프라인 실행)")
 
     class Config:
         env_prefix = "TELEGRAM_"
@@ -103,27 +105,160 @@ class ScreeningSettings(BaseSettings):
 class AnalysisSettings(BaseSettings):
     """분석 설정"""
 
-    lookback_days: int = Field(default=120, ge=30, le=365, description="데이터 조회 기간 (일)")
+    lookback_days: Optional[int] = Field(default=None, ge=30, le=365, description="고정 조회 기간 (달력일, 없으면 지표에 필요한 거래일 수로 계산)")
+    lookback_margin_bars: int = Field(default=20, ge=0, le=120, description="지표에 필요한 거래일 수에 더할 여유 거래일 수 (달력에 없는 휴장일, 거래정지, 당일 봉 지연 대비)")
     ma_period_short: int = Field(default=5, ge=3, le=20, description="단기 이동평균 기간")
     ma_period_long: int = Field(default=20, ge=10, le=60, description="장기 이동평균 기간")
     volume_window: int = Field(default=20, ge=5, le=60, description="거래량 평균 계산 기간")
     volatility_window: int = Field(default=20, ge=5, le=60, description="변동성 계산 기간")
+    indicator_cache_size: int = Field(default=20000, ge=0, le=1000000, description="지표 메모이제이션 최대 항목 수 (0이면 비활성화)")
 
     class Config:
         env_prefix = "ANALYSIS_"
 
 
+class ProviderSettings(BaseSettings):
+    """데이터 제공자 설정"""
+
+    type: str = Field(default="fdr", description="데이터 제공자 (fdr/pykrx/krx_snapshot/hedged/synthetic)")
+    hedge_quantile: float = Field(default=0.95, ge=0.5, le=0.999, description="보조 요청을 보내는 지연 분위수")
+    hedge_min_delay: float = Field(default=0.2, ge=0.0, le=30.0, description="보조 요청 최소 대기 시간 (초)")
+    hedge_initial_delay: float = Field(default=1.0, ge=0.0, le=30.0, description="지연 기록이 쌓이기 전 보조 요청 대기 시간 (초)")
+    failure_threshold: int = Field(default=5, ge=1, le=100, description="연속 실패 시 강등 기준 횟수")
+    demote_seconds: int = Field(default=300, ge=10, le=3600, description="강등 유지 시간 (초)")
+    max_workers: int = Field(default=64, ge=2, le=512, description="헤지 요청 스레드 수")
+    retry_attempts: int = Field(default=3, ge=1, le=10, description="일시적 오류 최대 시도 횟수")
+    retry_base_delay: float = Field(default=0.5, ge=0.0, le=10.0, description="재시도 기본 대기 시간 (초, 지수 증가/지터)")
+    retry_max_delay: float = Field(default=8.0, ge=0.0, le=60.0, description="재시도 최대 대기 시간 (초)")
+    breaker_threshold: int = Field(default=5, ge=1, le=100, description="서킷 브레이커를 여는 연속 실패 횟수")
+    breaker_reset_seconds: float = Field(default=30.0, ge=1.0, le=600.0, description="서킷 열림 유지 시간 (초)")
+
+    class Config:
+        env_prefix = "PROVIDER_"
+
+
 class CacheSettings(BaseSettings):
     """캐시 설정"""
 
     enabled: bool = Field(default=True, description="캐시 사용 여부")
     ttl_seconds: int = Field(default=3600, ge=60, le=86400, description="캐시 TTL (초)")
-    max_size: int = Field(default=1000, ge=100, le=10000, description="최대 캐시 크기")
+    max_size: int = Field(default=1000, ge=100, le=10000, description="최대 캐시 크기 (max_memory_mb=0일 때 항목 수 제한)")
+    max_memory_mb: int = Field(default=256, ge=0, le=8192, description="캐시 메모리 한도 (MB, 0이면 항목 수 제한)")
+    pin_universe: bool = Field(default=False, description="스크리닝 대상 종목을 캐시에 고정")
 
     class Config:
         env_prefix = "CACHE_"
 
 
+class StoreSettings(BaseSettings):
+    """OHLCV 디스크 저장소 설정"""
+
+    enabled: bool = Field(default=True, description="디스크 저장소 사용 여부")
+    path: str = Field(default="data/ohlcv", description="티커별 Parquet 파일 디렉토리")
+
+    class Config:
+        env_prefix = "STORE_"
+
+
+class ArchiveSettings(BaseSettings):
+    """메모리 맵 OHLCV 아카이브 설정"""
+
+    enabled: bool = Field(default=True, description="아카이브 우선 조회 여부")
+    path: str = Field(default="data/archive", description="아카이브 루트 디렉토리")
+    lookback_days: int = Field(default=365, ge=30, le=3650, description="아카이브 보관 기간 (일)")
+
+    class Config:
+        env_prefix = "ARCHIVE_"
+
+
+class AsyncProviderSettings(BaseSettings):
+    """비동기 데이터 제공자 설정"""
+
+    base_url: str = Field(
+        default="https://api.finance.naver.com/siseJson.naver",
+        description="일봉 API 주소"
+    )
+    max_concurrency: int = Field(default=200, ge=1, le=1000, description="최대 동시 요청 수")
+    timeout: float = Field(default=10.0, ge=1.0, le=120.0, description="요청 타임아웃 (초)")
+
+    class Config:
+        env_prefix = "ASYNC_"
+
+
+class TickerSettings(BaseSettings):
+    """종목 마스터 설정"""
+
+    path: str = Field(default="data/ticker_master.parquet", description="종목 리스트 Parquet 파일 경로")
+
+    class Config:
+        env_prefix = "TICKER_"
+
+
+class GovernorSettings(BaseSettings):
+    """프로세스 간 요청 조율 설정"""
+
+    enabled: bool = Field(default=True, description="프로세스 간 요청 조율 사용 여부")
+    path: str = Field(default="", description="공유 상태 파일 디렉토리 (비우면 시스템 임시 디렉토리)")
+    stale_seconds: float = Field(default=120.0, ge=5.0, le=3600.0, description="응답 없는 프로세스의 요청 슬롯 회수 시간 (초)")
+
+    class Config:
+        env_prefix = "GOVERNOR_"
+
+
+class WarmupSettings(BaseSettings):
+    """장 시작 전 워밍업 설정"""
+
+    path: str = Field(default="data/warmup", description="준비 완료 표시/지표 저장 디렉토리")
+    max_workers: int = Field(default=16, ge=1, le=128, description="워밍업 병렬 처리 스레드 수")
+    timeout: int = Field(default=1800, ge=60, le=7200, description="워밍업 전체 타임아웃 (초)")
+
+    class Config:
+        env_prefix = "WARMUP_"
+
+
+class UniverseSettings(BaseSettings):
+    """스캔 종목군 설정"""
+
+    preset: str = Field(default="all", description="스크리너 기본 종목군 프리셋 (all/common/tradable 또는 presets에 정의한 이름)")
+    path: str = Field(default="data/universe.parquet", description="종목군 인덱스 Parquet 파일 경로")
+    turnover_days: int = Field(default=20, ge=1, le=120, description="평균 거래대금 계산 거래일 수")
+    min_turnover: float = Field(default=1_000_000_000, ge=0, description="tradable 프리셋의 최소 평균 거래대금 (원)")
+    presets: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="추가 프리셋 (JSON, 예: {\"liquid\": {\"instruments\": [\"common\"], \"exclude_halted\": true, \"min_turnover\": 5e9}})"
+    )
+
+    class Config:
+        env_prefix = "UNIVERSE_"
+
+
+class SyntheticSettings(BaseSettings):
+    """합성 데이터 제공자 설정 (부하 테스트)"""
+
+    tickers: int = Field(default=3000, ge=1, le=100000, description="합성 종목 수")
+    days: int = Field(default=500, ge=40, le=10000, description="종목별 이력 거래일 수")
+    seed: int = Field(default=0, description="난수 시드")
+    breakout_rate: float = Field(default=0.03, ge=0.0, le=1.0, description="A/B/C 패턴 주입 종목 비율")
+    latency: float = Field(default=0.0, ge=0.0, le=10.0, description="조회당 평균 지연 (초)")
+    error_rate: float = Field(default=0.0, ge=0.0, le=1.0, description="조회 실패 확률")
+
+    class Config:
+        env_prefix = "SYNTHETIC_"
+
+
+class ReplaySettings(BaseSettings):
+    """녹화/재생 설정 (오프라인 벤치마크)"""
+
+    mode: str = Field(default="off", description="off/record(실제 응답 녹화)/replay(녹화 응답만 사용)")
+    path: str = Field(default="data/cassettes/provider.zip", description="카세트 파일 경로")
+    latency: str = Field(default="none", description="재생 지연 (none/recorded/sampled)")
+    latency_scale: float = Field(default=1.0, ge=0.0, le=100.0, description="재생 지연 배율")
+    seed: int = Field(default=0, description="sampled 지연 난수 시드")
+
+    class Config:
+        env_prefix = "REPLAY_"
+
+
 class LoggingSettings(BaseSettings):
     """로깅 설정"""
 
@@ -147,6 +282,15 @@ class LoggingSettings(BaseSettings):
         env_prefix = "LOG_"
 
 
+class CalendarSettings(BaseSettings):
+    """거래일 달력 설정"""
+
+    extra_holidays: List[date] = Field(default_factory=list, description="추가 휴장일 (임시공휴일 등, JSON 목록)")
+
+    class Config:
+        env_prefix = "CALENDAR_"
+
+
 class FilePathSettings(BaseSettings):
     """파일 경로 설정"""
 
@@ -167,7 +311,18 @@ class Settings(BaseSettings):
     database: DatabaseSettings = DatabaseSettings()
     screening: ScreeningSettings = ScreeningSettings()
     analysis: AnalysisSettings = AnalysisSettings()
+    calendar: CalendarSettings = CalendarSettings()
+    provider: ProviderSettings = ProviderSettings()
     cache: CacheSettings = CacheSettings()
+    store: StoreSettings = StoreSettings()
+    archive: ArchiveSettings = ArchiveSettings()
+    ticker: TickerSettings = TickerSettings()
+    governor: GovernorSettings = GovernorSettings()
+    warmup: WarmupSettings = WarmupSettings()
+    universe: UniverseSettings = UniverseSettings()
+    replay: ReplaySettings = ReplaySettings()
+    synthetic: SyntheticSettings = SyntheticSettings()
+    async_provider: AsyncProviderSettings = AsyncProviderSettings()
     logging: LoggingSettings = LoggingSettings()
     file_paths: FilePathSettings = FilePathSettings()
 
@@ -28,7 +28,7 @@ class StockAnalyzerApp:
         self.settings = get_settings()
 
         # 컴포넌트 생성
-        self.data_provider = create_data_provider('fdr', use_cache=True)
+        self.data_provider = create_data_provider(self.settings.provider.type, use_cache=True)
         self.db = DatabaseManager()
         self.analyzer = TechnicalAnalyzer(self.data_provider)
         self.classifier = SignalClassifier()
@@ -51,6 +51,7 @@ class StockAnalyzerApp:
         print("2. 급등주 초기 포착 (A/B/C 등급 분류)")
         print("3. 통계 조회")
         print("4. 캐시 초기화")
+        print("5. 장 시작 전 워밍업 (전종목 이력 미리 조회)")
         print("0. 종료")
         print("="*60 + "\n")
 
@@ -90,6 +91,7 @@ class StockAnalyzerApp:
             volume_multiplier=volume_multiplier,
             max_workers=max_workers
         )
+        self._print_coverage()
 
         if not results:
             print("\n[결과] 조건을 만족하는 종목이 없습니다.")
@@ -129,8 +131,14 @@ class StockAnalyzerApp:
 
         print(f"\n[설정] 병렬 처리: {max_workers}개\n")
 
-        # 스크리닝 실행
-        results_by_grade = self.screener.screen_surge_stocks(max_workers=max_workers)
+        # 스크리닝 실행 (장중에는 당일 봉만 갱신하는 증분 모드)
+        from stock_analyzer.utils.intraday import is_market_hours
+        if is_market_hours():
+            print("[설정] 장중 증분 모드 (과거 이력 재사용, 당일 봉만 갱신)\n")
+            results_by_grade = self.screener.screen_surge_stocks_intraday(max_workers=max_workers)
+        else:
+            results_by_grade = self.screener.screen_surge_stocks(max_workers=max_workers)
+        self._print_coverage()
 
         results_a = results_by_grade['A']
         results_b = results_by_grade['B']
@@ -165,6 +173,16 @@ class StockAnalyzerApp:
             df.to_csv(filename, index=False, encoding='utf-8-sig')
             print(f"[저장] {filename}")
 
+    def _print_coverage(self):
+        """데이터 소스 장애로 스캔이 중단되었으면 분석 범위를 표시"""
+        result = self.screener.last_result
+        if result is not None and result.stopped:
+            print(
+                f"\n[경고] 데이터 소스 장애로 스캔 중단 - "
+                f"{result.processed}/{result.total}개 종목만 분석 ({result.coverage:.0%})"
+            )
+            print(f"[경고] {result.stopped}")
+
     async def _send_multiple_messages(self, messages):
         """여러 메시지를 순차적으로 전송"""
         stats = await self.notifier.send_long_message('\n\n'.join(messages))
@@ -186,7 +204,24 @@ class StockAnalyzerApp:
         from stock_analyzer.utils.data_provider import CachedDataProvider
         if isinstance(self.data_provider, CachedDataProvider):
             cache_stats = self.data_provider.get_cache_stats()
-            print(f"\n[캐시] {cache_stats['size']}/{cache_stats['maxsize']} (TTL: {cache_stats['ttl']}초)")
+            if cache_stats['max_bytes']:
+                print(
+                    f"\n[캐시] {cache_stats['size']}개 (고정 {cache_stats['pinned']}개), "
+                    f"{cache_stats['bytes'] / 1024 / 1024:.1f}/{cache_stats['max_bytes'] / 1024 / 1024:.0f}MB "
+                    f"(TTL: {cache_stats['ttl']}초)"
+                )
+            else:
+                print(f"\n[캐시] {cache_stats['size']}/{cache_stats['maxsize']} (TTL: {cache_stats['ttl']}초)")
+            print(
+                f"[캐시] 히트 {cache_stats['hits']} / 미스 {cache_stats['misses']} / "
+                f"대기 병합 {cache_stats['coalesced']}"
+            )
+
+        # 프로세스 간 요청 조율 현황 (다른 스크립트 포함)
+        from stock_analyzer.utils.request_governor import get_request_governor
+        governor = get_request_governor()
+        if governor is not None:
+            print(f"\n[요청 조율]\n{governor.format_report()}")
 
     def handle_cache_clear(self):
         """캐시 초기화"""
@@ -197,10 +232,24 @@ class StockAnalyzerApp:
         else:
             print("[캐시] 캐시가 활성화되어 있지 않습니다")
 
+    def handle_warmup(self):
+        """장 시작 전 워밍업 (이 프로세스의 캐시와 디스크 저장소를 채움)"""
+        from stock_analyzer.utils.warmup import MarketWarmup, format_readiness
+
+        print("\n[실행] 전종목 전일까지 이력을 미리 조회합니다...\n")
+        ready = MarketWarmup(self.data_provider, self.screener.ticker_master).run()
+        if ready['stopped']:
+            print(f"[경고] 데이터 소스 장애로 워밍업 중단 - {ready['warmed']}/{ready['tickers']}개 종목만 조회")
+        else:
+            print(f"[워밍업] {format_readiness(ready)} ({ready['seconds']}초)")
+
     def run(self):
         """메인 루프"""
         print("\n[시작] 주식 분석 프로그램을 시작합니다.")
 
+        from stock_analyzer.utils.warmup import load_readiness, format_readiness
+        print(f"[워밍업] {format_readiness(load_readiness())}")
+
         while True:
             try:
                 self.show_menu()
@@ -214,6 +263,8 @@ class StockAnalyzerApp:
                     self.handle_statistics()
                 elif choice == "4":
                     self.handle_cache_clear()
+                elif choice == "5":
+                    self.handle_warmup()
                 elif choice == "0":
                     print("\n[종료] 프로그램을 종료합니다.\n")
                     break
@@ -5,7 +5,10 @@
 """
 
 import asyncio
-from typing import List, Dict
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Optional
 from telegram import Bot
 
 from stock_analyzer.config import get_settings
@@ -15,12 +18,26 @@ from stock_analyzer.utils.logger import LoggerMixin
 class TelegramNotifier(LoggerMixin):
     """텔레그램 알림 클래스"""
 
-    def __init__(self):
-        """설정을 로드합니다"""
+    def __init__(self, outbox: Optional[str] = None):
+        """
+        설정을 로드합니다.
+
+        Args:
+            outbox: 전송 대신 메시지를 기록할 JSONL 파일 (None이면 설정값, 둘 다 없으면 실제 전송)
+        """
         telegram_config = get_settings().telegram
         self.token = telegram_config.token
         self.chat_id = telegram_config.chat_id
         self.max_length = telegram_config.max_message_length
+        outbox = outbox or telegram_config.outbox
+        self.outbox = Path(outbox) if outbox else None
+
+    def _write_outbox(self, message: str):
+        """오프라인 전송 - 메시지를 outbox 파일에 한 줄씩 기록"""
+        self.outbox.parent.mkdir(parents=True, exist_ok=True)
+        record = {'time': datetime.now().isoformat(), 'chat_id': self.chat_id, 'text': message}
+        with open(self.outbox, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
 
     async def send_message(self, message: str) -> bool:
         """
@@ -33,6 +50,11 @@ class TelegramNotifier(LoggerMixin):
             성공 여부
         """
         try:
+            if self.outbox is not None:
+                self._write_outbox(message)
+                self.logger.info(f"텔레그램 메시지 기록 ({len(message)}자): {self.outbox}")
+                return True
+
             bot = Bot(token=self.token)
             async with bot:
                 await bot.send_message(chat_id=self.chat_id, text=message)
@@ -65,7 +87,7 @@ class TelegramNotifier(LoggerMixin):
             self.logger.info(f"메시지 {i}/{len(chunks)} 전송 중... ({len(chunk)}자)")
             if await self.send_message(chunk):
                 success_count += 1
-                if i < len(chunks):
+                if i < len(chunks) and self.outbox is None:
                     await asyncio.sleep(delay)
             else:
                 self.logger.error(f"메시지 {i}/{len(chunks)} 전송 실패")
@@ -4,18 +4,39 @@
 주식 시장을 스캔하여 급등 가능성이 있는 종목을 찾습니다.
 """
 
-from typing import List, Dict, Optional, Callable
-from datetime import datetime
+import time
+from typing import List, Dict, Optional, Callable, Sequence
+from datetime import date, datetime, timedelta
+import numpy as np
 import pandas as pd
 
-from stock_analyzer.utils.data_provider import DataProvider
+from stock_analyzer.utils.data_provider import DataProvider, CachedDataProvider
 from stock_analyzer.analyzers.technical import TechnicalAnalyzer
-from stock_analyzer.analyzers.classifier import SignalClassifier
+from stock_analyzer.analyzers.classifier import SignalClassifier, SignalGrade
+from stock_analyzer.analyzers.indicator_graph import SERIES_INDICATORS
+from stock_analyzer.analyzers.streaming import IndicatorStateBook
 from stock_analyzer.database.operations import DatabaseManager
-from stock_analyzer.utils.parallel import ParallelProcessor
+from stock_analyzer.utils.parallel import ParallelProcessor, ProcessingResult
+from stock_analyzer.utils.resilience import (
+    DataSourceError, SourceUnavailableError, TransientSourceError
+)
+from stock_analyzer.utils.market_panel import MarketPanel
+from stock_analyzer.utils.ticker_master import TickerMaster
+from stock_analyzer.utils.universe import UniverseIndex
+from stock_analyzer.utils.warmup import load_readiness, load_state_book
+from stock_analyzer.utils.async_provider import AsyncDataProvider, fetch_panel
+from stock_analyzer.utils.intraday import IntradayPanel, SnapshotFetcher, default_snapshot_fetcher
 from stock_analyzer.utils.logger import LoggerMixin
 from stock_analyzer.config import get_settings
 
+# 데이터 소스 장애 오류 유형 (ProcessingError.error_type)
+_SOURCE_ERRORS = frozenset(
+    cls.__name__ for cls in (DataSourceError, TransientSourceError, SourceUnavailableError)
+)
+
+# MA 기준 스크리닝에 필요한 지표가 유효한 최근 거래일 수
+MA_SCREEN_HISTORY = 20
+
 
 class StockScreener(LoggerMixin):
     """통합 주식 스크리너"""
@@ -25,7 +46,9 @@ class StockScreener(LoggerMixin):
         data_provider: DataProvider,
         db_manager: DatabaseManager,
         analyzer: TechnicalAnalyzer,
-        classifier: SignalClassifier
+        classifier: SignalClassifier,
+        ticker_master: Optional[TickerMaster] = None,
+        universe_index: Optional[UniverseIndex] = None
     ):
         """
         Args:
@@ -33,19 +56,31 @@ class StockScreener(LoggerMixin):
             db_manager: 데이터베이스 관리자
             analyzer: 기술적 분석기
             classifier: 신호 분류기
+            ticker_master: 종목 마스터 (None이면 데이터 제공자의 종목 리스트 사용)
+            universe_index: 종목군 인덱스 (None이면 프리셋을 처음 사용할 때 생성)
         """
         self.data_provider = data_provider
         self.db = db_manager
         self.analyzer = analyzer
         self.classifier = classifier
+        self.ticker_master = ticker_master or TickerMaster.from_provider(data_provider)
         self.settings = get_settings()
+        self._universe_index = universe_index
+        self._state_cache: Optional[tuple] = None  # (거래일, 스트리밍 지표 상태)
+
+        # 마지막 스캔 처리 결과 (데이터 소스 장애로 중단된 경우 stopped/coverage 확인)
+        self.last_result: Optional[ProcessingResult] = None
+
+        # 장중 증분 패널 (첫 장중 분류 때 생성, 이후 당일 봉만 갱신)
+        self.intraday: Optional[IntradayPanel] = None
 
     def screen_by_ma_threshold(
         self,
         threshold: float,
         market: str = 'KRX',
         volume_multiplier: float = 1.0,
-        max_workers: int = 20
+        max_workers: int = 20,
+        universe: Optional[str] = None
     ) -> List[Dict]:
         """
         20일 이동평균 대비 상승률 기준으로 스크리닝합니다.
@@ -55,6 +90,7 @@ class StockScreener(LoggerMixin):
             market: 시장 (KRX, KOSPI, KOSDAQ)
             volume_multiplier: 거래량 배수 조건
             max_workers: 병렬 처리 워커 수
+            universe: 종목군 프리셋 (None이면 설정값 UNIVERSE_PRESET)
 
         Returns:
             조건을 만족하는 종목 리스트
@@ -62,11 +98,10 @@ class StockScreener(LoggerMixin):
         self.logger.info(f"스크리닝 시작: {threshold}% 임계값, 거래량 배수: {volume_multiplier}")
 
         # 종목 리스트 가져오기
-        df_stocks = self.data_provider.get_stock_list(market)
-        if market == 'KRX':
-            df_stocks = df_stocks[df_stocks['Market'] != 'KONEX']
+        stocks = self._universe(market, exclude=('KONEX',), preset=universe)
 
-        self.logger.info(f"총 {len(df_stocks)}개 종목 스캔")
+        self.logger.info(f"총 {len(stocks)}개 종목 스캔")
+        self._pin_universe(row['Code'] for row in stocks)
 
         # 병렬 처리
         processor = ParallelProcessor(
@@ -85,10 +120,12 @@ class StockScreener(LoggerMixin):
             )
 
         result = processor.process(
-            items=df_stocks.to_dict('records'),
+            items=stocks,
             func=analyze_stock,
-            desc="MA 기준 스크리닝"
+            desc="MA 기준 스크리닝",
+            stop_on=(SourceUnavailableError,)
         )
+        self._report_coverage(result)
 
         # DB에 이력 저장
         for stock in result.successes:
@@ -108,8 +145,9 @@ class StockScreener(LoggerMixin):
     ) -> Optional[Dict]:
         """단일 종목 분석 (MA 기준)"""
         try:
-            df = self.analyzer.fetch_and_analyze(code, days=50)
-            if df is None or len(df) < 20:
+            bars = self.analyzer.planner.bars(SERIES_INDICATORS, history=MA_SCREEN_HISTORY)
+            df = self.analyzer.fetch_and_analyze(code, bars=bars)
+            if df is None or len(df) < MA_SCREEN_HISTORY:
                 return None
 
             last = df.iloc[-1]
@@ -144,6 +182,9 @@ class StockScreener(LoggerMixin):
                 '거래량비율': round(volume_ratio, 2)
             }
 
+        except DataSourceError:
+            # 소스 장애는 "신호 없음"이 아님 - 처리기가 오류로 집계/중단
+            raise
         except Exception as e:
             self.logger.debug(f"종목 분석 오류: {code} - {e}")
             return None
@@ -151,7 +192,9 @@ class StockScreener(LoggerMixin):
     def screen_surge_stocks(
         self,
         market: str = 'KRX',
-        max_workers: int = 10
+        max_workers: int = 10,
+        panel: Optional[MarketPanel] = None,
+        universe: Optional[str] = None
     ) -> Dict[str, List[Dict]]:
         """
         급등주 초기 포착 (A/B/C 분류).
@@ -159,6 +202,8 @@ class StockScreener(LoggerMixin):
         Args:
             market: 시장 (KRX, KOSPI, KOSDAQ)
             max_workers: 병렬 처리 워커 수
+            panel: 시장 패널 (주어지면 종목별 조회 없이 패널에서 지표 계산)
+            universe: 종목군 프리셋 (None이면 설정값 UNIVERSE_PRESET)
 
         Returns:
             A/B/C 등급별 종목 딕셔너리
@@ -166,11 +211,20 @@ class StockScreener(LoggerMixin):
         self.logger.info(f"급등주 초기 포착 시작 (A/B/C 분류)")
 
         # 종목 리스트
-        df_stocks = self.data_provider.get_stock_list(market)
-        if market == 'KRX':
-            df_stocks = df_stocks[df_stocks['Market'].isin(['KOSPI', 'KOSDAQ'])]
+        stocks = self._universe(market, include=('KOSPI', 'KOSDAQ'), preset=universe)
+
+        self.logger.info(f"총 {len(stocks)}개 종목 분석")
+
+        if panel is not None:
+            successes = self._classify_panel(panel, stocks)
+        else:
+            successes = self._classify_rows(stocks, max_workers)
 
-        self.logger.info(f"총 {len(df_stocks)}개 종목 분석")
+        return self._save_by_grade(successes)
+
+    def _classify_rows(self, rows: List[Dict], max_workers: int) -> List[Dict]:
+        """종목별 이력 조회 후 병렬 분류"""
+        self._pin_universe(row['Code'] for row in rows)
 
         # 병렬 처리
         processor = ParallelProcessor(
@@ -187,16 +241,20 @@ class StockScreener(LoggerMixin):
             )
 
         result = processor.process(
-            items=df_stocks.to_dict('records'),
+            items=rows,
             func=analyze_stock,
-            desc="급등주 분류"
+            desc="급등주 분류",
+            stop_on=(SourceUnavailableError,)
         )
+        self._report_coverage(result)
+        return result.successes
 
-        # 등급별 분류
+    def _save_by_grade(self, successes: List[Dict], grades: Sequence[str] = ('A', 'B', 'C')) -> Dict[str, List[Dict]]:
+        """등급별로 나누어 DB에 저장 (grades에 없는 등급은 제외)"""
         results_by_grade = {'A': [], 'B': [], 'C': []}
-        for stock in result.successes:
+        for stock in successes:
             grade = stock.get('class')
-            if grade in results_by_grade:
+            if grade in results_by_grade and grade in grades:
                 results_by_grade[grade].append(stock)
 
         # DB에 저장
@@ -211,6 +269,248 @@ class StockScreener(LoggerMixin):
 
         return results_by_grade
 
+    def screen_surge_stocks_two_phase(
+        self,
+        market: str = 'KRX',
+        min_grade: str = 'B',
+        max_workers: int = 10,
+        snapshot_fetcher: Optional[SnapshotFetcher] = None,
+        session: Optional[date] = None,
+        universe: Optional[str] = None
+    ) -> Dict[str, List[Dict]]:
+        """
+        급등주 초기 포착 (2단계: 스냅샷 사전 필터 후 후보만 이력 조회).
+
+        1단계는 전종목 당일/전일 스냅샷 두 번의 요청으로 종목별 점수 상한
+        (SignalClassifier.max_possible_scores)을 계산해 min_grade 기준에 못 미치는 종목을 제외하고,
+        2단계는 남은 종목만 기존과 같이 이력을 조회해 분류합니다.
+        상한은 보수적이므로 결과는 전체 스캔의 min_grade 이상 결과와 같습니다.
+
+        점수 상한에는 이력이 필요한 조건(MA20 이상, 저점 상승) 2점이 항상 포함되어
+        C급 기준(2점)에서는 제외되는 종목이 없습니다. 요청 절감 효과는 B급 이상에서 나타납니다.
+
+        Args:
+            market: 시장 (KRX, KOSPI, KOSDAQ)
+            min_grade: 최소 등급 (A/B/C)
+            max_workers: 2단계 병렬 처리 워커 수
+            snapshot_fetcher: (YYYYMMDD, 시장) -> 전종목 OHLCV 함수 (None이면 설정된 소스의 기본값)
+            session: 당일 (None이면 오늘)
+            universe: 종목군 프리셋 (None이면 설정값 UNIVERSE_PRESET)
+
+        Returns:
+            A/B/C 등급별 종목 딕셔너리 (min_grade 미만 등급은 빈 리스트)
+        """
+        grades = ('A', 'B', 'C')[:('A', 'B', 'C').index(min_grade) + 1]
+        stocks = self._universe(market, include=('KOSPI', 'KOSDAQ'), preset=universe)
+        snapshot_fetcher = snapshot_fetcher or default_snapshot_fetcher()
+        session = session or datetime.now().date()
+
+        today = self._fetch_snapshot(snapshot_fetcher, session)
+        if today is None:
+            self.logger.warning("당일 스냅샷을 사용할 수 없어 전체 스캔으로 대체")
+            return self._save_by_grade(self._classify_rows(stocks, max_workers), grades)
+        previous = self._previous_snapshot(snapshot_fetcher, session)
+
+        # 1단계: 당일 봉만으로 점수 상한 계산 (스냅샷에 없거나 거래가 없는 종목은 후보 유지)
+        codes = [row['Code'] for row in stocks]
+        bars = today.reindex(codes)
+        prev_volume = (
+            previous['거래량'].reindex(codes).to_numpy(np.float64)
+            if previous is not None else np.full(len(codes), np.nan)
+        )
+        upper = self.classifier.max_possible_scores(
+            bars['시가'].to_numpy(np.float64),
+            bars['고가'].to_numpy(np.float64),
+            bars['저가'].to_numpy(np.float64),
+            bars['종가'].to_numpy(np.float64),
+            bars['거래량'].to_numpy(np.float64),
+            np.where(prev_volume > 0, prev_volume, np.nan),
+        )
+        traded = bars['거래량'].to_numpy(np.float64) > 0
+        keep = ~traded | (upper >= self.classifier.grade_threshold(min_grade))
+        candidates = [row for row, kept in zip(stocks, keep) if kept]
+        self.logger.info(
+            f"사전 필터: {len(candidates)}/{len(stocks)}개 종목 후보 "
+            f"({min_grade}급 이상, 이력 조회 {len(stocks) - len(candidates)}회 절감)"
+        )
+
+        # 2단계: 후보만 이력 조회/분류
+        return self._save_by_grade(self._classify_rows(candidates, max_workers), grades)
+
+    def _fetch_snapshot(self, fetcher: Optional[SnapshotFetcher], day: date) -> Optional[pd.DataFrame]:
+        """전종목 일자 스냅샷 (없거나 휴장일이면 None)"""
+        if fetcher is None:
+            return None
+        try:
+            snapshot = fetcher(day.strftime("%Y%m%d"), 'ALL')
+        except Exception as e:
+            self.logger.warning(f"스냅샷 조회 실패: {day} - {e}")
+            return None
+        if snapshot is None or snapshot.empty or snapshot['거래량'].sum() == 0:
+            return None
+        return snapshot
+
+    def _previous_snapshot(self, fetcher: SnapshotFetcher, session: date) -> Optional[pd.DataFrame]:
+        """직전 거래일 스냅샷 (거래일 달력에 없는 휴장일을 만나면 최대 10일 전까지 거슬러 올라감)"""
+        calendar = self.analyzer.planner.calendar
+        day = calendar.previous_trading_day(session)
+        while (session - day).days <= 10:
+            snapshot = self._fetch_snapshot(fetcher, day)
+            if snapshot is not None:
+                return snapshot
+            day = calendar.previous_trading_day(day)
+        return None
+
+    async def screen_surge_stocks_async(
+        self,
+        provider: AsyncDataProvider,
+        market: str = 'KRX',
+        days: Optional[int] = None,
+        universe: Optional[str] = None
+    ) -> Dict[str, List[Dict]]:
+        """
+        급등주 초기 포착 (비동기 조회).
+
+        전 종목 이력을 비동기 제공자로 동시에 조회하여 패널을 만든 뒤
+        패널 경로(screen_surge_stocks(panel=...))로 분류합니다.
+
+        Args:
+            provider: 비동기 데이터 제공자
+            market: 시장 (KRX, KOSPI, KOSDAQ)
+            days: 조회 기간 (달력일, None이면 지표에 필요한 거래일 수로 계산)
+            universe: 종목군 프리셋 (None이면 설정값 UNIVERSE_PRESET)
+
+        Returns:
+            A/B/C 등급별 종목 딕셔너리
+        """
+        stocks = self._universe(market, include=('KOSPI', 'KOSDAQ'), preset=universe)
+        planner = self.analyzer.planner
+        end_date = datetime.now().date()
+        if days:
+            start_date = end_date - timedelta(days=days)
+        else:
+            start_date = planner.start_date(end_date)
+
+        started = datetime.now()
+        result = ProcessingResult()
+        panel = await fetch_panel(
+            provider, [row['Code'] for row in stocks], start_date, end_date,
+            result=result, stop_on=(SourceUnavailableError,)
+        )
+
+        # 달력에 없는 휴장일/거래정지로 봉이 부족한 종목은 기간을 넓혀 다시 조회
+        short = [] if days or result.stopped else planner.short_tickers(panel)
+        if short:
+            self.logger.info(f"이력 부족 종목 {len(short)}개 - 조회 기간을 넓혀 다시 조회")
+            wider = await fetch_panel(provider, short, planner.widened_start(end_date), end_date)
+            panel = panel.with_rows(wider)
+        self.logger.info(
+            f"비동기 조회 완료: {len(panel)}/{len(stocks)}개 종목 "
+            f"({(datetime.now() - started).total_seconds():.1f}초)"
+        )
+        self._report_coverage(result)
+
+        return self.screen_surge_stocks(market, panel=panel, universe=universe)
+
+    def screen_surge_stocks_intraday(
+        self,
+        market: str = 'KRX',
+        max_workers: int = 10,
+        universe: Optional[str] = None
+    ) -> Dict[str, List[Dict]]:
+        """
+        급등주 초기 포착 (장중 증분 모드).
+
+        오늘 워밍업이 남긴 스트리밍 지표 상태가 있으면 전종목 당일 스냅샷 한 번으로
+        종목마다 상태에 당일 봉만 더해 분류합니다 (이력 조회 없음).
+        없으면 확정된 과거 봉을 거래일마다 한 번만 불러 두고, 다시 실행할 때는 당일 봉만 갱신한 뒤
+        지표 계산에 필요한 마지막 구간만으로 패널 경로 분류를 수행합니다.
+
+        Args:
+            market: 시장 (KRX, KOSPI, KOSDAQ)
+            max_workers: 이력/당일 봉 조회 병렬 처리 워커 수
+            universe: 종목군 프리셋 (None이면 설정값 UNIVERSE_PRESET)
+
+        Returns:
+            A/B/C 등급별 종목 딕셔너리
+        """
+        stocks = self._universe(market, include=('KOSPI', 'KOSDAQ'), preset=universe)
+        session = datetime.now().date()
+        book = self._state_book(session)
+        if book is not None:
+            bars = self._fetch_snapshot(default_snapshot_fetcher(), session)
+            if bars is not None:
+                return self._classify_streaming(book, bars, stocks, session, max_workers)
+
+        if self.intraday is None:
+            self.intraday = IntradayPanel(
+                self.data_provider, default_snapshot_fetcher(), max_workers=max_workers
+            )
+
+        panel = self.intraday.refresh([row['Code'] for row in stocks])
+        # 거래정지 등으로 빠진 거래일을 감안해 필요한 길이에 여유 거래일을 더함
+        tail = panel.tail(self.analyzer.required_bars + self.analyzer.settings.lookback_margin_bars)
+        return self.screen_surge_stocks(market, panel=tail, universe=universe)
+
+    def _universe(
+        self,
+        market: str,
+        include: Optional[Sequence[str]] = None,
+        exclude: Sequence[str] = (),
+        preset: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        스캔 대상 종목 레코드 (Code/Name/Market)
+
+        Args:
+            market: 시장 (KRX면 include/exclude 조건 적용, 그 외에는 해당 시장만)
+            include: KRX 전체 중 포함할 시장 (None이면 전체)
+            exclude: KRX 전체 중 제외할 시장
+            preset: 종목군 프리셋 (None이면 설정값, all이면 인덱스를 만들지 않음)
+        """
+        try:
+            if market != 'KRX':
+                markets = [market]
+            else:
+                markets = [
+                    m for m in (include or self.ticker_master.markets) if m not in exclude
+                ]
+            records = self.ticker_master.records(markets)
+        except Exception as e:
+            self.logger.error(f"종목 리스트 조회 오류: {market} - {e}")
+            return []
+
+        preset = preset or self.settings.universe.preset
+        if preset == 'all':
+            return records
+        return self.universe_index.filter(records, preset)
+
+    @property
+    def universe_index(self) -> UniverseIndex:
+        """종목군 인덱스 (처음 사용할 때 설정된 소스의 스냅샷으로 생성)"""
+        if self._universe_index is None:
+            self._universe_index = UniverseIndex(self.ticker_master, default_snapshot_fetcher())
+        return self._universe_index
+
+    def _report_coverage(self, result: ProcessingResult):
+        """스캔 처리 범위 기록 (데이터 소스 장애로 일부만 분석한 경우 경고)"""
+        self.last_result = result
+        source_errors = sum(1 for error in result.errors if error.error_type in _SOURCE_ERRORS)
+        if result.stopped:
+            self.logger.warning(
+                f"데이터 소스 장애로 스캔 중단 - 분석 {result.processed}/{result.total}개 "
+                f"({result.coverage:.0%}): {result.stopped}"
+            )
+        elif source_errors:
+            self.logger.warning(
+                f"데이터 소스 오류 {source_errors}건 - 분석 {result.processed}/{result.total}개 ({result.coverage:.0%})"
+            )
+
+    def _pin_universe(self, tickers):
+        """스캔 대상 종목을 캐시 작업 집합으로 고정 (CACHE_PIN_UNIVERSE 설정 시)"""
+        if self.settings.cache.pin_universe and isinstance(self.data_provider, CachedDataProvider):
+            self.data_provider.pin_universe(tickers)
+
     def _classify_single_stock(
         self,
         code: str,
@@ -229,24 +529,95 @@ class StockScreener(LoggerMixin):
             if signal.grade == 'NONE':
                 return None
 
-            return {
-                '종목코드': code,
-                '종목명': name,
-                '시장': market,
-                'class': signal.grade,
-                'score': signal.score,
-                '현재가': int(indicators['close']),
-                'today_return': round(indicators['today_return'], 2),
-                '거래량': int(indicators.get('volume_today', 0)),  # 전체 이력 추적을 위해 추가
-                '테마명': '',  # 급등주는 테마명 없음
-                '이유': '; '.join(signal.reasons),
-                'mode': 'initial'
-            }
+            return self._make_surge_record(code, name, market, indicators, signal)
 
+        except DataSourceError:
+            raise
         except Exception as e:
             self.logger.debug(f"종목 분류 오류: {code} - {e}")
             return None
 
+    def _state_book(self, session: date) -> Optional[IndicatorStateBook]:
+        """
+        오늘 워밍업이 전일까지 반영한 스트리밍 지표 상태 (거래일마다 한 번만 읽음)
+
+        상태의 마지막 봉이 직전 평일이 아니면(워밍업 누락 등) 사용하지 않습니다.
+        """
+        if self._state_cache is None or self._state_cache[0] != session:
+            ready = load_readiness(session=session)
+            book = None
+            previous = self.analyzer.planner.calendar.previous_trading_day(session)
+            if ready is not None and ready.get('last_bar') == previous.isoformat():
+                book = load_state_book(session=session)
+            self._state_cache = (session, book)
+        return self._state_cache[1]
+
+    def _classify_streaming(
+        self,
+        book: IndicatorStateBook,
+        bars: pd.DataFrame,
+        rows: List[Dict],
+        session: date,
+        max_workers: int
+    ) -> Dict[str, List[Dict]]:
+        """스트리밍 지표 상태 + 당일 스냅샷으로 분류 (상태가 없는 종목만 종목별 조회)"""
+        started = time.perf_counter()
+        with_state = [row for row in rows if row['Code'] in book]
+        indicators_by_ticker = book.peek_all(bars.reindex([row['Code'] for row in with_state]).dropna(), session)
+        records = self._records_from_indicators(with_state, indicators_by_ticker)
+        self.logger.info(
+            f"스트리밍 지표 분류: {len(indicators_by_ticker)}/{len(rows)}개 종목 "
+            f"({(time.perf_counter() - started) * 1000:.0f}ms)"
+        )
+
+        missing = [row for row in rows if row['Code'] not in book]
+        if missing:
+            records += self._classify_rows(missing, max_workers)
+        return self._save_by_grade(records)
+
+    def _classify_panel(self, panel: MarketPanel, rows: List[Dict]) -> List[Dict]:
+        """시장 패널에서 일괄 분류"""
+        panel = panel.select([row['Code'] for row in rows])
+        return self._records_from_indicators(rows, self.analyzer.get_panel_indicators(panel))
+
+    def _records_from_indicators(self, rows: List[Dict], indicators_by_ticker: Dict[str, Dict]) -> List[Dict]:
+        """종목별 최신 지표를 분류해 급등주 결과 레코드로 만듭니다 (NONE 등급 제외)"""
+        signals = self.classifier.classify_all(indicators_by_ticker)
+
+        records = []
+        for row in rows:
+            signal = signals.get(row['Code'])
+            if signal is None or signal.grade == 'NONE':
+                continue
+            records.append(self._make_surge_record(
+                row['Code'], row['Name'], row['Market'],
+                indicators_by_ticker[row['Code']], signal
+            ))
+        return records
+
+    @staticmethod
+    def _make_surge_record(
+        code: str,
+        name: str,
+        market: str,
+        indicators: Dict,
+        signal: SignalGrade
+    ) -> Dict:
+        """급등주 결과 레코드 생성"""
+        return {
+            '종목코드': code,
+            '종목명': name,
+            '시장': market,
+            'class': signal.grade,
+            'score': signal.score,
+            '현재가': int(indicators['close']),
+            'today_return': round(indicators['today_return'], 2),
+            '거래량': int(indicators.get('volume_today', 0)),  # 전체 이력 추적을 위해 추가
+            '테마명': '',  # 급등주는 테마명 없음
+            '이유': '; '.join(signal.reasons),
+            'mode': 'initial'
+        }
+
 
 if __name__ == "__main__":
     from stock_analyzer.utils.data_provider import create_data_provider
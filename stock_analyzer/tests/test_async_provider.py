@@ -0,0 +1,123 @@
+"""
+비동기 데이터 제공자 테스트
+"""
+
+import asyncio
+from datetime import date
+
+import pandas as pd
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from stock_analyzer.utils.async_provider import (
+    NaverAsyncDataProvider, fetch_panel, parse_naver_daily
+)
+from stock_analyzer.utils.parallel import ProcessingResult
+from stock_analyzer.utils.rate_limiter import AdaptiveRateLimiter, RateLimit
+from stock_analyzer.utils.resilience import CircuitBreaker, SourceUnavailableError
+
+
+def canned_response(symbol: str) -> str:
+    """네이버 일봉 응답 형식의 기록된 응답"""
+    base = int(symbol[-3:])
+    rows = ["[['날짜', '시가', '고가', '저가', '종가', '거래량', '외국인소진율'],"]
+    for i, day in enumerate(pd.bdate_range('2024-01-02', '2024-01-31')):
+        price = 1000 + base + i * 10
+        rows.append(
+            f'["{day:%Y%m%d}", {price}, {price + 20}, {price - 20}, {price + 5}, {1000 * (i + 1)}, 10.5],'
+        )
+    rows.append("]")
+    return "\n\t\t\n".join(rows)
+
+
+class ReplayServer:
+    """기록된 응답을 돌려주는 로컬 HTTP 대역 (동시 처리 수 기록)"""
+
+    def __init__(self, delay: float = 0.02, down: bool = False):
+        self.delay = delay
+        self.down = down
+        self.active = 0
+        self.max_active = 0
+        self.requests = 0
+
+    async def handle(self, request):
+        self.requests += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            symbol = request.query['symbol']
+            if self.down:
+                return web.Response(status=503)
+            if symbol == '999999':
+                return web.Response(status=500)
+            if symbol == '000000':
+                return web.Response(text="[['날짜', '시가', '고가', '저가', '종가', '거래량', '외국인소진율'],\n]")
+            return web.Response(text=canned_response(symbol))
+        finally:
+            self.active -= 1
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get('/siseJson.naver', self.handle)
+        return app
+
+
+def test_parse_naver_daily():
+    df = parse_naver_daily(canned_response('005930'))
+    assert list(df.columns) == ['시가', '고가', '저가', '종가', '거래량']
+    assert df.index.name == 'Date'
+    assert df.index[0] == pd.Timestamp('2024-01-02')
+    assert df['종가'].iloc[0] == 1000 + 930 + 5
+    assert df['거래량'].dtype == 'int64'
+
+
+def test_fetch_many_bounded_concurrency():
+    """수백 종목을 세마포어 한도까지 동시에 조회"""
+    replay = ReplayServer()
+    tickers = [f"{i:06d}" for i in range(1, 301)] + ['999999', '000000']
+
+    async def run():
+        async with TestServer(replay.app()) as server:
+            url = str(server.make_url('/siseJson.naver'))
+            limiter = AdaptiveRateLimiter('localhost', RateLimit(1e6, 1e6, 1e6, burst=1000))
+            async with NaverAsyncDataProvider(
+                url, max_concurrency=100, timeout=5, rate_limiter=limiter
+            ) as provider:
+                return await fetch_panel(provider, tickers, date(2024, 1, 2), date(2024, 1, 31))
+
+    panel = asyncio.run(run())
+
+    assert replay.requests == 302
+    assert 20 < replay.max_active <= 100
+    assert panel.tickers == tickers[:300]  # 오류/빈 응답 종목 제외, 입력 순서 유지
+    assert panel.shape == (300, 22)
+
+
+def test_outage_reported_as_source_error():
+    """소스 장애는 빈 결과가 아니라 오류로 집계되고, 서킷이 열리면 남은 요청을 취소"""
+    replay = ReplayServer(delay=0.001, down=True)
+    tickers = [f"{i:06d}" for i in range(1, 101)]
+    result = ProcessingResult()
+
+    async def run():
+        async with TestServer(replay.app()) as server:
+            url = str(server.make_url('/siseJson.naver'))
+            limiter = AdaptiveRateLimiter('localhost', RateLimit(1e6, 1e6, 1e6, burst=1000))
+            breaker = CircuitBreaker('naver_async', failure_threshold=3, reset_seconds=60)
+            async with NaverAsyncDataProvider(
+                url, max_concurrency=2, timeout=5, rate_limiter=limiter, breaker=breaker
+            ) as provider:
+                return await fetch_panel(
+                    provider, tickers, date(2024, 1, 2), date(2024, 1, 31),
+                    result=result, stop_on=(SourceUnavailableError,)
+                )
+
+    panel = asyncio.run(run())
+
+    assert len(panel) == 0
+    assert result.stopped
+    assert result.errors[0].error_type == 'TransientSourceError'
+    assert result.errors[-1].error_type == 'SourceUnavailableError'
+    assert result.coverage == 0
+    assert replay.requests < len(tickers)
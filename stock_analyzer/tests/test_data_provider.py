@@ -0,0 +1,322 @@
+"""
+데이터 제공자 테스트
+"""
+
+from datetime import date, timedelta
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_analyzer.utils.data_provider import (
+    DataProvider, CachedDataProvider, KRXSnapshotDataProvider
+)
+from stock_analyzer.utils.ohlcv_store import OHLCV_COLUMNS, OHLCVStore
+
+
+class FakeProvider(DataProvider):
+    """호출 기록을 남기는 가짜 제공자 (평일마다 1봉)"""
+
+    def __init__(self):
+        self.calls: List[Tuple[str, date, date]] = []
+
+    def fetch_ohlcv(self, ticker, start_date, end_date):
+        self.calls.append((ticker, start_date, end_date))
+        dates = pd.bdate_range(start_date, end_date, name='Date')
+        if len(dates) == 0:
+            return None
+        base = np.arange(len(dates), dtype=float) + (dates[0] - pd.Timestamp('2024-01-01')).days
+        return pd.DataFrame({
+            '시가': base + 100,
+            '고가': base + 110,
+            '저가': base + 90,
+            '종가': base + 105,
+            '거래량': (base + 1) * 1000,
+        }, index=dates)
+
+    def get_stock_list(self, market='KRX'):
+        return pd.DataFrame()
+
+
+@pytest.fixture
+def store(tmp_path):
+    """임시 디렉토리 저장소"""
+    return OHLCVStore(str(tmp_path / "ohlcv"))
+
+
+def test_store_roundtrip(store):
+    """저장소 저장/조회 테스트"""
+    df = FakeProvider().fetch_ohlcv('005930', date(2024, 1, 1), date(2024, 1, 31))
+    store.save('005930', df, covered_start=date(2023, 12, 25))
+
+    loaded, covered_start = store.load('005930')
+    pd.testing.assert_frame_equal(loaded, df, check_freq=False)
+    assert covered_start == date(2023, 12, 25)
+    assert store.load('000660') is None
+
+
+def test_store_incremental_fetch(store):
+    """새 프로세스에서는 저장된 마지막 봉 이후만 조회"""
+    start, end = date(2024, 1, 1), date(2024, 3, 29)
+
+    first = FakeProvider()
+    df1 = CachedDataProvider(first, store=store).fetch_ohlcv('005930', start, end)
+    assert first.calls == [('005930', start, end)]
+
+    # 다음 거래일 - 메모리 캐시가 비어 있는 새 인스턴스
+    second = FakeProvider()
+    new_end = date(2024, 4, 1)
+    df2 = CachedDataProvider(second, store=store).fetch_ohlcv(
+        '005930', start + timedelta(days=1), new_end
+    )
+
+    assert second.calls == [('005930', end, new_end)]
+    assert df2.index.max() == pd.Timestamp(new_end)
+    assert len(df2) == len(df1)  # 앞 1봉 제외, 뒤 1봉 추가
+
+
+def test_store_backfills_head(store):
+    """저장 범위보다 이른 구간만 추가 조회"""
+    provider = FakeProvider()
+    CachedDataProvider(provider, store=store).fetch_ohlcv(
+        '005930', date(2024, 2, 1), date(2024, 2, 29)
+    )
+
+    provider.calls.clear()
+    df = CachedDataProvider(provider, store=store).fetch_ohlcv(
+        '005930', date(2024, 1, 15), date(2024, 2, 29)
+    )
+
+    assert provider.calls == [('005930', date(2024, 1, 15), date(2024, 1, 31))]
+    assert df.index.min() == pd.Timestamp('2024-01-15')
+
+
+def test_cache_serves_sub_windows():
+    """넓은 구간을 한 번 조회하면 포함된 구간은 잘라서 반환"""
+    provider = FakeProvider()
+    cached = CachedDataProvider(provider)
+    end = date(2024, 6, 28)
+
+    wide = cached.fetch_ohlcv('005930', end - timedelta(days=120), end)
+    narrow = cached.fetch_ohlcv('005930', end - timedelta(days=50), end)
+    assert len(provider.calls) == 1
+    pd.testing.assert_frame_equal(narrow, wide.loc[pd.Timestamp(end - timedelta(days=50)):])
+
+    # 캐시 히트는 복사 없는 읽기 전용 뷰
+    assert np.shares_memory(narrow['종가'].to_numpy(), wide['종가'].to_numpy())
+    with pytest.raises(ValueError):
+        narrow.iloc[0, 3] = 0
+    assert cached.fetch_ohlcv('005930', end - timedelta(days=5), end)['종가'].min() > 0
+
+
+def test_indicators_do_not_touch_cached_frame():
+    """지표 계산은 읽기 전용 캐시 프레임을 수정하지 않고 새 프레임을 반환"""
+    from stock_analyzer.analyzers.technical import TechnicalAnalyzer
+
+    cached = CachedDataProvider(FakeProvider())
+    analyzer = TechnicalAnalyzer(cached)
+
+    df = analyzer.fetch_and_analyze('005930', days=90)
+    assert {'MA20', 'vol_avg20', 'volatility20'} <= set(df.columns)
+
+    raw = cached.fetch_ohlcv('005930', date.today() - timedelta(days=90), date.today())
+    assert list(raw.columns) == ['시가', '고가', '저가', '종가', '거래량']
+    assert not raw['종가'].to_numpy().flags.writeable
+
+
+def test_cache_extends_missing_side_only():
+    """캐시 구간을 벗어난 쪽만 추가 조회"""
+    provider = FakeProvider()
+    cached = CachedDataProvider(provider)
+    cached.fetch_ohlcv('005930', date(2024, 2, 1), date(2024, 2, 29))
+
+    df = cached.fetch_ohlcv('005930', date(2024, 1, 15), date(2024, 3, 4))
+    assert provider.calls[1:] == [
+        ('005930', date(2024, 1, 15), date(2024, 1, 31)),
+        ('005930', date(2024, 2, 29), date(2024, 3, 4)),
+    ]
+    assert df.index.min() == pd.Timestamp('2024-01-15')
+    assert df.index.max() == pd.Timestamp('2024-03-04')
+
+    cached.fetch_ohlcv('005930', date(2024, 2, 1), date(2024, 3, 1))
+    assert len(provider.calls) == 3
+
+
+def test_cache_coalesces_concurrent_requests():
+    """같은 종목 동시 요청은 한 번만 조회"""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    class SlowProvider(FakeProvider):
+        def __init__(self):
+            super().__init__()
+            self.lock = threading.Lock()
+
+        def fetch_ohlcv(self, ticker, start_date, end_date):
+            time.sleep(0.05)
+            with self.lock:
+                return super().fetch_ohlcv(ticker, start_date, end_date)
+
+    provider = SlowProvider()
+    cached = CachedDataProvider(provider)
+    start, end = date(2024, 1, 1), date(2024, 3, 29)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(
+            lambda i: cached.fetch_ohlcv('005930' if i % 2 else '000660', start, end),
+            range(32)
+        ))
+
+    assert len(provider.calls) == 2
+    assert all(len(df) == len(results[0]) for df in results)
+
+    stats = cached.get_cache_stats()
+    assert stats['misses'] == 2
+    assert stats['hits'] + stats['coalesced'] == 30
+    assert stats['size'] == 2
+
+
+def test_cache_memory_budget_and_pinning(monkeypatch):
+    """바이트 한도를 넘으면 밀려나지만 고정 종목은 유지"""
+    from stock_analyzer.config import get_settings
+
+    monkeypatch.setattr(get_settings().cache, 'max_memory_mb', 1)
+    provider = FakeProvider()
+    cached = CachedDataProvider(provider)
+    start, end = date(2022, 1, 1), date(2024, 12, 31)  # 종목당 약 37KB
+
+    cached.pin_universe(['T0000'])
+    for i in range(60):
+        cached.fetch_ohlcv(f"T{i:04d}", start, end)
+
+    stats = cached.get_cache_stats()
+    assert stats['max_bytes'] == 1024 * 1024
+    assert stats['pinned'] == 1
+    memory = cached.get_memory_stats()
+    assert memory['cached']['bytes'] <= stats['max_bytes']
+    assert memory['cached']['entries'] < 59
+
+    calls = len(provider.calls)
+    cached.fetch_ohlcv('T0000', start, end)
+    assert len(provider.calls) == calls
+
+    # 고정 해제 시 일반 캐시로 이동
+    cached.pin_universe([])
+    assert cached.get_memory_stats()['pinned']['entries'] == 0
+
+
+class SnapshotReplay:
+    """기록된 전종목 스냅샷을 재생하는 pykrx 대역"""
+
+    def __init__(self, snapshots):
+        self.snapshots = snapshots
+        self.calls: List[str] = []
+
+    def __call__(self, date_str, market):
+        self.calls.append(date_str)
+        return self.snapshots.get(date_str, pd.DataFrame())
+
+
+@pytest.fixture
+def snapshot_replay():
+    """2024-01-02 ~ 2024-01-12 스냅샷 (2024-01-08은 휴장일 가정)"""
+    snapshots = {}
+    for i, day in enumerate(pd.bdate_range('2024-01-02', '2024-01-12')):
+        if day == pd.Timestamp('2024-01-08'):
+            continue
+        snapshots[day.strftime('%Y%m%d')] = pd.DataFrame({
+            '시가': [100 + i, 200 + i],
+            '고가': [110 + i, 210 + i],
+            '저가': [90 + i, 190 + i],
+            '종가': [105 + i, 205 + i],
+            '거래량': [1000 * (i + 1), 2000 * (i + 1)],
+            '거래대금': [105000 * (i + 1), 410000 * (i + 1)],
+            '등락률': [1.0, 0.5],
+        }, index=pd.Index(['005930', '000660'], name='티커'))
+    return SnapshotReplay(snapshots)
+
+
+def test_snapshot_provider_builds_history(snapshot_replay):
+    """일자별 스냅샷으로 종목 이력을 구성"""
+    provider = KRXSnapshotDataProvider(snapshot_replay, listing_provider=FakeProvider())
+
+    df = provider.fetch_ohlcv('005930', date(2024, 1, 2), date(2024, 1, 12))
+    assert len(df) == 8  # 9 영업일 - 휴장일 1일
+    assert pd.Timestamp('2024-01-08') not in df.index
+    assert df['종가'].iloc[0] == 105
+    # 다른 제공자와 같은 공통 스키마 (거래대금/등락률 제외, 'Date' 인덱스)
+    assert list(df.columns) == OHLCV_COLUMNS
+    assert df.index.name == 'Date'
+    assert df['종가'].dtype == 'float64' and df['거래량'].dtype == 'int64'
+
+    # 같은 기간의 다른 종목은 추가 요청 없이 패널에서 제공
+    calls = len(snapshot_replay.calls)
+    other = provider.fetch_ohlcv('000660', date(2024, 1, 3), date(2024, 1, 10))
+    assert len(snapshot_replay.calls) == calls == 9
+    assert other.index.min() == pd.Timestamp('2024-01-03')
+    assert provider.fetch_ohlcv('999999', date(2024, 1, 2), date(2024, 1, 12)) is None
+
+
+def test_snapshot_provider_extends_window(snapshot_replay):
+    """기존 패널 밖의 일자만 추가로 조회"""
+    provider = KRXSnapshotDataProvider(snapshot_replay, listing_provider=FakeProvider())
+    assert provider.preload(date(2024, 1, 2), date(2024, 1, 5)) == 4
+
+    provider.fetch_ohlcv('005930', date(2024, 1, 2), date(2024, 1, 12))
+    assert snapshot_replay.calls[4:] == [
+        '20240108', '20240109', '20240110', '20240111', '20240112'
+    ]
+
+
+def test_snapshot_provider_keeps_only_final_days(snapshot_replay):
+    """조회 오류, 거래일인데 빈 스냅샷, 오늘 스냅샷은 보관하지 않고 다시 조회"""
+    from stock_analyzer.utils.resilience import DataSourceError, TransientSourceError
+    from stock_analyzer.utils.trading_calendar import TradingCalendar
+
+    failing = {'20240110'}
+
+    def fetcher(date_str, market):
+        if date_str in failing:
+            raise TimeoutError("read timeout")
+        return snapshot_replay(date_str, market)
+
+    # 2024-01-09는 휴장일로 확인된 날 (빈 결과 보관)
+    snapshot_replay.snapshots.pop('20240109')
+    calendar = TradingCalendar([date(2024, 1, 9)])
+    provider = KRXSnapshotDataProvider(
+        fetcher, listing_provider=FakeProvider(), calendar=calendar, refresh_seconds=0
+    )
+
+    with pytest.raises(TransientSourceError):
+        provider.fetch_ohlcv_strict('005930', date(2024, 1, 2), date(2024, 1, 12))
+    assert provider.fetch_ohlcv('005930', date(2024, 1, 2), date(2024, 1, 12)) is None
+
+    # 소스 복구 후에는 실패했던 날과 확인되지 않은 빈 날(01-08)만 다시 조회
+    failing.clear()
+    snapshot_replay.calls.clear()
+    df = provider.fetch_ohlcv_strict('005930', date(2024, 1, 2), date(2024, 1, 12))
+    assert snapshot_replay.calls == ['20240108', '20240110', '20240111', '20240112']
+    assert pd.Timestamp('2024-01-10') in df.index
+    assert pd.Timestamp('2024-01-09') not in df.index
+
+    # 오늘 스냅샷 (장전 빈 결과)은 보관하지 않으므로 장중 데이터가 나중에 나타남
+    today = date.today()
+    frame = snapshot_replay.snapshots['20240102']
+    live = {}
+    provider = KRXSnapshotDataProvider(
+        lambda date_str, market: live.get(date_str, pd.DataFrame()),
+        listing_provider=FakeProvider(), calendar=TradingCalendar(), refresh_seconds=0
+    )
+    assert provider.fetch_ohlcv('005930', today, today) is None
+    live[today.strftime('%Y%m%d')] = frame
+    if today.weekday() < 5:
+        assert len(provider.fetch_ohlcv('005930', today, today)) == 1
+
+    # 일시적이지 않은 오류도 DataSourceError로 전달
+    provider = KRXSnapshotDataProvider(
+        lambda date_str, market: 1 / 0, listing_provider=FakeProvider(), calendar=calendar
+    )
+    with pytest.raises(DataSourceError):
+        provider.fetch_ohlcv_strict('005930', date(2024, 1, 2), date(2024, 1, 3))
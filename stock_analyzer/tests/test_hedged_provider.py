@@ -0,0 +1,108 @@
+"""
+헤지 요청 데이터 제공자 테스트
+"""
+
+import time
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from stock_analyzer.utils.data_provider import DataProvider
+from stock_analyzer.utils.hedged_provider import HedgedDataProvider
+from stock_analyzer.utils.ohlcv_store import normalize_ohlcv
+
+START, END = date(2024, 1, 2), date(2024, 1, 5)
+
+
+def fdr_frame() -> pd.DataFrame:
+    """FDR 형식 (영문 컬럼, Change 포함)"""
+    index = pd.DatetimeIndex(pd.bdate_range(START, END), name='Date')
+    return pd.DataFrame({
+        'Open': [100, 101, 102, 103], 'High': [110, 111, 112, 113], 'Low': [90, 91, 92, 93],
+        'Close': [105, 106, 107, 108], 'Volume': [1000, 2000, 3000, 4000],
+        'Change': [0.0, 0.01, 0.01, 0.01],
+    }, index=index)
+
+
+def pykrx_frame() -> pd.DataFrame:
+    """pykrx 형식 (한글 컬럼, '날짜' 인덱스, 거래대금/등락률 포함)"""
+    df = fdr_frame().rename(columns={
+        'Open': '시가', 'High': '고가', 'Low': '저가', 'Close': '종가', 'Volume': '거래량', 'Change': '등락률'
+    })
+    df['거래대금'] = df['종가'] * df['거래량']
+    df.index = pd.Index(df.index.strftime('%Y-%m-%d'), name='날짜')
+    return df
+
+
+class SlowProvider(DataProvider):
+    """지연/실패를 조절할 수 있는 대역"""
+
+    def __init__(self, frame, delay=0.0):
+        self.frame = frame
+        self.delay = delay
+        self.fail = False
+        self.calls = 0
+
+    def fetch_ohlcv(self, ticker, start_date, end_date):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("source down")
+        return self.frame
+
+    def get_stock_list(self, market='KRX'):
+        raise NotImplementedError
+
+
+def test_sources_normalized_to_same_schema():
+    fdr_df, krx_df = normalize_ohlcv(fdr_frame()), normalize_ohlcv(pykrx_frame())
+    pd.testing.assert_frame_equal(fdr_df, krx_df, check_freq=False)
+    assert list(fdr_df.columns) == ['시가', '고가', '저가', '종가', '거래량']
+    assert fdr_df.index.name == 'Date'
+
+
+@pytest.fixture
+def sources():
+    return SlowProvider(fdr_frame(), delay=0.01), SlowProvider(pykrx_frame(), delay=0.01)
+
+
+def make_provider(primary, secondary, **kwargs):
+    options = dict(min_delay=0.1, initial_delay=0.2, failure_threshold=3, demote_seconds=60, max_workers=8)
+    options.update(kwargs)
+    return HedgedDataProvider([('fdr', primary), ('pykrx', secondary)], **options)
+
+
+def test_slow_primary_is_hedged(sources):
+    """주 소스가 p95를 넘기면 보조 소스 결과를 먼저 사용"""
+    primary, secondary = sources
+    provider = make_provider(primary, secondary)
+    for _ in range(25):  # 주 소스 응답 시간 기록
+        provider.fetch_ohlcv('005930', START, END)
+    assert secondary.calls == 0
+
+    primary.delay = 1.0
+    started = time.monotonic()
+    df = provider.fetch_ohlcv('005930', START, END)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.5
+    assert df is not None and len(df) == 4
+    assert provider.hedges == 1
+    assert provider.get_hedge_stats()['sources']['pykrx']['wins'] == 1
+    provider.close()
+
+
+def test_failing_source_demoted(sources):
+    """계속 실패하는 소스는 강등되어 더 이상 먼저 요청하지 않음"""
+    primary, secondary = sources
+    primary.fail = True
+    provider = make_provider(primary, secondary)
+
+    for _ in range(5):
+        assert provider.fetch_ohlcv('005930', START, END) is not None
+
+    assert primary.calls == 3  # 3회 연속 실패 후 강등
+    assert secondary.calls == 5
+    assert provider.get_hedge_stats()['sources']['fdr']['demoted']
+    provider.close()
@@ -0,0 +1,109 @@
+"""
+벡터화 지표 엔진 테스트
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_analyzer.analyzers.indicator_engine import (
+    IndicatorEngine, rolling_max, rolling_mean, rolling_min, rolling_std
+)
+from stock_analyzer.analyzers.indicator_graph import IndicatorCache
+from stock_analyzer.analyzers.technical import TechnicalAnalyzer
+from stock_analyzer.utils.data_provider import DataProvider
+from stock_analyzer.utils.synthetic_provider import SyntheticDataProvider
+
+
+def test_kernels_match_pandas_rolling():
+    rng = np.random.default_rng(3)
+    values = 50000 + rng.normal(0, 500, (4, 80))
+    values[1, 30] = np.nan  # 결측이 있는 창은 NaN
+
+    frame = pd.DataFrame(values.T)
+    for window in (5, 20):
+        rolling = frame.rolling(window)
+        np.testing.assert_allclose(rolling_mean(values, window), rolling.mean().to_numpy().T, rtol=1e-12)
+        np.testing.assert_allclose(rolling_max(values, window), rolling.max().to_numpy().T)
+        np.testing.assert_allclose(rolling_min(values, window), rolling.min().to_numpy().T)
+        np.testing.assert_allclose(rolling_std(values, window), rolling.std().to_numpy().T, rtol=1e-9)
+
+    # 1차원 입력과 창보다 짧은 입력
+    np.testing.assert_allclose(rolling_mean(values[0], 5), frame[0].rolling(5).mean().to_numpy())
+    assert np.isnan(rolling_mean(values[0, :3], 5)).all()
+
+
+class FrameProvider(DataProvider):
+    """종목별 데이터프레임을 기간과 무관하게 돌려주는 대역"""
+
+    def __init__(self, frames):
+        self.frames = frames
+
+    def fetch_ohlcv(self, ticker, start_date, end_date):
+        return self.frames.get(ticker)
+
+    def get_stock_list(self, market='KRX'):
+        return pd.DataFrame()
+
+
+def pandas_latest(df: pd.DataFrame, settings) -> dict:
+    """기존 종목별 pandas 경로 (rolling 지표 계산 후 워밍업 구간 제거, 마지막 봉 기준)"""
+    short, long = settings.ma_period_short, settings.ma_period_long
+    spread = df['고가'] - df['저가']
+    df = df.assign(
+        MA5=df['종가'].rolling(short).mean(),
+        MA20=df['종가'].rolling(long).mean(),
+        vol_avg5=df['거래량'].rolling(short).mean(),
+        vol_avg20=df['거래량'].rolling(settings.volume_window).mean(),
+        high20=df['고가'].rolling(long).max(),
+        low20=df['저가'].rolling(long).min(),
+        volatility5=spread.rolling(short).std(),
+        volatility20=spread.rolling(settings.volatility_window).std(),
+    ).dropna()
+    last = df.iloc[-1]
+    latest = {key: float(last[key]) for key in PARITY_KEYS if key in df}
+    latest['min_low5'] = float(df['저가'].tail(5).min())
+    latest['min_low_prev5'] = float(df['저가'].tail(10).head(5).min())
+    return latest
+
+
+PARITY_KEYS = (
+    'MA5', 'MA20', 'vol_avg5', 'vol_avg20', 'high20', 'low20',
+    'min_low5', 'min_low_prev5', 'volatility5', 'volatility20',
+)
+
+
+def test_panel_latest_matches_per_ticker_path():
+    """결측 거래일이 있는 패널도 종목별 get_latest_indicators / pandas rolling 경로와 같은 최신 지표"""
+    end = date(2024, 6, 28)
+    source = SyntheticDataProvider(tickers=40, days=90, end=end)
+    panel = source.build_panel(date(2024, 1, 1), end)
+    panel.close[::3, 70:75] = np.nan  # 중간 결측 거래일 (거래정지)
+    panel.close[1, -1] = np.nan  # 당일 결측
+
+    frames = {ticker: panel.to_frame(ticker).dropna() for ticker in panel.tickers}
+    analyzer = TechnicalAnalyzer(FrameProvider(frames))
+    analyzer.resolver.cache = IndicatorCache(0)
+
+    batch = analyzer.get_panel_indicators(panel)
+    assert len(batch) == len(panel)
+    gapped = {panel.tickers[i] for i in range(0, len(panel), 3)} | {panel.tickers[1]}
+
+    for ticker, expected in batch.items():
+        per_ticker = analyzer.get_latest_indicators(ticker)
+        reference = pandas_latest(frames[ticker], analyzer.settings)
+        for key in PARITY_KEYS:
+            assert expected[key] == pytest.approx(per_ticker[key], rel=1e-6), (ticker, key)
+            assert expected[key] == pytest.approx(reference[key], rel=1e-6), (ticker, key)
+        for key, value in per_ticker.items():
+            assert expected[key] == pytest.approx(value, rel=1e-6), (ticker, key)
+    assert gapped <= set(batch)
+
+
+def test_short_panel_returns_nothing():
+    provider = SyntheticDataProvider(tickers=3, days=20, end=date(2024, 6, 28))
+    panel = provider.build_panel(date(2024, 1, 1), date(2024, 6, 28))
+    assert TechnicalAnalyzer(provider).get_panel_indicators(panel) == {}
+    assert IndicatorEngine().latest_from_panel(panel) == ([], {})
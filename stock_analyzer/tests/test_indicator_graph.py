@@ -0,0 +1,99 @@
+"""
+지표 의존성 그래프 테스트
+"""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from stock_analyzer.analyzers.indicator_engine import IndicatorEngine, rolling_mean
+from stock_analyzer.analyzers.indicator_graph import (
+    IndicatorCache, IndicatorRegistry, IndicatorResolver, LATEST_INDICATORS, SERIES_INDICATORS,
+    default_registry
+)
+from stock_analyzer.config import AnalysisSettings
+from stock_analyzer.utils.synthetic_provider import SyntheticDataProvider
+
+END = date(2024, 6, 28)
+
+
+def make_frame(days=80):
+    provider = SyntheticDataProvider(tickers=2, days=days, end=END)
+    return provider.fetch_ohlcv(provider.tickers[0], date(2023, 1, 1), END)
+
+
+def test_registry_closure_and_warmup():
+    registry = default_registry(AnalysisSettings())
+    assert registry.closure(['volatility20', 'close']) == ['candle_spread', 'volatility20']
+    assert registry.warmup('MA20') == 19
+    assert registry.warmup('min_low_prev5') == 9
+    assert registry.required_bars(LATEST_INDICATORS) == 20
+
+    with pytest.raises(KeyError):
+        registry.closure(['MA200'])
+    with pytest.raises(ValueError):
+        registry.add('broken', ['MA200'], 5, rolling_mean)
+
+
+def test_matches_indicator_engine():
+    settings = AnalysisSettings()
+    df = make_frame()
+    resolver = IndicatorResolver(default_registry(settings), IndicatorCache(100))
+    engine = IndicatorEngine(settings)
+
+    columns = [df[c].to_numpy(float) for c in ('시가', '고가', '저가', '종가', '거래량')]
+    series = engine.series(*columns[1:])
+    resolved = resolver.resolve('A', df, SERIES_INDICATORS)
+    for name in SERIES_INDICATORS:
+        np.testing.assert_allclose(resolved[name], series[name], rtol=1e-12, equal_nan=True)
+
+    latest = engine.latest(*(c[None, :] for c in columns))
+    for name, value in resolver.latest('A', df).items():
+        assert value == pytest.approx(latest[name][0], rel=1e-9), name
+
+
+def test_memoized_once_per_ticker_and_bar():
+    calls = []
+    registry = IndicatorRegistry()
+    registry.add('MA20', ['close'], 20, lambda c: calls.append('MA20') or rolling_mean(c, 20))
+    registry.add('gap', ['close', 'MA20'], 1, lambda c, m: calls.append('gap') or c / m - 1)
+    resolver = IndicatorResolver(registry, IndicatorCache(100))
+    df = make_frame()
+
+    first = resolver.resolve('A', df, ['gap'])
+    assert calls == ['MA20', 'gap']
+
+    # 다른 소비자가 같은 봉의 지표 요청 - 다시 계산하지 않음
+    assert resolver.latest('A', df, ['MA20'])['MA20'] == pytest.approx(rolling_mean(df['종가'].to_numpy(float), 20)[-1])
+    np.testing.assert_array_equal(resolver.resolve('A', df, ['gap'])['gap'], first['gap'])
+    assert calls == ['MA20', 'gap']
+
+    # 더 짧은 이력 요청은 끝부분 재사용 (워밍업 구간은 새로 계산한 것과 같이 NaN)
+    short = df.tail(30)
+    reused = resolver.resolve('A', short, ['MA20'])['MA20']
+    assert calls == ['MA20', 'gap']
+    np.testing.assert_allclose(reused, rolling_mean(short['종가'].to_numpy(float), 20), equal_nan=True)
+
+    # 다른 종목, 마지막 봉이 바뀐 경우, 종목 코드가 없는 경우는 다시 계산
+    resolver.resolve('B', df, ['MA20'])
+    changed = df.copy()
+    changed.iloc[-1, changed.columns.get_loc('종가')] += 100
+    resolver.resolve('A', changed, ['MA20'])
+    resolver.resolve(None, df, ['MA20'])
+    assert calls.count('MA20') == 4
+
+
+def test_analyzer_paths_share_results():
+    from stock_analyzer.analyzers.technical import TechnicalAnalyzer
+
+    provider = SyntheticDataProvider(tickers=3, days=150)
+    analyzer = TechnicalAnalyzer(provider)
+    analyzer.resolver.cache = IndicatorCache(1000)
+    ticker = provider.tickers[0]
+
+    df = analyzer.fetch_and_analyze(ticker)
+    indicators = analyzer.get_latest_indicators(ticker)
+    assert indicators['MA20'] == pytest.approx(df['MA20'].iloc[-1])
+    # 두 번째 조회의 시계열 지표는 모두 캐시 적중
+    assert analyzer.resolver.cache.hits >= len(SERIES_INDICATORS)
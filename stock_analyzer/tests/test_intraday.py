@@ -0,0 +1,85 @@
+"""
+장중 증분 갱신 테스트
+"""
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_analyzer.analyzers.technical import TechnicalAnalyzer
+from stock_analyzer.utils.intraday import IntradayPanel, is_market_hours
+from stock_analyzer.utils.synthetic_provider import SyntheticDataProvider
+
+SESSION = date(2024, 6, 28)
+NOW = datetime(2024, 6, 28, 10, 0)
+
+
+class CountingProvider(SyntheticDataProvider):
+    """요청 구간을 기록하는 합성 제공자"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.requests = []
+
+    def fetch_ohlcv(self, ticker, start_date, end_date):
+        self.requests.append((start_date, end_date))
+        return super().fetch_ohlcv(ticker, start_date, end_date)
+
+
+@pytest.fixture
+def source():
+    return CountingProvider(tickers=40, days=150, end=SESSION, breakout_rate=0.3)
+
+
+def snapshot_of(provider):
+    """합성 데이터의 당일 전종목 스냅샷 (pykrx 형식: 티커 인덱스, 한글 컬럼)"""
+    calls = []
+
+    def fetch(date_str, market):
+        calls.append(date_str)
+        rows = {t: provider.build_panel(SESSION, SESSION, [t]).to_frame(t).iloc[-1] for t in provider.tickers}
+        return pd.DataFrame(rows).T
+    return fetch, calls
+
+
+def test_rerun_splices_only_todays_bar(source):
+    fetch, calls = snapshot_of(source)
+    intraday = IntradayPanel(source, fetch)
+
+    panel = intraday.refresh(source.tickers, now=NOW)
+    assert panel.dates[-1] == np.datetime64(SESSION)
+    assert all(end < SESSION for _, end in source.requests)  # 이력은 전일까지만
+
+    source.requests.clear()
+    panel = intraday.refresh(source.tickers, now=NOW)
+    assert source.requests == []  # 재실행은 스냅샷 한 번만
+    assert len(calls) == 2
+    assert intraday.last_refresh['updated'] == 40
+
+    # 꼬리 구간 지표 == 전체 이력 지표
+    analyzer = TechnicalAnalyzer(source)
+    full = analyzer.get_panel_indicators(source.build_panel(SESSION - timedelta(days=120), SESSION))
+    tail = analyzer.get_panel_indicators(panel.tail(analyzer.required_bars + 20))
+    assert tail.keys() == full.keys()
+    for ticker in full:
+        for key, value in full[ticker].items():
+            assert np.isclose(tail[ticker][key], value, rtol=1e-5), (ticker, key)
+
+
+def test_per_ticker_fallback_without_snapshot(source):
+    intraday = IntradayPanel(source, snapshot_fetcher=None)
+    intraday.refresh(source.tickers, now=NOW)
+
+    source.requests.clear()
+    intraday.refresh(source.tickers, now=NOW)
+    assert set(source.requests) == {(SESSION, SESSION)}
+    assert intraday.last_refresh['source'] == 'per_ticker'
+
+
+def test_market_hours_skip_weekday_holidays():
+    assert is_market_hours(datetime(2025, 10, 2, 10, 0))
+    assert not is_market_hours(datetime(2025, 10, 2, 15, 30))
+    assert not is_market_hours(datetime(2025, 10, 4, 10, 0))  # 토요일
+    assert not is_market_hours(datetime(2025, 10, 6, 10, 0))  # 추석 연휴 (월요일)
@@ -0,0 +1,130 @@
+"""
+거래일 달력 / 조회 기간 계획 테스트
+"""
+
+import logging
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from stock_analyzer.analyzers.indicator_engine import IndicatorEngine
+from stock_analyzer.analyzers.lookback import LookbackPlanner
+from stock_analyzer.analyzers.technical import TechnicalAnalyzer
+from stock_analyzer.config import AnalysisSettings
+from stock_analyzer.utils.synthetic_provider import SyntheticDataProvider
+from stock_analyzer.utils.trading_calendar import TradingCalendar
+
+
+def test_krx_calendar_skips_weekends_and_holidays():
+    calendar = TradingCalendar.krx()
+    # 2025 추석 연휴 (10/3 ~ 10/9)
+    assert not calendar.is_trading_day(date(2025, 10, 6))
+    assert calendar.previous_trading_day(date(2025, 10, 10)) == date(2025, 10, 2)
+    assert calendar.next_trading_day(date(2025, 10, 2)) == date(2025, 10, 10)
+    assert calendar.count(date(2025, 9, 29), date(2025, 10, 12)) == 5
+
+    # 표에 없는 연도는 고정 공휴일 + 연말 휴장일
+    assert not calendar.is_trading_day(date(2030, 8, 15))
+    assert not calendar.is_trading_day(date(2030, 12, 31))
+    assert calendar.is_trading_day(date(2030, 12, 30))
+
+    extra = TradingCalendar.krx([date(2030, 12, 30)])
+    assert not extra.is_trading_day(date(2030, 12, 30))
+
+    start = calendar.start_for_bars(date(2025, 10, 12), 10)
+    assert calendar.count(start, date(2025, 10, 12)) == 10
+    assert calendar.is_trading_day(start)
+
+
+def test_planner_derives_bars_from_indicators():
+    settings = AnalysisSettings()
+    planner = LookbackPlanner(settings, TradingCalendar.krx())
+    assert planner.required_bars == IndicatorEngine(settings).required_bars
+    assert planner.bars(['MA20']) == 20
+    assert planner.bars(['MA5'], history=3) == 7
+
+    end = date(2024, 9, 20)
+    start = planner.start_date(end, 20)
+    assert planner.calendar.count(start, end) == 20 + settings.lookback_margin_bars
+
+    fixed = LookbackPlanner(AnalysisSettings(lookback_days=120), TradingCalendar.krx())
+    assert fixed.start_date(end) == date(2024, 5, 23)
+
+
+def test_analyzer_fetches_only_planned_window():
+    requests = []
+    provider = SyntheticDataProvider(tickers=2, days=200)
+    original = provider.fetch_ohlcv
+    provider.fetch_ohlcv = lambda t, s, e: requests.append((s, e)) or original(t, s, e)
+    analyzer = TechnicalAnalyzer(provider)
+
+    indicators = analyzer.get_latest_indicators(provider.tickers[0])
+    assert indicators is not None
+
+    start, end = requests[-1]
+    assert start == analyzer.planner.start_date(end)
+    assert analyzer.planner.calendar.count(start, end) == (
+        analyzer.required_bars + analyzer.settings.lookback_margin_bars
+    )
+    assert len(requests) == 1  # 봉이 충분하면 다시 조회하지 않음
+
+
+class HolidayProvider(SyntheticDataProvider):
+    """달력이 모르는 휴장일(closed)을 빼고 돌려주는 대역 (조회 기간 기록)"""
+
+    def __init__(self, closed, **kwargs):
+        super().__init__(**kwargs)
+        self.closed = pd.DatetimeIndex(closed)
+        self.requests = []
+
+    def fetch_ohlcv(self, ticker, start_date, end_date):
+        self.requests.append((start_date, end_date))
+        df = super().fetch_ohlcv(ticker, start_date, end_date)
+        return None if df is None else df[~df.index.isin(self.closed)]
+
+
+def test_planner_widens_when_bars_missing():
+    """달력에 없는 휴장일이 여유 거래일보다 많으면 기간을 넓혀 다시 조회"""
+    end = date(2024, 6, 28)
+    calendar = TradingCalendar()  # 합성 제공자와 같은 평일 달력
+    planner = LookbackPlanner(AnalysisSettings(lookback_margin_bars=1), calendar)
+    bars = planner.required_bars
+    start = planner.start_date(end)
+
+    # 계획한 기간 안에 달력이 모르는 휴장일 5일
+    closed = calendar.trading_days(start, end)[5:10]
+    provider = HolidayProvider(closed, tickers=2, days=200, end=end)
+
+    df = planner.fetch(provider, provider.tickers[0], end)
+    assert len(df) >= bars
+    assert len(provider.requests) == 2
+    assert provider.requests[1][0] == planner.widened_start(end) < start
+
+    # 고정 기간 설정이면 넓히지 않음
+    provider.requests.clear()
+    fixed = LookbackPlanner(AnalysisSettings(lookback_days=30), calendar)
+    fixed.fetch(provider, provider.tickers[0], end)
+    assert len(provider.requests) == 1
+
+    # 패널 경로: 봉이 부족한 종목만 다시 조회 대상
+    panel = provider.build_panel(start, end)
+    panel.close[1, :-5] = np.nan
+    assert planner.short_tickers(panel, bars) == [panel.tickers[1]]
+
+
+def test_calendar_warns_once_for_unknown_years(caplog):
+    calendar = TradingCalendar.krx()
+    with caplog.at_level(logging.WARNING, logger='stock_analyzer.utils.trading_calendar'):
+        calendar.start_for_bars(date(2025, 12, 31), 40)
+        assert not caplog.records
+
+        calendar.start_for_bars(date(2040, 3, 2), 30)
+        calendar.count(date(2040, 1, 2), date(2040, 3, 2))
+    assert len(caplog.records) == 1
+    assert '2040' in caplog.records[0].getMessage()
+
+    # 알려진 연도를 지정하지 않은 달력은 경고하지 않음
+    caplog.clear()
+    TradingCalendar().start_for_bars(date(2040, 3, 2), 30)
+    assert not caplog.records
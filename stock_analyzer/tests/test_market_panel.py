@@ -0,0 +1,193 @@
+"""
+시장 패널 테스트
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_analyzer.analyzers.technical import TechnicalAnalyzer
+from stock_analyzer.utils.data_provider import DataProvider
+from stock_analyzer.utils.market_panel import MarketPanel
+
+
+def make_frame(seed: int, days: int = 60, start: str = '2024-01-02') -> pd.DataFrame:
+    """랜덤 워크 OHLCV 데이터프레임"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start, periods=days, name='Date')
+    close = np.round(10000 * np.exp(np.cumsum(rng.normal(0, 0.02, days))))
+    open_ = np.round(close * (1 + rng.normal(0, 0.01, days)))
+    return pd.DataFrame({
+        '시가': open_,
+        '고가': np.maximum(open_, close) + rng.integers(0, 200, days),
+        '저가': np.minimum(open_, close) - rng.integers(0, 200, days),
+        '종가': close,
+        '거래량': rng.integers(10_000, 1_000_000, days),
+    }, index=dates)
+
+
+class FrameProvider(DataProvider):
+    """미리 만든 데이터프레임을 반환하는 제공자"""
+
+    def __init__(self, frames):
+        self.frames = frames
+
+    def fetch_ohlcv(self, ticker, start_date, end_date):
+        df = self.frames.get(ticker)
+        if df is None:
+            return None
+        return df.loc[pd.Timestamp(start_date):pd.Timestamp(end_date)]
+
+    def get_stock_list(self, market='KRX'):
+        return pd.DataFrame()
+
+
+@pytest.fixture
+def frames():
+    """신규 상장 종목(짧은 이력) 포함 종목별 데이터"""
+    return {
+        '005930': make_frame(1),
+        '000660': make_frame(2),
+        '123456': make_frame(3, days=30, start='2024-02-13'),
+    }
+
+
+def test_panel_from_frames(frames):
+    """데이터프레임 -> 패널 -> 데이터프레임 왕복"""
+    panel = MarketPanel.from_frames(frames)
+
+    assert panel.shape == (3, 60)
+    assert panel.close.dtype == np.float32
+    assert panel.volume.dtype == np.int64
+    assert panel.valid[2].sum() == 30
+
+    restored = panel.to_frame('123456')
+    pd.testing.assert_frame_equal(
+        restored, frames['123456'], check_dtype=False, check_freq=False
+    )
+
+
+def test_panel_slicing_is_zero_copy(frames):
+    """행/날짜 슬라이싱은 원본 배열의 뷰"""
+    panel = MarketPanel.from_frames(frames)
+
+    window = panel.window(date(2024, 2, 1), date(2024, 2, 29))
+    assert np.shares_memory(window.close, panel.close)
+    assert window.dates[0] == np.datetime64('2024-02-01')
+    assert window.dates[-1] == np.datetime64('2024-02-29')
+
+    rows = panel[1:]
+    assert np.shares_memory(rows.high, panel.high)
+    assert rows.tickers == ['000660', '123456']
+    assert np.shares_memory(panel.tail(5).volume, panel.volume)
+
+
+def test_panel_from_provider(frames):
+    """제공자에서 패널 생성"""
+    provider = FrameProvider(frames)
+    panel = MarketPanel.from_provider(
+        provider, ['005930', '999999', '000660'], date(2024, 1, 2), date(2024, 3, 29)
+    )
+    assert panel.tickers == ['005930', '000660']
+
+
+def test_panel_indicators_match_dataframe_path(frames):
+    """패널 지표 계산은 종목별 데이터프레임 경로와 동일"""
+    provider = FrameProvider(frames)
+    analyzer = TechnicalAnalyzer(provider)
+    panel = MarketPanel.from_frames(frames)
+
+    batch = analyzer.get_panel_indicators(panel)
+
+    # 30일 이력은 지표 계산에 부족
+    assert set(batch) == {'005930', '000660'}
+
+    for ticker in batch:
+        df = analyzer._calculate_indicators(frames[ticker]).dropna()
+        last = df.iloc[-1]
+        expected = batch[ticker]
+        assert expected['MA20'] == pytest.approx(last['MA20'])
+        assert expected['high20'] == pytest.approx(last['high20'])
+        assert expected['vol_avg5'] == pytest.approx(last['vol_avg5'])
+        assert expected['volatility20'] == pytest.approx(last['volatility20'])
+        assert expected['min_low_prev5'] == pytest.approx(df['저가'].tail(10).head(5).min())
+
+
+def test_archive_roundtrip_is_memmapped(frames, tmp_path):
+    """아카이브 기록 후 읽기 전용 memmap으로 매핑"""
+    from datetime import datetime
+    from stock_analyzer.utils.panel_archive import write_archive, open_archive
+
+    panel = MarketPanel.from_frames(frames)
+    root = str(tmp_path / "archive")
+    write_archive(panel, root, as_of=datetime(2024, 3, 26, 16, 0))
+
+    mapped, meta = open_archive(root)
+    assert isinstance(mapped.close, np.memmap)
+    assert not mapped.close.flags.writeable
+    assert mapped.tickers == panel.tickers
+    np.testing.assert_array_equal(mapped.volume, panel.volume)
+    np.testing.assert_array_equal(mapped.dates, panel.dates)
+    assert meta.start_date == date(2024, 1, 2)
+
+    # 두 번째 기록은 새 세대로 교체
+    write_archive(panel.tail(10), root, as_of=datetime(2024, 3, 27, 16, 0))
+    remapped, _ = open_archive(root)
+    assert remapped.shape == (3, 10)
+
+
+def test_archive_provider_falls_back(frames, tmp_path):
+    """아카이브가 담지 않은 기간은 대체 제공자로 조회"""
+    from datetime import datetime
+    from stock_analyzer.utils.panel_archive import write_archive, ArchiveDataProvider
+
+    class CountingProvider(FrameProvider):
+        calls = 0
+
+        def fetch_ohlcv(self, ticker, start_date, end_date):
+            CountingProvider.calls += 1
+            return super().fetch_ohlcv(ticker, start_date, end_date)
+
+    root = str(tmp_path / "archive")
+    # 2024-03-25 장중 갱신 -> 03-22까지만 확정
+    write_archive(MarketPanel.from_frames(frames), root, as_of=datetime(2024, 3, 25, 11, 0))
+    provider = ArchiveDataProvider(root, fallback=CountingProvider(frames))
+
+    df = provider.fetch_ohlcv('005930', date(2024, 2, 1), date(2024, 3, 22))
+    assert CountingProvider.calls == 0
+    pd.testing.assert_frame_equal(
+        df, frames['005930'].loc['2024-02-01':'2024-03-22'], check_dtype=False, check_freq=False
+    )
+
+    provider.fetch_ohlcv('005930', date(2024, 2, 1), date(2024, 3, 25))
+    provider.fetch_ohlcv('005930', date(2023, 12, 1), date(2024, 3, 22))
+    assert CountingProvider.calls == 2
+
+
+def test_refresh_archive_skips_failed_tickers(frames, tmp_path):
+    """개별 종목의 일시적 오류는 제외하고 기록, 서킷이 열리면 중단"""
+    from stock_analyzer.utils.panel_archive import open_archive, refresh_archive
+    from stock_analyzer.utils.resilience import SourceUnavailableError, TransientSourceError
+
+    class ListingProvider(FrameProvider):
+        error = TransientSourceError
+
+        def fetch_ohlcv(self, ticker, start_date, end_date):
+            if ticker == '000660':
+                raise self.error('fake', f"{ticker} - 3회 시도 실패")
+            return super().fetch_ohlcv(ticker, start_date, end_date)
+
+        def get_stock_list(self, market='KRX'):
+            return pd.DataFrame({'Code': list(self.frames), 'Market': 'KOSPI'})
+
+    root = str(tmp_path / "archive")
+    provider = ListingProvider(frames)
+    panel = refresh_archive(provider, root, lookback_days=365 * 10, max_workers=1)
+    assert panel.tickers == ['005930', '123456']
+    assert open_archive(root)[0].tickers == ['005930', '123456']
+
+    provider.error = SourceUnavailableError
+    with pytest.raises(RuntimeError):
+        refresh_archive(provider, str(tmp_path / "down"), lookback_days=365 * 10, max_workers=1)
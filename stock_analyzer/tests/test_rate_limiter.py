@@ -0,0 +1,57 @@
+"""
+적응형 rate limiter 테스트
+"""
+
+import time
+
+import pytest
+
+from stock_analyzer.utils.rate_limiter import (
+    AdaptiveRateLimiter, RateLimit, get_rate_limiter, is_throttle_error
+)
+
+
+class FakeHTTPError(Exception):
+    def __init__(self, status):
+        self.status = status
+
+
+def test_token_bucket_paces_requests():
+    """버킷을 다 쓰면 속도에 맞춰 대기"""
+    limiter = AdaptiveRateLimiter('test', RateLimit(initial=50.0, minimum=1.0, maximum=100.0, burst=2))
+    started = time.monotonic()
+    waits = [limiter.acquire() for _ in range(6)]
+    elapsed = time.monotonic() - started
+
+    assert waits[:2] == [0.0, 0.0]
+    assert elapsed == pytest.approx(4 / 50, abs=0.03)
+
+
+def test_aimd_adjusts_rate():
+    """빠른 정상 응답은 가산 증가, 과부하 신호는 승산 감소 (쿨다운 내 1회)"""
+    limiter = AdaptiveRateLimiter('test', RateLimit(initial=10.0, minimum=1.0, maximum=12.0))
+
+    for _ in range(100):
+        limiter.record_success(latency=0.05)
+    assert limiter.rate == 12.0
+
+    limiter.record_success(latency=5.0)  # 느린 응답은 유지
+    limiter.record_status(503, latency=0.1)
+    limiter.record_failure()  # 쿨다운 내 추가 신호는 무시
+    assert limiter.rate == 6.0
+
+    with pytest.raises(FakeHTTPError):
+        with limiter.request():
+            raise FakeHTTPError(429)
+    assert limiter.failures == 3
+
+
+def test_throttle_errors():
+    assert is_throttle_error(TimeoutError())
+    assert is_throttle_error(FakeHTTPError(502))
+    assert not is_throttle_error(FakeHTTPError(404))
+    assert not is_throttle_error(ValueError("parse"))
+
+
+def test_shared_per_host():
+    assert get_rate_limiter('https://finance.naver.com/sise/theme.naver') is get_rate_limiter('finance.naver.com')
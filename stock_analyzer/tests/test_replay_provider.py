@@ -0,0 +1,125 @@
+"""
+녹화/재생 데이터 제공자 테스트
+"""
+
+import json
+import time
+from datetime import date
+
+import pandas as pd
+import pytest
+import requests
+
+from stock_analyzer.utils.data_provider import DataProvider
+from stock_analyzer.utils.replay_provider import Cassette, ReplayDataProvider, http_cassette
+from stock_analyzer.utils.resilience import TransientSourceError
+
+START, END = date(2024, 1, 2), date(2024, 1, 5)
+
+
+class FakeProvider(DataProvider):
+    """응답 시간을 조절할 수 있는 대역"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+
+    def fetch_ohlcv(self, ticker, start_date, end_date):
+        self.calls += 1
+        time.sleep(self.delay)
+        if ticker == 'down':
+            raise TransientSourceError('fake', "upstream down")
+        if ticker == 'none':
+            return None
+        index = pd.DatetimeIndex(pd.date_range(start_date, end_date), name='Date')
+        return pd.DataFrame({
+            '시가': 1.0, '고가': 2.0, '저가': 0.5, '종가': float(len(ticker)), '거래량': 100
+        }, index=index)
+
+    def get_stock_list(self, market='KRX'):
+        return pd.DataFrame({'Code': ['005930'], 'Name': ['삼성전자'], 'Market': [market]})
+
+
+def record(path, tickers, delay=0.0):
+    source = FakeProvider(delay)
+    recorder = ReplayDataProvider(Cassette(path), upstream=source)
+    for ticker in tickers:
+        try:
+            recorder.fetch_ohlcv(ticker, START, END)
+        except TransientSourceError:
+            pass
+    recorder.get_stock_list('KRX')
+    recorder.save()
+    return source
+
+
+def test_replay_serves_recorded_responses(tmp_path):
+    path = tmp_path / 'provider.zip'
+    source = record(path, ['005930', 'none', 'down'])
+
+    replay = ReplayDataProvider(Cassette(path))
+    expected = source.fetch_ohlcv('005930', START, END)
+    pd.testing.assert_frame_equal(replay.fetch_ohlcv('005930', START, END), expected, check_freq=False)
+    assert replay.fetch_ohlcv('none', START, END) is None
+    with pytest.raises(TransientSourceError):
+        replay.fetch_ohlcv('down', START, END)
+    assert list(replay.get_stock_list('KRX')['Code']) == ['005930']
+
+    # 날짜 구간이 달라도 같은 종목의 녹화 응답 사용, 녹화되지 않은 종목은 누락으로 집계
+    assert replay.fetch_ohlcv('005930', START, date(2024, 2, 1)) is not None
+    assert replay.fetch_ohlcv('000660', START, END) is None
+    assert replay.get_replay_stats()['misses'] == 1
+
+
+def test_recorded_latency_reinjected(tmp_path):
+    path = tmp_path / 'provider.zip'
+    record(path, ['005930'], delay=0.05)
+
+    fast = ReplayDataProvider(Cassette(path))
+    started = time.monotonic()
+    fast.fetch_ohlcv('005930', START, END)
+    assert time.monotonic() - started < 0.04
+
+    slow = ReplayDataProvider(Cassette(path), latency='recorded')
+    started = time.monotonic()
+    slow.fetch_ohlcv('005930', START, END)
+    assert time.monotonic() - started >= 0.05
+
+
+def test_http_cassette_replays_requests(tmp_path, monkeypatch):
+    """크롤러의 requests 호출을 네트워크 없이 재생"""
+    def fake_request(session, method, url, params=None, data=None, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.headers['Content-Type'] = 'text/html; charset=euc-kr'
+        response.encoding = 'euc-kr'
+        response.url = url
+        response._content = '<td>테마</td>'.encode('euc-kr')
+        return response
+
+    path = tmp_path / 'http.zip'
+    monkeypatch.setattr(requests.Session, 'request', fake_request)
+    with http_cassette(path, mode='record'):
+        requests.get('https://finance.naver.com/sise/theme.naver', params={'page': 1})
+
+    def offline(*args, **kwargs):
+        raise AssertionError("네트워크 요청 발생")
+
+    monkeypatch.setattr(requests.Session, 'request', offline)
+    with http_cassette(path, mode='replay'):
+        response = requests.get('https://finance.naver.com/sise/theme.naver', params={'page': 1})
+        assert response.status_code == 200
+        assert response.text == '<td>테마</td>'
+        with pytest.raises(requests.ConnectionError):
+            requests.get('https://finance.naver.com/sise/theme.naver', params={'page': 2})
+
+
+def test_telegram_outbox(tmp_path):
+    from stock_analyzer.notifiers.telegram import TelegramNotifier
+
+    outbox = tmp_path / 'outbox.jsonl'
+    notifier = TelegramNotifier(outbox=str(outbox))
+    assert notifier.send_message_sync('안녕하세요')
+
+    lines = outbox.read_text(encoding='utf-8').splitlines()
+    assert json.loads(lines[0])['text'] == '안녕하세요'
@@ -0,0 +1,153 @@
+"""
+프로세스 간 요청 조율 테스트
+"""
+
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from stock_analyzer.utils.rate_limiter import AdaptiveRateLimiter, RateLimit
+from stock_analyzer.utils.request_governor import _RETURN_SECONDS, RequestGovernor
+
+HOST = 'example.com'
+
+
+def _worker(path: str, count: int) -> list:
+    """별도 프로세스에서 요청 슬롯을 받아 시각을 기록"""
+    governor = RequestGovernor(path)
+    stamps = []
+    for _ in range(count):
+        governor.acquire(HOST, rate=100.0, burst=1, max_inflight=4)
+        stamps.append(time.time())
+        governor.release(HOST)
+    return stamps
+
+
+def test_rate_shared_between_processes(tmp_path):
+    """세 프로세스의 요청 합계가 공용 속도를 넘지 않음"""
+    with multiprocessing.get_context('spawn').Pool(3) as pool:
+        results = pool.starmap(_worker, [(str(tmp_path), 10)] * 3)
+
+    stamps = sorted(stamp for stamps in results for stamp in stamps)
+    assert len(stamps) == 30
+    assert stamps[-1] - stamps[0] >= 29 / 100.0 * 0.9
+
+    report = RequestGovernor(str(tmp_path)).report(HOST)[HOST]
+    assert report == []  # 종료된 프로세스 기록은 정리됨
+
+
+def test_inflight_limit_and_report(tmp_path):
+    """동시 요청 한도는 프로세스 합계로 적용되고, 사용 중인 프로세스를 보고"""
+    mine = RequestGovernor(str(tmp_path))
+    other = RequestGovernor(str(tmp_path))
+    other.pid, other.name = os.getppid(), 'KRX_crawling2.py'  # 살아 있는 다른 프로세스
+
+    other.acquire(HOST, rate=1000.0, burst=10, max_inflight=2)
+    other.acquire(HOST, rate=1000.0, burst=10, max_inflight=2)
+    assert mine._try_reserve(HOST, 1000.0, 10, 2) is None
+
+    rows = mine.report(HOST)[HOST]
+    assert [(row['name'], row['inflight'], row['requests']) for row in rows] == [('KRX_crawling2.py', 2, 2)]
+
+    other.release(HOST)
+    time.sleep(_RETURN_SECONDS * 3)  # 쓰지 않는 슬롯은 잠시 뒤 반환
+    assert mine._try_reserve(HOST, 1000.0, 10, 2) == 0.0
+    assert {row['pid'] for row in mine.report(HOST)[HOST]} == {os.getpid(), os.getppid()}
+
+
+def test_slots_and_tokens_leased_in_batches(tmp_path):
+    """요청마다 상태 파일을 잠그지 않고 토큰/슬롯을 묶어 받으며, 속도 상한은 그대로 지킴"""
+    governor = RequestGovernor(str(tmp_path))
+    locks = 0
+    state = governor._state
+
+    def counting_state(host):
+        nonlocal locks
+        locks += 1
+        return state(host)
+
+    governor._state = counting_state
+    started = time.monotonic()
+    for _ in range(100):
+        governor.acquire(HOST, rate=200.0, burst=1, max_inflight=16)
+        governor.release(HOST)
+    elapsed = time.monotonic() - started
+
+    assert locks <= 100 / 20 + 2  # 토큰 20개(200/s x 0.1초)씩
+    assert elapsed >= 99 / 200.0 * 0.9
+
+    governor._state = state
+    rows = governor.report(HOST)[HOST]
+    assert (rows[0]['requests'], rows[0]['inflight']) == (100, 0)
+
+
+def test_dead_process_slots_reclaimed(tmp_path):
+    """종료된 프로세스가 잡고 있던 요청 슬롯은 회수"""
+    proc = subprocess.Popen([sys.executable, '-c', 'pass'])
+    proc.wait()
+
+    crashed = RequestGovernor(str(tmp_path))
+    crashed.pid = proc.pid
+    crashed.acquire(HOST, rate=1000.0, burst=10, max_inflight=1)  # release 없이 종료
+
+    governor = RequestGovernor(str(tmp_path))
+    assert governor.acquire(HOST, rate=1000.0, burst=10, max_inflight=1) < 1.0
+    assert [row['pid'] for row in governor.report(HOST)[HOST]] == [os.getpid()]
+
+
+def test_limiter_releases_governor_slot(tmp_path):
+    """rate limiter 요청 컨텍스트는 예외가 나도 조율기 슬롯을 반납"""
+    governor = RequestGovernor(str(tmp_path))
+    limiter = AdaptiveRateLimiter(HOST, RateLimit(1e6, 1e6, 1e6, burst=100, max_inflight=1), governor=governor)
+
+    try:
+        with limiter.request():
+            assert governor.report(HOST)[HOST][0]['inflight'] == 1
+            raise ValueError("parse error")
+    except ValueError:
+        pass
+
+    with limiter.request():
+        pass
+    assert governor.report(HOST)[HOST][0]['requests'] == 2
+    assert governor.report(HOST)[HOST][0]['inflight'] == 0
+
+
+def test_async_acquire_does_not_block_event_loop(tmp_path):
+    """다른 프로세스가 상태 파일을 잠그고 있어도 이벤트 루프의 다른 코루틴은 계속 실행"""
+    holder = RequestGovernor(str(tmp_path))
+    governor = RequestGovernor(str(tmp_path))
+    locked = threading.Event()
+
+    def hold_lock():
+        with holder._state(HOST):
+            locked.set()
+            time.sleep(0.3)
+
+    async def run():
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        beat = asyncio.create_task(heartbeat())
+        await governor.acquire_async(HOST, rate=1000.0, burst=10, max_inflight=4)
+        beat.cancel()
+        await governor.release_async(HOST)
+        return ticks
+
+    thread = threading.Thread(target=hold_lock)
+    thread.start()
+    locked.wait()
+    ticks = asyncio.run(run())
+    thread.join()
+
+    assert ticks >= 10
+    assert governor.report(HOST)[HOST][0]['inflight'] == 0
@@ -0,0 +1,137 @@
+"""
+재시도/서킷 브레이커 테스트
+"""
+
+import time
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from stock_analyzer.utils.data_provider import DataProvider
+from stock_analyzer.utils.parallel import ParallelProcessor
+from stock_analyzer.utils.resilience import (
+    CircuitBreaker, DataSourceError, ResilientDataProvider, RetryPolicy,
+    SourceUnavailableError, TransientSourceError
+)
+
+START, END = date(2024, 1, 2), date(2024, 1, 5)
+FRAME = pd.DataFrame(
+    {'시가': [1.0], '고가': [1.0], '저가': [1.0], '종가': [1.0], '거래량': [1]},
+    index=pd.DatetimeIndex(['2024-01-02'], name='Date')
+)
+
+
+class FlakyProvider(DataProvider):
+    """처음 fail_times번은 연결 오류를 내는 대역"""
+
+    def __init__(self, fail_times=0, error=ConnectionError):
+        self.fail_times = fail_times
+        self.error = error
+        self.calls = 0
+
+    def fetch_ohlcv(self, ticker, start_date, end_date):
+        self.calls += 1
+        if self.calls <= self.fail_times:
+            raise self.error("upstream down")
+        return FRAME
+
+    def get_stock_list(self, market='KRX'):
+        return pd.DataFrame()
+
+
+def make_provider(source, threshold=3, reset_seconds=30.0):
+    return ResilientDataProvider(
+        source, 'fake',
+        retry=RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.01),
+        breaker=CircuitBreaker('fake', failure_threshold=threshold, reset_seconds=reset_seconds)
+    )
+
+
+def test_transient_errors_retried():
+    source = FlakyProvider(fail_times=2)
+    provider = make_provider(source)
+    assert provider.fetch_ohlcv('005930', START, END) is FRAME
+    assert source.calls == 3
+    assert provider.get_resilience_stats()['retries'] == 2
+
+
+def test_permanent_errors_not_retried():
+    """일시적이지 않은 오류는 재시도 없이 기존처럼 None"""
+    source = FlakyProvider(fail_times=10, error=KeyError)
+    provider = make_provider(source)
+    assert provider.fetch_ohlcv('999999', START, END) is None
+    assert source.calls == 1
+    assert provider.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_permanent_source_errors_raised():
+    """감싼 소스의 일시적이지 않은 장애는 None이 아니라 예외로 전달하고 서킷 실패로 집계"""
+    source = FlakyProvider(fail_times=10, error=lambda message: DataSourceError('fake', message))
+    provider = make_provider(source, threshold=2)
+
+    for _ in range(2):
+        with pytest.raises(DataSourceError) as info:
+            provider.fetch_ohlcv('005930', START, END)
+        assert not isinstance(info.value, TransientSourceError)
+    assert source.calls == 2  # 재시도 없음
+    assert provider.breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(SourceUnavailableError):
+        provider.fetch_ohlcv('005930', START, END)
+
+
+def test_breaker_opens_and_recovers():
+    """연속 실패 후 요청 없이 바로 실패하고, 리셋 시간이 지나면 시험 요청으로 복구"""
+    source = FlakyProvider(fail_times=9)
+    provider = make_provider(source, threshold=3, reset_seconds=0.2)
+
+    for _ in range(3):
+        with pytest.raises(TransientSourceError):
+            provider.fetch_ohlcv('005930', START, END)
+    assert source.calls == 9
+    assert provider.breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(SourceUnavailableError):
+        provider.fetch_ohlcv('005930', START, END)
+    assert source.calls == 9  # 차단 중에는 요청하지 않음
+
+    time.sleep(0.25)
+    assert provider.fetch_ohlcv('005930', START, END) is FRAME
+    assert provider.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_scan_stops_early_on_outage():
+    """소스가 중단되면 전체 타임아웃까지 기다리지 않고 부분 처리 결과를 보고"""
+    provider = make_provider(FlakyProvider(fail_times=10 ** 6), threshold=3)
+    tickers = [f"{i:06d}" for i in range(500)]
+
+    result = ParallelProcessor(max_workers=4).process(
+        tickers,
+        lambda ticker: provider.fetch_ohlcv(ticker, START, END),
+        stop_on=(SourceUnavailableError,)
+    )
+
+    assert result.stopped is not None
+    assert result.completed < 50
+    assert result.coverage == 0.0
+
+
+def test_snapshot_errors_retried():
+    """스냅샷 제공자의 TransientSourceError도 재시도 대상"""
+    from stock_analyzer.utils.data_provider import KRXSnapshotDataProvider
+    from stock_analyzer.utils.trading_calendar import TradingCalendar
+
+    calls = []
+
+    def fetcher(date_str, market):
+        calls.append(date_str)
+        if len(calls) == 1:
+            raise ConnectionError("reset by peer")
+        return FRAME.reset_index(drop=True).set_axis(pd.Index(['005930'], name='티커'))
+
+    source = KRXSnapshotDataProvider(fetcher, listing_provider=FlakyProvider(), calendar=TradingCalendar())
+    provider = make_provider(source)
+    df = provider.fetch_ohlcv('005930', START, START)
+    assert len(df) == 1
+    assert calls == ['20240102', '20240102']
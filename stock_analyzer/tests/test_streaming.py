@@ -0,0 +1,64 @@
+"""
+스트리밍 지표 상태 테스트
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_analyzer.analyzers.indicator_engine import IndicatorEngine
+from stock_analyzer.analyzers.streaming import IndicatorState, IndicatorStateBook
+from stock_analyzer.utils.synthetic_provider import SyntheticDataProvider
+
+END = date(2024, 6, 28)
+FIELDS = ['시가', '고가', '저가', '종가', '거래량']
+
+
+@pytest.fixture(scope='module')
+def frames():
+    provider = SyntheticDataProvider(tickers=5, days=400, end=END, breakout_rate=0.5)
+    return {t: provider.fetch_ohlcv(t, date(2022, 1, 1), END) for t in provider.tickers}
+
+
+def test_peek_matches_engine_at_every_bar(frames):
+    """상태에 확정 봉을 하나씩 더하며 당일 봉 peek == 전체 이력 지표 (재동기화 주기 이후 포함)"""
+    engine = IndicatorEngine()
+    df = frames['000002']
+    values = df[FIELDS].to_numpy(np.float64)
+
+    state = IndicatorState()
+    checked = 0
+    for i, session in enumerate(df.index.date):
+        indicators = state.peek(*values[i])
+        if i + 1 >= engine.required_bars:
+            expected = engine.latest(*(values[:i + 1, k][None, :] for k in range(5)))
+            for key, value in expected.items():
+                assert indicators[key] == pytest.approx(value[0], rel=1e-9, abs=1e-9), (i, key)
+            checked += 1
+        else:
+            assert indicators is None
+        state.push(*values[i], session)
+    assert checked > 300
+
+
+def test_book_roundtrip_and_advance(frames, tmp_path):
+    book = IndicatorStateBook()
+    for ticker, df in frames.items():
+        assert book.advance(ticker, df.iloc[:-2]) == len(df) - 2
+    path = str(tmp_path / 'state.parquet')
+    book.save(path)
+
+    restored = IndicatorStateBook.load(path)
+    assert len(restored) == len(frames)
+    for ticker, df in frames.items():
+        # 다음 실행 - 새 확정 봉 하나만 반영
+        assert restored.advance(ticker, df.iloc[:-1]) == 1
+        assert book.advance(ticker, df.iloc[:-1]) == 1
+        today = df.iloc[-1]
+        assert restored.peek(ticker, today) == pytest.approx(book.peek(ticker, today))
+
+    snapshot = pd.DataFrame({t: df.iloc[-1][FIELDS] for t, df in frames.items()}).T
+    assert set(restored.peek_all(snapshot, END)) == set(frames)
+    assert restored.peek_all(snapshot, date(2024, 6, 27)) == {}  # 이미 반영된 거래일
@@ -0,0 +1,50 @@
+"""
+합성 데이터 제공자 테스트
+"""
+
+from datetime import date
+
+import numpy as np
+
+from stock_analyzer.analyzers.classifier import SignalClassifier
+from stock_analyzer.analyzers.technical import TechnicalAnalyzer
+from stock_analyzer.utils.synthetic_provider import SyntheticDataProvider
+
+END = date(2024, 6, 28)
+
+
+def make_provider(**kwargs):
+    options = dict(tickers=300, days=120, seed=7, end=END, breakout_rate=0.3)
+    options.update(kwargs)
+    return SyntheticDataProvider(**options)
+
+
+def test_series_reproducible_and_valid():
+    provider = make_provider()
+    first = provider.fetch_ohlcv('000042', date(2024, 1, 1), END)
+    again = make_provider().fetch_ohlcv('000042', date(2024, 1, 1), END)
+
+    assert first.equals(again)
+    assert first.index[-1] == np.datetime64(END)
+    assert (first['고가'] >= first[['시가', '종가']].max(axis=1)).all()
+    assert (first['저가'] <= first[['시가', '종가']].min(axis=1)).all()
+    assert (first['거래량'] >= 0).all()
+    assert provider.fetch_ohlcv('999999', date(2024, 1, 1), END) is None
+
+
+def test_injected_patterns_classified():
+    """주입한 A/B/C 패턴이 분류기에서 같은 등급으로 나옴"""
+    provider = make_provider()
+    panel = provider.build_panel(date(2024, 1, 1), END)
+    indicators = TechnicalAnalyzer(provider).get_panel_indicators(panel)
+    grades = SignalClassifier().classify_all(indicators)
+
+    injected = {t: provider.injected_grade(t) for t in provider.tickers if provider.injected_grade(t)}
+    assert set(injected.values()) == {'A', 'B', 'C'}
+    for ticker, grade in injected.items():
+        assert grades[ticker].grade == grade, ticker
+
+
+def test_error_injection():
+    provider = make_provider(error_rate=1.0)
+    assert provider.fetch_ohlcv('000001', date(2024, 1, 1), END) is None
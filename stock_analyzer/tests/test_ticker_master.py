@@ -0,0 +1,84 @@
+"""
+종목 마스터 테스트
+"""
+
+import pandas as pd
+import pytest
+
+from stock_analyzer.utils.ticker_master import TickerMaster, to_chosung
+
+
+class ListingFetcher:
+    """호출 횟수를 세는 종목 리스트 대역"""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    def __call__(self):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("listing unavailable")
+        return pd.DataFrame({
+            'Code': ['005930', '005935', '000660', '247540', '028300', '123450'],
+            'Name': ['삼성전자', '삼성전자우', 'SK하이닉스', '에코프로비엠', 'HLB', '코넥스종목'],
+            'Market': ['KOSPI', 'KOSPI', 'KOSPI', 'KOSDAQ', 'KOSDAQ', 'KONEX'],
+            'Marcap': [1, 2, 3, 4, 5, 6],
+        })
+
+
+@pytest.fixture
+def fetcher():
+    return ListingFetcher()
+
+
+@pytest.fixture
+def master(fetcher, tmp_path):
+    return TickerMaster(fetcher, str(tmp_path / "ticker_master.parquet"))
+
+
+def test_chosung():
+    assert to_chosung('삼성전자') == 'ㅅㅅㅈㅈ'
+    assert to_chosung('SK하이닉스') == 'SKㅎㅇㄴㅅ'
+
+
+def test_lookup_and_search(master):
+    """코드/이름 조회와 앞부분/초성 검색"""
+    assert master.get('005930').name == '삼성전자'
+    assert master.name_of('999999', '?') == '?'
+    assert master.code_of('sk 하이닉스') == '000660'
+
+    assert [i.code for i in master.search('삼성')] == ['005930', '005935']
+    assert [i.code for i in master.search('ㅅㅅㅈㅈ')] == ['005930', '005935']
+    assert [i.code for i in master.search('skㅎ')] == ['000660']
+    assert master.search('247540')[0].name == '에코프로비엠'
+
+    assert master.resolve('삼성전자').code == '005930'
+    assert master.resolve('에코').code == '247540'
+    assert master.resolve('삼성') is None  # 후보가 여러 개
+
+
+def test_market_filters(master):
+    """시장별 목록은 시장 조합마다 한 번만 생성"""
+    assert master.codes(['KOSPI', 'KOSDAQ']) == ['005930', '005935', '000660', '247540', '028300']
+    records = master.records(['KOSDAQ'])
+    assert records == [
+        {'Code': '247540', 'Name': '에코프로비엠', 'Market': 'KOSDAQ'},
+        {'Code': '028300', 'Name': 'HLB', 'Market': 'KOSDAQ'},
+    ]
+    assert master.records(['KOSDAQ'])[0] is records[0]
+    assert list(master.listing(['KONEX'])['Code']) == ['123450']
+
+
+def test_listing_persisted_daily(master, fetcher, tmp_path):
+    """같은 날 다른 인스턴스는 디스크에서 읽고, 갱신 실패 시 저장된 리스트 사용"""
+    assert len(master) == 6
+    assert fetcher.calls == 1
+
+    other = TickerMaster(fetcher, str(tmp_path / "ticker_master.parquet"))
+    assert other.get('000660').market == 'KOSPI'
+    assert fetcher.calls == 1
+
+    fetcher.fail = True
+    other.refresh()
+    assert '005930' in other
@@ -0,0 +1,84 @@
+"""
+2단계 급등주 스크리닝 테스트
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from stock_analyzer.analyzers.classifier import SignalClassifier
+from stock_analyzer.analyzers.technical import TechnicalAnalyzer
+from stock_analyzer.database.operations import DatabaseManager
+from stock_analyzer.screeners.surge_screener import StockScreener
+from stock_analyzer.utils.synthetic_provider import SyntheticDataProvider
+from stock_analyzer.utils.ticker_master import TickerMaster
+
+class CountingProvider(SyntheticDataProvider):
+    """이력 조회 종목을 기록하는 합성 제공자"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.fetched = []
+
+    def fetch_ohlcv(self, ticker, start_date, end_date):
+        self.fetched.append(ticker)
+        return super().fetch_ohlcv(ticker, start_date, end_date)
+
+
+def snapshot_of(provider):
+    """합성 데이터의 일자별 전종목 스냅샷 (pykrx 형식: 티커 인덱스, 한글 컬럼)"""
+    def fetch(date_str, market):
+        day = datetime.strptime(date_str, "%Y%m%d").date()
+        rows = {}
+        for ticker in provider.tickers:
+            df = SyntheticDataProvider.fetch_ohlcv(provider, ticker, day, day)
+            if df is not None and not df.empty:
+                rows[ticker] = df.iloc[-1]
+        return pd.DataFrame(rows).T
+    return fetch
+
+
+def last_session(provider):
+    return pd.Timestamp(provider.dates[-1]).date()
+
+
+@pytest.fixture
+def screener(tmp_path, monkeypatch):
+    # 분석기가 오늘 기준으로 이력을 조회하므로 합성 데이터도 오늘까지 생성
+    source = CountingProvider(tickers=120, days=150, breakout_rate=0.3)
+    db = DatabaseManager(f"sqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setattr(db, 'save_surge_results', lambda results: None)
+    master = TickerMaster.from_provider(source, path=str(tmp_path / 'tickers.parquet'))
+    return StockScreener(source, db, TechnicalAnalyzer(source), SignalClassifier(), master)
+
+
+@pytest.mark.parametrize('min_grade', ['A', 'B'])
+def test_two_phase_matches_full_scan(screener, min_grade):
+    source = screener.data_provider
+    full = screener.screen_surge_stocks(market='KRX', max_workers=4)
+    full_fetches = len(source.fetched)
+
+    source.fetched.clear()
+    two_phase = screener.screen_surge_stocks_two_phase(
+        market='KRX', min_grade=min_grade, max_workers=4,
+        snapshot_fetcher=snapshot_of(source), session=last_session(screener.data_provider)
+    )
+
+    grades = 'AB'[:'AB'.index(min_grade) + 1]
+    for grade in 'ABC':
+        expected = full[grade] if grade in grades else []
+        assert sorted(r['종목코드'] for r in two_phase[grade]) == sorted(r['종목코드'] for r in expected)
+    assert two_phase['A']
+    assert 0 < len(source.fetched) < full_fetches
+
+
+def test_without_snapshot_falls_back_to_full_scan(screener):
+    full = screener.screen_surge_stocks(market='KRX', max_workers=4)
+    fallback = screener.screen_surge_stocks_two_phase(
+        market='KRX', min_grade='B', max_workers=4,
+        snapshot_fetcher=lambda date_str, market: None, session=last_session(screener.data_provider)
+    )
+    assert fallback['A']
+    assert sorted(r['종목코드'] for r in fallback['A']) == sorted(r['종목코드'] for r in full['A'])
+    assert fallback['C'] == []
@@ -0,0 +1,103 @@
+"""
+스캔 종목군 인덱스 테스트
+"""
+
+import pandas as pd
+import pytest
+
+from stock_analyzer.analyzers.classifier import SignalClassifier
+from stock_analyzer.analyzers.technical import TechnicalAnalyzer
+from stock_analyzer.database.operations import DatabaseManager
+from stock_analyzer.screeners.surge_screener import StockScreener
+from stock_analyzer.utils.synthetic_provider import SyntheticDataProvider
+from stock_analyzer.utils.ticker_master import TickerMaster
+from stock_analyzer.utils.universe import UniverseIndex, get_preset, instrument_type
+
+LISTING = pd.DataFrame([
+    ('005930', '삼성전자', 'KOSPI'),
+    ('005935', '삼성전자우', 'KOSPI'),
+    ('005387', '현대차2우B', 'KOSPI'),
+    ('069500', 'KODEX 200', 'KOSPI'),
+    ('440790', '하나30호스팩', 'KOSDAQ'),
+    ('395400', 'SK리츠', 'KOSPI'),
+    ('035720', '카카오', 'KOSPI'),   # 거래정지
+    ('123400', '소형주', 'KOSDAQ'),  # 거래대금 부족
+], columns=['Code', 'Name', 'Market'])
+
+# 종목별 하루 거래대금 (원), 0이면 거래정지
+TURNOVER = {
+    '005930': 1e12, '005935': 5e10, '005387': 2e9, '069500': 3e11,
+    '440790': 1e9, '395400': 2e9, '035720': 0, '123400': 1e8,
+}
+
+
+def make_snapshot_fetcher():
+    calls = []
+
+    def fetch(date_str, market):
+        calls.append(date_str)
+        return pd.DataFrame({
+            '종가': 10000.0,
+            '거래량': [value / 10000 for value in TURNOVER.values()],
+            '거래대금': list(TURNOVER.values()),
+        }, index=list(TURNOVER))
+    return fetch, calls
+
+
+def test_instrument_types():
+    types = {code: instrument_type(code, name, market) for code, name, market in LISTING.itertuples(index=False)}
+    assert types == {
+        '005930': 'common', '005935': 'preferred', '005387': 'preferred', '069500': 'etf',
+        '440790': 'spac', '395400': 'reit', '035720': 'common', '123400': 'common',
+    }
+    assert instrument_type('580001', '신한 레버리지 WTI원유 선물 ETN') == 'etn'
+    # 운용사 브랜드로 시작하는 회사명은 보통주
+    assert instrument_type('138930', 'BNK금융지주', 'KOSPI') == 'common'
+    assert instrument_type('000000', 'SOLID', 'KOSDAQ') == 'common'
+    assert instrument_type('0000A0', 'SOL 미국배당다우존스', 'KOSPI') == 'etf'
+
+
+def test_presets_and_daily_reuse(tmp_path):
+    master = TickerMaster(lambda: LISTING, path=str(tmp_path / 'tickers.parquet'))
+    fetch, calls = make_snapshot_fetcher()
+    index = UniverseIndex(master, fetch, path=str(tmp_path / 'universe.parquet'))
+
+    assert sorted(index.codes('all')) == sorted(LISTING['Code'])
+    assert sorted(index.codes('common')) == ['005930', '123400']
+    assert index.codes('tradable') == ['005930']
+    assert index.table.loc['035720', 'Halted']
+    assert (index.table['Sessions'] == 20).all()
+    assert len(calls) == 20
+
+    # 같은 날 다른 프로세스는 저장된 인덱스 사용
+    other = UniverseIndex(master, fetch, path=str(tmp_path / 'universe.parquet'))
+    assert other.codes('tradable') == ['005930']
+    assert len(calls) == 20
+
+    with pytest.raises(ValueError):
+        get_preset('unknown')
+
+
+def test_screener_scans_only_preset(tmp_path, monkeypatch):
+    source = SyntheticDataProvider(tickers=30, days=60)
+    fetched = []
+    original = source.fetch_ohlcv
+    monkeypatch.setattr(source, 'fetch_ohlcv', lambda t, s, e: fetched.append(t) or original(t, s, e))
+
+    liquid = set(source.tickers[::3])
+    master = TickerMaster.from_provider(source, path=str(tmp_path / 'tickers.parquet'))
+    index = UniverseIndex(
+        master,
+        lambda date_str, market: pd.DataFrame(
+            {'종가': 1000.0, '거래량': [5e6 if t in liquid else 10.0 for t in source.tickers]},
+            index=source.tickers
+        ),
+        path=str(tmp_path / 'universe.parquet')
+    )
+    db = DatabaseManager(f"sqlite:///{tmp_path / 'test.db'}")
+    screener = StockScreener(
+        source, db, TechnicalAnalyzer(source), SignalClassifier(), master, universe_index=index
+    )
+
+    screener.screen_by_ma_threshold(0.0, universe='tradable', max_workers=4)
+    assert set(fetched) == liquid
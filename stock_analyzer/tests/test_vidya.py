@@ -0,0 +1,85 @@
+"""
+VIDYA / Volumatic VIDYA 커널 테스트
+"""
+
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+
+from stock_analyzer.analyzers import vidya as kernels
+from stock_analyzer.utils.market_panel import MarketPanel
+from stock_analyzer.utils.synthetic_provider import SyntheticDataProvider
+
+
+def reference(close: pd.Series, volume: pd.Series, period: int, cmo_period: int):
+    """기존 스크립트(vidya_indicator.py)의 봉 단위 루프"""
+    delta = close.diff()
+    up_sum = delta.clip(lower=0).rolling(cmo_period).sum()
+    down_sum = (-delta).clip(lower=0).rolling(cmo_period).sum()
+    cmo_ratio = (100 * (up_sum - down_sum) / (up_sum + down_sum)).abs() / 100
+    volume_ratio = (volume / volume.rolling(period).mean()).clip(upper=2.0)
+    alpha = 2 / (period + 1)
+
+    plain = [close.iloc[0]]
+    volumatic = [close.iloc[0]]
+    for i in range(1, len(close)):
+        c, v = cmo_ratio.iloc[i], volume_ratio.iloc[i]
+        if pd.notna(c):
+            a = alpha * c
+            plain.append(a * close.iloc[i] + (1 - a) * plain[-1])
+        else:
+            plain.append(plain[-1])
+        if pd.notna(c) and pd.notna(v):
+            a = min(alpha * c * v, 1.0)
+            volumatic.append(a * close.iloc[i] + (1 - a) * volumatic[-1])
+        else:
+            volumatic.append(volumatic[-1])
+    return np.array(plain), np.array(volumatic)
+
+
+def test_matches_reference_loop_1d_and_2d():
+    provider = SyntheticDataProvider(tickers=4, days=120)
+    frames = [provider.fetch_ohlcv(t, provider.dates[0], provider.dates[-1]) for t in provider.tickers]
+    # 보합 구간 (CMO 0/0 → NaN) 포함
+    frames[0].loc[frames[0].index[30:40], '종가'] = frames[0]['종가'].iloc[30]
+
+    close = np.vstack([f['종가'].to_numpy(float) for f in frames])
+    volume = np.vstack([f['거래량'].to_numpy(float) for f in frames])
+    bundle = kernels.vidya_bundle(close, volume, period=10, cmo_period=9)
+
+    for i, frame in enumerate(frames):
+        plain, volumatic = reference(frame['종가'], frame['거래량'].astype(float), 10, 9)
+        np.testing.assert_allclose(bundle['VIDYA'][i], plain, rtol=1e-10)
+        np.testing.assert_allclose(bundle['Volumatic_VIDYA'][i], volumatic, rtol=1e-10)
+        np.testing.assert_allclose(kernels.vidya(close[i], 10, 9), plain, rtol=1e-10)
+
+
+def test_screen_skips_missing_bars():
+    provider = SyntheticDataProvider(tickers=5, days=80)
+    frames = {t: provider.fetch_ohlcv(t, provider.dates[0], provider.dates[-1]) for t in provider.tickers}
+    halted = provider.tickers[1]
+    panel = MarketPanel.from_frames(frames)
+    # 거래정지 거래일 (패널에서 결측) - 결측을 뺀 단일 종목 계산과 같아야 함
+    panel.close[1, 40:43] = np.nan
+    panel.volume[1, 40:43] = 0
+
+    screen = kernels.volumatic_vidya_screen(panel, period=20, cmo_period=14)
+    assert list(screen.index) == provider.tickers
+
+    kept = ~np.isnan(panel.close[1])
+    expected = kernels.volumatic_vidya(panel.close[1, kept], panel.volume[1, kept], 20, 14)
+    assert np.isclose(screen.loc[halted, 'Volumatic_VIDYA'], expected[-1])
+    assert screen['cross_up'].dtype == bool
+
+
+def test_kernels_import_without_data_stack():
+    """독립 스크립트용 커널은 pykrx/설정/데이터 제공자를 불러오지 않음"""
+    code = (
+        "import sys; import stock_analyzer.analyzers.vidya; "
+        "print(sorted(m for m in sys.modules if m.split('.')[0] in ('pykrx', 'FinanceDataReader', 'pydantic') "
+        "or m.startswith(('stock_analyzer.config', 'stock_analyzer.utils'))))"
+    )
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == '[]'
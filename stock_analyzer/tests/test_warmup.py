@@ -0,0 +1,81 @@
+"""
+장 시작 전 워밍업 테스트
+"""
+
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from stock_analyzer.analyzers.lookback import LookbackPlanner
+from stock_analyzer.utils.data_provider import CachedDataProvider
+from stock_analyzer.utils.synthetic_provider import SyntheticDataProvider
+from stock_analyzer.utils.ticker_master import TickerMaster
+from stock_analyzer.utils.warmup import (
+    MarketWarmup, load_readiness, load_state_book
+)
+
+SESSION = date(2024, 6, 28)
+PRE_MARKET = datetime(2024, 6, 28, 8, 30)
+
+
+class RecordingProvider(SyntheticDataProvider):
+    """요청 구간을 기록하는 합성 제공자"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.requests = []
+
+    def fetch_ohlcv(self, ticker, start_date, end_date):
+        self.requests.append((ticker, start_date, end_date))
+        return super().fetch_ohlcv(ticker, start_date, end_date)
+
+
+def test_warmup_leaves_only_todays_bar(tmp_path):
+    source = RecordingProvider(tickers=30, days=150, end=SESSION)
+    provider = CachedDataProvider(source)
+    master = TickerMaster.from_provider(provider, path=str(tmp_path / 'tickers.parquet'))
+
+    ready = MarketWarmup(provider, master, path=str(tmp_path / 'warmup')).run(now=PRE_MARKET)
+    assert ready['warmed'] == ready['tickers'] == 30
+    assert ready['last_bar'] == '2024-06-27'
+    assert load_readiness(str(tmp_path / 'warmup'), session=SESSION) == ready
+    assert load_readiness(str(tmp_path / 'warmup'), session=date(2024, 7, 1)) is None
+
+    # 장중 스크리닝 - 종목마다 마지막 봉 이후만 조회
+    source.requests.clear()
+    start = LookbackPlanner().start_date(SESSION)
+    df = provider.fetch_ohlcv('000001', start, SESSION)
+    assert df.index[-1] == np.datetime64(SESSION)
+    assert [(s, e) for _, s, e in source.requests] == [(date(2024, 6, 27), SESSION)]
+
+
+def test_warmup_state_book_needs_only_todays_bar(tmp_path):
+    """스트리밍 지표 상태는 전일까지 반영되어 당일 봉만 더하면 최신 지표"""
+    source = SyntheticDataProvider(tickers=5, days=150, end=SESSION)
+    master = TickerMaster.from_provider(source, path=str(tmp_path / 'tickers.parquet'))
+    path = str(tmp_path / 'warmup')
+    MarketWarmup(source, master, path=path).run(now=PRE_MARKET)
+
+    df = source.fetch_ohlcv('000003', date(2024, 1, 1), SESSION)
+    close = df['종가'].to_numpy()
+    book = load_state_book(path, session=SESSION)
+    assert len(book) == 5
+    assert book.states['000003'].last_date == date(2024, 6, 27)
+    assert book.peek('000003', df.iloc[-1])['MA20'] == pytest.approx(close[-20:].mean())
+
+
+def test_warmup_after_close_prepares_next_session(tmp_path):
+    """장 마감 후 실행하면 다음 거래일용으로 당일 봉까지 조회"""
+    source = RecordingProvider(tickers=5, days=150, end=SESSION)
+    master = TickerMaster.from_provider(source, path=str(tmp_path / 'tickers.parquet'))
+    path = str(tmp_path / 'warmup')
+
+    ready = MarketWarmup(source, master, path=path).run(now=datetime(2024, 6, 27, 16, 0))
+    assert ready['session'] == SESSION.isoformat()
+    assert ready['last_bar'] == '2024-06-27'
+    assert {e for _, _, e in source.requests} == {date(2024, 6, 27)}
+
+    # 스크리너가 확인하는 조건: 마지막 봉 = 대상 거래일의 직전 거래일
+    assert load_readiness(path, session=SESSION) == ready
+    assert load_state_book(path, session=SESSION).states['000003'].last_date == date(2024, 6, 27)
@@ -0,0 +1,297 @@
+"""
+비동기 데이터 제공자
+
+스레드마다 소켓 하나를 붙잡고 기다리는 대신, 하나의 이벤트 루프에서 수백 개 종목의
+일봉 요청을 동시에 보냅니다. 동시 요청 수는 세마포어로 제한합니다.
+소스 장애(HTTP 오류, 연결 오류, 타임아웃)는 동기 경로처럼 DataSourceError 계열 예외로 전달하여
+"데이터 없음"과 구분하고, 연속 실패 시 서킷 브레이커를 열어 스캔을 일찍 멈출 수 있게 합니다.
+"""
+
+import asyncio
+import json
+import re
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict, Iterable, Optional, Tuple, Type
+
+import aiohttp
+import pandas as pd
+
+from stock_analyzer.config import get_settings
+from stock_analyzer.utils.logger import LoggerMixin
+from stock_analyzer.utils.market_panel import MarketPanel
+from stock_analyzer.utils.parallel import ProcessingError, ProcessingResult
+from stock_analyzer.utils.rate_limiter import AdaptiveRateLimiter, THROTTLE_STATUS, get_rate_limiter
+from stock_analyzer.utils.resilience import (
+    CircuitBreaker, DataSourceError, SourceUnavailableError, TransientSourceError
+)
+
+# 네이버 일봉 응답 컬럼 -> 데이터프레임 컬럼명
+_NAVER_COLUMNS = ['시가', '고가', '저가', '종가', '거래량']
+_TRAILING_COMMA = re.compile(r',\s*\]')
+
+
+class AsyncDataProvider(ABC):
+    """비동기 데이터 제공자 추상 클래스"""
+
+    @abstractmethod
+    async def fetch_ohlcv(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """
+        OHLCV 데이터를 가져옵니다.
+
+        Args:
+            ticker: 종목 코드
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+
+        Returns:
+            OHLCV 데이터프레임 (한글 컬럼) 또는 None (데이터 없음)
+
+        Raises:
+            DataSourceError: 소스 장애
+        """
+        pass
+
+    async def fetch_many(
+        self,
+        tickers: Iterable[str],
+        start_date: date,
+        end_date: date,
+        result: Optional[ProcessingResult] = None,
+        stop_on: Tuple[Type[BaseException], ...] = ()
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        여러 종목을 동시에 조회합니다.
+
+        Args:
+            tickers: 종목 코드
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            result: 처리 결과 (주어지면 종목별 오류와 처리 범위를 기록)
+            stop_on: 이 예외가 발생하면 남은 요청을 취소하고 중단 (result.stopped에 사유 기록)
+
+        Returns:
+            종목 코드 -> OHLCV 데이터프레임 (데이터가 없거나 실패한 종목은 제외)
+        """
+        tickers = list(tickers)
+        result = result if result is not None else ProcessingResult()
+        result.total = len(tickers)
+
+        async def fetch(ticker):
+            try:
+                return ticker, await self.fetch_ohlcv(ticker, start_date, end_date), None
+            except Exception as e:
+                return ticker, None, e
+
+        tasks = [asyncio.ensure_future(fetch(ticker)) for ticker in tickers]
+        frames: Dict[str, pd.DataFrame] = {}
+        try:
+            for future in asyncio.as_completed(tasks):
+                ticker, df, error = await future
+                result.completed += 1
+                if error is not None:
+                    result.errors.append(ProcessingError(ticker, type(error).__name__, str(error)))
+                    if stop_on and isinstance(error, stop_on):
+                        result.stopped = str(error)
+                        break
+                elif df is not None and not df.empty:
+                    frames[ticker] = df
+                    result.successes.append(ticker)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # 입력 순서 유지
+        return {ticker: frames[ticker] for ticker in tickers if ticker in frames}
+
+    async def close(self):
+        """연결 등 자원을 정리합니다"""
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+def parse_naver_daily(text: str) -> Optional[pd.DataFrame]:
+    """
+    네이버 일봉 응답을 데이터프레임으로 변환합니다.
+
+    응답은 작은따옴표 헤더 행과 [날짜, 시가, 고가, 저가, 종가, 거래량, 외국인소진율] 행으로
+    이루어진 배열 문자열입니다 (JSON과 달리 끝에 쉼표가 올 수 있음).
+    """
+    text = text.strip()
+    if not text:
+        return None
+
+    rows = json.loads(_TRAILING_COMMA.sub(']', text.replace("'", '"')))
+    data = [row for row in rows[1:] if row]
+    if not data:
+        return None
+
+    index = pd.to_datetime([str(row[0]) for row in data], format='%Y%m%d')
+    df = pd.DataFrame(
+        [row[1:6] for row in data],
+        columns=_NAVER_COLUMNS,
+        index=pd.DatetimeIndex(index, name='Date'),
+        dtype='float64'
+    )
+    df['거래량'] = df['거래량'].astype('int64')
+    return df
+
+
+def _retry_after(response: aiohttp.ClientResponse) -> Optional[float]:
+    """Retry-After 헤더 (초)"""
+    value = response.headers.get('Retry-After')
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+class NaverAsyncDataProvider(AsyncDataProvider, LoggerMixin):
+    """aiohttp 기반 네이버 일봉 데이터 제공자"""
+
+    SOURCE = 'naver_async'
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        """
+        Args:
+            base_url: 일봉 API 주소 (None이면 설정에서 가져옴)
+            max_concurrency: 최대 동시 요청 수 (None이면 설정에서 가져옴)
+            timeout: 요청 타임아웃 (초, None이면 설정에서 가져옴)
+            rate_limiter: 요청 속도 제한 (None이면 호스트별 공유 limiter)
+            breaker: 서킷 브레이커 (None이면 PROVIDER_ 설정값으로 생성)
+        """
+        settings = get_settings()
+        config = settings.async_provider
+        self.base_url = base_url or config.base_url
+        self.max_concurrency = max_concurrency or config.max_concurrency
+        self.timeout = timeout or config.timeout
+        self.rate_limiter = rate_limiter or get_rate_limiter(self.base_url)
+        self.breaker = breaker or CircuitBreaker(
+            self.SOURCE, settings.provider.breaker_threshold, settings.provider.breaker_reset_seconds
+        )
+
+        # 이벤트 루프 안에서 생성
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={'User-Agent': 'Mozilla/5.0'}
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def fetch_ohlcv(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """
+        네이버 일봉 API에서 OHLCV 데이터를 가져옵니다.
+
+        Raises:
+            SourceUnavailableError: 서킷이 열려 있음
+            TransientSourceError: 연결 오류, 타임아웃, 429/5xx
+            DataSourceError: 그 밖의 HTTP 오류
+        """
+        session = self._ensure_session()
+        params = {
+            'symbol': ticker,
+            'requestType': 1,
+            'startTime': start_date.strftime('%Y%m%d'),
+            'endTime': end_date.strftime('%Y%m%d'),
+            'timeframe': 'day',
+        }
+
+        async with self._semaphore:
+            if not self.breaker.allow():
+                raise SourceUnavailableError(self.SOURCE, "서킷 열림 - 요청 생략")
+            try:
+                async with self.rate_limiter.request() as call, \
+                        session.get(self.base_url, params=params) as response:
+                    call.status(response.status, _retry_after(response))
+                    status = response.status
+                    text = await response.text() if status == 200 else None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.breaker.record_failure()
+                raise TransientSourceError(self.SOURCE, f"{ticker} - {type(e).__name__} {e}") from e
+
+        if status != 200:
+            if status in THROTTLE_STATUS:
+                self.breaker.record_failure()
+                raise TransientSourceError(self.SOURCE, f"{ticker} - HTTP {status}")
+            self.breaker.record_success()  # 소스는 응답함
+            raise DataSourceError(self.SOURCE, f"{ticker} - HTTP {status}")
+        self.breaker.record_success()
+
+        try:
+            return parse_naver_daily(text)
+        except (ValueError, IndexError, TypeError) as e:
+            self.logger.warning(f"응답 형식 오류: {ticker} - {e}")
+            return None
+
+    async def close(self):
+        """HTTP 세션을 닫습니다"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+async def fetch_panel(
+    provider: AsyncDataProvider,
+    tickers: Iterable[str],
+    start_date: date,
+    end_date: date,
+    result: Optional[ProcessingResult] = None,
+    stop_on: Tuple[Type[BaseException], ...] = ()
+) -> MarketPanel:
+    """
+    비동기 제공자로 여러 종목을 동시에 조회하여 패널을 생성합니다.
+
+    Args:
+        result: 처리 결과 (주어지면 종목별 오류와 처리 범위를 기록)
+        stop_on: 이 예외가 발생하면 남은 요청을 취소하고 중단
+
+    Returns:
+        MarketPanel 인스턴스 (입력 순서 유지, 데이터가 없거나 실패한 종목은 제외)
+    """
+    frames = await provider.fetch_many(tickers, start_date, end_date, result=result, stop_on=stop_on)
+    return MarketPanel.from_frames(frames)
+
+
+if __name__ == "__main__":
+    from datetime import datetime, timedelta
+
+    async def _demo():
+        end_date = datetime.now().date()
+        start_date = end_date - timedelta(days=120)
+        tickers = ['005930', '000660', '035720', '035420', '247540']
+
+        async with NaverAsyncDataProvider() as provider:
+            started = datetime.now()
+            panel = await fetch_panel(provider, tickers, start_date, end_date)
+            print(f"{panel} - {(datetime.now() - started).total_seconds():.2f}초")
+
+    asyncio.run(_demo())
@@ -4,9 +4,12 @@
 주식 데이터를 가져오는 추상 인터페이스와 구현체
 """
 
+import threading
+import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, Callable, List, Iterable, Tuple
 import pandas as pd
 from cachetools import TTLCache
 import FinanceDataReader as fdr
@@ -14,6 +17,11 @@ from pykrx import stock
 
 from stock_analyzer.config import get_settings
 from stock_analyzer.utils.logger import LoggerMixin
+from stock_analyzer.utils.rate_limiter import get_rate_limiter, KRX_HOST, NAVER_CHART_HOST
+from stock_analyzer.utils.trading_calendar import TradingCalendar, get_trading_calendar
+from stock_analyzer.utils.ohlcv_store import (
+    OHLCVStore, merge_ohlcv, slice_ohlcv, freeze_ohlcv, is_provisional, normalize_ohlcv
+)
 
 
 class DataProvider(ABC):
@@ -39,6 +47,22 @@ class DataProvider(ABC):
         """
         pass
 
+    def fetch_ohlcv_strict(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """
+        오류를 None으로 삼키지 않고 예외로 전달하는 fetch_ohlcv (재시도/서킷 브레이커용).
+
+        기본 구현은 fetch_ohlcv와 같으며, 네트워크 조회 제공자는 재정의합니다.
+
+        Returns:
+            OHLCV 데이터프레임 (데이터가 없으면 None)
+        """
+        return self.fetch_ohlcv(ticker, start_date, end_date)
+
     @abstractmethod
     def get_stock_list(self, market: str = 'KRX') -> pd.DataFrame:
         """
@@ -64,30 +88,29 @@ class FDRDataProvider(DataProvider, LoggerMixin):
     ) -> Optional[pd.DataFrame]:
         """FDR을 사용하여 OHLCV 데이터를 가져옵니다"""
         try:
-            df = fdr.DataReader(ticker, start_date, end_date)
-            if df is None or df.empty:
-                return None
-
-            # 컬럼명 통일 (Close -> 종가)
-            column_mapping = {
-                'Close': '종가',
-                'Open': '시가',
-                'High': '고가',
-                'Low': '저가',
-                'Volume': '거래량'
-            }
-            df = df.rename(columns=column_mapping)
-
-            return df.dropna()
-
+            return self.fetch_ohlcv_strict(ticker, start_date, end_date)
         except Exception as e:
             self.logger.error(f"FDR 데이터 조회 오류: {ticker} - {e}")
             return None
 
+    def fetch_ohlcv_strict(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """FDR 조회 (오류는 예외로 전달)"""
+        with get_rate_limiter(NAVER_CHART_HOST).request():
+            df = fdr.DataReader(ticker, start_date, end_date)
+
+        # 컬럼명 통일 (Close -> 종가), 공통 스키마로 정리
+        return normalize_ohlcv(df)
+
     def get_stock_list(self, market: str = 'KRX') -> pd.DataFrame:
         """FDR을 사용하여 종목 리스트를 가져옵니다"""
         try:
-            return fdr.StockListing(market)
+            with get_rate_limiter(KRX_HOST).request():
+                return fdr.StockListing(market)
         except Exception as e:
             self.logger.error(f"종목 리스트 조회 오류: {market} - {e}")
             return pd.DataFrame()
@@ -104,53 +127,369 @@ class PyKRXDataProvider(DataProvider, LoggerMixin):
     ) -> Optional[pd.DataFrame]:
         """pykrx를 사용하여 OHLCV 데이터를 가져옵니다"""
         try:
-            start_str = start_date.strftime("%Y%m%d")
-            end_str = end_date.strftime("%Y%m%d")
+            return self.fetch_ohlcv_strict(ticker, start_date, end_date)
+        except Exception as e:
+            self.logger.error(f"pykrx 데이터 조회 오류: {ticker} - {e}")
+            return None
+
+    def fetch_ohlcv_strict(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """pykrx 조회 (오류는 예외로 전달)"""
+        start_str = start_date.strftime("%Y%m%d")
+        end_str = end_date.strftime("%Y%m%d")
 
+        with get_rate_limiter(KRX_HOST).request():
             df = stock.get_market_ohlcv(start_str, end_str, ticker)
-            if df is None or df.empty:
-                return None
 
-            df = df.dropna().copy()
-            df.index = pd.to_datetime(df.index)
-            return df
+        # 날짜 인덱스/컬럼을 FDR과 같은 공통 스키마로 정리
+        return normalize_ohlcv(df)
+
+    def get_stock_list(self, market: str = 'KRX') -> pd.DataFrame:
+        """pykrx는 종목 리스트 제공하지 않음 - FDR 사용 권장"""
+        raise NotImplementedError("pykrx는 종목 리스트를 제공하지 않습니다. FDRDataProvider를 사용하세요.")
+
+
+def _fetch_krx_snapshot(date_str: str, market: str) -> pd.DataFrame:
+    """pykrx 일자별 전종목 OHLCV (KRX 공유 rate limiter 적용)"""
+    with get_rate_limiter(KRX_HOST).request():
+        return stock.get_market_ohlcv(date_str, market=market)
+
 
+class KRXSnapshotDataProvider(DataProvider, LoggerMixin):
+    """
+    pykrx 일자별 전종목 스냅샷 기반 데이터 제공자
+
+    종목마다 기간 조회를 하는 대신 일자별 전종목 OHLCV를 한 번씩 받아
+    메모리 패널을 만들고, 종목별 조회는 패널에서 잘라서 반환합니다.
+    120일 조회 시 약 2,700회 대신 80여 회의 요청으로 끝납니다.
+
+    지난 거래일 스냅샷과 거래일 달력으로 확인한 휴장일만 계속 보관합니다.
+    오늘(장중/장전) 스냅샷과 거래일인데 비어 있는 스냅샷은 refresh_seconds가 지나면
+    다시 조회하고, 조회 오류는 보관하지 않고 DataSourceError로 전달합니다.
+    """
+
+    def __init__(
+        self,
+        snapshot_fetcher: Optional[Callable[[str, str], pd.DataFrame]] = None,
+        market: str = 'ALL',
+        listing_provider: Optional[DataProvider] = None,
+        calendar: Optional[TradingCalendar] = None,
+        refresh_seconds: float = 60.0
+    ):
+        """
+        Args:
+            snapshot_fetcher: (YYYYMMDD, 시장) -> 전종목 OHLCV 함수 (None이면 pykrx 사용)
+            market: 스냅샷 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+            listing_provider: 종목 리스트 제공자 (None이면 FDR 사용)
+            calendar: 휴장일 확인용 거래일 달력 (None이면 공유 KRX 달력)
+            refresh_seconds: 확정되지 않은 스냅샷(오늘, 거래일인데 빈 결과)의 재조회 간격 (초)
+        """
+        self.snapshot_fetcher = snapshot_fetcher or _fetch_krx_snapshot
+        self.market = market
+        self.listing_provider = listing_provider or FDRDataProvider()
+        self.calendar = calendar or get_trading_calendar()
+        self.refresh_seconds = refresh_seconds
+
+        self._snapshots: Dict[date, pd.DataFrame] = {}
+        self._provisional: Dict[date, Tuple[float, pd.DataFrame]] = {}
+        self._panel: Optional[pd.DataFrame] = None
+        self._lock = threading.Lock()
+
+    def preload(self, start_date: date, end_date: date) -> int:
+        """
+        기간 내 영업일 스냅샷을 모두 불러옵니다.
+
+        Args:
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+
+        Returns:
+            패널에 포함된 거래일 수
+
+        Raises:
+            DataSourceError: 스냅샷 조회 실패
+        """
+        self._ensure_loaded(start_date, end_date)
+        return sum(
+            1 for d, snapshot in self._loaded().items()
+            if start_date <= d <= end_date and not snapshot.empty
+        )
+
+    def _loaded(self) -> Dict[date, pd.DataFrame]:
+        """보관 중인 스냅샷 (확정 + 미확정)"""
+        loaded = {d: snapshot for d, (_, snapshot) in self._provisional.items()}
+        loaded.update(self._snapshots)
+        return loaded
+
+    def _is_fresh(self, day: date) -> bool:
+        entry = self._provisional.get(day)
+        return entry is not None and time.monotonic() - entry[0] < self.refresh_seconds
+
+    def _ensure_loaded(self, start_date: date, end_date: date):
+        """누락되었거나 재조회 시점이 된 일자 스냅샷만 조회하여 패널을 갱신합니다"""
+        with self._lock:
+            missing = [
+                d.date() for d in pd.bdate_range(start_date, end_date)
+                if d.date() not in self._snapshots and not self._is_fresh(d.date())
+            ]
+            if not missing:
+                return
+
+            self.logger.info(f"전종목 스냅샷 조회: {len(missing)}일 ({missing[0]} ~ {missing[-1]})")
+            today = datetime.now().date()
+            try:
+                for day in missing:
+                    snapshot = self._fetch_snapshot(day)
+                    if day < today and (not snapshot.empty or not self.calendar.is_trading_day(day)):
+                        self._snapshots[day] = snapshot
+                        self._provisional.pop(day, None)
+                    else:
+                        if day < today:
+                            self.logger.warning(f"거래일 스냅샷이 비어 있음: {day} - {self.refresh_seconds:.0f}초 후 재조회")
+                        self._provisional[day] = (time.monotonic(), snapshot)
+            finally:
+                # 실패 전까지 받은 스냅샷은 반영
+                self._panel = self._build_panel()
+
+    def _fetch_snapshot(self, day: date) -> pd.DataFrame:
+        """
+        단일 일자 스냅샷 조회 (휴장일/장전은 빈 데이터프레임)
+
+        Raises:
+            TransientSourceError: 타임아웃, 연결 오류, 429/5xx
+            DataSourceError: 그 밖의 조회 오류
+        """
+        from stock_analyzer.utils.resilience import DataSourceError, TransientSourceError, is_transient_error
+
+        try:
+            df = self.snapshot_fetcher(day.strftime("%Y%m%d"), self.market)
         except Exception as e:
-            self.logger.error(f"pykrx 데이터 조회 오류: {ticker} - {e}")
+            error = TransientSourceError if is_transient_error(e) else DataSourceError
+            raise error('krx_snapshot', f"{day} 스냅샷 조회 실패 - {type(e).__name__} {e}") from e
+
+        # 휴장일/장전에는 빈 결과 또는 거래량 0으로 채워진 결과가 반환됨
+        if df is None or df.empty or df['거래량'].sum() == 0:
+            return pd.DataFrame()
+        return df
+
+    def _build_panel(self) -> Optional[pd.DataFrame]:
+        """(티커, 날짜) 정렬 인덱스의 롱 포맷 패널 생성"""
+        frames = {
+            pd.Timestamp(d): snapshot
+            for d, snapshot in sorted(self._loaded().items())
+            if not snapshot.empty
+        }
+        if not frames:
+            return None
+
+        panel = pd.concat(frames, names=['날짜', '티커'])
+        panel = panel.swaplevel().sort_index()
+        return panel
+
+    def fetch_ohlcv(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """스냅샷 패널에서 종목의 OHLCV를 잘라 반환합니다"""
+        try:
+            return self.fetch_ohlcv_strict(ticker, start_date, end_date)
+        except Exception as e:
+            self.logger.error(f"스냅샷 데이터 조회 오류: {ticker} - {e}")
+            return None
+
+    def fetch_ohlcv_strict(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """
+        스냅샷 패널 조회 (공통 OHLCV 스키마, 스냅샷 조회 오류는 예외로 전달)
+
+        Raises:
+            DataSourceError: 스냅샷 조회 실패
+        """
+        self._ensure_loaded(start_date, end_date)
+
+        panel = self._panel
+        if panel is None:
             return None
 
+        try:
+            df = panel.loc[ticker]
+        except KeyError:
+            return None
+
+        return normalize_ohlcv(df.loc[pd.Timestamp(start_date):pd.Timestamp(end_date)])
+
     def get_stock_list(self, market: str = 'KRX') -> pd.DataFrame:
-        """pykrx는 종목 리스트 제공하지 않음 - FDR 사용 권장"""
-        raise NotImplementedError("pykrx는 종목 리스트를 제공하지 않습니다. FDRDataProvider를 사용하세요.")
+        """종목 리스트는 별도 제공자에 위임"""
+        return self.listing_provider.get_stock_list(market)
+
+    def clear(self):
+        """불러온 스냅샷을 비웁니다"""
+        with self._lock:
+            self._snapshots.clear()
+            self._provisional.clear()
+            self._panel = None
+
+
+@dataclass
+class _CacheEntry:
+    """종목별 캐시 항목 (조회 요청이 커버한 구간과 그 데이터, 읽기 전용 프레임)"""
+    df: pd.DataFrame
+    start_date: date
+    end_date: date
+    nbytes: int = field(init=False)  # 데이터프레임 실제 메모리 크기
+
+    def __post_init__(self):
+        self.df = freeze_ohlcv(self.df)
+        self.nbytes = int(self.df.memory_usage(index=True, deep=True).sum())
+
+    def covers(self, start_date: date, end_date: date) -> bool:
+        """요청 구간이 캐시 구간에 포함되는지 여부"""
+        return self.start_date <= start_date and end_date <= self.end_date
+
+
+# 캐시 잠금 분할 개수 (종목 코드 해시로 샤드 선택)
+_CACHE_STRIPES = 16
+
+
+class _InFlight:
+    """진행 중인 종목 조회 (같은 종목의 동시 요청은 이 조회 결과를 기다림)"""
+
+    def __init__(self, start_date: date, end_date: date):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.done = threading.Event()
+        self.found = False  # 데이터 조회 성공 여부
+        self.error: Optional[Exception] = None  # 조회 중 발생한 예외 (기다린 요청에도 전달)
+
+    def covers(self, start_date: date, end_date: date) -> bool:
+        return self.start_date <= start_date and end_date <= self.end_date
+
+
+def _entry_size(entry: _CacheEntry) -> int:
+    return entry.nbytes
+
+
+class _CacheStripe:
+    """캐시 샤드 (샤드마다 별도 잠금, 진행 중 조회, 통계)"""
+
+    def __init__(self, maxsize: int, ttl: int, getsizeof: Optional[Callable] = None):
+        self.lock = threading.Lock()
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl, getsizeof=getsizeof)
+        # 고정 종목: 용량 제한으로 밀려나지 않음 (종목 -> (만료 시각, 항목))
+        self.pinned: Dict[str, Tuple[float, _CacheEntry]] = {}
+        self.inflight: Dict[str, _InFlight] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
 
 
 class CachedDataProvider(DataProvider, LoggerMixin):
-    """캐싱을 적용한 데이터 제공자 (데코레이터 패턴)"""
+    """
+    캐싱을 적용한 데이터 제공자 (데코레이터 패턴)
+
+    여러 스레드에서 동시에 호출해도 안전합니다. 캐시는 종목 코드 기준으로 샤드마다
+    잠금을 나누고, 같은 종목을 동시에 요청하면 첫 요청만 실제 조회하고 나머지는 그 결과를 기다립니다.
+
+    용량은 데이터프레임 실제 메모리 크기(바이트) 기준으로 제한하며 (CACHE_MAX_MEMORY_MB),
+    pin_universe()로 고정한 스캔 대상 종목은 용량 제한으로 밀려나지 않습니다.
 
-    def __init__(self, provider: DataProvider):
+    캐시된 프레임은 읽기 전용이며 히트 시 복사 없이 뷰를 반환합니다.
+    값을 수정해야 하는 호출자는 직접 copy()해야 합니다.
+    """
+
+    def __init__(self, provider: DataProvider, store: Optional[OHLCVStore] = None):
         """
         Args:
             provider: 실제 데이터를 가져올 제공자
+            store: 디스크 저장소 (None이면 메모리 캐시만 사용)
         """
         self.provider = provider
+        self.store = store
         settings = get_settings()
         cache_config = settings.cache
 
+        self.ttl = cache_config.ttl_seconds
+        self._pinned_tickers: frozenset = frozenset()
+        self._memory_budget = cache_config.max_memory_mb > 0
+
         if cache_config.enabled:
-            self.cache = TTLCache(
-                maxsize=cache_config.max_size,
-                ttl=cache_config.ttl_seconds
-            )
-            self.logger.info(
-                f"캐시 활성화 (크기: {cache_config.max_size}, TTL: {cache_config.ttl_seconds}초)"
-            )
+            if self._memory_budget:
+                # 바이트 단위 용량 제한
+                budget = cache_config.max_memory_mb * 1024 * 1024
+                stripe_size, getsizeof = max(budget // _CACHE_STRIPES, 1), _entry_size
+                capacity = f"{cache_config.max_memory_mb}MB"
+            else:
+                stripe_size, getsizeof = max(-(-cache_config.max_size // _CACHE_STRIPES), 1), None
+                capacity = f"{cache_config.max_size}개"
+            self._stripes: Optional[List[_CacheStripe]] = [
+                _CacheStripe(stripe_size, cache_config.ttl_seconds, getsizeof)
+                for _ in range(_CACHE_STRIPES)
+            ]
+            self.logger.info(f"캐시 활성화 (크기: {capacity}, TTL: {cache_config.ttl_seconds}초)")
         else:
-            self.cache = None
+            self._stripes = None
             self.logger.info("캐시 비활성화")
 
-    def _make_cache_key(self, ticker: str, start_date: date, end_date: date) -> str:
-        """캐시 키 생성"""
-        return f"{ticker}_{start_date}_{end_date}"
+    def _stripe(self, ticker: str) -> _CacheStripe:
+        """종목이 속한 캐시 샤드"""
+        return self._stripes[hash(ticker) % _CACHE_STRIPES]
+
+    def _get_entry(self, stripe: _CacheStripe, ticker: str) -> Optional[_CacheEntry]:
+        """캐시 항목 조회 (stripe.lock을 잡은 상태에서 호출)"""
+        pinned = stripe.pinned.get(ticker)
+        if pinned is not None:
+            expires, entry = pinned
+            if expires > time.monotonic():
+                return entry
+            del stripe.pinned[ticker]
+        return stripe.cache.get(ticker)
+
+    def _put_entry(self, stripe: _CacheStripe, ticker: str, entry: _CacheEntry):
+        """캐시 항목 저장 (stripe.lock을 잡은 상태에서 호출)"""
+        if ticker in self._pinned_tickers:
+            stripe.pinned[ticker] = (time.monotonic() + self.ttl, entry)
+            stripe.cache.pop(ticker, None)
+            return
+        try:
+            stripe.cache[ticker] = entry
+        except ValueError:
+            # 항목 하나가 샤드 용량보다 큼 - 캐싱하지 않음
+            self.logger.debug(f"캐시 용량 초과 항목: {ticker} ({entry.nbytes}바이트)")
+
+    def pin_universe(self, tickers: Iterable[str]):
+        """
+        스캔 대상 종목을 작업 집합으로 고정합니다.
+
+        고정된 종목은 용량 제한으로 밀려나지 않고 TTL이 지나야 만료됩니다.
+        이전에 고정한 종목 중 새 집합에 없는 종목은 일반 캐시로 돌려보냅니다.
+
+        Args:
+            tickers: 고정할 종목 코드 (빈 값이면 고정 해제)
+        """
+        if self._stripes is None:
+            return
+
+        self._pinned_tickers = frozenset(tickers)
+        for stripe in self._stripes:
+            with stripe.lock:
+                for ticker in [t for t in stripe.pinned if t not in self._pinned_tickers]:
+                    expires, entry = stripe.pinned.pop(ticker)
+                    if expires > time.monotonic():
+                        self._put_entry(stripe, ticker, entry)
+                for ticker in [t for t in stripe.cache if t in self._pinned_tickers]:
+                    self._put_entry(stripe, ticker, stripe.cache[ticker])
+
+        self.logger.info(f"캐시 작업 집합 고정: {len(self._pinned_tickers)}개 종목")
 
     def fetch_ohlcv(
         self,
@@ -158,25 +497,152 @@ class CachedDataProvider(DataProvider, LoggerMixin):
         start_date: date,
         end_date: date
     ) -> Optional[pd.DataFrame]:
-        """캐시를 먼저 확인하고, 없으면 실제 데이터 조회"""
-        if self.cache is None:
+        """
+        캐시를 먼저 확인하고, 없으면 실제 데이터 조회
+
+        종목마다 지금까지 조회한 가장 넓은 구간 하나를 캐시에 보관합니다.
+        요청 구간이 그 안에 포함되면 잘라서 반환하고, 벗어나면 부족한 쪽만 조회하여 구간을 넓힙니다.
+        """
+        if self._stripes is None:
             # 캐시 비활성화 - 직접 조회
-            return self.provider.fetch_ohlcv(ticker, start_date, end_date)
+            return self._fetch_upstream(ticker, start_date, end_date)
+
+        stripe = self._stripe(ticker)
+        waited: Optional[_InFlight] = None
+
+        while True:
+            with stripe.lock:
+                entry = self._get_entry(stripe, ticker)
+
+                if entry is not None and entry.covers(start_date, end_date):
+                    if waited is None:
+                        stripe.hits += 1
+                        self.logger.debug(f"캐시 히트: {ticker}")
+                    else:
+                        stripe.coalesced += 1
+                    return self._slice_entry(entry, start_date, end_date)
+
+                if waited is not None and not waited.found and waited.covers(start_date, end_date):
+                    # 앞선 조회가 데이터 없음(또는 소스 오류)으로 끝난 구간
+                    stripe.coalesced += 1
+                    if waited.error is not None:
+                        raise waited.error
+                    return None
+
+                flight = stripe.inflight.get(ticker)
+                if flight is None:
+                    flight = _InFlight(start_date, end_date)
+                    stripe.inflight[ticker] = flight
+                    stripe.misses += 1
+                    break
+
+            # 같은 종목 조회가 진행 중 - 완료 후 캐시 재확인
+            flight.done.wait()
+            waited = flight
 
-        cache_key = self._make_cache_key(ticker, start_date, end_date)
+        try:
+            if entry is None:
+                # 캐시 미스 - 실제 데이터 조회
+                self.logger.debug(f"캐시 미스: {ticker} - API 호출")
+                df = self._fetch_upstream(ticker, start_date, end_date)
+                entry = None if df is None else _CacheEntry(df, start_date, end_date)
+            else:
+                entry = self._extend_entry(ticker, entry, start_date, end_date)
+
+            with stripe.lock:
+                if entry is not None:
+                    self._put_entry(stripe, ticker, entry)
+                    flight.found = True
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with stripe.lock:
+                stripe.inflight.pop(ticker, None)
+            flight.done.set()
+
+        if entry is None:
+            return None
+        return self._slice_entry(entry, start_date, end_date)
 
-        if cache_key in self.cache:
-            self.logger.debug(f"캐시 히트: {ticker}")
-            return self.cache[cache_key].copy()
+    def _extend_entry(
+        self,
+        ticker: str,
+        entry: '_CacheEntry',
+        start_date: date,
+        end_date: date
+    ) -> '_CacheEntry':
+        """캐시 구간 밖의 앞/뒤 구간만 조회하여 넓힌 새 항목을 반환합니다"""
+        df = entry.df
+        covered_start, covered_end = entry.start_date, entry.end_date
+
+        if start_date < covered_start:
+            self.logger.debug(f"캐시 앞쪽 확장: {ticker} {start_date} ~ {covered_start}")
+            head = self._fetch_upstream(ticker, start_date, covered_start - timedelta(days=1))
+            df = merge_ohlcv(df, head)
+            covered_start = start_date
+
+        if end_date > covered_end:
+            # 마지막 봉부터 다시 조회하여 미완성 봉도 갱신
+            tail_start = min(df.index.max().date(), covered_end + timedelta(days=1))
+            self.logger.debug(f"캐시 뒤쪽 확장: {ticker} {tail_start} ~ {end_date}")
+            tail = self._fetch_upstream(ticker, tail_start, end_date)
+            if tail is not None:
+                df = merge_ohlcv(df, tail)
+                covered_end = end_date
+
+        return _CacheEntry(df, covered_start, covered_end)
+
+    @staticmethod
+    def _slice_entry(entry: '_CacheEntry', start_date: date, end_date: date) -> Optional[pd.DataFrame]:
+        """캐시 항목에서 요청 구간을 잘라 반환합니다 (복사 없는 읽기 전용 뷰)"""
+        return slice_ohlcv(entry.df, start_date, end_date)
+
+    def _fetch_upstream(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """디스크 저장소를 먼저 확인하고, 부족한 구간만 실제 제공자에서 조회"""
+        if self.store is None:
+            return self.provider.fetch_ohlcv(ticker, start_date, end_date)
 
-        # 캐시 미스 - 실제 데이터 조회
-        self.logger.debug(f"캐시 미스: {ticker} - API 호출")
-        df = self.provider.fetch_ohlcv(ticker, start_date, end_date)
+        stored = self.store.load(ticker)
+        if stored is None:
+            df = self.provider.fetch_ohlcv(ticker, start_date, end_date)
+            if df is not None:
+                self.store.save(ticker, df, covered_start=start_date)
+            return df
 
-        if df is not None:
-            self.cache[cache_key] = df.copy()
+        df, covered_start = stored
+        changed = False
 
-        return df
+        # 앞쪽 누락 구간 (저장된 범위보다 이른 날짜 요청)
+        if start_date < covered_start:
+            self.logger.debug(f"저장소 앞쪽 보충: {ticker} {start_date} ~ {covered_start}")
+            head = self.provider.fetch_ohlcv(
+                ticker, start_date, covered_start - timedelta(days=1)
+            )
+            df = merge_ohlcv(df, head)
+            covered_start = start_date
+            changed = True
+
+        # 뒤쪽 누락 구간 (마지막 봉부터 다시 조회하여 미완성 봉도 갱신)
+        last_date = df.index.max().date()
+        if end_date > last_date or (end_date == last_date and is_provisional(last_date)):
+            self.logger.debug(f"저장소 증분 조회: {ticker} {last_date} ~ {end_date}")
+            tail = self.provider.fetch_ohlcv(ticker, last_date, end_date)
+            if tail is None:
+                self.logger.warning(f"증분 조회 실패 - 저장된 데이터 사용: {ticker}")
+            else:
+                df = merge_ohlcv(df, tail)
+                changed = True
+
+        if changed:
+            self.store.save(ticker, df, covered_start=covered_start)
+
+        return slice_ohlcv(df, start_date, end_date)
 
     def get_stock_list(self, market: str = 'KRX') -> pd.DataFrame:
         """종목 리스트는 캐싱하지 않음 (자주 변경되지 않으므로)"""
@@ -184,44 +650,128 @@ class CachedDataProvider(DataProvider, LoggerMixin):
 
     def clear_cache(self):
         """캐시를 비웁니다"""
-        if self.cache:
-            self.cache.clear()
+        if self._stripes:
+            for stripe in self._stripes:
+                with stripe.lock:
+                    stripe.cache.clear()
+                    stripe.pinned.clear()
             self.logger.info("캐시 초기화 완료")
 
     def get_cache_stats(self) -> Dict[str, int]:
-        """캐시 통계를 반환합니다"""
-        if self.cache:
-            return {
-                'size': len(self.cache),
-                'maxsize': self.cache.maxsize,
-                'ttl': self.cache.ttl
-            }
-        return {'size': 0, 'maxsize': 0, 'ttl': 0}
+        """
+        캐시 통계를 반환합니다.
+
+        size/bytes는 고정 종목을 포함한 항목 수와 메모리 크기이며,
+        coalesced는 진행 중인 조회를 기다려 받은 요청 수입니다.
+        """
+        stats = {
+            'size': 0, 'maxsize': 0, 'bytes': 0, 'max_bytes': 0, 'pinned': 0,
+            'ttl': 0, 'hits': 0, 'misses': 0, 'coalesced': 0,
+        }
+        if not self._stripes:
+            return stats
+
+        memory = self.get_memory_stats()
+        for usage in memory.values():
+            stats['size'] += usage['entries']
+            stats['bytes'] += usage['bytes']
+        stats['pinned'] = memory['pinned']['entries']
+
+        for stripe in self._stripes:
+            with stripe.lock:
+                stats['hits'] += stripe.hits
+                stats['misses'] += stripe.misses
+                stats['coalesced'] += stripe.coalesced
+
+        capacity = sum(stripe.cache.maxsize for stripe in self._stripes)
+        if self._memory_budget:
+            stats['max_bytes'] = capacity
+        else:
+            stats['maxsize'] = capacity
+        stats['ttl'] = self.ttl
+        return stats
+
+    def get_memory_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        항목 종류별 상주 메모리를 반환합니다.
+
+        Returns:
+            {'pinned': 고정 종목, 'cached': 일반 캐시} 별 {'entries': 항목 수, 'bytes': 바이트}
+        """
+        usage = {
+            'pinned': {'entries': 0, 'bytes': 0},
+            'cached': {'entries': 0, 'bytes': 0},
+        }
+        for stripe in self._stripes or []:
+            with stripe.lock:
+                for _, entry in stripe.pinned.values():
+                    usage['pinned']['entries'] += 1
+                    usage['pinned']['bytes'] += entry.nbytes
+                stripe.cache.expire()
+                for entry in stripe.cache.values():
+                    usage['cached']['entries'] += 1
+                    usage['cached']['bytes'] += entry.nbytes
+        return usage
 
 
 def create_data_provider(
     provider_type: str = 'fdr',
-    use_cache: bool = True
+    use_cache: bool = True,
+    use_store: Optional[bool] = None,
+    use_archive: Optional[bool] = None
 ) -> DataProvider:
     """
     데이터 제공자를 생성합니다 (팩토리 함수).
 
     Args:
-        provider_type: 제공자 타입 ('fdr' 또는 'pykrx')
+        provider_type: 제공자 타입 ('fdr', 'pykrx', 'krx_snapshot', 'hedged' 또는 'synthetic')
         use_cache: 캐싱 사용 여부
+        use_store: 디스크 저장소 사용 여부 (None이면 설정값 사용)
+        use_archive: 메모리 맵 아카이브 우선 조회 여부 (None이면 설정값 사용)
 
     Returns:
         데이터 제공자 인스턴스
     """
+    # 네트워크 소스는 재시도/서킷 브레이커를 거쳐 장애를 DataSourceError로 전달
+    from stock_analyzer.utils.resilience import ResilientDataProvider
+
     if provider_type == 'fdr':
-        provider = FDRDataProvider()
+        provider = ResilientDataProvider(FDRDataProvider(), 'fdr')
     elif provider_type == 'pykrx':
-        provider = PyKRXDataProvider()
+        provider = ResilientDataProvider(PyKRXDataProvider(), 'pykrx')
+    elif provider_type == 'krx_snapshot':
+        provider = ResilientDataProvider(KRXSnapshotDataProvider(), 'krx_snapshot')
+    elif provider_type == 'hedged':
+        # FDR 우선, 응답이 늦거나 실패하면 pykrx로 헤지/장애 조치 (소스별 서킷 브레이커)
+        from stock_analyzer.utils.hedged_provider import HedgedDataProvider
+        provider = HedgedDataProvider([
+            ('fdr', ResilientDataProvider(FDRDataProvider(), 'fdr')),
+            ('pykrx', ResilientDataProvider(PyKRXDataProvider(), 'pykrx')),
+        ])
+    elif provider_type == 'synthetic':
+        # 부하 테스트용 합성 데이터 - 실제 데이터 저장소/아카이브에 섞이지 않도록 디스크 계층 사용 안 함
+        from stock_analyzer.utils.synthetic_provider import SyntheticDataProvider
+        provider = ResilientDataProvider(SyntheticDataProvider(), 'synthetic')
+        use_store = use_archive = False
     else:
         raise ValueError(f"알 수 없는 제공자 타입: {provider_type}")
 
+    settings = get_settings()
+    if settings.replay.mode != 'off':
+        # 녹화: 실제 소스 응답을 카세트에 기록 / 재생: 네트워크 대신 카세트 응답 사용
+        from stock_analyzer.utils.replay_provider import ReplayDataProvider
+        provider = ReplayDataProvider.from_settings(provider)
+    if use_archive is None:
+        use_archive = settings.archive.enabled
+    if use_archive:
+        from stock_analyzer.utils.panel_archive import ArchiveDataProvider
+        provider = ArchiveDataProvider(settings.archive.path, fallback=provider)
+
     if use_cache:
-        return CachedDataProvider(provider)
+        if use_store is None:
+            use_store = settings.store.enabled
+        store = OHLCVStore() if use_store else None
+        return CachedDataProvider(provider, store=store)
 
     return provider
 
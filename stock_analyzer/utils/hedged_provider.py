@@ -0,0 +1,291 @@
+"""
+헤지 요청 데이터 제공자
+
+여러 데이터 소스(FDR, pykrx)를 하나로 묶어, 주 소스가 평소 응답 시간(p95) 안에
+답하지 않으면 다음 소스에 같은 요청을 보내고 먼저 도착한 결과를 사용합니다.
+연속으로 실패하는 소스는 일정 시간 뒤로 밀어내고(강등) 다른 소스를 주 소스로 씁니다.
+전종목 스캔에서 느린 소스 하나 때문에 끝부분 요청이 늘어지는 것을 줄입니다.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from stock_analyzer.config import get_settings
+from stock_analyzer.utils.data_provider import DataProvider
+from stock_analyzer.utils.logger import LoggerMixin
+from stock_analyzer.utils.ohlcv_store import normalize_ohlcv
+from stock_analyzer.utils.resilience import DataSourceError, SourceUnavailableError
+
+# 분위수를 계산하기 위한 최소 응답 기록 수
+_MIN_SAMPLES = 20
+
+
+class LatencyTracker:
+    """최근 응답 시간 기록 (분위수 계산용, 스레드 안전)"""
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        응답 시간 분위수 (초)
+
+        Returns:
+            분위수 값 (기록이 _MIN_SAMPLES개 미만이면 None)
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if len(samples) < _MIN_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+@dataclass
+class _Source:
+    """데이터 소스 상태"""
+    name: str
+    provider: DataProvider
+    latency: LatencyTracker = field(default_factory=LatencyTracker)
+    requests: int = 0
+    wins: int = 0  # 먼저 데이터를 돌려준 횟수
+    failures: int = 0
+    consecutive_failures: int = 0
+    demoted_until: float = 0.0
+
+
+class HedgedDataProvider(DataProvider, LoggerMixin):
+    """
+    헤지 요청과 지연 기반 장애 조치를 적용한 복합 데이터 제공자
+
+    주 소스에 요청하고 그 소스의 p95 응답 시간이 지나도록 답이 없으면 다음 소스에
+    같은 요청을 보냅니다 (헤지). 먼저 데이터를 돌려준 소스의 결과를 사용하며,
+    늦게 끝난 요청의 결과는 버리고 응답 시간 기록에만 반영합니다.
+
+    한 소스가 예외를 내거나, 다른 소스는 데이터를 돌려준 종목에 빈 결과를 내면 실패로 셉니다.
+    연속 실패가 failure_threshold에 이르면 demote_seconds 동안 마지막 순위로 강등하고,
+    강등이 풀린 뒤 다시 실패하면 곧바로 재강등합니다.
+    모든 소스의 결과는 공통 OHLCV 스키마(normalize_ohlcv)로 맞춥니다.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[Tuple[str, DataProvider]],
+        hedge_quantile: Optional[float] = None,
+        min_delay: Optional[float] = None,
+        initial_delay: Optional[float] = None,
+        failure_threshold: Optional[int] = None,
+        demote_seconds: Optional[float] = None,
+        max_workers: Optional[int] = None
+    ):
+        """
+        Args:
+            sources: (이름, 제공자) 리스트 (앞쪽이 우선순위가 높음)
+            hedge_quantile: 헤지 요청을 보내는 응답 시간 분위수 (None이면 설정에서 가져옴)
+            min_delay: 헤지 요청 최소 대기 시간 (초)
+            initial_delay: 응답 기록이 쌓이기 전 헤지 대기 시간 (초)
+            failure_threshold: 강등 기준 연속 실패 횟수
+            demote_seconds: 강등 유지 시간 (초)
+            max_workers: 소스 요청 스레드 수
+        """
+        if not sources:
+            raise ValueError("데이터 소스가 없습니다")
+
+        config = get_settings().provider
+        self.hedge_quantile = hedge_quantile or config.hedge_quantile
+        self.min_delay = config.hedge_min_delay if min_delay is None else min_delay
+        self.initial_delay = config.hedge_initial_delay if initial_delay is None else initial_delay
+        self.failure_threshold = failure_threshold or config.failure_threshold
+        self.demote_seconds = config.demote_seconds if demote_seconds is None else demote_seconds
+
+        self._sources = [_Source(name, provider) for name, provider in sources]
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or config.max_workers,
+            thread_name_prefix='hedged-provider'
+        )
+        self._lock = threading.Lock()
+        self.hedges = 0
+
+    # ==================== 소스 상태 ====================
+
+    def _ordered(self) -> List[_Source]:
+        """요청 순서 (정상 소스는 설정 순서, 강등된 소스는 강등이 빨리 풀리는 순으로 뒤에)"""
+        now = time.monotonic()
+        healthy = [source for source in self._sources if source.demoted_until <= now]
+        demoted = sorted(
+            (source for source in self._sources if source.demoted_until > now),
+            key=lambda source: source.demoted_until
+        )
+        return healthy + demoted
+
+    def hedge_delay(self, source: _Source) -> float:
+        """헤지 요청 전 대기 시간 (소스의 응답 시간 분위수)"""
+        delay = source.latency.percentile(self.hedge_quantile)
+        if delay is None:
+            return self.initial_delay
+        return max(self.min_delay, delay)
+
+    def _record_win(self, source: _Source):
+        with self._lock:
+            source.wins += 1
+            source.consecutive_failures = 0
+
+    def _record_failure(self, source: _Source, reason: str):
+        with self._lock:
+            source.failures += 1
+            source.consecutive_failures += 1
+            now = time.monotonic()
+            if source.consecutive_failures >= self.failure_threshold and source.demoted_until <= now:
+                source.demoted_until = now + self.demote_seconds
+                self.logger.warning(
+                    f"데이터 소스 강등: {source.name} (연속 실패 {source.consecutive_failures}회, "
+                    f"{self.demote_seconds:.0f}초) - {reason}"
+                )
+
+    # ==================== 조회 ====================
+
+    def _call(
+        self,
+        source: _Source,
+        ticker: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """소스 하나에 요청 (응답 시간 기록, 결과는 공통 스키마)"""
+        with self._lock:
+            source.requests += 1
+        started = time.monotonic()
+        df = source.provider.fetch_ohlcv(ticker, start_date, end_date)
+        source.latency.record(time.monotonic() - started)
+        return normalize_ohlcv(df)
+
+    def _submit(self, source: _Source, ticker: str, start_date: date, end_date: date) -> Future:
+        return self._executor.submit(self._call, source, ticker, start_date, end_date)
+
+    def fetch_ohlcv(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """
+        주 소스에 요청하고, p95 안에 답이 없거나 실패하면 다음 소스에 요청합니다.
+
+        Returns:
+            먼저 도착한 OHLCV 데이터 (모든 소스가 데이터를 돌려주지 못하면 None)
+
+        Raises:
+            DataSourceError: 모든 소스가 장애로 실패함 (빈 결과를 낸 소스가 없을 때)
+        """
+        backups = self._ordered()
+        primary = backups.pop(0)
+        pending: Dict[Future, _Source] = {self._submit(primary, ticker, start_date, end_date): primary}
+        delay = self.hedge_delay(primary)
+        failed: List[Tuple[_Source, Exception]] = []
+        empty: List[_Source] = []
+
+        while pending:
+            done, _ = wait(pending, timeout=delay if backups else None, return_when=FIRST_COMPLETED)
+
+            if not done:
+                # 응답 지연 - 다음 소스에 헤지 요청
+                backup = backups.pop(0)
+                with self._lock:
+                    self.hedges += 1
+                pending[self._submit(backup, ticker, start_date, end_date)] = backup
+                delay = self.hedge_delay(backup)
+                continue
+
+            for future in done:
+                source = pending.pop(future)
+                try:
+                    df = future.result()
+                except Exception as e:
+                    if not isinstance(e, DataSourceError):
+                        self.logger.error(f"{source.name} 데이터 조회 오류: {ticker} - {e}")
+                    failed.append((source, e))
+                    continue
+
+                if df is None:
+                    empty.append(source)
+                    continue
+
+                self._record_win(source)
+                for loser, error in failed:
+                    self._record_failure(loser, f"{type(error).__name__}: {error}")
+                for loser in empty:
+                    # 다른 소스에는 있는 데이터를 못 가져옴 (오류를 삼킨 경우)
+                    self._record_failure(loser, f"빈 결과: {ticker}")
+                return df
+
+            if not pending and backups:
+                # 실패/빈 결과 - 기다리지 않고 다음 소스로 장애 조치
+                backup = backups.pop(0)
+                pending[self._submit(backup, ticker, start_date, end_date)] = backup
+                delay = self.hedge_delay(backup)
+
+        # 모든 소스가 빈 결과면 데이터가 없는 종목 (실패로 세지 않음)
+        for source, error in failed:
+            self._record_failure(source, f"{type(error).__name__}: {error}")
+
+        if failed and not empty:
+            # 모든 소스 장애 - 호출자가 "신호 없음"과 구분할 수 있도록 예외로 전달
+            if all(isinstance(error, SourceUnavailableError) for _, error in failed):
+                raise SourceUnavailableError('hedged', "모든 데이터 소스 서킷 열림")
+            error = next((error for _, error in failed if isinstance(error, DataSourceError)), None)
+            if error is not None:
+                raise error
+        return None
+
+    def get_stock_list(self, market: str = 'KRX') -> pd.DataFrame:
+        """종목 리스트를 제공하는 첫 번째 소스의 결과"""
+        for source in self._ordered():
+            try:
+                listing = source.provider.get_stock_list(market)
+            except NotImplementedError:
+                continue
+            except Exception as e:
+                self.logger.error(f"{source.name} 종목 리스트 조회 오류: {market} - {e}")
+                continue
+            if listing is not None and not listing.empty:
+                return listing
+        return pd.DataFrame()
+
+    # ==================== 통계 ====================
+
+    def get_hedge_stats(self) -> Dict:
+        """헤지 요청 수와 소스별 요청/승리/실패 횟수, 응답 시간 분위수"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                'hedges': self.hedges,
+                'sources': {
+                    source.name: {
+                        'requests': source.requests,
+                        'wins': source.wins,
+                        'failures': source.failures,
+                        'p50': source.latency.percentile(0.5),
+                        'p95': source.latency.percentile(self.hedge_quantile),
+                        'demoted': source.demoted_until > now,
+                    }
+                    for source in self._sources
+                },
+            }
+
+    def close(self):
+        """요청 스레드를 정리합니다 (진행 중인 요청은 기다리지 않음)"""
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,209 @@
+"""
+장중 증분 갱신
+
+장중에 급등주 분류를 여러 번 다시 돌릴 때, 확정된 과거 봉은 한 번만 불러 패널에 보관하고
+당일 봉만 갱신합니다. 소스가 지원하면 전종목 당일 스냅샷 한 번의 요청으로 당일 열을 채우고,
+지원하지 않으면 종목별로 당일 봉만 조회합니다.
+"""
+
+import threading
+import time
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Callable, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from stock_analyzer.analyzers.lookback import LookbackPlanner
+from stock_analyzer.config import get_settings
+from stock_analyzer.utils.data_provider import CachedDataProvider, DataProvider
+from stock_analyzer.utils.logger import LoggerMixin
+from stock_analyzer.utils.market_panel import FIELD_COLUMNS, MarketPanel
+from stock_analyzer.utils.panel_archive import MARKET_CLOSE
+from stock_analyzer.utils.parallel import ParallelProcessor
+from stock_analyzer.utils.trading_calendar import get_trading_calendar
+
+# 정규장 시작 시각
+MARKET_OPEN = dt_time(9, 0)
+
+SnapshotFetcher = Callable[[str, str], pd.DataFrame]
+
+
+def is_market_hours(now: Optional[datetime] = None) -> bool:
+    """KRX 거래일 정규장 시간(09:00~15:30) 여부 (평일 휴장일 제외)"""
+    now = now or datetime.now()
+    return (
+        MARKET_OPEN <= now.time() < MARKET_CLOSE
+        and get_trading_calendar().is_trading_day(now.date())
+    )
+
+
+def default_snapshot_fetcher() -> Optional[SnapshotFetcher]:
+    """설정된 데이터 소스에 맞는 전종목 스냅샷 함수 (합성 데이터/재생 모드면 None)"""
+    settings = get_settings()
+    if settings.provider.type == 'synthetic' or settings.replay.mode != 'off':
+        return None
+    from stock_analyzer.utils.data_provider import _fetch_krx_snapshot
+    return _fetch_krx_snapshot
+
+
+class IntradayPanel(LoggerMixin):
+    """
+    장중 증분 갱신 패널
+
+    거래일마다 처음 한 번 (지표에 필요한 거래일 수로 계획한 시작일 ~ 전일) 이력을 데이터 제공자(캐시/저장소/아카이브)에서
+    불러와 당일 열 하나를 덧붙인 패널을 만들고, 이후 refresh()는 당일 열만 덮어씁니다.
+    """
+
+    def __init__(
+        self,
+        provider: DataProvider,
+        snapshot_fetcher: Optional[SnapshotFetcher] = None,
+        market: str = 'ALL',
+        max_workers: int = 10
+    ):
+        """
+        Args:
+            provider: 과거 이력 데이터 제공자
+            snapshot_fetcher: (YYYYMMDD, 시장) -> 전종목 당일 OHLCV 함수 (None이면 종목별 당일 봉 조회)
+            market: 스냅샷 조회 시장
+            max_workers: 이력/종목별 조회 병렬 처리 워커 수
+        """
+        self.provider = provider
+        self.snapshot_fetcher = snapshot_fetcher
+        self.market = market
+        self.max_workers = max_workers
+        self.settings = get_settings()
+
+        self._panel: Optional[MarketPanel] = None
+        self._session: Optional[date] = None
+        self._requested: frozenset = frozenset()  # 이력을 요청한 종목 (데이터 없는 종목 포함)
+        self._lock = threading.Lock()
+        self.last_refresh: Dict = {}
+
+    # ==================== 과거 이력 ====================
+
+    def _load_history(self, tickers: Sequence[str], session: date):
+        """전일까지의 확정된 이력에 당일 빈 열을 덧붙인 패널을 만듭니다"""
+        planner = LookbackPlanner(self.settings.analysis)
+        last_close = session - timedelta(days=1)
+        history = MarketPanel.from_provider(
+            self.provider, tickers, planner.start_date(session), last_close, self.max_workers
+        )
+        history = history.window(end_date=last_close)
+
+        # 달력에 없는 휴장일/거래정지로 봉이 부족한 종목은 기간을 넓혀 다시 조회 (당일 봉 제외)
+        short = planner.short_tickers(history, planner.required_bars - 1)
+        if short:
+            self.logger.info(f"이력 부족 종목 {len(short)}개 - 조회 기간을 넓혀 다시 조회")
+            wider = MarketPanel.from_provider(
+                self.provider, short, planner.widened_start(session), last_close, self.max_workers
+            )
+            history = history.with_rows(wider.window(end_date=last_close))
+
+        dates = np.append(history.dates, np.datetime64(session, 'D'))
+        today = np.full((len(history), 1), np.nan, dtype=np.float32)
+        arrays = {
+            field: np.concatenate([getattr(history, field), today], axis=1)
+            for field in FIELD_COLUMNS if field != 'volume'
+        }
+        arrays['volume'] = np.concatenate(
+            [history.volume, np.zeros((len(history), 1), dtype=np.int64)], axis=1
+        )
+        self._panel = MarketPanel(history.tickers, dates, **arrays)
+        self._session = session
+        self._requested = frozenset(tickers)
+        self.logger.info(f"장중 패널 이력 로드: {history}")
+
+    # ==================== 당일 봉 ====================
+
+    def _fetch_snapshot(self, session: date) -> Optional[pd.DataFrame]:
+        """전종목 당일 스냅샷 (지원하지 않거나 실패하면 None)"""
+        if self.snapshot_fetcher is None:
+            return None
+        try:
+            snapshot = self.snapshot_fetcher(session.strftime("%Y%m%d"), self.market)
+        except Exception as e:
+            self.logger.warning(f"당일 스냅샷 조회 실패 - 종목별 조회로 대체: {e}")
+            return None
+        if snapshot is None or snapshot.empty:
+            return None
+        return snapshot
+
+    def _fetch_per_ticker(self, session: date) -> pd.DataFrame:
+        """종목별 당일 봉 조회 (메모리 캐시의 이전 당일 봉을 쓰지 않도록 실제 제공자에 요청)"""
+        source = self.provider.provider if isinstance(self.provider, CachedDataProvider) else self.provider
+
+        def fetch(ticker):
+            df = source.fetch_ohlcv(ticker, session, session)
+            if df is None or df.empty or df.index[-1].date() != session:
+                return None
+            return ticker, df.iloc[-1]
+
+        result = ParallelProcessor(max_workers=self.max_workers).process(
+            self._panel.tickers, fetch, desc="당일 봉 조회"
+        )
+        if not result.successes:
+            return pd.DataFrame(columns=list(FIELD_COLUMNS.values()))
+        return pd.DataFrame({ticker: bar for ticker, bar in result.successes}).T
+
+    def _splice(self, bars: pd.DataFrame) -> int:
+        """당일 열을 덮어씁니다 (거래가 없는 종목은 결측)"""
+        panel = self._panel
+        rows = np.array([panel.ticker_index.get(t, -1) for t in bars.index], dtype=np.int64)
+        traded = (rows >= 0) & (bars['거래량'].to_numpy(np.float64) > 0)
+        rows = rows[traded]
+
+        for field, column in FIELD_COLUMNS.items():
+            values = getattr(panel, field)
+            if field == 'volume':
+                values[:, -1] = 0
+                values[rows, -1] = bars[column].to_numpy(np.float64)[traded]
+            else:
+                values[:, -1] = np.nan
+                values[rows, -1] = bars[column].to_numpy(np.float64)[traded]
+        return len(rows)
+
+    def refresh(self, tickers: Sequence[str], now: Optional[datetime] = None) -> MarketPanel:
+        """
+        당일 봉만 갱신한 패널을 반환합니다.
+
+        거래일이 바뀌었거나 처음 보는 종목이 있으면 이력을 다시 불러옵니다.
+
+        Args:
+            tickers: 대상 종목 코드
+            now: 기준 시각 (None이면 현재 시각)
+
+        Returns:
+            (종목 × 거래일) 패널 (마지막 열이 당일, 다음 refresh에서 덮어쓰므로 보관하지 말 것)
+        """
+        session = (now or datetime.now()).date()
+        started = time.perf_counter()
+
+        with self._lock:
+            if (
+                self._panel is None
+                or self._session != session
+                or not self._requested.issuperset(tickers)
+            ):
+                self._load_history(tickers, session)
+
+            bars = self._fetch_snapshot(session)
+            source = 'snapshot'
+            if bars is None:
+                bars = self._fetch_per_ticker(session)
+                source = 'per_ticker'
+            updated = self._splice(bars)
+
+            self.last_refresh = {
+                'session': session,
+                'source': source,
+                'updated': updated,
+                'tickers': len(self._panel),
+                'seconds': round(time.perf_counter() - started, 2),
+            }
+            self.logger.info(
+                f"당일 봉 갱신 ({source}): {updated}/{len(self._panel)}개 종목 "
+                f"({self.last_refresh['seconds']}초)"
+            )
+            return self._panel
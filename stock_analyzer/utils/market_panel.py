@@ -0,0 +1,273 @@
+"""
+시장 패널
+
+전종목 OHLCV를 (종목 × 거래일) 형태의 연속 NumPy 배열로 보관합니다.
+종목마다 작은 데이터프레임을 만드는 대신 필드별 2차원 배열 하나로 전체 시장을 다룹니다.
+"""
+
+from datetime import date
+from typing import Dict, Optional, Sequence, Tuple, Type
+
+import numpy as np
+import pandas as pd
+
+from stock_analyzer.utils.data_provider import DataProvider
+from stock_analyzer.utils.parallel import ParallelProcessor
+
+# 패널 필드 -> 데이터프레임 컬럼명
+FIELD_COLUMNS = {
+    'open': '시가',
+    'high': '고가',
+    'low': '저가',
+    'close': '종가',
+    'volume': '거래량',
+}
+PRICE_FIELDS = ('open', 'high', 'low', 'close')
+
+
+class MarketPanel:
+    """
+    전종목 (종목 × 거래일) OHLCV 배열 패널
+
+    가격 필드는 float32 (결측치 NaN), 거래량은 int64 (결측치 0)로 저장하며
+    결측 여부는 종가 NaN으로 판단합니다.
+    """
+
+    def __init__(
+        self,
+        tickers: Sequence[str],
+        dates: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray
+    ):
+        """
+        Args:
+            tickers: 종목 코드 (행 순서)
+            dates: 거래일 배열 (datetime64[D], 열 순서, 오름차순)
+            open/high/low/close: (종목, 거래일) 가격 배열
+            volume: (종목, 거래일) 거래량 배열
+        """
+        self.tickers = list(tickers)
+        self.dates = np.asarray(dates, dtype='datetime64[D]')
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+        shape = (len(self.tickers), len(self.dates))
+        for field in FIELD_COLUMNS:
+            if getattr(self, field).shape != shape:
+                raise ValueError(f"{field} 배열 크기 불일치: {getattr(self, field).shape} != {shape}")
+
+        self.ticker_index: Dict[str, int] = {t: i for i, t in enumerate(self.tickers)}
+        self.date_index: Dict[date, int] = {d: j for j, d in enumerate(self.dates.tolist())}
+
+    # ==================== 생성 ====================
+
+    @classmethod
+    def empty(cls, tickers: Sequence[str], dates: Sequence) -> 'MarketPanel':
+        """결측치로 채운 빈 패널을 생성합니다"""
+        shape = (len(tickers), len(dates))
+        prices = {field: np.full(shape, np.nan, dtype=np.float32) for field in PRICE_FIELDS}
+        return cls(
+            tickers,
+            np.asarray(dates, dtype='datetime64[D]'),
+            volume=np.zeros(shape, dtype=np.int64),
+            **prices
+        )
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame]) -> 'MarketPanel':
+        """
+        종목별 OHLCV 데이터프레임으로 패널을 생성합니다.
+
+        Args:
+            frames: 종목 코드 -> OHLCV 데이터프레임 (한글 컬럼)
+
+        Returns:
+            모든 종목의 거래일 합집합을 열로 가지는 패널
+        """
+        frames = {t: df for t, df in frames.items() if df is not None and not df.empty}
+        if frames:
+            all_dates = np.unique(np.concatenate([
+                df.index.values.astype('datetime64[D]') for df in frames.values()
+            ]))
+        else:
+            all_dates = np.array([], dtype='datetime64[D]')
+
+        panel = cls.empty(list(frames), all_dates)
+        for row, df in enumerate(frames.values()):
+            cols = np.searchsorted(all_dates, df.index.values.astype('datetime64[D]'))
+            for field, column in FIELD_COLUMNS.items():
+                values = df[column].to_numpy(dtype=np.float64)
+                if field == 'volume':
+                    values = np.nan_to_num(values)
+                getattr(panel, field)[row, cols] = values
+
+        return panel
+
+    @classmethod
+    def from_provider(
+        cls,
+        provider: DataProvider,
+        tickers: Sequence[str],
+        start_date: date,
+        end_date: date,
+        max_workers: int = 10,
+        stop_on: Tuple[Type[BaseException], ...] = ()
+    ) -> 'MarketPanel':
+        """
+        데이터 제공자에서 종목별 이력을 받아 패널을 생성합니다.
+
+        Args:
+            provider: 데이터 제공자
+            tickers: 종목 코드 리스트
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            max_workers: 병렬 처리 워커 수
+            stop_on: 이 예외가 발생하면 남은 종목 조회를 멈추고 RuntimeError 발생
+                     (비어 있으면 실패한 종목만 제외)
+
+        Returns:
+            MarketPanel 인스턴스 (데이터가 없는 종목은 제외)
+
+        Raises:
+            RuntimeError: stop_on 예외로 조회가 중단됨
+        """
+        def fetch(ticker):
+            df = provider.fetch_ohlcv(ticker, start_date, end_date)
+            return None if df is None else (ticker, df)
+
+        processor = ParallelProcessor(max_workers=max_workers)
+        result = processor.process(list(tickers), fetch, desc="패널 데이터 조회", stop_on=stop_on)
+        if result.stopped:
+            raise RuntimeError(f"패널 데이터 조회 중단 ({result.coverage:.0%}): {result.stopped}")
+
+        # 입력 순서 유지
+        fetched = dict(result.successes)
+        return cls.from_frames({t: fetched[t] for t in tickers if t in fetched})
+
+    # ==================== 조회/슬라이싱 ====================
+
+    @property
+    def shape(self):
+        """(종목 수, 거래일 수)"""
+        return self.close.shape
+
+    @property
+    def nbytes(self) -> int:
+        """전체 배열 메모리 크기 (바이트)"""
+        return sum(getattr(self, field).nbytes for field in FIELD_COLUMNS)
+
+    @property
+    def valid(self) -> np.ndarray:
+        """(종목, 거래일) 데이터 존재 여부"""
+        return ~np.isnan(self.close)
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self.ticker_index
+
+    def _view(self, rows: slice, cols: slice) -> 'MarketPanel':
+        """기본 슬라이싱으로 배열을 복사하지 않는 하위 패널"""
+        return MarketPanel(
+            self.tickers[rows],
+            self.dates[cols],
+            **{field: getattr(self, field)[rows, cols] for field in FIELD_COLUMNS}
+        )
+
+    def __getitem__(self, rows: slice) -> 'MarketPanel':
+        """종목 행 범위 슬라이싱 (복사 없음)"""
+        if not isinstance(rows, slice):
+            raise TypeError("MarketPanel은 슬라이스로만 인덱싱할 수 있습니다. 종목 선택은 select()를 사용하세요.")
+        return self._view(rows, slice(None))
+
+    def window(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> 'MarketPanel':
+        """
+        날짜 범위로 자른 패널을 반환합니다 (복사 없음).
+
+        Args:
+            start_date: 시작 날짜 (포함)
+            end_date: 종료 날짜 (포함)
+        """
+        return self._view(slice(None), self._date_slice(start_date, end_date))
+
+    def _date_slice(self, start_date: Optional[date], end_date: Optional[date]) -> slice:
+        """날짜 범위에 해당하는 열 슬라이스"""
+        start = 0 if start_date is None else np.searchsorted(
+            self.dates, np.datetime64(start_date, 'D'), side='left'
+        )
+        stop = len(self.dates) if end_date is None else np.searchsorted(
+            self.dates, np.datetime64(end_date, 'D'), side='right'
+        )
+        return slice(int(start), int(stop))
+
+    def tail(self, days: int) -> 'MarketPanel':
+        """최근 N 거래일 패널 (복사 없음)"""
+        return self._view(slice(None), slice(max(len(self.dates) - days, 0), None))
+
+    def select(self, tickers: Sequence[str]) -> 'MarketPanel':
+        """지정 종목만 모은 패널 (임의 순서 선택이므로 배열을 복사함)"""
+        rows = [self.ticker_index[t] for t in tickers if t in self.ticker_index]
+        return MarketPanel(
+            [self.tickers[i] for i in rows],
+            self.dates,
+            **{field: getattr(self, field)[rows] for field in FIELD_COLUMNS}
+        )
+
+    def row(self, ticker: str) -> Dict[str, np.ndarray]:
+        """종목 한 행의 필드별 배열 (복사 없음)"""
+        i = self.ticker_index[ticker]
+        return {field: getattr(self, field)[i] for field in FIELD_COLUMNS}
+
+    def to_frame(
+        self,
+        ticker: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Optional[pd.DataFrame]:
+        """기존 코드 호환용 종목 데이터프레임 (한글 컬럼, 결측 거래일 제외)"""
+        if ticker not in self.ticker_index:
+            return None
+
+        cols = self._date_slice(start_date, end_date)
+        row = {field: values[cols] for field, values in self.row(ticker).items()}
+        mask = ~np.isnan(row['close'])
+        if not mask.any():
+            return None
+
+        index = pd.DatetimeIndex(self.dates[cols][mask].astype('datetime64[ns]'), name='Date')
+        return pd.DataFrame(
+            {column: row[field][mask] for field, column in FIELD_COLUMNS.items()},
+            index=index
+        )
+
+    def with_rows(self, other: 'MarketPanel') -> 'MarketPanel':
+        """
+        other에 있는 종목의 행을 other의 이력으로 바꾼 패널 (종목 순서 유지, 거래일은 합집합)
+
+        일부 종목만 기간을 넓혀 다시 조회한 결과를 합칠 때 사용합니다 (배열을 새로 만듦).
+        """
+        if len(other) == 0:
+            return self
+        return MarketPanel.from_frames({
+            ticker: other.to_frame(ticker) if ticker in other else self.to_frame(ticker)
+            for ticker in self.tickers
+        })
+
+    def __repr__(self) -> str:
+        if len(self.dates):
+            period = f"{self.dates[0]} ~ {self.dates[-1]}"
+        else:
+            period = "-"
+        return f"MarketPanel(종목={len(self.tickers)}, 거래일={len(self.dates)}, 기간={period})"
@@ -0,0 +1,186 @@
+"""
+OHLCV 영구 저장소
+
+티커별 Parquet 파일에 일봉 이력을 보관하여 프로세스 재시작 후에도
+전체 기간을 다시 내려받지 않도록 합니다.
+"""
+
+import os
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from stock_analyzer.config import get_settings
+from stock_analyzer.utils.logger import LoggerMixin
+
+# Parquet 스키마 메타데이터 키 (조회 요청이 커버한 가장 이른 날짜)
+_COVERED_START_KEY = b'covered_start'
+
+# 공통 OHLCV 컬럼 (모든 제공자가 이 순서/이름으로 반환)
+OHLCV_COLUMNS = ['시가', '고가', '저가', '종가', '거래량']
+_ENGLISH_COLUMNS = {'Open': '시가', 'High': '고가', 'Low': '저가', 'Close': '종가', 'Volume': '거래량'}
+
+
+class OHLCVStore(LoggerMixin):
+    """티커별 Parquet 파일 기반 OHLCV 저장소"""
+
+    def __init__(self, root_dir: Optional[str] = None):
+        """
+        Args:
+            root_dir: 저장 디렉토리 (None이면 설정에서 가져옴)
+        """
+        self.root = Path(root_dir or get_settings().store.path)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, ticker: str) -> Path:
+        """티커 파일 경로"""
+        return self.root / f"{ticker}.parquet"
+
+    def load(self, ticker: str) -> Optional[Tuple[pd.DataFrame, date]]:
+        """
+        저장된 이력을 읽어옵니다.
+
+        Args:
+            ticker: 종목 코드
+
+        Returns:
+            (이력 데이터프레임, 커버 시작일) 튜플 (없으면 None)
+        """
+        path = self._path(ticker)
+        if not path.exists():
+            return None
+
+        try:
+            table = pq.read_table(path)
+        except Exception as e:
+            self.logger.warning(f"저장소 파일 읽기 오류: {ticker} - {e}")
+            return None
+
+        df = table.to_pandas()
+        if df.empty:
+            return None
+
+        metadata = table.schema.metadata or {}
+        if _COVERED_START_KEY in metadata:
+            covered_start = date.fromisoformat(metadata[_COVERED_START_KEY].decode())
+        else:
+            covered_start = df.index.min().date()
+
+        return df, covered_start
+
+    def save(self, ticker: str, df: pd.DataFrame, covered_start: date):
+        """
+        이력을 저장합니다 (임시 파일 기록 후 교체).
+
+        Args:
+            ticker: 종목 코드
+            df: 저장할 OHLCV 데이터프레임
+            covered_start: 조회 요청이 커버한 가장 이른 날짜
+        """
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_COVERED_START_KEY] = covered_start.isoformat().encode()
+        table = table.replace_schema_metadata(metadata)
+
+        path = self._path(ticker)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.warning(f"저장소 파일 쓰기 오류: {ticker} - {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def delete(self, ticker: str):
+        """티커 파일을 삭제합니다"""
+        self._path(ticker).unlink(missing_ok=True)
+
+    def clear(self):
+        """저장소의 모든 파일을 삭제합니다"""
+        for path in self.root.glob("*.parquet"):
+            path.unlink(missing_ok=True)
+        self.logger.info(f"저장소 초기화 완료: {self.root}")
+
+
+def normalize_ohlcv(df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+    """
+    제공자마다 다른 OHLCV 형식을 공통 스키마로 맞춥니다.
+
+    영문 컬럼(FDR)은 한글로 바꾸고, 시가/고가/저가/종가(float64)와 거래량(int64)만 남깁니다.
+    인덱스는 'Date' 이름의 정렬된 DatetimeIndex (중복 날짜는 마지막 값)로 통일합니다.
+
+    Returns:
+        공통 스키마 데이터프레임 (데이터가 없으면 None)
+    """
+    if df is None or df.empty:
+        return None
+
+    df = df.rename(columns=_ENGLISH_COLUMNS)
+    missing = [column for column in OHLCV_COLUMNS if column not in df.columns]
+    if missing:
+        raise ValueError(f"OHLCV 컬럼 누락: {missing}")
+
+    df = df[OHLCV_COLUMNS].dropna()
+    if df.empty:
+        return None
+
+    df = df.astype({column: 'float64' for column in OHLCV_COLUMNS[:4]}).astype({'거래량': 'int64'})
+    df.index = pd.DatetimeIndex(pd.to_datetime(df.index), name='Date')
+    if not df.index.is_monotonic_increasing or df.index.has_duplicates:
+        df = df[~df.index.duplicated(keep='last')].sort_index()
+    return df
+
+
+def merge_ohlcv(base: pd.DataFrame, extra: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """
+    두 OHLCV 데이터프레임을 병합합니다 (같은 날짜는 새 데이터 우선).
+
+    Args:
+        base: 기존 데이터
+        extra: 추가 데이터
+
+    Returns:
+        날짜순으로 정렬된 병합 데이터프레임
+    """
+    if extra is None or extra.empty:
+        return base
+
+    merged = pd.concat([base, extra])
+    merged = merged[~merged.index.duplicated(keep='last')]
+    return merged.sort_index()
+
+
+def slice_ohlcv(df: pd.DataFrame, start_date: date, end_date: date) -> Optional[pd.DataFrame]:
+    """
+    날짜 범위로 데이터프레임을 자릅니다.
+
+    Returns:
+        범위 내 데이터 (비어 있으면 None)
+    """
+    sliced = df.loc[pd.Timestamp(start_date):pd.Timestamp(end_date)]
+    return None if sliced.empty else sliced
+
+
+def freeze_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    컬럼 배열을 읽기 전용으로 표시한 데이터프레임을 반환합니다 (복사 없음).
+
+    캐시에 보관한 프레임을 여러 호출자가 공유할 수 있도록 하며,
+    행 슬라이스도 읽기 전용 뷰이므로 값을 덮어쓰려 하면 ValueError가 발생합니다.
+    """
+    columns = {}
+    for column in df.columns:
+        values = df[column].to_numpy()
+        values.flags.writeable = False
+        columns[column] = values
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+def is_provisional(last_date: date) -> bool:
+    """오늘 이후 날짜의 봉은 장중 미완성일 수 있으므로 재조회 대상입니다"""
+    return last_date >= datetime.now().date()
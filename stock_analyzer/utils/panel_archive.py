@@ -0,0 +1,323 @@
+"""
+메모리 맵 OHLCV 아카이브
+
+갱신 작업 하나가 MarketPanel을 고정 폭 바이너리 컬럼 파일과 헤더(JSON)로 기록하면,
+다른 프로세스와 스크립트는 numpy.memmap으로 읽기 전용 매핑하여 복사 없이 사용합니다.
+여러 프로세스가 같은 파일을 매핑하므로 페이지 캐시를 공유하여 RSS가 늘어나지 않습니다.
+
+디렉토리 구조:
+    <root>/CURRENT              현재 세대 이름 (원자적으로 교체)
+    <root>/<세대>/header.json   종목, 거래일, 필드 dtype, 생성 시각
+    <root>/<세대>/<필드>.bin     (종목, 거래일) C-order 배열
+"""
+
+import json
+import os
+import shutil
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, time as dt_time, timedelta
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from stock_analyzer.utils.data_provider import DataProvider
+from stock_analyzer.utils.logger import LoggerMixin
+from stock_analyzer.utils.market_panel import MarketPanel, FIELD_COLUMNS
+
+ARCHIVE_VERSION = 1
+_CURRENT_FILE = 'CURRENT'
+_HEADER_FILE = 'header.json'
+
+# 장 마감 이후에 갱신된 아카이브만 당일 봉을 포함한 것으로 간주
+MARKET_CLOSE = dt_time(15, 30)
+
+# 세대 디렉토리 보관 개수 (읽는 중인 프로세스 보호)
+_KEEP_GENERATIONS = 2
+
+
+@dataclass
+class ArchiveMeta:
+    """아카이브 헤더 정보"""
+    as_of: datetime  # 데이터 기준 시각
+    start_date: date  # 조회 요청이 커버한 시작일
+
+
+def write_archive(
+    panel: MarketPanel,
+    root: str,
+    as_of: Optional[datetime] = None,
+    start_date: Optional[date] = None
+) -> Path:
+    """
+    패널을 새 세대 디렉토리에 기록하고 CURRENT를 교체합니다.
+
+    Args:
+        panel: 기록할 시장 패널
+        root: 아카이브 루트 디렉토리
+        as_of: 데이터 기준 시각 (None이면 현재 시각)
+        start_date: 조회 요청 시작일 (None이면 패널 첫 거래일)
+
+    Returns:
+        기록된 세대 디렉토리 경로
+    """
+    root_path = Path(root)
+    root_path.mkdir(parents=True, exist_ok=True)
+    as_of = as_of or datetime.now()
+
+    generation = f"{as_of.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+    gen_path = root_path / generation
+    gen_path.mkdir()
+
+    fields = {}
+    for field in FIELD_COLUMNS:
+        array = np.ascontiguousarray(getattr(panel, field))
+        array.tofile(gen_path / f"{field}.bin")
+        fields[field] = {'dtype': array.dtype.str, 'file': f"{field}.bin"}
+
+    header = {
+        'version': ARCHIVE_VERSION,
+        'as_of': as_of.isoformat(timespec='seconds'),
+        'start_date': str(start_date or (panel.dates[0] if len(panel.dates) else as_of.date())),
+        'shape': list(panel.shape),
+        'tickers': panel.tickers,
+        'dates': [str(d) for d in panel.dates],
+        'fields': fields,
+    }
+    with open(gen_path / _HEADER_FILE, 'w', encoding='utf-8') as f:
+        json.dump(header, f, ensure_ascii=False)
+
+    # CURRENT 포인터 원자적 교체
+    tmp_current = root_path / f"{_CURRENT_FILE}.{os.getpid()}.tmp"
+    tmp_current.write_text(generation, encoding='utf-8')
+    os.replace(tmp_current, root_path / _CURRENT_FILE)
+
+    _remove_old_generations(root_path, keep=generation)
+    return gen_path
+
+
+def _remove_old_generations(root_path: Path, keep: str):
+    """오래된 세대 디렉토리 정리 (매핑 중이라 삭제 실패하면 다음 갱신 때 재시도)"""
+    generations = sorted(
+        p for p in root_path.iterdir()
+        if p.is_dir() and (p / _HEADER_FILE).exists() and p.name != keep
+    )
+    for path in generations[:max(len(generations) - (_KEEP_GENERATIONS - 1), 0)]:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def current_generation(root: str) -> Optional[Path]:
+    """현재 세대 디렉토리 경로 (아카이브가 없으면 None)"""
+    current_file = Path(root) / _CURRENT_FILE
+    if not current_file.exists():
+        return None
+    return Path(root) / current_file.read_text(encoding='utf-8').strip()
+
+
+def open_archive(root: str) -> Tuple[MarketPanel, ArchiveMeta]:
+    """
+    현재 세대를 읽기 전용 memmap으로 엽니다.
+
+    Args:
+        root: 아카이브 루트 디렉토리
+
+    Returns:
+        (memmap 배열 기반 MarketPanel, 헤더 정보)
+
+    Raises:
+        FileNotFoundError: 아카이브가 없는 경우
+    """
+    gen_path = current_generation(root)
+    if gen_path is None:
+        raise FileNotFoundError(f"아카이브가 없습니다: {root}")
+
+    with open(gen_path / _HEADER_FILE, encoding='utf-8') as f:
+        header = json.load(f)
+
+    if header['version'] != ARCHIVE_VERSION:
+        raise ValueError(f"지원하지 않는 아카이브 버전: {header['version']}")
+
+    shape = tuple(header['shape'])
+    arrays = {}
+    for field, spec in header['fields'].items():
+        if 0 in shape:
+            arrays[field] = np.empty(shape, dtype=spec['dtype'])
+        else:
+            arrays[field] = np.memmap(
+                gen_path / spec['file'], dtype=spec['dtype'], mode='r', shape=shape
+            )
+
+    panel = MarketPanel(
+        header['tickers'],
+        np.array(header['dates'], dtype='datetime64[D]'),
+        **arrays
+    )
+    meta = ArchiveMeta(
+        as_of=datetime.fromisoformat(header['as_of']),
+        start_date=date.fromisoformat(header['start_date'])
+    )
+    return panel, meta
+
+
+def archive_covers(meta: ArchiveMeta, start_date: date, end_date: date) -> bool:
+    """
+    아카이브가 요청 기간의 확정된 봉을 모두 담고 있는지 판단합니다.
+
+    end_date 이후에 갱신되었거나, end_date 장 마감 이후에 갱신된 경우 True.
+    """
+    if start_date < meta.start_date:
+        return False
+    if end_date < meta.as_of.date():
+        return True
+    return end_date == meta.as_of.date() and meta.as_of.time() >= MARKET_CLOSE
+
+
+class _ArchiveHandle:
+    """프로세스 내 아카이브 매핑 (CURRENT가 바뀌면 다시 매핑)"""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.generation: Optional[Path] = None
+        self.panel: Optional[MarketPanel] = None
+        self.meta: Optional[ArchiveMeta] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Tuple[Optional[MarketPanel], Optional[ArchiveMeta]]:
+        with self._lock:
+            generation = current_generation(self.root)
+            if generation is None:
+                return None, None
+            if generation != self.generation:
+                self.panel, self.meta = open_archive(self.root)
+                self.generation = generation
+            return self.panel, self.meta
+
+
+_handles: Dict[str, _ArchiveHandle] = {}
+_handles_lock = threading.Lock()
+
+
+def load_archived_ohlcv(
+    ticker: str,
+    start_date: date,
+    end_date: date,
+    root: str
+) -> Optional[pd.DataFrame]:
+    """
+    아카이브에서 종목 OHLCV를 읽습니다 (스크립트용 단일 함수).
+
+    아카이브가 없거나 요청 기간을 다 담고 있지 않으면 None을 반환하므로
+    호출 측은 원래의 조회 경로로 대체하면 됩니다.
+
+    Args:
+        ticker: 종목 코드
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        root: 아카이브 루트 디렉토리
+
+    Returns:
+        OHLCV 데이터프레임 (한글 컬럼) 또는 None
+    """
+    with _handles_lock:
+        handle = _handles.setdefault(root, _ArchiveHandle(root))
+
+    try:
+        panel, meta = handle.get()
+    except (OSError, ValueError):
+        return None
+
+    if panel is None or ticker not in panel:
+        return None
+    if not archive_covers(meta, start_date, end_date):
+        return None
+
+    return panel.to_frame(ticker, start_date, end_date)
+
+
+class ArchiveDataProvider(DataProvider, LoggerMixin):
+    """메모리 맵 아카이브 기반 데이터 제공자 (범위 밖 요청은 대체 제공자로 위임)"""
+
+    def __init__(self, root: str, fallback: DataProvider):
+        """
+        Args:
+            root: 아카이브 루트 디렉토리
+            fallback: 아카이브가 담고 있지 않은 요청을 처리할 제공자
+        """
+        self.root = root
+        self.fallback = fallback
+
+    def fetch_ohlcv(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """아카이브를 먼저 확인하고, 없으면 대체 제공자에서 조회"""
+        df = load_archived_ohlcv(ticker, start_date, end_date, self.root)
+        if df is not None:
+            return df
+        return self.fallback.fetch_ohlcv(ticker, start_date, end_date)
+
+    def get_stock_list(self, market: str = 'KRX') -> pd.DataFrame:
+        """종목 리스트는 대체 제공자에 위임"""
+        return self.fallback.get_stock_list(market)
+
+
+def refresh_archive(
+    provider: DataProvider,
+    root: str,
+    lookback_days: int = 365,
+    markets=('KOSPI', 'KOSDAQ'),
+    max_workers: int = 10
+) -> MarketPanel:
+    """
+    전종목 이력을 조회하여 아카이브를 갱신합니다.
+
+    Args:
+        provider: 데이터 제공자 (전종목 스냅샷 제공자 권장)
+        root: 아카이브 루트 디렉토리
+        lookback_days: 조회 기간 (일)
+        markets: 포함할 시장
+        max_workers: 병렬 처리 워커 수
+
+    Returns:
+        기록된 패널
+
+    Raises:
+        RuntimeError: 서킷이 열려 조회가 중단됨 (일부만 받은 패널은 기록하지 않음)
+                      (재시도 후에도 실패한 개별 종목은 제외하고 기록)
+    """
+    from stock_analyzer.utils.resilience import SourceUnavailableError
+
+    as_of = datetime.now()
+    end_date = as_of.date()
+    start_date = end_date - timedelta(days=lookback_days)
+
+    df_stocks = provider.get_stock_list('KRX')
+    tickers = df_stocks[df_stocks['Market'].isin(markets)]['Code'].tolist()
+
+    panel = MarketPanel.from_provider(
+        provider, tickers, start_date, end_date, max_workers, stop_on=(SourceUnavailableError,)
+    )
+    write_archive(panel, root, as_of=as_of, start_date=start_date)
+    return panel
+
+
+if __name__ == "__main__":
+    from stock_analyzer.config import get_settings
+    from stock_analyzer.utils.data_provider import create_data_provider
+
+    # 아카이브 갱신 (장 마감 후 1회 실행)
+    archive_config = get_settings().archive
+    provider = create_data_provider('krx_snapshot', use_cache=False, use_archive=False)
+
+    started = datetime.now()
+    panel = refresh_archive(provider, archive_config.path, archive_config.lookback_days)
+    print(f"아카이브 갱신 완료: {panel} ({panel.nbytes / 1024 / 1024:.1f}MB)")
+    print(f"소요 시간: {(datetime.now() - started).total_seconds():.1f}초")
+
+    started = datetime.now()
+    mapped, meta = open_archive(archive_config.path)
+    print(f"아카이브 매핑: {mapped} - {(datetime.now() - started).total_seconds() * 1000:.1f}ms")
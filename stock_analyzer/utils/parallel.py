@@ -5,7 +5,7 @@ ThreadPoolExecutor를 래핑하여 편리한 병렬 처리 기능을 제공합
 """
 
 from concurrent.futures import ThreadPoolExecutor, as_completed, Future
-from typing import Callable, List, TypeVar, Optional, Tuple, Any
+from typing import Callable, List, TypeVar, Optional, Tuple, Any, Generic, Type
 from dataclasses import dataclass, field
 from datetime import datetime
 import threading
@@ -26,12 +26,23 @@ class ProcessingError:
 
 
 @dataclass
-class ProcessingResult:
+class ProcessingResult(Generic[R]):
     """처리 결과"""
     successes: List[R] = field(default_factory=list)
     errors: List[ProcessingError] = field(default_factory=list)
     total: int = 0
     completed: int = 0
+    stopped: Optional[str] = None  # 조기 중단 사유 (끝까지 처리했으면 None)
+
+    @property
+    def processed(self) -> int:
+        """오류 없이 처리를 마친 아이템 수 (결과가 None인 아이템 포함)"""
+        return self.completed - len(self.errors)
+
+    @property
+    def coverage(self) -> float:
+        """전체 대비 처리를 마친 비율 (0~1)"""
+        return self.processed / self.total if self.total else 1.0
 
 
 class ParallelProcessor(LoggerMixin):
@@ -59,7 +70,8 @@ class ParallelProcessor(LoggerMixin):
         items: List[T],
         func: Callable[[T], R],
         desc: str = "처리 중",
-        progress_callback: Optional[Callable[[int, int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int, int], None]] = None,
+        stop_on: Tuple[Type[BaseException], ...] = ()
     ) -> ProcessingResult[R]:
         """
         아이템 리스트를 병렬로 처리합니다.
@@ -69,6 +81,7 @@ class ParallelProcessor(LoggerMixin):
             func: 각 아이템에 적용할 함수
             desc: 진행 상황 설명
             progress_callback: 진행 상황 콜백 함수 (completed, total, success_count)
+            stop_on: 이 예외가 발생하면 남은 아이템을 취소하고 중단 (result.stopped에 사유 기록)
 
         Returns:
             ProcessingResult 객체
@@ -111,6 +124,14 @@ class ParallelProcessor(LoggerMixin):
                         )
                         with self._lock:
                             result.errors.append(error)
+
+                        if stop_on and isinstance(e, stop_on):
+                            result.stopped = str(e)
+                            self.logger.warning(
+                                f"{desc} 조기 중단: {e} - {result.completed}/{result.total} 처리"
+                            )
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            break
                         self.logger.error(f"처리 오류: {item} - {e}")
 
                     # 진행 상황 콜백 호출
@@ -139,7 +160,8 @@ class ParallelProcessor(LoggerMixin):
         items: List[T],
         func: Callable[[T], R],
         batch_size: int = 500,
-        desc: str = "배치 처리 중"
+        desc: str = "배치 처리 중",
+        stop_on: Tuple[Type[BaseException], ...] = ()
     ) -> ProcessingResult[R]:
         """
         아이템을 배치로 나누어 처리합니다.
@@ -149,6 +171,7 @@ class ParallelProcessor(LoggerMixin):
             func: 각 아이템에 적용할 함수
             batch_size: 배치 크기
             desc: 진행 상황 설명
+            stop_on: 이 예외가 발생하면 남은 배치까지 모두 중단
 
         Returns:
             ProcessingResult 객체
@@ -164,7 +187,8 @@ class ParallelProcessor(LoggerMixin):
             batch_result = self.process(
                 batch,
                 func,
-                desc=f"배치 {batch_num}/{len(batches)}"
+                desc=f"배치 {batch_num}/{len(batches)}",
+                stop_on=stop_on
             )
 
             # 결과 통합
@@ -172,6 +196,10 @@ class ParallelProcessor(LoggerMixin):
             total_result.errors.extend(batch_result.errors)
             total_result.completed += batch_result.completed
 
+            if batch_result.stopped:
+                total_result.stopped = batch_result.stopped
+                break
+
         return total_result
 
 
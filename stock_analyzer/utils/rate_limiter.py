@@ -0,0 +1,286 @@
+"""
+적응형 요청 속도 제한
+
+업스트림 호스트마다 토큰 버킷 하나를 두고 모든 제공자/크롤러가 공유합니다.
+응답이 빠르고 정상이면 허용 속도를 조금씩 올리고(가산 증가),
+429/5xx/타임아웃이 나면 크게 낮춥니다(승산 감소, AIMD).
+고정 지연 대신 업스트림이 견디는 최대 속도에 맞춰 요청합니다.
+
+get_rate_limiter()로 얻은 limiter는 request_governor를 함께 거쳐
+같은 머신의 다른 프로세스와 합산한 호스트별 속도/동시 요청 수 상한도 지킵니다.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from stock_analyzer.utils.logger import LoggerMixin
+from stock_analyzer.utils.request_governor import RequestGovernor, get_request_governor
+
+# 업스트림 호스트
+KRX_HOST = 'data.krx.co.kr'  # pykrx
+NAVER_CHART_HOST = 'fchart.stock.naver.com'  # FinanceDataReader (네이버 일봉)
+NAVER_API_HOST = 'api.finance.naver.com'  # 비동기 제공자 (네이버 일봉 JSON)
+NAVER_FINANCE_HOST = 'finance.naver.com'  # 네이버 금융 페이지 크롤링
+
+# 이 상태 코드는 속도를 낮춤
+THROTTLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """호스트별 속도 범위 (초당 요청 수)"""
+    initial: float
+    minimum: float
+    maximum: float
+    burst: int = 5  # 버킷 크기 (순간 허용 요청 수)
+    slow_seconds: float = 2.0  # 이보다 느린 응답은 속도를 올리지 않음
+    shared: float = 20.0  # 전체 프로세스 합계 초당 요청 수 상한 (request_governor)
+    max_inflight: int = 16  # 전체 프로세스 합계 동시 요청 수 상한 (request_governor)
+
+
+HOST_LIMITS: Dict[str, RateLimit] = {
+    KRX_HOST: RateLimit(initial=5.0, minimum=0.5, maximum=30.0, shared=30.0),
+    NAVER_CHART_HOST: RateLimit(initial=10.0, minimum=1.0, maximum=60.0, burst=10, shared=60.0),
+    NAVER_API_HOST: RateLimit(initial=20.0, minimum=1.0, maximum=200.0, burst=20, shared=200.0, max_inflight=200),
+    NAVER_FINANCE_HOST: RateLimit(initial=2.0, minimum=0.2, maximum=20.0, shared=20.0),
+}
+DEFAULT_LIMIT = RateLimit(initial=5.0, minimum=0.5, maximum=50.0)
+
+
+def host_of(url: str) -> str:
+    """URL의 호스트 이름"""
+    return urlparse(url).hostname or url
+
+
+def is_throttle_error(exc: BaseException) -> bool:
+    """업스트림 과부하를 뜻하는 예외인지 판단합니다 (타임아웃, 연결 오류, 429/5xx)"""
+    if isinstance(exc, (TimeoutError, asyncio.TimeoutError, ConnectionError)):
+        return True
+
+    # requests: Timeout/ConnectionError, HTTPError(response.status_code)
+    # aiohttp: ClientResponseError(status), ServerTimeoutError
+    name = type(exc).__name__
+    if 'Timeout' in name or name in ('ConnectionError', 'ClientConnectorError', 'ServerDisconnectedError'):
+        return True
+
+    status = getattr(exc, 'status', None)
+    response = getattr(exc, 'response', None)
+    if status is None and response is not None:
+        status = getattr(response, 'status_code', None)
+    return status in THROTTLE_STATUS
+
+
+class AdaptiveRateLimiter(LoggerMixin):
+    """
+    AIMD 토큰 버킷 (스레드와 asyncio 양쪽에서 사용 가능)
+
+    acquire()는 토큰이 없으면 다음 토큰이 생길 때까지 기다립니다.
+    요청 결과는 record_success()/record_failure()로 알려 주거나 request() 컨텍스트를 사용합니다.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        limit: RateLimit = DEFAULT_LIMIT,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+        governor: Optional[RequestGovernor] = None
+    ):
+        """
+        Args:
+            host: 호스트 이름 (로그, 프로세스 간 조율 키)
+            limit: 속도 범위
+            increase: 정상 응답 1초 분량마다 올리는 속도 (초당 요청 수)
+            decrease: 과부하 신호 시 곱하는 비율
+            cooldown: 연속 과부하 신호를 한 번으로 보는 시간 (초)
+            governor: 프로세스 간 요청 조율기 (None이면 이 프로세스 안에서만 제한)
+        """
+        self.host = host
+        self.limit = limit
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.governor = governor
+
+        self.rate = limit.initial
+        self._tokens = float(limit.burst)
+        self._updated = time.monotonic()
+        self._last_decrease = 0.0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        # 통계
+        self.successes = 0
+        self.failures = 0
+
+    def _reserve(self) -> float:
+        """토큰 하나를 예약하고 기다려야 할 시간(초)을 반환합니다"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.limit.burst),
+                self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+
+            self._tokens -= 1.0
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._paused_until - now)
+
+    def acquire(self) -> float:
+        """요청 전에 호출합니다 (대기한 시간 반환)"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """acquire()의 asyncio 버전"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def record_success(self, latency: float):
+        """정상 응답 - 빠르면 속도를 올립니다"""
+        with self._lock:
+            self.successes += 1
+            if latency < self.limit.slow_seconds:
+                # 요청마다 increase/rate 만큼 -> 1초 분량 요청마다 약 increase 증가
+                self.rate = min(self.limit.maximum, self.rate + self.increase / self.rate)
+
+    def record_failure(self, retry_after: Optional[float] = None):
+        """과부하 신호 - 속도를 크게 낮춥니다"""
+        with self._lock:
+            self.failures += 1
+            now = time.monotonic()
+            if now - self._last_decrease >= self.cooldown:
+                previous = self.rate
+                self.rate = max(self.limit.minimum, self.rate * self.decrease)
+                self._last_decrease = now
+                self.logger.info(f"요청 속도 감소: {self.host} {previous:.1f} -> {self.rate:.1f}/초")
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+    def record_status(self, status: int, latency: float, retry_after: Optional[float] = None):
+        """HTTP 상태 코드로 결과를 기록합니다"""
+        if status in THROTTLE_STATUS:
+            self.record_failure(retry_after)
+        elif status < 400:
+            self.record_success(latency)
+
+    def request(self) -> '_LimitedRequest':
+        """
+        요청 하나를 감싸는 컨텍스트 (with / async with 모두 지원)
+
+        진입 시 토큰(과 조율기의 요청 슬롯)을 얻고, 종료 시 소요 시간과 예외로 결과를 기록합니다.
+        HTTP 상태 코드를 직접 받는 경우 컨텍스트 안에서 call.status(code)를 호출합니다.
+        """
+        return _LimitedRequest(self)
+
+    def __repr__(self) -> str:
+        return f"AdaptiveRateLimiter({self.host}, {self.rate:.1f}/초)"
+
+
+class _LimitedRequest:
+    """AdaptiveRateLimiter.request() 컨텍스트"""
+
+    def __init__(self, limiter: AdaptiveRateLimiter):
+        self.limiter = limiter
+        self._status: Optional[int] = None
+        self._retry_after: Optional[float] = None
+        self._started = 0.0
+
+    def status(self, code: int, retry_after: Optional[float] = None):
+        """응답 상태 코드 기록"""
+        self._status = code
+        self._retry_after = retry_after
+
+    def _finish(self, exc: Optional[BaseException]):
+        latency = time.monotonic() - self._started
+        if exc is not None:
+            if is_throttle_error(exc):
+                self.limiter.record_failure()
+        elif self._status is not None:
+            self.limiter.record_status(self._status, latency, self._retry_after)
+        else:
+            self.limiter.record_success(latency)
+
+    def _release(self):
+        governor = self.limiter.governor
+        if governor is not None:
+            governor.release(self.limiter.host)
+
+    def __enter__(self):
+        limiter, limit = self.limiter, self.limiter.limit
+        limiter.acquire()
+        if limiter.governor is not None:
+            limiter.governor.acquire(limiter.host, limit.shared, limit.burst, limit.max_inflight)
+        self._started = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self._finish(exc)
+        finally:
+            self._release()
+        return False
+
+    async def __aenter__(self):
+        limiter, limit = self.limiter, self.limiter.limit
+        await limiter.acquire_async()
+        if limiter.governor is not None:
+            await limiter.governor.acquire_async(limiter.host, limit.shared, limit.burst, limit.max_inflight)
+        self._started = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            self._finish(exc)
+        finally:
+            governor = self.limiter.governor
+            if governor is not None:
+                await governor.release_async(self.limiter.host)
+        return False
+
+
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(host_or_url: str) -> AdaptiveRateLimiter:
+    """
+    호스트별 공유 rate limiter를 반환합니다 (프로세스 내 싱글톤).
+
+    GOVERNOR_ENABLED가 켜져 있으면 프로세스 간 요청 조율기를 붙입니다.
+
+    Args:
+        host_or_url: 호스트 이름 또는 URL
+    """
+    host = host_of(host_or_url) if '://' in host_or_url else host_or_url
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(
+                host, HOST_LIMITS.get(host, DEFAULT_LIMIT), governor=get_request_governor()
+            )
+            _limiters[host] = limiter
+        return limiter
+
+
+def get_rate_limiter_stats() -> Dict[str, Dict[str, float]]:
+    """호스트별 현재 속도와 성공/실패 횟수"""
+    with _limiters_lock:
+        return {
+            host: {
+                'rate': round(limiter.rate, 2),
+                'successes': limiter.successes,
+                'failures': limiter.failures,
+            }
+            for host, limiter in _limiters.items()
+        }
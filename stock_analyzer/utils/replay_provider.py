@@ -0,0 +1,431 @@
+"""
+녹화/재생 데이터 제공자
+
+실제 제공자의 응답과 원래 응답 시간을 로컬 카세트 파일(zip)에 녹화해 두고,
+재생 모드에서는 네트워크 없이 같은 응답을 돌려줍니다 (녹화된 지연 재현 선택 가능).
+네트워크 잡음 없이 스크리너/병렬 처리의 CPU·I/O 개선을 실행마다 비교할 수 있습니다.
+
+requests 기반 크롤러와 스크립트는 http_cassette()로 HTTP 응답 단위로 녹화/재생합니다.
+
+    python -m stock_analyzer.utils.replay_provider record data/cassettes/themes.zip naverCrawlThema.py
+    python -m stock_analyzer.utils.replay_provider replay data/cassettes/themes.zip naverCrawlThema.py
+"""
+
+import atexit
+import io
+import json
+import random
+import threading
+import time
+import zipfile
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from stock_analyzer.config import get_settings
+from stock_analyzer.utils.data_provider import DataProvider
+from stock_analyzer.utils.logger import LoggerMixin
+from stock_analyzer.utils import resilience
+
+_INDEX_NAME = 'index.json'
+LATENCY_MODES = ('none', 'recorded', 'sampled')
+
+
+class Cassette(LoggerMixin):
+    """
+    녹화 응답 보관소
+
+    zip 파일 하나에 index.json(요청 키, 응답 시간, 메타데이터)과 응답 본문
+    (데이터프레임은 Parquet, HTTP 응답은 원본 바이트)을 압축해 저장합니다.
+    같은 키를 여러 번 녹화하면 재생 시 녹화 순서대로 돌려주고 마지막 응답을 반복합니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 카세트 파일 경로 (있으면 불러옴)
+        """
+        self.path = Path(path)
+        self._entries: Dict[str, List[Dict]] = defaultdict(list)
+        self._blobs: Dict[str, bytes] = {}
+        self._cursor: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self.dirty = False  # 저장하지 않은 녹화가 있는지
+
+        if self.path.exists():
+            self._load()
+
+    def _load(self):
+        with zipfile.ZipFile(self.path) as archive:
+            index = json.loads(archive.read(_INDEX_NAME))
+            for entry in index:
+                self._entries[entry['key']].append(entry)
+                blob = entry.get('blob')
+                if blob is not None:
+                    self._blobs[blob] = archive.read(blob)
+        self.logger.info(f"카세트 불러옴: {self.path} ({len(index)}개 응답)")
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def keys(self) -> List[str]:
+        return list(self._entries)
+
+    @property
+    def latencies(self) -> List[float]:
+        """녹화된 모든 응답 시간 (초)"""
+        return [entry['latency'] for entries in self._entries.values() for entry in entries]
+
+    def add(
+        self,
+        key: str,
+        latency: float,
+        frame: Optional[pd.DataFrame] = None,
+        body: Optional[bytes] = None,
+        meta: Optional[Dict] = None
+    ):
+        """
+        응답 하나를 녹화합니다.
+
+        Args:
+            key: 요청 키
+            latency: 원래 응답 시간 (초)
+            frame: 데이터프레임 응답
+            body: 바이트 응답 (HTTP 본문)
+            meta: 기타 정보 (상태 코드, 오류 등 JSON 직렬화 가능한 값)
+        """
+        if frame is not None:
+            buffer = io.BytesIO()
+            frame.to_parquet(buffer)
+            data, kind = buffer.getvalue(), 'parquet'
+        elif body is not None:
+            data, kind = body, 'bytes'
+        else:
+            data, kind = None, None
+
+        with self._lock:
+            entry = {'key': key, 'latency': round(latency, 6), 'meta': meta or {}, 'kind': kind}
+            if data is not None:
+                blob = f"blobs/{len(self._blobs):06d}.{'parquet' if kind == 'parquet' else 'bin'}"
+                self._blobs[blob] = data
+                entry['blob'] = blob
+            self._entries[key].append(entry)
+            self.dirty = True
+
+    def get(self, key: str) -> Optional[Dict]:
+        """녹화 응답 (없으면 None, 같은 키는 녹화 순서대로)"""
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                return None
+            position = self._cursor[key]
+            self._cursor[key] = position + 1
+            return entries[min(position, len(entries) - 1)]
+
+    def frame(self, entry: Dict) -> Optional[pd.DataFrame]:
+        """녹화 응답의 데이터프레임"""
+        if entry.get('kind') != 'parquet':
+            return None
+        return pd.read_parquet(io.BytesIO(self._blobs[entry['blob']]))
+
+    def body(self, entry: Dict) -> bytes:
+        """녹화 응답의 바이트 본문"""
+        return self._blobs[entry['blob']] if entry.get('blob') else b''
+
+    def save(self):
+        """카세트 파일 저장 (임시 파일 기록 후 교체)"""
+        with self._lock:
+            index = [entry for entries in self._entries.values() for entry in entries]
+            blobs = dict(self._blobs)
+            self.dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(_INDEX_NAME, json.dumps(index, ensure_ascii=False))
+            for name, data in blobs.items():
+                # Parquet는 자체 압축되어 있으므로 그대로 저장
+                compress = zipfile.ZIP_STORED if name.endswith('.parquet') else zipfile.ZIP_DEFLATED
+                archive.writestr(name, data, compress_type=compress)
+        tmp_path.replace(self.path)
+        self.logger.info(f"카세트 저장: {self.path} ({len(index)}개 응답)")
+
+
+class _LatencyModel:
+    """재생 시 지연 재현 (none: 지연 없음, recorded: 응답별 원래 시간, sampled: 녹화 분포에서 추출)"""
+
+    def __init__(self, mode: str, latencies: List[float], scale: float = 1.0, seed: int = 0):
+        if mode not in LATENCY_MODES:
+            raise ValueError(f"알 수 없는 지연 모드: {mode} ({', '.join(LATENCY_MODES)})")
+        self.mode = mode
+        self.latencies = latencies
+        self.scale = scale
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sleep(self, recorded: float):
+        if self.mode == 'none':
+            return
+        if self.mode == 'recorded':
+            delay = recorded
+        else:
+            with self._lock:
+                delay = self._random.choice(self.latencies) if self.latencies else 0.0
+        if delay * self.scale > 0:
+            time.sleep(delay * self.scale)
+
+
+def _raise_recorded_error(meta: Dict):
+    """녹화된 제공자 오류를 같은 유형으로 다시 발생시킵니다"""
+    error_type = getattr(resilience, meta['error'], None)
+    if not (isinstance(error_type, type) and issubclass(error_type, resilience.DataSourceError)):
+        error_type = resilience.DataSourceError
+    raise error_type('replay', meta['message'])
+
+
+class ReplayDataProvider(DataProvider, LoggerMixin):
+    """
+    녹화/재생 데이터 제공자
+
+    upstream을 주면 녹화 모드: 실제 제공자에 요청하고 응답과 응답 시간을 카세트에 기록합니다
+    (save() 또는 프로세스 종료 시 저장). upstream이 없으면 재생 모드: 카세트의 응답만 돌려줍니다.
+
+    분석 기간은 실행 날짜 기준으로 정해지므로, match='ticker'(기본값)면 날짜 구간이 다른 요청에도
+    같은 종목의 마지막 녹화 응답을 돌려줍니다. match='exact'면 같은 구간 요청만 재생합니다.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        upstream: Optional[DataProvider] = None,
+        latency: str = 'none',
+        latency_scale: float = 1.0,
+        seed: int = 0,
+        match: str = 'ticker'
+    ):
+        """
+        Args:
+            cassette: 카세트
+            upstream: 녹화할 실제 제공자 (None이면 재생 모드)
+            latency: 재생 지연 모드 (none/recorded/sampled)
+            latency_scale: 재생 지연 배율
+            seed: sampled 모드 난수 시드
+            match: 재생 요청 매칭 방식 (ticker/exact)
+        """
+        self.cassette = cassette
+        self.upstream = upstream
+        self.match = match
+        self.latency = _LatencyModel(latency, cassette.latencies, latency_scale, seed)
+
+        # 종목 -> 마지막으로 녹화된 OHLCV 요청 키
+        self._latest: Dict[str, str] = {}
+        for key in cassette.keys():
+            if key.startswith('ohlcv/'):
+                self._latest[key.split('/')[1]] = key
+
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        if self.recording:
+            atexit.register(self.save)
+
+    @classmethod
+    def from_settings(cls, upstream: Optional[DataProvider] = None) -> 'ReplayDataProvider':
+        """REPLAY_ 설정으로 생성 (REPLAY_MODE=record면 upstream을 녹화)"""
+        config = get_settings().replay
+        if config.mode not in ('record', 'replay'):
+            raise ValueError(f"알 수 없는 재생 모드: {config.mode} (off/record/replay)")
+        return cls(
+            Cassette(config.path),
+            upstream if config.mode == 'record' else None,
+            latency=config.latency,
+            latency_scale=config.latency_scale,
+            seed=config.seed
+        )
+
+    @property
+    def recording(self) -> bool:
+        return self.upstream is not None
+
+    @staticmethod
+    def _ohlcv_key(ticker: str, start_date: date, end_date: date) -> str:
+        return f"ohlcv/{ticker}/{start_date.isoformat()}/{end_date.isoformat()}"
+
+    def _record(self, key: str, call) -> Optional[pd.DataFrame]:
+        """upstream 호출 결과(데이터프레임/None/제공자 오류)를 녹화"""
+        started = time.monotonic()
+        try:
+            df = call()
+        except resilience.DataSourceError as e:
+            self.cassette.add(
+                key, time.monotonic() - started,
+                meta={'error': type(e).__name__, 'message': str(e)}
+            )
+            raise
+        self.cassette.add(key, time.monotonic() - started, frame=df)
+        self.recorded += 1
+        return df
+
+    def _replay(self, key: str) -> Optional[pd.DataFrame]:
+        entry = self.cassette.get(key)
+        if entry is None and self.match == 'ticker' and key.startswith('ohlcv/'):
+            latest = self._latest.get(key.split('/')[1])
+            entry = self.cassette.get(latest) if latest else None
+        if entry is None:
+            self.misses += 1
+            self.logger.debug(f"녹화되지 않은 요청: {key}")
+            return None
+
+        self.hits += 1
+        self.latency.sleep(entry['latency'])
+        if 'error' in entry['meta']:
+            _raise_recorded_error(entry['meta'])
+        return self.cassette.frame(entry)
+
+    def fetch_ohlcv(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """녹화 모드는 실제 조회 후 기록, 재생 모드는 녹화 응답 반환"""
+        key = self._ohlcv_key(ticker, start_date, end_date)
+        if self.recording:
+            df = self._record(key, lambda: self.upstream.fetch_ohlcv(ticker, start_date, end_date))
+            self._latest[ticker] = key
+            return df
+        return self._replay(key)
+
+    def get_stock_list(self, market: str = 'KRX') -> pd.DataFrame:
+        """종목 리스트 녹화/재생"""
+        key = f"listing/{market}"
+        if self.recording:
+            return self._record(key, lambda: self.upstream.get_stock_list(market))
+        listing = self._replay(key)
+        return listing if listing is not None else pd.DataFrame()
+
+    def save(self):
+        """녹화 내용을 카세트 파일에 저장합니다 (재생 모드에서는 아무것도 하지 않음)"""
+        if self.recording and self.cassette.dirty:
+            self.cassette.save()
+
+    def get_replay_stats(self) -> Dict[str, int]:
+        """재생 적중/누락, 녹화 응답 수"""
+        return {'hits': self.hits, 'misses': self.misses, 'recorded': self.recorded}
+
+
+# ==================== HTTP 카세트 ====================
+
+def _http_key(method: str, url: str, params=None, data=None) -> str:
+    """정규화된 HTTP 요청 키 (메서드 + 쿼리 포함 URL + 본문)"""
+    import requests
+
+    prepared = requests.Request(method.upper(), url, params=params, data=data).prepare()
+    key = f"http/{prepared.method} {prepared.url}"
+    if prepared.body:
+        body = prepared.body if isinstance(prepared.body, str) else prepared.body.decode('utf-8', 'replace')
+        key += f" {body}"
+    return key
+
+
+def _replayed_response(cassette: Cassette, entry: Dict):
+    """녹화된 HTTP 응답으로 requests.Response 생성"""
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
+    meta = entry['meta']
+    response = requests.Response()
+    response.status_code = meta['status']
+    response.headers = CaseInsensitiveDict(meta.get('headers', {}))
+    response.encoding = meta.get('encoding')
+    response.url = meta.get('url', '')
+    response.reason = meta.get('reason', '')
+    response._content = cassette.body(entry)
+    return response
+
+
+@contextmanager
+def http_cassette(
+    path: str,
+    mode: str = 'replay',
+    latency: str = 'none',
+    latency_scale: float = 1.0,
+    seed: int = 0
+) -> Iterator[Cassette]:
+    """
+    requests 기반 HTTP 요청을 녹화/재생합니다 (requests.Session.request 교체).
+
+    크롤러처럼 requests.get()을 직접 호출하는 코드를 수정 없이 오프라인으로 실행합니다.
+    재생 모드에서 녹화되지 않은 요청은 requests.ConnectionError로 실패합니다.
+
+    Args:
+        path: 카세트 파일 경로
+        mode: record(실제 요청 후 기록) 또는 replay(녹화 응답 반환)
+        latency: 재생 지연 모드 (none/recorded/sampled)
+        latency_scale: 재생 지연 배율
+        seed: sampled 모드 난수 시드
+    """
+    import requests
+
+    if mode not in ('record', 'replay'):
+        raise ValueError(f"알 수 없는 카세트 모드: {mode}")
+
+    cassette = Cassette(path)
+    model = _LatencyModel(latency, cassette.latencies, latency_scale, seed)
+    original = requests.Session.request
+
+    def request(session, method, url, params=None, data=None, **kwargs):
+        key = _http_key(method, url, params, data)
+        if mode == 'record':
+            started = time.monotonic()
+            response = original(session, method, url, params=params, data=data, **kwargs)
+            cassette.add(key, time.monotonic() - started, body=response.content, meta={
+                'status': response.status_code,
+                'reason': response.reason,
+                'url': response.url,
+                'encoding': response.encoding,
+                'headers': {
+                    name: value for name, value in response.headers.items()
+                    if name.lower() in ('content-type', 'retry-after')
+                },
+            })
+            return response
+
+        entry = cassette.get(key)
+        if entry is None:
+            raise requests.ConnectionError(f"녹화되지 않은 요청: {key}")
+        model.sleep(entry['latency'])
+        return _replayed_response(cassette, entry)
+
+    requests.Session.request = request
+    try:
+        yield cassette
+    finally:
+        requests.Session.request = original
+        if mode == 'record':
+            cassette.save()
+
+
+if __name__ == "__main__":
+    import argparse
+    import runpy
+    import sys
+
+    parser = argparse.ArgumentParser(description="스크립트의 HTTP 요청을 카세트로 녹화/재생하며 실행")
+    parser.add_argument('mode', choices=['record', 'replay'])
+    parser.add_argument('cassette', help="카세트 파일 경로 (.zip)")
+    parser.add_argument('script', help="실행할 스크립트 (예: naverCrawlThema.py)")
+    parser.add_argument('args', nargs=argparse.REMAINDER, help="스크립트 인자")
+    parser.add_argument('--latency', choices=LATENCY_MODES, default='none')
+    parser.add_argument('--latency-scale', type=float, default=1.0)
+    options = parser.parse_args()
+
+    sys.argv = [options.script] + options.args
+    with http_cassette(options.cassette, options.mode, options.latency, options.latency_scale) as cassette:
+        started = time.perf_counter()
+        runpy.run_path(options.script, run_name='__main__')
+    print(f"[카세트] {options.mode}: {len(cassette)}개 응답, {time.perf_counter() - started:.2f}초")
@@ -0,0 +1,468 @@
+"""
+프로세스 간 요청 조율
+
+cron으로 겹쳐 실행되는 스크립트(KRX_crawling2.py, main.py 스크리닝, 네이버 테마 크롤러)가
+같은 호스트에 보내는 요청을 합산하여 제한합니다. 호스트마다 로컬 상태 파일 하나를 두고
+파일 잠금 아래에서 전체 프로세스 공용 토큰 버킷과 동시 요청 수를 관리하며,
+프로세스별 요청 수를 기록해 누가 한도를 쓰고 있는지 보여 줍니다.
+요청마다 파일을 잠그지 않도록 토큰과 요청 슬롯은 몇 개씩 묶어 미리 받아(lease) 두고,
+쓰지 않은 몫은 잠시 뒤 한꺼번에 돌려줍니다.
+
+프로세스 안의 속도 조절(AIMD)은 rate_limiter가 맡고, 여기서는 그 합계의 상한만 지킵니다.
+"""
+
+import asyncio
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, Optional
+
+from stock_analyzer.config import GovernorSettings
+from stock_analyzer.utils.logger import LoggerMixin
+
+if os.name == 'nt':
+    import msvcrt
+
+    def _lock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+_POLL_SECONDS = 0.05  # 동시 요청 한도 도달 시 첫 재확인 간격 (이후 두 배씩)
+_MAX_POLL_SECONDS = 0.5  # 동시 요청 한도 도달 시 최대 재확인 간격
+_LEASE_SECONDS = 0.1  # 한 번에 미리 받는 토큰 분량 (초당 요청 수 x 이 시간)
+_MAX_LEASE_TOKENS = 64  # 한 번에 미리 받는 최대 토큰 수
+_RETURN_SECONDS = 0.2  # 이 시간 동안 쓰지 않은 토큰/슬롯은 공용 상태로 반환
+_REPORT_SECONDS = 10.0  # 한도 대기 로그 최소 간격
+_FORGET_SECONDS = 86400.0  # 이 시간 동안 요청이 없던 프로세스 기록 삭제
+_UNSAFE_CHARS = re.compile(r'[^A-Za-z0-9.\-]')
+
+
+def _pid_alive(pid: int) -> bool:
+    """프로세스 생존 여부 (확인할 수 없으면 True)"""
+    if os.name == 'nt':
+        # Windows에서 os.kill(pid, 0)은 프로세스를 종료시키므로 사용하지 않음
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _process_name() -> str:
+    """현재 프로세스를 나타내는 이름 (스크립트 파일명)"""
+    return os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else 'python'
+
+
+@dataclass
+class _Lease:
+    """프로세스가 호스트별로 미리 받아 둔 토큰과 요청 슬롯"""
+    ready: Deque[float] = field(default_factory=deque)  # 토큰별 사용 가능 시각 (time.monotonic)
+    idle: int = 0  # 공용 상태에 잡아 두었지만 쓰지 않는 요청 슬롯
+    slots: int = 1  # 한 번에 받는 요청 슬롯 수
+    requests: int = 0  # 아직 기록하지 않은 요청 수
+    waited: float = 0.0  # 아직 기록하지 않은 대기 시간
+    last: float = 0.0  # 마지막 사용 시각 (time.monotonic)
+    timer: Optional[threading.Timer] = None
+
+
+class RequestGovernor(LoggerMixin):
+    """
+    파일 잠금 기반 프로세스 간 요청 조율기
+
+    호스트별 상태 파일({path}/{host}.json)에 공용 토큰 버킷, 프로세스별 동시 요청 수와
+    누적 요청 수를 기록합니다. 종료된 프로세스의 기록은 다음 요청 때 정리하고,
+    응답 없이 오래 잡혀 있는 요청 슬롯은 stale_seconds 후 회수합니다.
+
+    프로세스는 토큰(초당 요청 수 x _LEASE_SECONDS개)과 요청 슬롯(동시 요청 한도의 1/4)을
+    한 번의 잠금으로 묶어 받아 두고 그 안에서는 파일을 건드리지 않습니다. 상태 파일의 프로세스별
+    inflight는 진행 중인 요청과 받아 둔 빈 슬롯의 합이며, 쓰지 않은 토큰/슬롯은 _RETURN_SECONDS 동안
+    요청이 없으면 반환합니다. 요청 수/대기 시간 기록도 다음 잠금 때 함께 반영합니다.
+    """
+
+    def __init__(self, path: Optional[str] = None, stale_seconds: float = 120.0):
+        """
+        Args:
+            path: 상태 파일 디렉토리 (None이면 시스템 임시 디렉토리)
+            stale_seconds: 응답 없는 요청 슬롯을 회수하는 시간 (초)
+        """
+        self.path = Path(path or os.path.join(tempfile.gettempdir(), 'stock_analyzer_governor'))
+        self.stale_seconds = stale_seconds
+        self.pid = os.getpid()
+        self.name = _process_name()
+
+        # 같은 프로세스의 스레드끼리는 파일 잠금 전에 먼저 줄을 세움
+        self._lock = threading.Lock()
+        self._last_report: Dict[str, float] = {}
+
+        # 호스트별 미리 받은 몫 (_lease_lock -> _lock 순서로 잠금)
+        self._leases: Dict[str, _Lease] = {}
+        self._lease_lock = threading.Lock()
+
+    # ==================== 상태 파일 ====================
+
+    def _state_path(self, host: str) -> Path:
+        return self.path / f"{_UNSAFE_CHARS.sub('_', host)}.json"
+
+    @contextmanager
+    def _state(self, host: str) -> Iterator[Dict]:
+        """호스트 상태를 잠그고 읽은 뒤, 블록이 끝나면 기록하고 잠금을 풉니다"""
+        self.path.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            fd = os.open(self._state_path(host), os.O_RDWR | os.O_CREAT, 0o666)
+            with os.fdopen(fd, 'r+', encoding='utf-8') as f:
+                _lock_file(f)
+                try:
+                    f.seek(0)
+                    text = f.read()
+                    try:
+                        state = json.loads(text) if text else {}
+                    except ValueError:
+                        self.logger.warning(f"요청 조율 상태 파일 손상 - 초기화: {host}")
+                        state = {}
+                    state.setdefault('processes', {})
+
+                    yield state
+
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    _unlock_file(f)
+
+    def _prune(self, state: Dict, now: float):
+        """종료된 프로세스 기록과 오래된 요청 슬롯 정리"""
+        processes = state['processes']
+        for pid, entry in list(processes.items()):
+            idle = now - entry['last']
+            if not _pid_alive(int(pid)) or (entry['inflight'] == 0 and idle > _FORGET_SECONDS):
+                del processes[pid]
+            elif entry['inflight'] > 0 and idle > self.stale_seconds:
+                self.logger.warning(
+                    f"응답 없는 요청 슬롯 회수: {entry['name']}(pid {pid}) {entry['inflight']}건"
+                )
+                entry['inflight'] = 0
+
+    def _entry(self, state: Dict, now: float) -> Dict:
+        """현재 프로세스 기록"""
+        return state['processes'].setdefault(str(self.pid), {
+            'name': self.name,
+            'inflight': 0,
+            'requests': 0,
+            'waited': 0.0,
+            'started': now,
+            'last': now,
+        })
+
+    # ==================== 요청 슬롯 ====================
+
+    def _try_reserve(self, host: str, rate: float, burst: int, max_inflight: int) -> Optional[float]:
+        """
+        요청 슬롯 하나를 예약합니다 (미리 받은 몫이 있으면 파일을 잠그지 않음).
+
+        Returns:
+            토큰을 기다려야 하는 시간 (초), 동시 요청 한도에 걸리면 None
+        """
+        with self._lease_lock:
+            lease = self._leases.setdefault(host, _Lease())
+            if lease.idle == 0 or not lease.ready:
+                if not self._refill(host, lease, rate, burst, max_inflight):
+                    return None
+            else:
+                lease.requests += 1
+
+            now = time.monotonic()
+            wait = max(0.0, lease.ready.popleft() - now)
+            lease.idle -= 1
+            lease.waited += wait
+            lease.last = now
+            self._schedule_return(host, lease)
+            return wait
+
+    def _refill(self, host: str, lease: _Lease, rate: float, burst: int, max_inflight: int) -> bool:
+        """
+        공용 상태에서 빈 슬롯과 토큰을 묶어 받고 이번 요청을 기록합니다 (_lease_lock 보유 상태에서 호출).
+
+        Returns:
+            슬롯을 받았으면 True, 동시 요청 한도에 걸리면 False
+        """
+        with self._state(host) as state:
+            now = time.time()
+            self._prune(state, now)
+
+            processes = state['processes']
+            if lease.idle == 0:
+                free = max_inflight - sum(entry['inflight'] for entry in processes.values())
+                if free <= 0:
+                    self._report_wait(host, processes, max_inflight, now)
+                    return False
+
+            entry = self._sync(state, lease, now)
+            entry['requests'] += 1
+            if lease.idle == 0:
+                lease.slots = max(1, max_inflight // 4)
+                slots = min(free, lease.slots)
+                entry['inflight'] += slots
+                lease.idle += slots
+
+            if not lease.ready:
+                count = max(1, min(int(rate * _LEASE_SECONDS), _MAX_LEASE_TOKENS))
+                tokens = state.get('tokens', float(burst))
+                updated = state.get('updated', now)
+                tokens = min(float(burst), tokens + max(0.0, now - updated) * rate)
+                # i번째 토큰은 버킷이 i+1개가 될 때 사용 가능
+                base = time.monotonic()
+                lease.ready.extend(base + max(0.0, (i + 1 - tokens) / rate) for i in range(count))
+                state['tokens'] = tokens - count
+                state['updated'] = now
+            return True
+
+    def _sync(self, state: Dict, lease: _Lease, now: float) -> Dict:
+        """쌓아 둔 요청 수/대기 시간을 현재 프로세스 기록에 반영"""
+        entry = self._entry(state, now)
+        entry['requests'] += lease.requests
+        entry['waited'] += lease.waited
+        entry['last'] = now
+        lease.requests, lease.waited = 0, 0.0
+        return entry
+
+    def _give_back(self, host: str, lease: _Lease, slots: int, tokens: bool):
+        """빈 슬롯 slots개와 (tokens면) 쓰지 않은 토큰을 공용 상태로 반환 (_lease_lock 보유 상태에서 호출)"""
+        if not (slots or (tokens and lease.ready) or lease.requests or lease.waited):
+            return
+        with self._state(host) as state:
+            now = time.time()
+            entry = self._sync(state, lease, now)
+            entry['inflight'] = max(0, entry['inflight'] - slots)
+            lease.idle -= slots
+            if tokens and lease.ready and 'tokens' in state:
+                state['tokens'] += len(lease.ready)
+                lease.ready.clear()
+
+    def _schedule_return(self, host: str, lease: _Lease):
+        """쓰지 않은 몫의 반환 예약 (_lease_lock 보유 상태에서 호출)"""
+        if lease.timer is None:
+            lease.timer = threading.Timer(_RETURN_SECONDS, self._expire, (host,))
+            lease.timer.daemon = True
+            lease.timer.start()
+
+    def _expire(self, host: str):
+        """_RETURN_SECONDS 동안 쓰지 않았으면 미리 받은 몫을 반환하고, 아니면 다시 예약"""
+        with self._lease_lock:
+            lease = self._leases[host]
+            lease.timer = None
+            if time.monotonic() - lease.last < _RETURN_SECONDS:
+                self._schedule_return(host, lease)
+            else:
+                self._give_back(host, lease, lease.idle, tokens=True)
+
+    def flush(self, host: Optional[str] = None):
+        """
+        미리 받은 몫을 즉시 반환하고 요청 기록을 반영합니다.
+
+        Args:
+            host: 대상 호스트 (None이면 전체)
+        """
+        with self._lease_lock:
+            for name, lease in self._leases.items():
+                if host is None or name == host:
+                    self._give_back(name, lease, lease.idle, tokens=True)
+
+    def _report_wait(self, host: str, processes: Dict[str, Dict], max_inflight: int, now: float):
+        """동시 요청 한도를 쓰고 있는 프로세스 로그 (호스트별 최소 간격)"""
+        if now - self._last_report.get(host, 0.0) < _REPORT_SECONDS:
+            return
+        self._last_report[host] = now
+        holders = ', '.join(
+            f"{entry['name']}(pid {pid}) {entry['inflight']}건"
+            for pid, entry in sorted(processes.items(), key=lambda item: -item[1]['inflight'])
+            if entry['inflight'] > 0
+        )
+        self.logger.info(f"요청 대기: {host} 동시 요청 한도 {max_inflight}건 - 사용 중: {holders}")
+
+    def acquire(self, host: str, rate: float, burst: int = 1, max_inflight: int = 16) -> float:
+        """
+        요청 전에 호출합니다. 반드시 release()와 짝을 맞춥니다.
+
+        동시 요청 한도에 걸리면 재확인 간격을 _POLL_SECONDS부터 _MAX_POLL_SECONDS까지 두 배씩 늘립니다.
+
+        Args:
+            host: 호스트 이름
+            rate: 전체 프로세스 합계 초당 요청 수
+            burst: 순간 허용 요청 수
+            max_inflight: 전체 프로세스 합계 동시 요청 수
+
+        Returns:
+            대기한 시간 (초)
+        """
+        started = time.monotonic()
+        poll = _POLL_SECONDS
+        while True:
+            wait = self._try_reserve(host, rate, burst, max_inflight)
+            if wait is not None:
+                break
+            time.sleep(poll)
+            poll = min(poll * 2, _MAX_POLL_SECONDS)
+        if wait > 0:
+            time.sleep(wait)
+        return time.monotonic() - started
+
+    async def acquire_async(self, host: str, rate: float, burst: int = 1, max_inflight: int = 16) -> float:
+        """
+        acquire()의 asyncio 버전
+
+        파일 잠금 구간(_try_reserve)은 다른 프로세스와 경합하면 막힐 수 있으므로 실행기 스레드에서
+        실행하고, 이벤트 루프에서는 기다리기만 합니다. 예약 도중이나 대기 중에 취소되면 예약한 슬롯을 반환합니다.
+        """
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        poll = _POLL_SECONDS
+        while True:
+            future = loop.run_in_executor(None, self._try_reserve, host, rate, burst, max_inflight)
+            try:
+                wait = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 실행기에서 예약이 끝나면 그 슬롯을 반환
+                future.add_done_callback(lambda f: self._release_reserved(loop, host, f))
+                raise
+            if wait is not None:
+                break
+            await asyncio.sleep(poll)
+            poll = min(poll * 2, _MAX_POLL_SECONDS)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                await self.release_async(host)
+                raise
+        return time.monotonic() - started
+
+    def _release_reserved(self, loop: asyncio.AbstractEventLoop, host: str, future: asyncio.Future):
+        """취소된 acquire_async()가 예약한 슬롯 반환 (파일 잠금은 실행기 스레드에서)"""
+        if not future.cancelled() and future.exception() is None and future.result() is not None:
+            loop.run_in_executor(None, self.release, host)
+
+    def release(self, host: str):
+        """
+        요청이 끝나면 호출합니다.
+
+        슬롯은 다음 요청을 위해 빈 슬롯으로 남겨 두고, 빈 슬롯이 한 번에 받는 수보다 많아지면
+        (동시 요청이 줄어든 경우) 넘는 만큼만 바로 반환합니다.
+        """
+        with self._lease_lock:
+            lease = self._leases.get(host)
+            if lease is None:
+                return
+            lease.idle += 1
+            lease.last = time.monotonic()
+            if lease.idle > lease.slots:
+                self._give_back(host, lease, lease.idle - lease.slots, tokens=False)
+            self._schedule_return(host, lease)
+
+    async def release_async(self, host: str):
+        """release()의 asyncio 버전 (파일 잠금은 실행기 스레드에서)"""
+        await asyncio.get_running_loop().run_in_executor(None, self.release, host)
+
+    # ==================== 사용 현황 ====================
+
+    def report(self, host: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """
+        호스트별 프로세스 사용 현황
+
+        Args:
+            host: 조회할 호스트 (None이면 상태 파일이 있는 모든 호스트)
+
+        Returns:
+            호스트 -> 요청 수가 많은 순으로 정렬한 프로세스 리스트
+            (pid, name, inflight, requests, waited, last)
+        """
+        if host is not None:
+            hosts = [host]
+        elif self.path.exists():
+            hosts = sorted(path.stem for path in self.path.glob('*.json'))
+        else:
+            hosts = []
+
+        self.flush(host)  # 이 프로세스가 미리 받은 몫과 요청 기록 반영
+        report = {}
+        for name in hosts:
+            with self._state(name) as state:
+                self._prune(state, time.time())
+                rows = [
+                    {
+                        'pid': int(pid),
+                        'name': entry['name'],
+                        'inflight': entry['inflight'],
+                        'requests': entry['requests'],
+                        'waited': round(entry['waited'], 2),
+                        'last': entry['last'],
+                    }
+                    for pid, entry in state['processes'].items()
+                ]
+            report[name] = sorted(rows, key=lambda row: -row['requests'])
+        return report
+
+    def format_report(self) -> str:
+        """사용 현황 텍스트"""
+        lines = []
+        for host, rows in self.report().items():
+            lines.append(f"[{host}] 진행 중 요청 {sum(row['inflight'] for row in rows)}건")
+            for row in rows:
+                lines.append(
+                    f"  {row['name']}(pid {row['pid']}): 요청 {row['requests']}건, "
+                    f"진행 중 {row['inflight']}건, 대기 {row['waited']:.1f}초"
+                )
+        return '\n'.join(lines) if lines else "요청 기록 없음"
+
+
+_governor: Optional[RequestGovernor] = None
+_governor_loaded = False
+_governor_lock = threading.Lock()
+
+
+def get_request_governor() -> Optional[RequestGovernor]:
+    """
+    공유 요청 조율기를 반환합니다 (프로세스 내 싱글톤, 비활성화 시 None).
+
+    텔레그램 설정이 없는 레거시 스크립트에서도 쓰이므로 GOVERNOR_ 설정만 읽습니다.
+    """
+    global _governor, _governor_loaded
+    with _governor_lock:
+        if not _governor_loaded:
+            config = GovernorSettings()
+            if config.enabled:
+                _governor = RequestGovernor(config.path or None, stale_seconds=config.stale_seconds)
+            _governor_loaded = True
+        return _governor
+
+
+if __name__ == "__main__":
+    governor = get_request_governor()
+    if governor is None:
+        print("요청 조율 비활성화 (GOVERNOR_ENABLED=false)")
+    else:
+        print(f"상태 파일: {governor.path}")
+        print(governor.format_report())
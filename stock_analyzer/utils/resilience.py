@@ -0,0 +1,242 @@
+"""
+데이터 소스 장애 대응
+
+일시적인 오류(타임아웃, 연결 오류, 429/5xx)는 지터를 준 지수 백오프로 재시도하고,
+소스가 계속 실패하면 서킷 브레이커를 열어 한동안 요청 없이 바로 실패시킵니다.
+실패는 None 대신 DataSourceError 계열 예외로 전달하여, 스크리너가 "신호 없음"과
+"소스 장애"를 구분하고 장애 시 스캔을 일찍 멈출 수 있게 합니다.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Optional
+
+import pandas as pd
+
+from stock_analyzer.config import get_settings
+from stock_analyzer.utils.data_provider import DataProvider
+from stock_analyzer.utils.logger import LoggerMixin
+from stock_analyzer.utils.rate_limiter import is_throttle_error
+
+
+class DataSourceError(Exception):
+    """데이터 소스 장애 (종목에 데이터가 없는 것과 구분)"""
+
+    def __init__(self, source: str, message: str):
+        super().__init__(f"{source}: {message}")
+        self.source = source
+
+
+class TransientSourceError(DataSourceError):
+    """재시도 후에도 해결되지 않은 일시적 오류"""
+
+
+class SourceUnavailableError(DataSourceError):
+    """서킷 브레이커가 열려 요청하지 않음 (소스 중단)"""
+
+
+# 연결이 중간에 끊긴 경우 (requests/urllib3/http.client)
+_DISCONNECT_ERRORS = frozenset({'ChunkedEncodingError', 'ProtocolError', 'RemoteDisconnected', 'IncompleteRead'})
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """
+    재시도할 만한 일시적 오류인지 판단합니다
+    (타임아웃, 연결 오류, 429/5xx, 감싼 소스가 일시적 오류로 분류한 TransientSourceError)
+    """
+    if isinstance(exc, TransientSourceError):
+        return True
+    return is_throttle_error(exc) or type(exc).__name__ in _DISCONNECT_ERRORS
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """지터를 준 지수 백오프 재시도 정책"""
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째 실패 후 대기 시간 (0 ~ base_delay * 2^attempt 사이 균등 분포)"""
+        return random.uniform(0.0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker(LoggerMixin):
+    """
+    소스별 서킷 브레이커
+
+    연속 실패가 failure_threshold에 이르면 열림(open) 상태가 되어 reset_seconds 동안
+    요청을 막습니다. 그 뒤 한 요청만 시험 삼아 보내고(half-open), 성공하면 닫고 실패하면 다시 엽니다.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_seconds: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+        # 통계
+        self.rejected = 0
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_seconds:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 여부 (열림 상태면 False)"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_seconds:
+                    self.rejected += 1
+                    return False
+                self._state = self.HALF_OPEN
+            # half-open: 시험 요청 하나만 허용
+            if self._probing:
+                self.rejected += 1
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            if self._state != self.CLOSED:
+                self.logger.info(f"서킷 닫힘: {self.name} - 소스 복구")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self.trips += 1
+                self.logger.warning(
+                    f"서킷 열림: {self.name} (연속 실패 {self._failures}회) - "
+                    f"{self.reset_seconds:.0f}초 동안 요청 차단"
+                )
+            self._probing = False
+
+
+class ResilientDataProvider(DataProvider, LoggerMixin):
+    """
+    재시도와 서킷 브레이커를 적용한 데이터 제공자 (데코레이터 패턴)
+
+    감싼 제공자의 fetch_ohlcv_strict()로 예외를 직접 받아, 일시적 오류는 재시도하고
+    재시도가 모두 실패하면 TransientSourceError, 서킷이 열려 있으면 SourceUnavailableError를 발생시킵니다.
+    감싼 소스가 일시적이지 않은 DataSourceError를 내면 재시도 없이 실패로 집계해 그대로 전달하고,
+    그 밖의 일시적이지 않은 오류(잘못된 종목 등)는 기존처럼 로그를 남기고 None을 반환합니다.
+    서킷의 성공으로는 응답을 받은 경우(데이터 없음 포함)만 집계합니다.
+    """
+
+    def __init__(
+        self,
+        provider: DataProvider,
+        name: Optional[str] = None,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        """
+        Args:
+            provider: 실제 데이터 제공자
+            name: 소스 이름 (로그, 오류 메시지용)
+            retry: 재시도 정책 (None이면 설정에서 가져옴)
+            breaker: 서킷 브레이커 (None이면 설정값으로 생성)
+        """
+        config = get_settings().provider
+        self.provider = provider
+        self.name = name or type(provider).__name__
+        self.retry = retry or RetryPolicy(
+            max_attempts=config.retry_attempts,
+            base_delay=config.retry_base_delay,
+            max_delay=config.retry_max_delay
+        )
+        self.breaker = breaker or CircuitBreaker(
+            self.name, config.breaker_threshold, config.breaker_reset_seconds
+        )
+        self.retries = 0
+
+    def fetch_ohlcv(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """
+        재시도/서킷 브레이커를 거쳐 OHLCV 데이터를 가져옵니다.
+
+        Raises:
+            SourceUnavailableError: 서킷이 열려 있음
+            TransientSourceError: 일시적 오류가 재시도 후에도 계속됨
+            DataSourceError: 감싼 소스의 일시적이지 않은 장애
+        """
+        if not self.breaker.allow():
+            raise SourceUnavailableError(self.name, "서킷 열림 - 요청 생략")
+
+        last_error: Optional[BaseException] = None
+        for attempt in range(self.retry.max_attempts):
+            if attempt > 0:
+                if self.breaker.state == CircuitBreaker.OPEN:
+                    # 다른 요청들이 이미 서킷을 열었음 - 더 기다리지 않음
+                    raise SourceUnavailableError(self.name, f"서킷 열림 - 재시도 중단 ({last_error})")
+                self.retries += 1
+                time.sleep(self.retry.delay(attempt - 1))
+
+            try:
+                df = self.provider.fetch_ohlcv_strict(ticker, start_date, end_date)
+            except DataSourceError as e:
+                if not is_transient_error(e):
+                    # 감싼 소스가 장애로 분류한 오류 - 재시도하지 않지만 "데이터 없음"과 구분
+                    self.breaker.record_failure()
+                    raise
+                last_error = e
+                self.logger.debug(f"{self.name} 일시적 오류 ({attempt + 1}/{self.retry.max_attempts}): {ticker} - {e}")
+                continue
+            except Exception as e:
+                if not is_transient_error(e):
+                    # 잘못된 종목 등 - 소스 상태와 무관하므로 서킷에 반영하지 않음
+                    self.logger.error(f"{self.name} 데이터 조회 오류: {ticker} - {e}")
+                    return None
+                last_error = e
+                self.logger.debug(f"{self.name} 일시적 오류 ({attempt + 1}/{self.retry.max_attempts}): {ticker} - {e}")
+                continue
+
+            self.breaker.record_success()
+            return df
+
+        self.breaker.record_failure()
+        raise TransientSourceError(
+            self.name, f"{self.retry.max_attempts}회 시도 실패: {ticker} - {type(last_error).__name__} {last_error}"
+        ) from last_error
+
+    def get_stock_list(self, market: str = 'KRX') -> pd.DataFrame:
+        """종목 리스트는 감싼 제공자에 위임"""
+        return self.provider.get_stock_list(market)
+
+    def get_resilience_stats(self) -> Dict:
+        """서킷 상태와 재시도/차단 횟수"""
+        return {
+            'state': self.breaker.state,
+            'retries': self.retries,
+            'rejected': self.breaker.rejected,
+            'trips': self.breaker.trips,
+        }
@@ -0,0 +1,297 @@
+"""
+합성 시장 데이터 제공자
+
+시드에서 재현 가능한 가상 종목 OHLCV를 생성합니다 (기하 랜덤워크, 거래량 폭증,
+갭, 거래정지, A/B/C 급등 패턴 주입). 실제 데이터 없이 현재 유니버스의 수십 배 종목,
+수십 년 이력으로 스크리너/병렬 처리/DB/분류기 부하 테스트를 할 수 있습니다.
+"""
+
+import threading
+import time
+from datetime import date, datetime
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from stock_analyzer.config import get_settings
+from stock_analyzer.utils.data_provider import DataProvider
+from stock_analyzer.utils.logger import LoggerMixin
+from stock_analyzer.utils.market_panel import MarketPanel
+
+# 패턴 주입 구간 (마지막 거래일 포함 거래일 수, 20일 지표 창보다 길게)
+_PATTERN_DAYS = 31
+# 일간 로그 수익률 한도 (가격제한폭 ±30%)
+_LIMIT = float(np.log(1.3))
+_GRADES = ('A', 'B', 'C')
+
+
+def _trading_days(end: date, days: int) -> np.ndarray:
+    """end 이전(포함) 평일 days개 (datetime64[D], 오름차순)"""
+    last = np.busday_offset(np.datetime64(end, 'D'), 0, roll='backward')
+    return np.busday_offset(last, np.arange(-days + 1, 1), roll='backward')
+
+
+class SyntheticDataProvider(DataProvider, LoggerMixin):
+    """
+    시드 기반 합성 OHLCV 제공자
+
+    종목 i의 전체 이력은 (seed, i)만으로 결정되므로 조회 순서나 스레드와 무관하게 항상 같습니다.
+    종목마다 breakout_rate 확률로 마지막 거래일에 A/B/C 등급 패턴을 주입하며,
+    injected_grade()로 기대 등급을 확인할 수 있습니다.
+    조회마다 latency(평균 초, 로그정규 분포) 만큼 대기하고 error_rate 확률로 연결 오류를 냅니다.
+    """
+
+    def __init__(
+        self,
+        tickers: Optional[int] = None,
+        days: Optional[int] = None,
+        seed: Optional[int] = None,
+        end: Optional[date] = None,
+        breakout_rate: Optional[float] = None,
+        burst_rate: float = 0.01,
+        gap_rate: float = 0.01,
+        halt_rate: float = 0.02,
+        latency: Optional[float] = None,
+        latency_sigma: float = 0.5,
+        error_rate: Optional[float] = None
+    ):
+        """
+        Args:
+            tickers: 종목 수 (None이면 설정에서 가져옴)
+            days: 종목별 이력 거래일 수
+            seed: 난수 시드
+            end: 마지막 거래일 기준 날짜 (None이면 오늘)
+            breakout_rate: 급등 패턴 주입 종목 비율 (A/B/C 균등)
+            burst_rate: 거래일별 거래량 폭증 확률
+            gap_rate: 거래일별 시가 갭 확률
+            halt_rate: 종목별 거래정지 구간 발생 확률
+            latency: 조회당 평균 지연 (초)
+            latency_sigma: 지연 로그정규 분포 표준편차
+            error_rate: 조회 실패(ConnectionError) 확률
+        """
+        config = get_settings().synthetic
+        self.n_tickers = tickers or config.tickers
+        self.days = days or config.days
+        self.seed = config.seed if seed is None else seed
+        self.breakout_rate = config.breakout_rate if breakout_rate is None else breakout_rate
+        self.burst_rate = burst_rate
+        self.gap_rate = gap_rate
+        self.halt_rate = halt_rate
+        self.latency = config.latency if latency is None else latency
+        self.latency_sigma = latency_sigma
+        self.error_rate = config.error_rate if error_rate is None else error_rate
+
+        self.dates = _trading_days(end or datetime.now().date(), self.days)
+        self.tickers = [f"{i + 1:06d}" for i in range(self.n_tickers)]
+        self._index = {ticker: i for i, ticker in enumerate(self.tickers)}
+
+        self._random = np.random.default_rng([self.seed, 2 ** 31])
+        self._lock = threading.Lock()
+
+    # ==================== 생성 ====================
+
+    def _rng(self, index: int) -> np.random.Generator:
+        return np.random.default_rng([self.seed, index])
+
+    def injected_grade(self, ticker: str) -> Optional[str]:
+        """마지막 거래일에 주입한 패턴 등급 (A/B/C, 없으면 None)"""
+        index = self._index.get(ticker)
+        if index is None:
+            return None
+        draw = self._rng(index).random()
+        if draw >= self.breakout_rate:
+            return None
+        return _GRADES[int(draw / self.breakout_rate * len(_GRADES))]
+
+    def generate(self, index: int) -> Dict[str, np.ndarray]:
+        """
+        종목 하나의 전체 이력을 생성합니다.
+
+        Returns:
+            open/high/low/close (float64, 소수 둘째 자리 반올림), volume (int64) 배열
+        """
+        rng = self._rng(index)
+        rng.random()  # injected_grade 추첨 (같은 순서로 소비)
+        n = self.days
+
+        price = np.exp(rng.uniform(np.log(1_000), np.log(300_000)))
+        base_volume = np.exp(rng.uniform(np.log(10_000), np.log(3_000_000)))
+        drift = rng.normal(0.0002, 0.0005)
+        sigma = rng.uniform(0.01, 0.04)
+
+        # 수익률을 장외(시가 갭)와 장중으로 나눔
+        overnight = rng.normal(0.0, sigma * 0.3, n)
+        gaps = rng.random(n) < self.gap_rate
+        overnight[gaps] += rng.normal(0.0, sigma * 4, gaps.sum())
+        intraday = rng.normal(drift, sigma, n)
+
+        # 거래정지: 구간 내 가격 변화 없음, 거래량 0
+        halted = np.zeros(n, dtype=bool)
+        if rng.random() < self.halt_rate and n > 2:
+            start = rng.integers(1, n)
+            halted[start:start + rng.integers(1, 21)] = True
+        overnight[halted] = 0.0
+        intraday[halted] = 0.0
+
+        overnight = np.clip(overnight, -_LIMIT, _LIMIT)
+        intraday = np.clip(intraday, -_LIMIT - overnight, _LIMIT - overnight)
+
+        log_close = np.log(price) + np.cumsum(overnight + intraday)
+        close = np.exp(log_close)
+        open_ = np.exp(log_close - intraday)
+        wick = np.abs(rng.normal(0.0, sigma * 0.5, (2, n)))
+        high = np.maximum(open_, close) * np.exp(wick[0])
+        low = np.minimum(open_, close) * np.exp(-wick[1])
+        high[halted] = low[halted] = close[halted]
+
+        # 거래량: 변동이 클수록 증가, 가끔 폭증
+        volume = base_volume * rng.lognormal(0.0, 0.4, n) * (1 + np.abs(intraday) / sigma)
+        bursts = rng.random(n) < self.burst_rate
+        volume[bursts] *= rng.uniform(3, 10, bursts.sum())
+        volume[halted] = 0
+
+        bars = {'open': open_, 'high': high, 'low': low, 'close': close, 'volume': volume}
+        grade = self.injected_grade(self.tickers[index])
+        if grade is not None and n > _PATTERN_DAYS:
+            self._inject(bars, grade, base_volume)
+
+        for field in ('open', 'high', 'low', 'close'):
+            bars[field] = np.round(bars[field], 2)
+        bars['volume'] = np.round(bars['volume']).astype(np.int64)
+        return bars
+
+    @staticmethod
+    def _inject(bars: Dict[str, np.ndarray], grade: str, base_volume: float):
+        """
+        마지막 _PATTERN_DAYS 거래일을 등급 패턴으로 덮어씁니다.
+
+        A: 좁은 횡보(거래량 감소) 후 20일 고점을 뚫는 거래량 6배 장대양봉
+        B: 하락 추세 중 거래량 변화 없는 +2.5% 몸통 양봉 (고점/이평/거래량 조건 미충족)
+        C: B와 같되 윗꼬리가 길어 몸통 비율 70% 미만
+        """
+        k = _PATTERN_DAYS - 1
+        start = len(bars['close']) - _PATTERN_DAYS
+        anchor = bars['close'][start - 1]
+        tail = slice(start, start + k)
+
+        if grade == 'A':
+            steps = np.linspace(0, 1, k)
+            close = anchor * (1 + 0.002 * np.sin(steps * 12))
+            open_ = np.concatenate([[anchor], close[:-1]])
+            volume = base_volume * np.linspace(1.0, 0.6, k)
+            bars['high'][tail] = np.maximum(open_, close) * 1.004
+            bars['low'][tail] = np.minimum(open_, close) * 0.996
+            last_open = close[-1]
+            last_close = last_open * 1.08
+            last = (last_open, last_close * 1.003, last_open * 0.997, last_close, base_volume * 6)
+        else:
+            close = anchor * (1.25 - 0.25 * np.arange(k) / (k - 1))
+            open_ = np.concatenate([[close[0] * 1.01], close[:-1]])
+            volume = np.full(k, base_volume)
+            bars['high'][tail] = open_ * 1.005
+            bars['low'][tail] = close * 0.995
+            last_open = close[-1]
+            last_close = last_open * 1.025
+            last_high = last_close if grade == 'B' else last_close + (last_close - last_open) * 0.6
+            last = (last_open, last_high, last_open, last_close, base_volume)
+
+        bars['open'][tail] = open_
+        bars['close'][tail] = close
+        bars['volume'][tail] = volume
+        for field, value in zip(('open', 'high', 'low', 'close', 'volume'), last):
+            bars[field][-1] = value
+
+    def _window(self, start_date: date, end_date: date) -> slice:
+        left = np.searchsorted(self.dates, np.datetime64(start_date, 'D'), side='left')
+        right = np.searchsorted(self.dates, np.datetime64(end_date, 'D'), side='right')
+        return slice(left, right)
+
+    # ==================== 조회 ====================
+
+    def _simulate_request(self):
+        """지연 모델과 오류 주입"""
+        with self._lock:
+            delay = self.latency * self._random.lognormal(-self.latency_sigma ** 2 / 2, self.latency_sigma) \
+                if self.latency > 0 else 0.0
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+        if delay > 0:
+            time.sleep(delay)
+        if failed:
+            raise ConnectionError("합성 데이터 소스 연결 오류")
+
+    def fetch_ohlcv(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """합성 OHLCV 데이터 (주입된 연결 오류는 로그 후 None)"""
+        try:
+            return self.fetch_ohlcv_strict(ticker, start_date, end_date)
+        except ConnectionError as e:
+            self.logger.error(f"합성 데이터 조회 오류: {ticker} - {e}")
+            return None
+
+    def fetch_ohlcv_strict(
+        self,
+        ticker: str,
+        start_date: date,
+        end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """합성 OHLCV 데이터 (주입된 연결 오류를 그대로 발생)"""
+        self._simulate_request()
+        index = self._index.get(ticker)
+        if index is None:
+            return None
+
+        window = self._window(start_date, end_date)
+        if window.start >= window.stop:
+            return None
+        bars = self.generate(index)
+        return pd.DataFrame({
+            '시가': bars['open'][window],
+            '고가': bars['high'][window],
+            '저가': bars['low'][window],
+            '종가': bars['close'][window],
+            '거래량': bars['volume'][window],
+        }, index=pd.DatetimeIndex(self.dates[window], name='Date'))
+
+    def get_stock_list(self, market: str = 'KRX') -> pd.DataFrame:
+        """합성 종목 리스트 (KOSPI:KOSDAQ = 1:2)"""
+        listing = pd.DataFrame({
+            'Code': self.tickers,
+            'Name': [f"합성{ticker}" for ticker in self.tickers],
+            'Market': ['KOSPI' if i % 3 == 0 else 'KOSDAQ' for i in range(self.n_tickers)],
+        })
+        if market != 'KRX':
+            listing = listing[listing['Market'] == market].reset_index(drop=True)
+        return listing
+
+    def build_panel(
+        self,
+        start_date: date,
+        end_date: date,
+        tickers: Optional[Sequence[str]] = None
+    ) -> MarketPanel:
+        """
+        종목별 조회 없이 기간 내 전종목 패널을 직접 생성합니다 (지연/오류 주입 없음).
+
+        Args:
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            tickers: 종목 코드 (None이면 전체)
+        """
+        tickers = list(tickers) if tickers is not None else self.tickers
+        window = self._window(start_date, end_date)
+        dates = self.dates[window]
+        panel = MarketPanel.empty(tickers, dates)
+
+        for row, ticker in enumerate(tickers):
+            index = self._index.get(ticker)
+            if index is None:
+                continue
+            bars = self.generate(index)
+            for field in ('open', 'high', 'low', 'close', 'volume'):
+                getattr(panel, field)[row] = bars[field][window]
+        return panel
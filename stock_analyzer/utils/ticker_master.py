@@ -0,0 +1,317 @@
+"""
+종목 마스터
+
+KRX 종목 리스트를 디스크에 하루 단위로 보관하고, 종목코드/종목명 조회와
+시장별 종목 목록을 미리 만들어 둔 딕셔너리로 제공합니다.
+단일 종목 분석이나 스크리닝마다 전체 종목 리스트를 다시 내려받지 않습니다.
+"""
+
+import os
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from stock_analyzer.config import get_settings
+from stock_analyzer.utils.data_provider import DataProvider
+from stock_analyzer.utils.logger import LoggerMixin
+
+# Parquet 스키마 메타데이터 키 (종목 리스트 기준일)
+_AS_OF_KEY = b'as_of'
+
+# 한글 음절 초성 (유니코드 음절 순서)
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_HANGUL_START, _HANGUL_END = ord('가'), ord('힣')
+_JUNG_JONG_COUNT = 21 * 28
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절을 초성으로 바꿉니다 (한글이 아닌 문자는 그대로)"""
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_START <= code <= _HANGUL_END:
+            chars.append(CHOSUNG[(code - _HANGUL_START) // _JUNG_JONG_COUNT])
+        else:
+            chars.append(ch)
+    return ''.join(chars)
+
+
+def _normalize_name(name: str) -> str:
+    """검색용 종목명 (공백 제거, 영문 대문자)"""
+    return ''.join(name.split()).upper()
+
+
+@dataclass(frozen=True)
+class TickerInfo:
+    """종목 정보"""
+    code: str
+    name: str
+    market: str
+
+
+class TickerMaster(LoggerMixin):
+    """
+    디스크에 보관하는 KRX 종목 마스터
+
+    종목 리스트는 하루 한 번만 새로 받아 Parquet 파일에 저장하고, 같은 날 다른 프로세스는
+    파일을 읽어 사용합니다. 새로 받지 못하면 마지막으로 저장된 리스트로 대체합니다.
+    """
+
+    def __init__(
+        self,
+        listing_fetcher: Callable[[], pd.DataFrame],
+        path: Optional[str] = None
+    ):
+        """
+        Args:
+            listing_fetcher: KRX 전체 종목 리스트를 반환하는 함수 (Code/Name/Market 컬럼)
+            path: 종목 리스트 Parquet 파일 경로 (None이면 설정에서 가져옴)
+        """
+        self.listing_fetcher = listing_fetcher
+        self.path = Path(path or get_settings().ticker.path)
+        self._lock = threading.Lock()
+
+        self.as_of: Optional[date] = None  # 종목 리스트 기준일
+        self._checked_on: Optional[date] = None  # 마지막 갱신 확인일
+        self._by_code: Dict[str, TickerInfo] = {}
+        self._by_name: Dict[str, str] = {}
+        self._by_market: Dict[str, Tuple[str, ...]] = {}
+        self._name_keys: List[str] = []
+        self._chosung_keys: List[Tuple[str, str]] = []
+        self._records: Dict[Tuple[str, ...], List[Dict]] = {}
+
+    @classmethod
+    def from_provider(cls, provider: DataProvider, path: Optional[str] = None) -> 'TickerMaster':
+        """데이터 제공자의 종목 리스트를 사용하는 종목 마스터"""
+        return cls(lambda: provider.get_stock_list('KRX'), path)
+
+    # ==================== 갱신 ====================
+
+    def _ensure_fresh(self):
+        """오늘 갱신 여부를 확인하고 필요하면 다시 불러옵니다"""
+        today = datetime.now().date()
+        if self._checked_on == today:
+            return
+
+        with self._lock:
+            if self._checked_on == today:
+                return
+            self._refresh(today, force=False)
+
+    def refresh(self):
+        """종목 리스트를 강제로 다시 받습니다"""
+        with self._lock:
+            self._refresh(datetime.now().date(), force=True)
+
+    def _refresh(self, today: date, force: bool):
+        stored = self._load()
+        if stored is not None and stored[1] == today and not force:
+            listing, as_of = stored
+        else:
+            try:
+                listing = self._clean(self.listing_fetcher())
+                as_of = today
+                self._save(listing, as_of)
+                self.logger.info(f"종목 리스트 갱신: {len(listing)}개 종목")
+            except Exception as e:
+                if stored is None:
+                    if self._by_code:
+                        self.logger.warning(f"종목 리스트 갱신 실패 - 기존 리스트 사용: {e}")
+                        self._checked_on = today
+                        return
+                    raise
+                listing, as_of = stored
+                self.logger.warning(f"종목 리스트 갱신 실패 - {as_of} 리스트 사용: {e}")
+
+        self._build(listing, as_of)
+        self._checked_on = today
+
+    @staticmethod
+    def _clean(listing: Optional[pd.DataFrame]) -> pd.DataFrame:
+        """Code/Name/Market 컬럼만 남긴 문자열 데이터프레임"""
+        if listing is None or listing.empty:
+            raise ValueError("빈 종목 리스트")
+        listing = listing[['Code', 'Name', 'Market']].dropna()
+        return listing.astype(str).drop_duplicates('Code').reset_index(drop=True)
+
+    def _load(self) -> Optional[Tuple[pd.DataFrame, date]]:
+        """저장된 종목 리스트 (없거나 읽을 수 없으면 None)"""
+        if not self.path.exists():
+            return None
+        try:
+            table = pq.read_table(self.path)
+            as_of = date.fromisoformat((table.schema.metadata or {})[_AS_OF_KEY].decode())
+        except Exception as e:
+            self.logger.warning(f"종목 리스트 파일 읽기 오류: {e}")
+            return None
+        return table.to_pandas(), as_of
+
+    def _save(self, listing: pd.DataFrame, as_of: date):
+        """종목 리스트 저장 (임시 파일 기록 후 교체)"""
+        table = pa.Table.from_pandas(listing, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_AS_OF_KEY] = as_of.isoformat().encode()
+        table = table.replace_schema_metadata(metadata)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.logger.warning(f"종목 리스트 파일 쓰기 오류: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _build(self, listing: pd.DataFrame, as_of: date):
+        """조회용 인덱스 생성"""
+        by_code: Dict[str, TickerInfo] = {}
+        by_market = defaultdict(list)
+        for code, name, market in listing.itertuples(index=False):
+            by_code[code] = TickerInfo(code, name, market)
+            by_market[market].append(code)
+
+        by_name = {_normalize_name(info.name): info.code for info in by_code.values()}
+
+        self._by_code = by_code
+        self._by_name = by_name
+        self._by_market = {market: tuple(codes) for market, codes in by_market.items()}
+        self._name_keys = sorted(by_name)
+        self._chosung_keys = sorted((to_chosung(key), key) for key in by_name)
+        self._records = {}
+        self.as_of = as_of
+
+    # ==================== 조회 ====================
+
+    def __len__(self) -> int:
+        self._ensure_fresh()
+        return len(self._by_code)
+
+    def __contains__(self, code: str) -> bool:
+        self._ensure_fresh()
+        return code in self._by_code
+
+    def get(self, code: str) -> Optional[TickerInfo]:
+        """종목코드로 종목 정보 조회"""
+        self._ensure_fresh()
+        return self._by_code.get(code)
+
+    def name_of(self, code: str, default: Optional[str] = None) -> Optional[str]:
+        """종목코드 -> 종목명"""
+        info = self.get(code)
+        return info.name if info is not None else default
+
+    def code_of(self, name: str) -> Optional[str]:
+        """종목명 -> 종목코드 (공백/대소문자 무시, 정확히 일치하는 경우만)"""
+        self._ensure_fresh()
+        return self._by_name.get(_normalize_name(name))
+
+    def search(self, query: str, limit: int = 10) -> List[TickerInfo]:
+        """
+        종목명 앞부분 또는 초성으로 종목을 검색합니다.
+
+        Args:
+            query: 종목코드, 종목명 앞부분 ('삼성') 또는 초성 ('ㅅㅅㅈㅈ')
+            limit: 최대 결과 수
+
+        Returns:
+            정확히 일치하는 종목을 먼저, 나머지는 이름이 짧은 순으로 정렬한 리스트
+        """
+        self._ensure_fresh()
+        query = _normalize_name(query)
+        if not query:
+            return []
+        if query in self._by_code:
+            return [self._by_code[query]]
+
+        if any(ch in CHOSUNG for ch in query):
+            keys = self._chosung_keys
+            target = to_chosung(query)
+            i = bisect_left(keys, (target, ''))
+            matches = []
+            while i < len(keys) and keys[i][0].startswith(target):
+                matches.append(keys[i][1])
+                i += 1
+        else:
+            keys = self._name_keys
+            i = bisect_left(keys, query)
+            matches = []
+            while i < len(keys) and keys[i].startswith(query):
+                matches.append(keys[i])
+                i += 1
+
+        matches.sort(key=lambda key: (key != query, len(key), key))
+        return [self._by_code[self._by_name[key]] for key in matches[:limit]]
+
+    def resolve(self, query: str) -> Optional[TickerInfo]:
+        """종목코드, 정확한 종목명 또는 검색 결과가 하나뿐인 입력을 종목 정보로 변환"""
+        self._ensure_fresh()
+        query = query.strip()
+        info = self._by_code.get(query)
+        if info is not None:
+            return info
+
+        code = self.code_of(query)
+        if code is not None:
+            return self._by_code[code]
+
+        results = self.search(query, limit=2)
+        return results[0] if len(results) == 1 else None
+
+    # ==================== 시장 필터 ====================
+
+    @property
+    def markets(self) -> List[str]:
+        """종목 리스트에 포함된 시장 이름"""
+        self._ensure_fresh()
+        return list(self._by_market)
+
+    def codes(self, markets: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        시장별 종목코드 리스트
+
+        Args:
+            markets: 포함할 시장 (None이면 전체)
+        """
+        return [row['Code'] for row in self.records(markets)]
+
+    def records(self, markets: Optional[Iterable[str]] = None) -> List[Dict]:
+        """
+        시장별 종목 레코드 리스트 (Code/Name/Market 딕셔너리, 시장 조합마다 한 번만 생성)
+
+        Args:
+            markets: 포함할 시장 (None이면 전체)
+        """
+        self._ensure_fresh()
+        key = tuple(self._by_market) if markets is None else tuple(markets)
+        records = self._records.get(key)
+        if records is None:
+            records = [
+                {'Code': code, 'Name': self._by_code[code].name, 'Market': market}
+                for market in key
+                for code in self._by_market.get(market, ())
+            ]
+            self._records[key] = records
+        return list(records)
+
+    def listing(self, markets: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """시장별 종목 리스트 데이터프레임 (Code/Name/Market, 기존 코드 호환용)"""
+        return pd.DataFrame(self.records(markets), columns=['Code', 'Name', 'Market'])
+
+
+if __name__ == "__main__":
+    from stock_analyzer.utils.data_provider import create_data_provider
+
+    master = TickerMaster.from_provider(create_data_provider('fdr', use_cache=False))
+    print(f"종목 수: {len(master)} (기준일: {master.as_of})")
+    print(f"시장: {master.markets}")
+    print(f"005930: {master.get('005930')}")
+    print(f"'삼성' 검색: {[info.name for info in master.search('삼성')]}")
+    print(f"'ㅅㅅㅈㅈ' 검색: {[info.name for info in master.search('ㅅㅅㅈㅈ')]}")
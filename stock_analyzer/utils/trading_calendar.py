@@ -0,0 +1,191 @@
+"""
+KRX 거래일 달력
+
+주말과 KRX 휴장일(공휴일, 대체/임시 공휴일, 선거일, 연말 휴장일)을 제외한 거래일을 계산합니다.
+음력 공휴일과 대체/임시 공휴일은 연도별 표로 관리하며, 표에 없는 연도는 양력 고정 공휴일과
+연말 휴장일(마지막 평일)만 적용합니다. 새로 지정된 임시 공휴일은 CALENDAR_EXTRA_HOLIDAYS로 추가합니다.
+
+사용법:
+    python -m stock_analyzer.utils.trading_calendar 2025
+"""
+
+import logging
+import threading
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from stock_analyzer.config import CalendarSettings
+
+# 텔레그램 설정이 없는 레거시 스크립트에서도 쓰이므로 LoggerMixin(get_settings) 대신 표준 로거 사용
+logger = logging.getLogger(__name__)
+
+# 양력 고정 공휴일 (신정, 삼일절, 근로자의 날, 어린이날, 현충일, 광복절, 개천절, 한글날, 성탄절)
+FIXED_HOLIDAYS: Tuple[Tuple[int, int], ...] = (
+    (1, 1), (3, 1), (5, 1), (5, 5), (6, 6), (8, 15), (10, 3), (10, 9), (12, 25),
+)
+
+# 연도별 KRX 휴장일 (주말 제외, 연말 휴장일 포함)
+KRX_HOLIDAYS: Dict[int, Tuple[str, ...]] = {
+    2022: (
+        '2022-01-31', '2022-02-01', '2022-02-02', '2022-03-01', '2022-03-09', '2022-05-05',
+        '2022-06-01', '2022-06-06', '2022-08-15', '2022-09-09', '2022-09-12', '2022-10-03',
+        '2022-10-10', '2022-12-30',
+    ),
+    2023: (
+        '2023-01-23', '2023-01-24', '2023-03-01', '2023-05-01', '2023-05-05', '2023-05-29',
+        '2023-06-06', '2023-08-15', '2023-09-28', '2023-09-29', '2023-10-02', '2023-10-03',
+        '2023-10-09', '2023-12-25', '2023-12-29',
+    ),
+    2024: (
+        '2024-01-01', '2024-02-09', '2024-02-12', '2024-03-01', '2024-04-10', '2024-05-01',
+        '2024-05-06', '2024-05-15', '2024-06-06', '2024-08-15', '2024-09-16', '2024-09-17',
+        '2024-09-18', '2024-10-01', '2024-10-03', '2024-10-09', '2024-12-25', '2024-12-31',
+    ),
+    2025: (
+        '2025-01-01', '2025-01-27', '2025-01-28', '2025-01-29', '2025-01-30', '2025-03-03',
+        '2025-05-01', '2025-05-05', '2025-05-06', '2025-06-03', '2025-06-06', '2025-08-15',
+        '2025-10-03', '2025-10-06', '2025-10-07', '2025-10-08', '2025-10-09', '2025-12-25',
+        '2025-12-31',
+    ),
+    2026: (
+        '2026-01-01', '2026-02-16', '2026-02-17', '2026-02-18', '2026-03-02', '2026-05-01',
+        '2026-05-05', '2026-05-25', '2026-06-03', '2026-08-17', '2026-09-24', '2026-09-25',
+        '2026-10-05', '2026-10-09', '2026-12-25', '2026-12-31',
+    ),
+}
+
+# 표에 없는 연도에 고정 공휴일 규칙을 적용할 범위
+RULE_YEARS = range(2000, 2041)
+
+
+def _year_end_closure(year: int, holidays: Iterable[date]) -> date:
+    """연말 휴장일 (12월의 마지막 평일 중 공휴일이 아닌 날)"""
+    holidays = set(holidays)
+    day = date(year, 12, 31)
+    while day.weekday() >= 5 or day in holidays:
+        day -= timedelta(days=1)
+    return day
+
+
+def krx_holidays(years: Iterable[int] = RULE_YEARS) -> List[date]:
+    """연도별 KRX 휴장일 (표에 없는 연도는 양력 고정 공휴일 + 연말 휴장일)"""
+    holidays = []
+    for year in years:
+        if year in KRX_HOLIDAYS:
+            holidays.extend(date.fromisoformat(day) for day in KRX_HOLIDAYS[year])
+            continue
+        fixed = [date(year, month, day) for month, day in FIXED_HOLIDAYS]
+        holidays.extend(fixed)
+        holidays.append(_year_end_closure(year, fixed))
+    return holidays
+
+
+class TradingCalendar:
+    """
+    거래일 달력 (numpy busdaycalendar 기반)
+
+    모든 메서드는 date를 받아 date를 반환합니다.
+    """
+
+    def __init__(self, holidays: Iterable[date] = (), known_years: Optional[Iterable[int]] = None):
+        """
+        Args:
+            holidays: 휴장일 (주말은 자동 제외)
+            known_years: 휴장일을 모두 알고 있는 연도 (주어지면 다른 연도를 조회할 때 한 번씩 경고)
+        """
+        self.holidays = np.array(sorted(set(holidays)), dtype='datetime64[D]')
+        self._busdays = np.busdaycalendar(weekmask='1111100', holidays=self.holidays)
+        self.known_years = None if known_years is None else frozenset(known_years)
+        self._warned: Set[int] = set()
+        self._warn_lock = threading.Lock()
+
+    @classmethod
+    def krx(cls, extra_holidays: Iterable[date] = ()) -> 'TradingCalendar':
+        """KRX 휴장일 달력 (KRX_HOLIDAYS에 없는 연도를 조회하면 경고)"""
+        return cls(krx_holidays() + list(extra_holidays), known_years=KRX_HOLIDAYS)
+
+    def _check_years(self, *days: date):
+        """휴장일 표에 없는 연도를 처음 조회하면 경고 (음력/대체 공휴일이 빠진 근사 달력)"""
+        if self.known_years is None:
+            return
+        years = range(min(day.year for day in days), max(day.year for day in days) + 1)
+        with self._warn_lock:
+            missing = [year for year in years if year not in self.known_years and year not in self._warned]
+            self._warned.update(missing)
+        if missing:
+            logger.warning(
+                f"KRX 휴장일 표에 없는 연도: {missing} - 양력 고정 공휴일과 연말 휴장일만 적용 "
+                f"(설날/추석/대체 공휴일 누락 가능, KRX_HOLIDAYS 또는 CALENDAR_EXTRA_HOLIDAYS에 추가 필요)"
+            )
+
+    def is_trading_day(self, day: date) -> bool:
+        """거래일 여부"""
+        self._check_years(day)
+        return bool(np.is_busday(np.datetime64(day, 'D'), busdaycal=self._busdays))
+
+    def _offset(self, day: date, offset: int, roll: str) -> date:
+        result = np.busday_offset(np.datetime64(day, 'D'), offset, roll=roll, busdaycal=self._busdays).item()
+        self._check_years(day, result)
+        return result
+
+    def previous_trading_day(self, day: date) -> date:
+        """day 이전의 마지막 거래일 (day 제외)"""
+        return self._offset(day, -1, 'forward')
+
+    def next_trading_day(self, day: date, inclusive: bool = False) -> date:
+        """day 이후의 첫 거래일 (inclusive면 day가 거래일일 때 day)"""
+        return self._offset(day, 0 if inclusive else 1, 'forward')
+
+    def last_trading_day(self, day: date) -> date:
+        """day 이전(포함)의 마지막 거래일"""
+        return self._offset(day, 0, 'backward')
+
+    def start_for_bars(self, end_date: date, bars: int) -> date:
+        """[시작일, end_date]에 거래일이 bars개 들어가는 가장 늦은 시작일"""
+        last = np.busday_offset(np.datetime64(end_date, 'D'), 0, roll='backward', busdaycal=self._busdays)
+        start = np.busday_offset(last, -(max(bars, 1) - 1), roll='backward', busdaycal=self._busdays).item()
+        self._check_years(start, end_date)
+        return start
+
+    def count(self, start_date: date, end_date: date) -> int:
+        """[start_date, end_date]의 거래일 수"""
+        self._check_years(start_date, end_date)
+        return int(np.busday_count(
+            np.datetime64(start_date, 'D'), np.datetime64(end_date, 'D') + 1, busdaycal=self._busdays
+        ))
+
+    def trading_days(self, start_date: date, end_date: date) -> np.ndarray:
+        """[start_date, end_date]의 거래일 배열 (datetime64[D])"""
+        self._check_years(start_date, end_date)
+        days = np.arange(np.datetime64(start_date, 'D'), np.datetime64(end_date, 'D') + 1)
+        return days[np.is_busday(days, busdaycal=self._busdays)]
+
+
+_calendar: Optional[TradingCalendar] = None
+_calendar_lock = threading.Lock()
+
+
+def get_trading_calendar() -> TradingCalendar:
+    """
+    공유 KRX 거래일 달력을 반환합니다 (프로세스 내 싱글톤).
+
+    텔레그램 설정이 없는 레거시 스크립트에서도 쓰이므로 CALENDAR_ 설정만 읽습니다.
+    """
+    global _calendar
+    with _calendar_lock:
+        if _calendar is None:
+            _calendar = TradingCalendar.krx(CalendarSettings().extra_holidays)
+        return _calendar
+
+
+if __name__ == "__main__":
+    import sys
+
+    year = int(sys.argv[1]) if len(sys.argv) > 1 else date.today().year
+    calendar = get_trading_calendar()
+    closed = [day for day in calendar.holidays.tolist() if day.year == year]
+    print(f"{year}년 거래일 {calendar.count(date(year, 1, 1), date(year, 12, 31))}일, 휴장일 {len(closed)}일")
+    for day in closed:
+        print(f"  {day} ({'월화수목금토일'[day.weekday()]})")
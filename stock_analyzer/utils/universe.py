@@ -0,0 +1,303 @@
+"""
+스캔 종목군 인덱스
+
+종목 리스트와 최근 거래일 전종목 스냅샷으로 종목마다 상품 유형(보통주/우선주/스팩/ETF/ETN/리츠),
+거래정지 여부, 최근 평균 거래대금을 하루 한 번 계산해 Parquet 파일에 보관합니다.
+스크리너는 프리셋(예: 거래대금 10억 이상 보통주)으로 스캔 대상을 줄인 뒤 이력을 조회합니다.
+
+    python -m stock_analyzer.utils.universe
+"""
+
+import os
+import re
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from stock_analyzer.config import get_settings
+from stock_analyzer.utils.intraday import SnapshotFetcher
+from stock_analyzer.utils.logger import LoggerMixin
+from stock_analyzer.utils.ticker_master import TickerMaster
+from stock_analyzer.utils.trading_calendar import get_trading_calendar
+
+# Parquet 스키마 메타데이터 키 (인덱스 기준일)
+_AS_OF_KEY = b'as_of'
+
+INSTRUMENT_TYPES = ('common', 'preferred', 'spac', 'etf', 'etn', 'reit')
+
+# ETF 운용사 브랜드 (종목명 앞부분)
+_ETF_BRANDS = (
+    'KODEX', 'TIGER', 'KBSTAR', 'RISE', 'ARIRANG', 'HANARO', 'KOSEF', 'KINDEX', 'ACE',
+    'SOL', 'PLUS', 'TIMEFOLIO', 'KOACT', 'TREX', 'FOCUS', 'BNK', 'WON', '1Q', 'UNICORN',
+)
+# ETF 종목명 (브랜드 뒤에 공백이 오는 경우만 - 'KODEX 200'은 ETF, 'BNK금융지주'는 보통주)
+_ETF_NAME = re.compile(r'^(?:%s)\s' % '|'.join(_ETF_BRANDS), re.IGNORECASE)
+# 우선주 종목명 접미사 (삼성전자우, 현대차2우B, 대한항공우(전환) 등)
+_PREFERRED_NAME = re.compile(r'\d?우[A-Z]?(\(전환\))?$')
+
+
+def instrument_type(code: str, name: str, market: str = '') -> str:
+    """
+    종목코드/종목명으로 상품 유형을 판별합니다.
+
+    우선주는 단축코드 끝자리가 0이 아니고(5/7/9 또는 영문자) 종목명이 '우'/'우B' 등으로 끝납니다.
+    ETF는 시장 구분이 ETF이거나 종목명이 운용사 브랜드와 공백으로 시작하는 경우입니다
+    (브랜드로 시작하는 일반 회사명은 보통주).
+    """
+    upper = name.upper().replace(' ', '')
+    if market == 'ETF' or _ETF_NAME.match(name.strip()):
+        return 'etn' if 'ETN' in upper else 'etf'
+    if market == 'ETN' or 'ETN' in upper:
+        return 'etn'
+    if '스팩' in name:
+        return 'spac'
+    if '리츠' in name:
+        return 'reit'
+    if code[-1:] != '0' and _PREFERRED_NAME.search(name):
+        return 'preferred'
+    return 'common'
+
+
+@dataclass(frozen=True)
+class UniversePreset:
+    """스캔 종목군 프리셋"""
+    name: str
+    instruments: Optional[Tuple[str, ...]] = None  # None이면 전체 유형
+    exclude_halted: bool = False
+    min_turnover: float = 0.0  # 최근 평균 거래대금 하한 (원)
+
+    def mask(self, table: pd.DataFrame) -> pd.Series:
+        """인덱스 행별 포함 여부 (거래대금을 모르는 종목은 제외하지 않음)"""
+        keep = pd.Series(True, index=table.index)
+        if self.instruments is not None:
+            keep &= table['Instrument'].isin(self.instruments)
+        if self.exclude_halted:
+            keep &= ~table['Halted']
+        if self.min_turnover > 0:
+            keep &= ~(table['AvgTurnover'] < self.min_turnover)
+        return keep
+
+
+def get_preset(name: str) -> UniversePreset:
+    """
+    이름으로 프리셋을 찾습니다.
+
+    기본 프리셋은 all(필터 없음), common(거래정지 제외 보통주),
+    tradable(common + 평균 거래대금 UNIVERSE_MIN_TURNOVER 이상)이고,
+    UNIVERSE_PRESETS(JSON)로 추가하거나 덮어쓸 수 있습니다.
+    """
+    config = get_settings().universe
+    presets = {
+        'all': UniversePreset('all'),
+        'common': UniversePreset('common', ('common',), exclude_halted=True),
+        'tradable': UniversePreset(
+            'tradable', ('common',), exclude_halted=True, min_turnover=config.min_turnover
+        ),
+    }
+    for preset_name, spec in config.presets.items():
+        spec = dict(spec)
+        if spec.get('instruments') is not None:
+            spec['instruments'] = tuple(spec['instruments'])
+        presets[preset_name] = UniversePreset(preset_name, **spec)
+
+    if name not in presets:
+        raise ValueError(f"알 수 없는 종목군 프리셋: {name} (사용 가능: {', '.join(presets)})")
+    return presets[name]
+
+
+class UniverseIndex(LoggerMixin):
+    """
+    디스크에 보관하는 스캔 종목군 인덱스
+
+    종목코드 인덱스에 Name/Market/Instrument/Halted/AvgTurnover/Sessions 컬럼을 가진 표를
+    하루 한 번 만들어 저장하고, 같은 날 다른 프로세스는 파일을 읽어 사용합니다.
+    최근 거래대금은 전일까지의 전종목 스냅샷 turnover_days개(거래일 수만큼의 요청)로 계산합니다.
+    """
+
+    def __init__(
+        self,
+        ticker_master: TickerMaster,
+        snapshot_fetcher: Optional[SnapshotFetcher] = None,
+        path: Optional[str] = None
+    ):
+        """
+        Args:
+            ticker_master: 종목 마스터
+            snapshot_fetcher: (YYYYMMDD, 시장) -> 전종목 OHLCV 함수
+                (None이면 거래대금/거래정지 정보 없이 상품 유형만 판별)
+            path: 인덱스 Parquet 파일 경로 (None이면 설정에서 가져옴)
+        """
+        self.settings = get_settings()
+        self.ticker_master = ticker_master
+        self.snapshot_fetcher = snapshot_fetcher
+        self.path = Path(path or self.settings.universe.path)
+        self._lock = threading.Lock()
+
+        self.as_of: Optional[date] = None
+        self._table: Optional[pd.DataFrame] = None
+
+    # ==================== 갱신 ====================
+
+    @property
+    def table(self) -> pd.DataFrame:
+        """종목군 인덱스 (오늘 기준으로 없으면 다시 만듦)"""
+        today = datetime.now().date()
+        if self.as_of != today:
+            with self._lock:
+                if self.as_of != today:
+                    self._refresh(today, force=False)
+        return self._table
+
+    def refresh(self) -> pd.DataFrame:
+        """인덱스를 강제로 다시 만듭니다"""
+        with self._lock:
+            self._refresh(datetime.now().date(), force=True)
+        return self._table
+
+    def _refresh(self, today: date, force: bool):
+        stored = self._load()
+        if stored is not None and stored[1] == today and not force:
+            table = stored[0]
+        else:
+            table = self._build(today)
+            self._save(table, today)
+            self.logger.info(
+                f"종목군 인덱스 갱신: {len(table)}개 종목, "
+                f"거래대금 {int(table['Sessions'].max()) if len(table) else 0}거래일"
+            )
+        self._table = table
+        self.as_of = today
+
+    def _build(self, today: date) -> pd.DataFrame:
+        """종목 리스트 + 최근 스냅샷으로 인덱스 생성"""
+        listing = self.ticker_master.listing()
+        table = pd.DataFrame({
+            'Name': listing['Name'].to_numpy(),
+            'Market': listing['Market'].to_numpy(),
+            'Instrument': [
+                instrument_type(code, name, market)
+                for code, name, market in listing[['Code', 'Name', 'Market']].itertuples(index=False)
+            ],
+        }, index=pd.Index(listing['Code'], name='Code'))
+
+        turnover, last_volume = self._recent_turnover(today)
+        table['AvgTurnover'] = turnover.mean(axis=1).reindex(table.index).to_numpy(np.float64)
+        table['Sessions'] = turnover.count(axis=1).reindex(table.index).fillna(0).astype(np.int64)
+        # 마지막 거래일에 스냅샷에 있으면서 거래가 없던 종목 = 거래정지
+        table['Halted'] = (last_volume.reindex(table.index) == 0).to_numpy()
+        return table
+
+    def _recent_turnover(self, today: date) -> Tuple[pd.DataFrame, pd.Series]:
+        """
+        전일까지 최근 turnover_days개 거래일의 종목별 거래대금 (종목 × 거래일)과
+        마지막 거래일 거래량 (휴장일은 건너뛰며 최대 2배 일수까지 거슬러 올라감)
+        """
+        days = self.settings.universe.turnover_days
+        columns: Dict[date, pd.Series] = {}
+        last_volume = pd.Series(dtype=np.float64)
+        if self.snapshot_fetcher is None:
+            self.logger.warning("스냅샷을 사용할 수 없어 거래대금/거래정지 정보 없이 인덱스 생성")
+            return pd.DataFrame(), last_volume
+
+        calendar = get_trading_calendar()
+        day = today
+        for _ in range(days * 2):
+            if len(columns) >= days:
+                break
+            day = calendar.previous_trading_day(day)
+            try:
+                snapshot = self.snapshot_fetcher(day.strftime("%Y%m%d"), 'ALL')
+            except Exception as e:
+                self.logger.warning(f"스냅샷 조회 실패: {day} - {e}")
+                continue
+            if snapshot is None or snapshot.empty or snapshot['거래량'].sum() == 0:
+                continue  # 휴장일
+            if '거래대금' in snapshot:
+                value = snapshot['거래대금'].astype(np.float64)
+            else:
+                value = snapshot['종가'].astype(np.float64) * snapshot['거래량'].astype(np.float64)
+            columns[day] = value
+            if last_volume.empty:
+                last_volume = snapshot['거래량'].astype(np.float64)
+
+        return pd.DataFrame(columns), last_volume
+
+    def _load(self) -> Optional[Tuple[pd.DataFrame, date]]:
+        """저장된 인덱스 (없거나 읽을 수 없으면 None)"""
+        if not self.path.exists():
+            return None
+        try:
+            table = pq.read_table(self.path)
+            as_of = date.fromisoformat((table.schema.metadata or {})[_AS_OF_KEY].decode())
+        except Exception as e:
+            self.logger.warning(f"종목군 인덱스 파일 읽기 오류: {e}")
+            return None
+        return table.to_pandas(), as_of
+
+    def _save(self, table: pd.DataFrame, as_of: date):
+        """인덱스 저장 (임시 파일 기록 후 교체)"""
+        arrow = pa.Table.from_pandas(table)
+        metadata = dict(arrow.schema.metadata or {})
+        metadata[_AS_OF_KEY] = as_of.isoformat().encode()
+        arrow = arrow.replace_schema_metadata(metadata)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            pq.write_table(arrow, tmp_path)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.logger.warning(f"종목군 인덱스 파일 쓰기 오류: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    # ==================== 조회 ====================
+
+    def codes(self, preset: str, markets: Optional[Iterable[str]] = None) -> List[str]:
+        """프리셋 조건을 만족하는 종목코드 (markets가 주어지면 해당 시장만)"""
+        table = self.table
+        keep = get_preset(preset).mask(table)
+        if markets is not None:
+            keep &= table['Market'].isin(list(markets))
+        return table.index[keep].tolist()
+
+    def filter(self, records: List[Dict], preset: str) -> List[Dict]:
+        """
+        종목 레코드(Code/Name/Market)를 프리셋으로 거릅니다.
+
+        인덱스에 없는 종목(인덱스 생성 후 신규 상장)은 유지합니다.
+        """
+        table = self.table
+        keep = get_preset(preset).mask(table)
+        excluded = set(table.index[~keep])
+        kept = [row for row in records if row['Code'] not in excluded]
+        self.logger.info(f"종목군 '{preset}': {len(kept)}/{len(records)}개 종목")
+        return kept
+
+    def summary(self) -> pd.DataFrame:
+        """상품 유형별 종목 수/거래정지 수/평균 거래대금 중앙값"""
+        return self.table.groupby('Instrument').agg(
+            종목수=('Name', 'size'),
+            거래정지=('Halted', 'sum'),
+            거래대금중앙값=('AvgTurnover', 'median'),
+        )
+
+
+if __name__ == "__main__":
+    from stock_analyzer.utils.data_provider import create_data_provider
+    from stock_analyzer.utils.intraday import default_snapshot_fetcher
+
+    # 장 시작 전 실행 (스케줄러 08:30 워밍업 전)
+    settings = get_settings()
+    master = TickerMaster.from_provider(create_data_provider(settings.provider.type, use_cache=False))
+    index = UniverseIndex(master, default_snapshot_fetcher())
+    index.refresh()
+    print(index.summary())
+    for name in ('all', 'common', 'tradable', settings.universe.preset):
+        print(f"{name}: {len(index.codes(name, ['KOSPI', 'KOSDAQ']))}개 종목")
@@ -0,0 +1,200 @@
+"""
+장 시작 전 워밍업
+
+장 시작 전에 종목 마스터를 불러오고, KOSPI/KOSDAQ 전종목의 전일까지 이력을
+데이터 제공자 캐시와 디스크 저장소에 미리 채웁니다. 전일까지 반영한 스트리밍 지표 상태를
+저장하고 준비 완료 표시를 남깁니다.
+이후 09:00 스크리닝은 종목마다 당일 봉만 조회합니다.
+
+    python -m stock_analyzer.utils.warmup
+"""
+
+import json
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+from stock_analyzer.analyzers.lookback import LookbackPlanner
+from stock_analyzer.analyzers.streaming import IndicatorStateBook
+from stock_analyzer.config import get_settings
+from stock_analyzer.utils.data_provider import CachedDataProvider, DataProvider
+from stock_analyzer.utils.intraday import default_snapshot_fetcher
+from stock_analyzer.utils.logger import LoggerMixin
+from stock_analyzer.utils.panel_archive import MARKET_CLOSE
+from stock_analyzer.utils.parallel import ParallelProcessor
+from stock_analyzer.utils.resilience import SourceUnavailableError
+from stock_analyzer.utils.ticker_master import TickerMaster
+from stock_analyzer.utils.trading_calendar import get_trading_calendar
+from stock_analyzer.utils.universe import UniverseIndex
+
+READY_FILE = 'ready.json'
+STATE_FILE = 'state.parquet'
+
+
+def target_session(now: Optional[datetime] = None) -> date:
+    """
+    워밍업 결과를 사용할 거래일 (KRX 거래일 달력 기준)
+
+    장 마감 전이면 오늘(휴장일이면 다음 거래일), 장 마감 후면 다음 거래일입니다.
+    """
+    now = now or datetime.now()
+    return get_trading_calendar().next_trading_day(now.date(), inclusive=now.time() < MARKET_CLOSE)
+
+
+def load_readiness(path: Optional[str] = None, session: Optional[date] = None) -> Optional[Dict]:
+    """
+    준비 완료 표시를 읽습니다.
+
+    Args:
+        path: 워밍업 디렉토리 (None이면 설정값)
+        session: 확인할 거래일 (None이면 target_session())
+
+    Returns:
+        해당 거래일을 위한 워밍업 결과 (없거나 다른 거래일용이면 None)
+    """
+    marker = Path(path or get_settings().warmup.path) / READY_FILE
+    try:
+        ready = json.loads(marker.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if ready.get('session') != (session or target_session()).isoformat():
+        return None
+    return ready
+
+
+def load_state_book(
+    path: Optional[str] = None,
+    session: Optional[date] = None
+) -> Optional[IndicatorStateBook]:
+    """전일까지 반영한 스트리밍 지표 상태 (해당 거래일용 준비 완료 표시가 없으면 None)"""
+    path = path or get_settings().warmup.path
+    if load_readiness(path, session) is None:
+        return None
+    return IndicatorStateBook.load(str(Path(path) / STATE_FILE))
+
+
+class MarketWarmup(LoggerMixin):
+    """장 시작 전 전종목 이력/지표 워밍업"""
+
+    def __init__(
+        self,
+        provider: DataProvider,
+        ticker_master: Optional[TickerMaster] = None,
+        path: Optional[str] = None,
+        markets: Sequence[str] = ('KOSPI', 'KOSDAQ'),
+        universe_index: Optional[UniverseIndex] = None
+    ):
+        """
+        Args:
+            provider: 데이터 제공자 (CachedDataProvider면 메모리 캐시와 디스크 저장소에 채움)
+            ticker_master: 종목 마스터 (None이면 데이터 제공자의 종목 리스트 사용)
+            path: 준비 완료 표시/지표 상태 저장 디렉토리 (None이면 설정값)
+            markets: 대상 시장
+            universe_index: 종목군 인덱스 (UNIVERSE_PRESET이 all이 아니면 프리셋 종목만 워밍업)
+        """
+        self.settings = get_settings()
+        self.provider = provider
+        self.ticker_master = ticker_master or TickerMaster.from_provider(provider)
+        self.path = Path(path or self.settings.warmup.path)
+        self.markets = list(markets)
+        self.universe_index = universe_index
+
+    def run(self, now: Optional[datetime] = None) -> Dict:
+        """
+        워밍업을 실행하고 준비 완료 표시를 기록합니다.
+
+        스크리너와 같은 시작일(지표에 필요한 거래일 수로 계획한 조회 시작일)부터 대상 거래일
+        (target_session())의 직전 거래일까지 조회하므로,
+        장중 스크리닝 요청은 캐시/저장소의 마지막 봉 이후(당일 봉)만 새로 조회합니다.
+        스트리밍 지표 상태는 지난 실행의 상태에 새 확정 봉만 반영해 함께 저장합니다.
+
+        Returns:
+            준비 완료 표시 내용 (session, tickers, warmed, failed, seconds 등)
+        """
+        now = now or datetime.now()
+        started = time.perf_counter()
+        config = self.settings.warmup
+
+        records = self.ticker_master.records(self.markets)
+        preset = self.settings.universe.preset
+        if preset != 'all':
+            if self.universe_index is None:
+                self.universe_index = UniverseIndex(self.ticker_master, default_snapshot_fetcher())
+            records = self.universe_index.filter(records, preset)
+        tickers = [row['Code'] for row in records]
+        session = target_session(now)
+        end_date = get_trading_calendar().previous_trading_day(session)
+        planner = LookbackPlanner(self.settings.analysis)
+        start_date = planner.start_date(session)
+        self.logger.info(f"워밍업 시작: {len(tickers)}개 종목 ({start_date} ~ {end_date})")
+
+        if self.settings.cache.pin_universe and isinstance(self.provider, CachedDataProvider):
+            self.provider.pin_universe(tickers)
+        book = IndicatorStateBook.load(str(self.path / STATE_FILE))
+
+        def warm(ticker):
+            df = planner.fetch(self.provider, ticker, session, fetch_end=end_date)
+            if df is None or df.empty:
+                return None
+            book.advance(ticker, df)
+            return ticker, df.index[-1].date()
+
+        processor = ParallelProcessor(max_workers=config.max_workers, timeout=config.timeout)
+        result = processor.process(tickers, warm, desc="워밍업", stop_on=(SourceUnavailableError,))
+
+        last_dates = [last for _, last in result.successes]
+        ready = {
+            'session': session.isoformat(),
+            'created': now.isoformat(timespec='seconds'),
+            'start_date': start_date.isoformat(),
+            'last_bar': max(last_dates).isoformat() if last_dates else None,
+            'tickers': len(tickers),
+            'warmed': len(result.successes),
+            'states': len(book),
+            'failed': len(result.errors),
+            'stopped': result.stopped,
+            'seconds': round(time.perf_counter() - started, 1),
+        }
+
+        self._write(book, ready)
+        self.logger.info(
+            f"워밍업 완료: {ready['warmed']}/{ready['tickers']}개 종목, "
+            f"지표 상태 {ready['states']}개 ({ready['seconds']}초)"
+        )
+        return ready
+
+    def _write(self, book: IndicatorStateBook, ready: Dict):
+        """지표 상태를 저장한 뒤 마지막에 준비 완료 표시를 교체합니다 (중단 시 이전 결과 유지)"""
+        if ready['stopped']:
+            # 소스 장애로 중단 - 준비 완료로 표시하지 않음
+            self.logger.warning(f"워밍업 중단으로 준비 완료 표시 생략: {ready['stopped']}")
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        book.save(str(self.path / STATE_FILE))
+
+        tmp = self.path / f"{READY_FILE}.tmp"
+        tmp.write_text(json.dumps(ready, ensure_ascii=False, indent=2), encoding='utf-8')
+        tmp.replace(self.path / READY_FILE)
+
+
+def format_readiness(ready: Optional[Dict]) -> str:
+    """준비 완료 표시 요약 문자열"""
+    if ready is None:
+        return "워밍업 안 됨 - 첫 스크리닝은 전체 이력을 조회합니다"
+    return (
+        f"워밍업 완료 ({ready['created']}): {ready['warmed']}/{ready['tickers']}개 종목, "
+        f"마지막 봉 {ready['last_bar']}"
+    )
+
+
+if __name__ == "__main__":
+    from stock_analyzer.utils.data_provider import create_data_provider
+
+    # 장 시작 전 실행 (스케줄러 08:30)
+    settings = get_settings()
+    provider = create_data_provider(settings.provider.type, use_cache=True)
+    ready = MarketWarmup(provider).run()
+    print(format_readiness(ready if not ready['stopped'] else None))
+    print(f"소요 시간: {ready['seconds']}초")
@@ -16,6 +16,7 @@ import requests
 from bs4 import BeautifulSoup
 import sqlite3
 from typing import Dict, Tuple, Optional
+from contextlib import nullcontext
 
 # 환경변수 로드
 load_dotenv()
@@ -40,6 +41,49 @@ DB_FILE = "stock_history.db"  # SQLite DB 파일명
 WATCHLIST_JSON = "watchlist.json"
 WATCHLIST_CSV = "watchlist.csv"
 
+# 공유 OHLCV 아카이브 (python -m stock_analyzer.utils.panel_archive 로 갱신)
+ARCHIVE_PATH = os.getenv("ARCHIVE_PATH", "data/archive")
+try:
+    from stock_analyzer.utils.panel_archive import load_archived_ohlcv
+except ImportError:
+    load_archived_ohlcv = None
+
+# 종목 마스터 (KRX 종목 리스트를 하루 한 번만 받아 디스크에 보관)
+TICKER_MASTER_PATH = os.getenv("TICKER_PATH", "data/ticker_master.parquet")
+try:
+    from stock_analyzer.utils.ticker_master import TickerMaster
+    ticker_master = TickerMaster(lambda: fdr.StockListing('KRX'), TICKER_MASTER_PATH)
+except ImportError:
+    ticker_master = None
+
+# 지표 리졸버 (종목/기준 봉마다 한 번만 계산해 fetch_stock_data와 종목 분석이 공유)
+# 조회 기간 계획 (지표에 필요한 거래일 수 -> KRX 거래일 달력으로 조회 시작일)
+try:
+    from stock_analyzer.analyzers.indicator_graph import IndicatorResolver, default_registry
+    from stock_analyzer.analyzers.lookback import LookbackPlanner
+    from stock_analyzer.config import AnalysisSettings
+    legacy_analysis = AnalysisSettings(ma_period_short=5, ma_period_long=20, volume_window=20, volatility_window=20)
+    indicator_resolver = IndicatorResolver(default_registry(legacy_analysis))
+    lookback_planner = LookbackPlanner(legacy_analysis, registry=indicator_resolver.registry)
+except ImportError:
+    indicator_resolver = lookback_planner = None
+
+# fetch_stock_data가 계산하는 지표
+SURGE_INDICATORS = ["MA5", "MA20", "vol_avg5", "vol_avg20", "high20"]
+
+# 호스트별 공유 rate limiter (응답 상태에 따라 요청 속도 자동 조절)
+try:
+    from stock_analyzer.utils.rate_limiter import get_rate_limiter, KRX_HOST, NAVER_FINANCE_HOST
+    krx_limiter = get_rate_limiter(KRX_HOST)
+    naver_finance_limiter = get_rate_limiter(NAVER_FINANCE_HOST)
+except ImportError:
+    krx_limiter = naver_finance_limiter = None
+
+
+def limited(limiter):
+    """rate limiter 요청 컨텍스트 (limiter가 없으면 아무것도 하지 않음)"""
+    return limiter.request() if limiter is not None else nullcontext()
+
 # ==================== SQLite DB 관리 ====================
 def init_db():
     """DB 초기화 및 테이블 생성"""
@@ -426,12 +470,56 @@ def save_surge_results_to_db(results):
 
 
 # ==================== 분석 헬퍼 ====================
+def get_ohlcv(code, start_date, end_date):
+    """공유 아카이브(memmap)를 먼저 확인하고, 없으면 pykrx에서 OHLCV를 불러옵니다."""
+    if load_archived_ohlcv is not None:
+        df = load_archived_ohlcv(code, start_date.date(), end_date.date(), ARCHIVE_PATH)
+        if df is not None:
+            return df
+    with limited(krx_limiter):
+        return stock.get_market_ohlcv(start_date.strftime("%Y%m%d"), end_date.strftime("%Y%m%d"), code)
+
+
+def get_krx_listing(markets=None, exclude=()):
+    """KRX 종목 리스트 (종목 마스터가 있으면 시장별 목록을 미리 만들어 둔 것 사용)"""
+    if ticker_master is not None:
+        try:
+            if markets is None:
+                markets = [m for m in ticker_master.markets if m not in exclude]
+            return ticker_master.listing(markets)
+        except Exception as e:
+            print(f"[주의] 종목 마스터 조회 실패 - 직접 조회합니다: {e}")
+
+    df_krx = fdr.StockListing('KRX')
+    if markets is not None:
+        df_krx = df_krx[df_krx['Market'].isin(list(markets))]
+    if exclude:
+        df_krx = df_krx[~df_krx['Market'].isin(list(exclude))]
+    return df_krx
+
+
+def lookup_stock(code):
+    """종목코드 -> (종목명, 시장) (찾지 못하면 None)"""
+    if ticker_master is not None:
+        try:
+            info = ticker_master.get(code)
+            return (info.name, info.market) if info is not None else None
+        except Exception as e:
+            print(f"[주의] 종목 마스터 조회 실패 - 직접 조회합니다: {e}")
+
+    df_krx = fdr.StockListing('KRX')
+    stock_info = df_krx[df_krx['Code'] == code]
+    if stock_info.empty:
+        return None
+    return stock_info.iloc[0]['Name'], stock_info.iloc[0]['Market']
+
+
 def fetch_data(ticker, days=120):
     """pykrx에서 OHLCV를 불러옵니다."""
     end_date = datetime.now()
     start_date = end_date - timedelta(days=days)
     try:
-        df = stock.get_market_ohlcv(start_date.strftime("%Y%m%d"), end_date.strftime("%Y%m%d"), ticker)
+        df = get_ohlcv(ticker, start_date, end_date)
         if df is None or df.empty:
             return None
         df = df.dropna().copy()
@@ -448,11 +536,32 @@ def get_volatility(df, window):
 
 
 # ==================== 급등주 분류 헬퍼 (A/B/C) ====================
-def fetch_stock_data(ticker, days=120):
-    """OHLCV + 보조지표 계산"""
+def planned_days(history, default):
+    """fetch_stock_data 지표가 최근 history개 거래일에서 유효하도록 조회할 기간 (달력일, 계획할 수 없으면 default)"""
+    if lookback_planner is None:
+        return default
+    today = datetime.now().date()
+    start = lookback_planner.start_date(today, lookback_planner.bars(SURGE_INDICATORS, history))
+    return (today - start).days
+
+
+def fetch_stock_data(ticker, days=120, min_rows=0):
+    """OHLCV + 보조지표 계산 (지표가 유효한 행이 min_rows개보다 적으면 기간을 두 배로 넓혀 한 번 더 조회)"""
+    df = _fetch_with_indicators(ticker, days)
+    if df is not None and len(df) < min_rows:
+        # 달력에 없는 휴장일/거래정지로 계획한 기간에 봉이 부족함
+        wider = _fetch_with_indicators(ticker, days * 2)
+        if wider is not None and len(wider) > len(df):
+            return wider
+    return df
+
+
+def _fetch_with_indicators(ticker, days):
     df = fetch_data(ticker, days)
     if df is None or df.empty:
         return None
+    if indicator_resolver is not None:
+        return indicator_resolver.frame(ticker, df, ["MA5", "MA20", "vol_avg5", "vol_avg20", "high20"]).dropna()
     df = df.copy()
     df["MA5"] = df["종가"].rolling(5).mean()
     df["MA20"] = df["종가"].rolling(20).mean()
@@ -675,16 +784,22 @@ def normalize_stock_symbol(symbol):
     """종목코드 정규화 - 한국 주식의 경우 KOSPI/KOSDAQ 자동 판단"""
     symbol = symbol.strip().upper()
 
+    # 한글 종목명인 경우 종목 마스터에서 종목코드로 변환
+    if not symbol.isascii() and ticker_master is not None:
+        try:
+            info = ticker_master.resolve(symbol)
+            if info is not None:
+                symbol = info.code
+        except Exception as e:
+            print(f"[주의] 종목명 확인 중 오류: {e}")
+
     # 숫자로만 이루어진 경우 (한국 주식) - FinanceDataReader는 접미사 없이 사용
     if symbol.isdigit():
-        # FinanceDataReader로 종목 존재 여부 확인
+        # 종목 존재 여부 확인
         try:
-            # KRX 전체 종목 리스트에서 확인
-            df_krx = fdr.StockListing('KRX')
-            if symbol in df_krx['Code'].values:
-                stock_info = df_krx[df_krx['Code'] == symbol].iloc[0]
-                market = stock_info['Market']
-                name = stock_info['Name']
+            found = lookup_stock(symbol)
+            if found is not None:
+                name, market = found
                 print(f"[OK] {symbol} ({name}, {market}) 종목을 찾았습니다.")
                 return symbol, 'KRX'
             else:
@@ -715,12 +830,8 @@ def analyze_stock(symbol):
 
             # 종목 이름 가져오기
             try:
-                df_krx = fdr.StockListing('KRX')
-                stock_info = df_krx[df_krx['Code'] == symbol_code]
-                if not stock_info.empty:
-                    stock_name = stock_info.iloc[0]['Name']
-                else:
-                    stock_name = symbol_code
+                found = lookup_stock(symbol_code)
+                stock_name = found[0] if found is not None else symbol_code
             except:
                 stock_name = symbol_code
         else:
@@ -787,6 +898,7 @@ def get_stock_symbol():
     print("  - 카카오: 035720")
     print("  - NAVER: 035420")
     print("  - 에코프로비엠: 247540")
+    print("  - 종목명/초성 검색: 삼성전자, 에코프로, ㅅㅅㅈㅈ")
     print("")
     print("  [미국 주식]")
     print("  - 애플: AAPL")
@@ -796,6 +908,25 @@ def get_stock_symbol():
     symbol = input("종목코드를 입력하세요 (기본값: 005930): ").strip()
     if not symbol:
         symbol = "005930"
+
+    # 한글 종목명/초성 입력은 검색 후 선택
+    if not symbol.isascii() and ticker_master is not None:
+        try:
+            candidates = ticker_master.search(symbol)
+        except Exception as e:
+            print(f"[주의] 종목 검색 실패: {e}")
+            return symbol
+
+        if not candidates:
+            print(f"[주의] '{symbol}'에 해당하는 종목이 없습니다.")
+        elif len(candidates) == 1 or ticker_master.code_of(symbol) == candidates[0].code:
+            symbol = candidates[0].code
+        else:
+            for i, info in enumerate(candidates, 1):
+                print(f"  {i}. {info.name} ({info.code}, {info.market})")
+            choice = input("번호를 선택하세요 (기본값: 1): ").strip()
+            index = int(choice) - 1 if choice.isdigit() and 0 < int(choice) <= len(candidates) else 0
+            symbol = candidates[index].code
     return symbol
 
 def analyze_single_stock(code, name, market, start_date, end_date, threshold, volume_multiplier=1.0):
@@ -816,21 +947,25 @@ def analyze_single_stock(code, name, market, start_date, end_date, threshold, vo
     """
     try:
         # pykrx로 데이터 가져오기 (성능 개선)
-        hist = stock.get_market_ohlcv(start_date.strftime("%Y%m%d"), end_date.strftime("%Y%m%d"), code)
+        hist = get_ohlcv(code, start_date, end_date)
 
         if hist is None or hist.empty or len(hist) < 20:
             return None
 
         # 현재가와 20일 이동평균 계산
         current_price = hist['종가'].iloc[-1]
-        ma_20 = hist['종가'].tail(20).mean()
+        current_volume = hist['거래량'].iloc[-1]
+        if indicator_resolver is not None:
+            latest = indicator_resolver.latest(code, hist, ['MA20', 'vol_avg20'])
+            ma_20, avg_volume_20 = latest['MA20'], latest['vol_avg20']
+        else:
+            ma_20 = hist['종가'].tail(20).mean()
+            avg_volume_20 = hist['거래량'].tail(20).mean()
 
         # 상승률 계산
         diff_pct = ((current_price - ma_20) / ma_20) * 100
 
         # 거래량 체크
-        current_volume = hist['거래량'].iloc[-1]
-        avg_volume_20 = hist['거래량'].tail(20).mean()
 
         # 거래량 배수 조건 체크
         if volume_multiplier > 1.0 and current_volume < (avg_volume_20 * volume_multiplier):
@@ -876,8 +1011,7 @@ def screen_stocks(threshold=5.0, max_workers=20, volume_multiplier=1.0):
     print("="*70)
 
     try:
-        df_krx = fdr.StockListing('KRX')
-        df_krx = df_krx[df_krx['Market'] != 'KONEX']
+        df_krx = get_krx_listing(exclude=('KONEX',))
         print(f"[정보] 총 {len(df_krx)}개 종목 스캔 중...\n")
     except Exception as e:
         print(f"[오류] 종목 리스트 가져오기 실패: {e}")
@@ -1055,8 +1189,9 @@ def crawl_theme_page(page=1):
     }
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        with limited(naver_finance_limiter):
+            response = requests.get(url, headers=headers, timeout=10)
+            response.raise_for_status()
         soup = BeautifulSoup(response.text, 'html.parser')
 
         # 테마 테이블 찾기 - 여러 방법 시도
@@ -1167,8 +1302,8 @@ def crawl_all_themes(max_pages=7):
         themes = crawl_theme_page(page)
         all_themes.extend(themes)
 
-        # 서버 부하 방지를 위한 대기
-        if page < max_pages:
+        # 서버 부하 방지를 위한 대기 (공유 rate limiter가 있으면 요청 시점에 조절됨)
+        if naver_finance_limiter is None and page < max_pages:
             time.sleep(1)
 
     df = pd.DataFrame(all_themes)
@@ -1243,14 +1378,17 @@ def analyze_theme_stock(code, name, theme_name, start_date, end_date, threshold)
     for attempt in range(max_retries):
         try:
             # pykrx로 데이터 가져오기 (성능 개선)
-            hist = stock.get_market_ohlcv(start_date.strftime("%Y%m%d"), end_date.strftime("%Y%m%d"), code)
+            hist = get_ohlcv(code, start_date, end_date)
 
             if hist is None or hist.empty or len(hist) < 20:
                 return None
 
             # 현재가와 20일 이동평균 계산
             current_price = hist['종가'].iloc[-1]
-            ma_20 = hist['종가'].tail(20).mean()
+            if indicator_resolver is not None:
+                ma_20 = indicator_resolver.latest(code, hist, ['MA20'])['MA20']
+            else:
+                ma_20 = hist['종가'].tail(20).mean()
 
             # 상승률 계산
             diff_pct = ((current_price - ma_20) / ma_20) * 100
@@ -1270,9 +1408,10 @@ def analyze_theme_stock(code, name, theme_name, start_date, end_date, threshold)
         except KeyboardInterrupt:
             raise
         except Exception as e:
-            # 마지막 시도가 아니면 재시도
+            # 마지막 시도가 아니면 재시도 (rate limiter가 있으면 다음 요청 시점에 대기)
             if attempt < max_retries - 1:
-                time.sleep(retry_delay)
+                if krx_limiter is None:
+                    time.sleep(retry_delay)
                 continue
             return None
 
@@ -1475,8 +1614,7 @@ def screen_surge_stocks(max_workers=10):
 
     # KOSPI + KOSDAQ 종목 리스트
     try:
-        df_krx = fdr.StockListing('KRX')
-        df_krx = df_krx[df_krx['Market'].isin(['KOSPI', 'KOSDAQ'])]
+        df_krx = get_krx_listing(['KOSPI', 'KOSDAQ'])
         print(f"[정보] 총 {len(df_krx)}개 KOSPI+KOSDAQ 종목 분석 중...")
         kospi_count = len(df_krx[df_krx['Market'] == 'KOSPI'])
         kosdaq_count = len(df_krx[df_krx['Market'] == 'KOSDAQ'])
@@ -1493,12 +1631,15 @@ def screen_surge_stocks(max_workers=10):
     error_count = 0
     lock = threading.Lock()
 
+    # 분류에 지표가 유효한 최근 25거래일 필요
+    days = planned_days(25, 120)
+
     def analyze_stock(row):
         ticker = row['Code']
         name = row['Name']
         market = row['Market']
 
-        df = fetch_stock_data(ticker, days=120)
+        df = fetch_stock_data(ticker, days=days, min_rows=25)
         if df is None or len(df) < 25:
             return None
 
@@ -1,4 +1,6 @@
 import schedule
+import subprocess
+import sys
 import time
 import asyncio
 from stock_analyzer import analyze_stock, send_telegram_message
@@ -8,9 +10,51 @@ def job():
     if message:
         asyncio.run(send_telegram_message(message))
 
+# 실행 중인 백그라운드 작업 (작업 이름 -> 프로세스)
+running = {}
+
+def launch(name, module):
+    """모듈을 별도 프로세스로 실행하고 바로 반환 (스케줄 루프를 막지 않음)"""
+    proc = running.get(name)
+    if proc is not None and proc.poll() is None:
+        print(f"[스케줄러] {name} 작업이 아직 실행 중 (pid {proc.pid}) - 이번 실행 생략")
+        return
+    running[name] = subprocess.Popen([sys.executable, "-m", module])
+
+def reap():
+    """끝난 백그라운드 작업 정리 (종료 코드 기록)"""
+    for name, proc in list(running.items()):
+        code = proc.poll()
+        if code is not None:
+            if code != 0:
+                print(f"[스케줄러] {name} 작업 실패 (종료 코드 {code})")
+            del running[name]
+
+def universe_job():
+    # 스캔 종목군 인덱스 갱신 (상품 유형/거래정지/최근 거래대금)
+    launch("universe", "stock_analyzer.utils.universe")
+
+def warmup_job():
+    # 장 시작 전 전종목 이력 워밍업 (디스크 저장소 + 준비 완료 표시)
+    launch("warmup", "stock_analyzer.utils.warmup")
+
+def archive_job():
+    # 공유 OHLCV 아카이브 갱신 (별도 프로세스 - 다른 스크립트는 memmap으로 읽기만 함)
+    launch("archive", "stock_analyzer.utils.panel_archive")
+
+# 장 시작 전 종목군 인덱스 갱신 - 워밍업/스크리닝 대상 축소
+schedule.every().day.at("08:20").do(universe_job)
+
+# 장 시작 전 워밍업 - 9시 작업은 당일 봉만 조회
+schedule.every().day.at("08:30").do(warmup_job)
+
 # 매일 오전 9시에 실행
 schedule.every().day.at("09:00").do(job)
 
+# 장 마감 후 아카이브 갱신
+schedule.every().day.at("16:00").do(archive_job)
+
 while True:
     schedule.run_pending()
+    reap()
     time.sleep(60)
\ No newline at end of file
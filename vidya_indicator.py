@@ -3,98 +3,33 @@ import numpy as np
 import matplotlib.pyplot as plt
 import yfinance as yf
 
+from stock_analyzer.analyzers import vidya as vidya_kernels
+
 # 한글 폰트 설정
 plt.rcParams['font.family'] = 'Malgun Gothic'
 plt.rcParams['axes.unicode_minus'] = False
 
-def calculate_cmo(data, period=14):
-    """
-    Chande Momentum Oscillator 계산
-    """
-    delta = data.diff()
-
-    up = delta.copy()
-    down = delta.copy()
-
-    up[up < 0] = 0
-    down[down > 0] = 0
-    down = abs(down)
+def _values(data):
+    """Series / 단일 열 DataFrame을 1차원 float 배열로 변환"""
+    return np.asarray(data, dtype=np.float64).reshape(-1)
 
-    up_sum = up.rolling(window=period).sum()
-    down_sum = down.rolling(window=period).sum()
-
-    cmo = 100 * (up_sum - down_sum) / (up_sum + down_sum)
-
-    return cmo
+def calculate_cmo(data, period=14):
+    """Chande Momentum Oscillator 계산"""
+    return pd.Series(vidya_kernels.cmo(_values(data), period), index=data.index)
 
 def calculate_vidya(data, period=14, cmo_period=14):
-    """
-    VIDYA (Variable Index Dynamic Average) 계산
-    변동성에 따라 적응하는 이동평균선
-    """
-    alpha = 2 / (period + 1)
-
-    # CMO 계산
-    cmo = calculate_cmo(data, cmo_period)
-    cmo_ratio = abs(cmo) / 100
-
-    # VIDYA 계산
-    vidya = pd.Series(index=data.index, dtype=float)
-    vidya.iloc[0] = data.iloc[0]
-
-    for i in range(1, len(data)):
-        cmo_val = cmo_ratio.iloc[i]
-        # Series인 경우 스칼라로 변환
-        if isinstance(cmo_val, pd.Series):
-            cmo_val = cmo_val.values[0] if len(cmo_val) > 0 else np.nan
-
-        if not pd.isna(cmo_val):
-            adaptive_alpha = alpha * cmo_val
-            vidya.iloc[i] = adaptive_alpha * data.iloc[i] + (1 - adaptive_alpha) * vidya.iloc[i-1]
-        else:
-            vidya.iloc[i] = vidya.iloc[i-1]
-
-    return vidya
+    """VIDYA (Variable Index Dynamic Average) 계산 - 변동성에 따라 적응하는 이동평균선"""
+    return pd.Series(vidya_kernels.vidya(_values(data), period, cmo_period), index=data.index)
 
 def calculate_volumatic_vidya(data, volume, period=14, cmo_period=14):
-    """
-    Volumatic VIDYA - 거래량을 고려한 VIDYA
-    변동성과 거래량을 모두 고려하여 적응
-    """
-    alpha = 2 / (period + 1)
-
-    # CMO 계산
-    cmo = calculate_cmo(data, cmo_period)
-    cmo_ratio = abs(cmo) / 100
-
-    # 거래량 비율 계산 (현재 거래량 / 평균 거래량)
-    avg_volume = volume.rolling(window=period).mean()
-    volume_ratio = volume / avg_volume
-    volume_ratio = volume_ratio.clip(upper=2.0)  # 최대값 제한
-
-    # Volumatic VIDYA 계산
-    vidya = pd.Series(index=data.index, dtype=float)
-    vidya.iloc[0] = data.iloc[0]
-
-    for i in range(1, len(data)):
-        cmo_val = cmo_ratio.iloc[i]
-        vol_val = volume_ratio.iloc[i]
-
-        # Series인 경우 스칼라로 변환
-        if isinstance(cmo_val, pd.Series):
-            cmo_val = cmo_val.values[0] if len(cmo_val) > 0 else np.nan
-        if isinstance(vol_val, pd.Series):
-            vol_val = vol_val.values[0] if len(vol_val) > 0 else np.nan
-
-        if not pd.isna(cmo_val) and not pd.isna(vol_val):
-            # 거래량 비율을 추가로 곱함
-            adaptive_alpha = alpha * cmo_val * vol_val
-            adaptive_alpha = min(adaptive_alpha, 1.0)  # 1.0을 넘지 않도록
-            vidya.iloc[i] = adaptive_alpha * data.iloc[i] + (1 - adaptive_alpha) * vidya.iloc[i-1]
-        else:
-            vidya.iloc[i] = vidya.iloc[i-1]
-
-    return vidya
+    """Volumatic VIDYA - 거래량을 고려한 VIDYA"""
+    values = vidya_kernels.volumatic_vidya(_values(data), _values(volume), period, cmo_period)
+    return pd.Series(values, index=data.index)
+
+def calculate_vidya_bundle(data, volume, period=14, cmo_period=14):
+    """CMO를 한 번만 계산해 CMO / VIDYA / Volumatic VIDYA를 함께 반환"""
+    bundle = vidya_kernels.vidya_bundle(_values(data), _values(volume), period, cmo_period)
+    return pd.DataFrame(bundle, index=data.index)
 
 def main():
     # 사용자 설정
@@ -145,9 +80,10 @@ def main():
     print("지표 계산 중...")
     data['SMA_20'] = data['Close'].rolling(window=20).mean()
     data['EMA_20'] = data['Close'].ewm(span=20, adjust=False).mean()
-    data['VIDYA'] = calculate_vidya(data['Close'], period=20, cmo_period=14)
-    data['Volumatic_VIDYA'] = calculate_volumatic_vidya(data['Close'], data['Volume'], period=20, cmo_period=14)
-    data['CMO'] = calculate_cmo(data['Close'], period=14)
+    bundle = calculate_vidya_bundle(data['Close'], data['Volume'], period=20, cmo_period=14)
+    data['VIDYA'] = bundle['VIDYA']
+    data['Volumatic_VIDYA'] = bundle['Volumatic_VIDYA']
+    data['CMO'] = bundle['CMO']
 
     # 그래프 그리기
     print("그래프 생성 중...")